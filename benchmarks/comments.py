@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Measures lexing of large comments and inline HTML.
+
+Each fixture is dominated by one kind of token: a multi-megabyte docblock,
+a long run of line comments, or a template that is mostly HTML.  The
+former per-character rules of phplex (reproduced below as LEGACY_RULES) are
+timed on the same input next to both lexers.
+
+    $ python benchmarks/comments.py [--size 2000000]
+"""
+import os
+import re
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+LEGACY_RULES = {
+    'docblock': r'/\*\*(.|\n)*?\*/',
+    'line comments': r'//([^?%\n]|[?%](?!>))*\n?',
+    'template': r'([^<]|<(?![?%]))+',
+}
+
+
+def fixtures(size):
+    line = ' * Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n'
+    yield 'docblock', '<?php\n/**\n' + line * (size // len(line)) + ' */\n'
+
+    line = '// Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n'
+    yield 'line comments', '<?php\n' + line * (size // len(line))
+
+    line = '<li class="item"><a href="#">Lorem ipsum dolor sit amet</a></li>\n'
+    yield 'template', line * (size // len(line)) + '<?php echo 1; ?>\n'
+
+
+def tokenize(lexer, source):
+    lexer = lexer.clone()
+    lexer.input(source)
+
+    started = time.time()
+    while lexer.token():
+        pass
+
+    return time.time() - started
+
+
+def legacy(pattern, source):
+    regex = re.compile(pattern, re.VERBOSE)
+    pos = len('<?php\n') if source.startswith('<?php') else 0
+
+    started = time.time()
+    try:
+        m = regex.match(source, pos)
+        while m and m.end() > pos:
+            pos = m.end()
+            m = regex.match(source, pos)
+    except RuntimeError:
+        return None
+
+    return time.time() - started
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--size', type=int, default=2000000)
+    options = parser.parse_args()
+
+    from phply import phplex, phpscan
+    for name, source in fixtures(options.size):
+        source = source.decode('utf-8')
+        print('%s (%d bytes)' % (name, len(source)))
+
+        elapsed = legacy(LEGACY_RULES[name], source)
+        if elapsed is None:
+            print('  %-14s failed (recursion limit)' % 'legacy rule')
+        else:
+            print('  %-14s %7.3f s' % ('legacy rule', elapsed))
+        print('  %-14s %7.3f s' % ('phplex', tokenize(phplex.lexer, source)))
+        print('  %-14s %7.3f s' % ('phpscan', tokenize(phpscan.lexer, source)))
+
+
+if __name__ == '__main__':
+    main()
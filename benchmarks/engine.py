@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Compares the parse time of PLY's LALR engine with phply.engine.
+
+Parses a synthetic file of --lines lines --repeat times with each engine,
+reports the best time of each, and checks that both give the same tree.
+
+    $ python benchmarks/engine.py [--lines 20000] [--mode full] [--repeat 3]
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def main():
+    from phply import batch
+
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--mode', default='full', choices=('declarations', 'lazy', 'full'))
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args()
+
+    source = php_source(options.lines).decode('utf-8')
+    print('%d lines, %.1f MB' % (options.lines, len(source) / 1048576.0))
+
+    trees = []
+    for engine in batch.ENGINES:
+        batch.set_engine(engine)
+        batch.get_parser()
+
+        best = None
+        for _ in range(options.repeat):
+            started = time.time()
+            tree = batch.parse(source, options.mode)
+            elapsed = time.time() - started
+            best = min(best or elapsed, elapsed)
+        trees.append(tree)
+        print('%-6s %6.2f s' % (engine, best))
+
+    assert trees[0] == trees[1]
+
+
+if __name__ == '__main__':
+    main()
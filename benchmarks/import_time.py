@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Measures the start-up cost of the extension in fresh interpreters.
+
+``import`` is what every Sphinx build (and every ``-j`` worker) pays for
+loading the extension; ``import + get_parser()`` is what it paid before the
+lexer and parser were built lazily, and what a build still pays once it
+actually parses PHP.
+
+    $ python benchmarks/import_time.py [-n REPEAT]
+"""
+import os
+import sys
+import time
+import subprocess
+from argparse import ArgumentParser
+
+SRCDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SCENARIOS = [
+    ('python startup', 'pass'),
+    ('import', 'import sphinxcontrib_phpautodoc'),
+    ('import + get_parser()', 'import sphinxcontrib_phpautodoc; '
+                              'sphinxcontrib_phpautodoc.get_parser()'),
+]
+
+
+def measure(code, repeat):
+    env = dict(os.environ, PYTHONPATH=SRCDIR)
+    timings = []
+    for _ in range(repeat):
+        started = time.time()
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+        timings.append(time.time() - started)
+
+    return sorted(timings)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('-n', dest='repeat', type=int, default=10)
+    options = parser.parse_args()
+
+    for name, code in SCENARIOS:
+        timings = measure(code, options.repeat)
+        print('%-24s min %7.1f ms   median %7.1f ms' %
+              (name, timings[0] * 1000, timings[len(timings) // 2] * 1000))
+
+
+if __name__ == '__main__':
+    main()
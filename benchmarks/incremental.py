@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Measures how long a file takes to refresh in the cache after a small edit.
+
+Writes a synthetic file of --lines lines, parses it into a cache with
+phply.batch.load_file(), edits one function in the middle, and loads it
+again with a full parse and with an incremental reparse.
+
+    $ python benchmarks/incremental.py [--lines 5000] [--mode full]
+"""
+import os
+import sys
+import time
+import shutil
+from tempfile import mkdtemp
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def refresh(path, source, edited, mode, incremental):
+    from phply import batch
+    from phply.cache import DiskCache
+
+    cachedir = mkdtemp()
+    try:
+        cache = DiskCache(cachedir, os.path.dirname(path), incremental)
+        with open(path, 'wb') as f:
+            f.write(source)
+        started = time.time()
+        batch.load_file(path, cache, mode)
+        cold = time.time() - started
+
+        with open(path, 'wb') as f:
+            f.write(edited)
+        started = time.time()
+        batch.load_file(path, cache, mode)
+        return cold, time.time() - started
+    finally:
+        shutil.rmtree(cachedir)
+
+
+def main():
+    from phply import batch
+
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=5000)
+    parser.add_argument('--mode', default='full', choices=('declarations', 'lazy', 'full'))
+    options = parser.parse_args()
+
+    source = php_source(options.lines)
+    middle = source.index('return $result;', len(source) / 2)
+    edited = source[:middle] + 'return $result . "\\n";\n\n' + source[middle + 15:]
+
+    batch.get_parser()
+    tmpdir = mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'large.php')
+        print('%d lines, %.1f MB' % (options.lines, len(source) / 1048576.0))
+        for incremental in (False, True):
+            cold, edit = refresh(path, source, edited, options.mode, incremental)
+            print('%-11s cold %6.3f s, after edit %6.3f s' %
+                  ('incremental' if incremental else 'full', cold, edit))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
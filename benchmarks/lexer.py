@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Measures lexer throughput in tokens per second.
+
+Compares the PLY lexer (phplex.lexer) with the hand-written scanner
+(phpscan.lexer) over a synthetic file; both produce the same tokens.
+
+    $ python benchmarks/lexer.py [--lines 20000] [-n REPEAT]
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def tokenize(lexer, source):
+    lexer = lexer.clone()
+    lexer.input(source)
+
+    count = 0
+    started = time.time()
+    while lexer.token():
+        count += 1
+
+    return count, time.time() - started
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('-n', dest='repeat', type=int, default=5)
+    options = parser.parse_args()
+
+    from phply import phplex, phpscan
+    source = php_source(options.lines).decode('utf-8')
+
+    for name, lexer in (('phplex', phplex.lexer), ('phpscan', phpscan.lexer)):
+        timings = []
+        for _ in range(options.repeat):
+            count, elapsed = tokenize(lexer, source)
+            timings.append(elapsed)
+
+        best = min(timings)
+        print('%-8s %d tokens in %.3f s (%8.0f tokens/s)' % (name, count, best, count / best))
+
+
+if __name__ == '__main__':
+    main()
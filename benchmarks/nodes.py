@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Measures the cost of allocating phpast nodes.
+
+Compares node construction against the former ``__dict__``-based Node
+(reproduced below as LegacyNode), then parses a synthetic file and reports
+the parse time, the number of nodes and the peak RSS of the process.
+
+    $ python benchmarks/nodes.py [--lines 20000]
+"""
+import os
+import sys
+import gc
+import time
+import resource
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from phply import phpast as ast
+from synthetic import php_source
+
+
+class LegacyNode(object):
+    fields = ['name', 'params', 'nodes', 'is_ref']
+
+    def __init__(self, *args, **kwargs):
+        assert len(self.fields) == len(args), \
+            '%s takes %d arguments' % (self.__class__.__name__,
+                                       len(self.fields))
+        try:
+            self.lineno = kwargs['lineno']
+        except KeyError:
+            self.lineno = None
+        for i, field in enumerate(self.fields):
+            setattr(self, field, args[i])
+
+
+def construct(cls, count):
+    started = time.time()
+    nodes = [cls('f', [], [], False, lineno=i) for i in xrange(count)]
+    elapsed = time.time() - started
+
+    node = nodes[0]
+    size = sys.getsizeof(node) + sys.getsizeof(getattr(node, '__dict__', None) or ())
+    return elapsed, size
+
+
+def count_nodes(tree):
+    counter = [0]
+
+    def visitor(node):
+        counter[0] += 1
+
+    for node in tree:
+        if isinstance(node, ast.Node):
+            node.accept(visitor)
+
+    return counter[0]
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--count', type=int, default=200000)
+    options = parser.parse_args()
+
+    for name, cls in (('legacy Node', LegacyNode), ('phpast.Function', ast.Function)):
+        elapsed, size = construct(cls, options.count)
+        print('%-16s %d nodes in %.3f s (%4d bytes/node)' % (name, options.count, elapsed, size))
+        gc.collect()
+
+    from phply.phplex import lexer
+    from phply.phpparse import parser as php_parser
+    source = php_source(options.lines).decode('utf-8')
+
+    started = time.time()
+    tree = php_parser.parse(source, lexer=lexer.clone())
+    elapsed = time.time() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print('parsed %d lines into %d nodes in %.2f s, peak RSS %.1f MB' %
+          (source.count('\n'), count_nodes(tree), elapsed, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Measures how fast a cold cache is filled by phply.batch.parse_files.
+
+Writes --files synthetic PHP files to a temporary directory and parses
+them into an empty cache with one worker process and with --jobs worker
+processes.
+
+    $ python benchmarks/prewarm.py [--files 200] [--lines 500] [-j JOBS]
+"""
+import os
+import sys
+import time
+import shutil
+from tempfile import mkdtemp
+from argparse import ArgumentParser
+from multiprocessing import cpu_count
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def prewarm(srcdir, paths, jobs):
+    from phply.batch import parse_files
+    from phply.cache import DiskCache
+
+    cachedir = mkdtemp()
+    try:
+        cache = DiskCache(cachedir, srcdir)
+        started = time.time()
+        for path, error in parse_files(paths, cache, 'declarations', jobs):
+            if error:
+                raise error
+
+        return time.time() - started
+    finally:
+        shutil.rmtree(cachedir)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--lines', type=int, default=500)
+    parser.add_argument('-j', dest='jobs', type=int, default=cpu_count())
+    options = parser.parse_args()
+
+    srcdir = mkdtemp()
+    try:
+        paths = []
+        for n in range(options.files):
+            path = os.path.join(srcdir, 'file%d.php' % n)
+            with open(path, 'wb') as f:
+                f.write(php_source(options.lines))
+            paths.append(path)
+
+        for jobs in (1, options.jobs):
+            elapsed = prewarm(srcdir, paths, jobs)
+            print('%2d jobs: %d files in %.3f s (%6.1f files/s)' %
+                  (jobs, options.files, elapsed, options.files / elapsed))
+    finally:
+        shutil.rmtree(srcdir)
+
+
+if __name__ == '__main__':
+    main()
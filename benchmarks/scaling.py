@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Checks that parse time grows linearly with the length of statement lists.
+
+Parses synthetic files with N top-level statements and a class with N
+members for each N, and fails if the time per statement or member grows
+by more than --tolerance between consecutive sizes.
+
+    $ python benchmarks/scaling.py [--sizes 1000,10000,100000] [--tolerance 2.0]
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+
+def statements(count):
+    return u'<?php\n' + u''.join(u'$v%d = %d;\n' % (i, i) for i in xrange(count))
+
+
+def members(count):
+    lines = [u'<?php\nclass Members {\n']
+    for i in xrange(count):
+        if i % 2:
+            lines.append(u'    public $m%d = array(%d, %d);\n' % (i, i, i))
+        else:
+            lines.append(u'    public function m%d($a, $b) { return $a; }\n' % i)
+    lines.append(u'}\n')
+    return u''.join(lines)
+
+
+def measure(source):
+    from phply.phpparse import parser
+    from phply.phpscan import Lexer
+
+    started = time.time()
+    parser.parse(source, lexer=Lexer(comments='doc'))
+    return time.time() - started
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--tolerance', type=float, default=2.0)
+    options = parser.parse_args()
+    sizes = [int(size) for size in options.sizes.split(',')]
+
+    failed = False
+    for name, generate in (('statements', statements), ('members', members)):
+        last = None
+        for size in sizes:
+            elapsed = measure(generate(size))
+            per_item = elapsed / size
+            growth = per_item / last if last else 1.0
+            print('%-10s %7d  %7.3f s  %6.2f us/item  x%.2f' %
+                  (name, size, elapsed, per_item * 1e6, growth))
+            if growth > options.tolerance:
+                failed = True
+            last = per_item
+
+    if failed:
+        print('time per item grew by more than x%.1f' % options.tolerance)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Measures how fast one large file is parsed when it is split at its
+top-level declarations and the pieces are parsed in parallel.
+
+Parses a synthetic file of --lines lines with phply.batch.parse() and
+with phply.batch.iterparse_parallel() on --jobs worker processes, and
+checks that both give the same statements.
+
+    $ python benchmarks/splitparse.py [--lines 50000] [--mode full] [-j JOBS]
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from multiprocessing import cpu_count
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def main():
+    from phply import batch
+
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=50000)
+    parser.add_argument('--mode', default='full', choices=('declarations', 'lazy', 'full'))
+    parser.add_argument('-j', dest='jobs', type=int, default=cpu_count())
+    options = parser.parse_args()
+
+    source = php_source(options.lines).decode('utf-8')
+    batch.get_parser()
+    print('%d lines, %.1f MB, %d chunks' %
+          (options.lines, len(source) / 1048576.0, len(batch.split(source, options.jobs * 4) or [])))
+
+    started = time.time()
+    expected = batch.parse(source, options.mode)
+    print('sequential   %6.2f s' % (time.time() - started))
+
+    started = time.time()
+    statements = list(batch.iterparse_parallel(source, options.mode, options.jobs))
+    print('%2d jobs      %6.2f s' % (options.jobs, time.time() - started))
+    assert statements == expected
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Measures the peak memory of parsing a large file into the cache.
+
+Writes a synthetic file of --lines lines and, each in a fresh process,
+parses it with phply.batch.parse() and stores the whole tree, or streams
+it with phply.batch.iterparse() statement by statement.
+
+    $ python benchmarks/streaming.py [--lines 200000] [--mode full]
+"""
+import os
+import sys
+import time
+import shutil
+import resource
+import subprocess
+from tempfile import mkdtemp
+from argparse import ArgumentParser, SUPPRESS
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def run(method, path, mode):
+    from phply import batch
+    from phply.cache import DiskCache, digest
+
+    batch.get_parser()
+    baseline = reset_peak_memory()
+
+    cachedir = mkdtemp()
+    try:
+        cache = DiskCache(cachedir, os.path.dirname(path))
+        with open(path, 'rb') as f:
+            source = f.read()
+
+        started = time.time()
+        if method == 'parse':
+            tree = batch.parse(source.decode('utf-8'), mode)
+        else:
+            tree = batch.iterparse(source.decode('utf-8'), mode)
+        cache.store(path, tree, os.stat(path), digest(source))
+        elapsed = time.time() - started
+    finally:
+        shutil.rmtree(cachedir)
+
+    peak = peak_memory()
+    print('%-9s %6.2f s, peak memory +%d MB' % (method, elapsed, (peak - baseline) / 1024))
+
+
+def reset_peak_memory():
+    # Loading the parsing tables peaks higher than parsing small inputs;
+    # Linux can reset the high-water mark (see proc(5), clear_refs)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except IOError:
+        pass
+    return current_memory()
+
+
+def current_memory():
+    return proc_status('VmRSS') or resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def peak_memory():
+    return proc_status('VmHWM') or resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def proc_status(field):
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except IOError:
+        return None
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--mode', default='full', choices=('declarations', 'lazy', 'full'))
+    parser.add_argument('--run', choices=('parse', 'iterparse'), help=SUPPRESS)
+    parser.add_argument('path', nargs='?', help=SUPPRESS)
+    options = parser.parse_args()
+
+    if options.run:
+        run(options.run, options.path, options.mode)
+        return
+
+    tmpdir = mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'large.php')
+        with open(path, 'wb') as f:
+            f.write(php_source(options.lines))
+        print('%d lines, %.1f MB' % (options.lines, os.path.getsize(path) / 1048576.0))
+
+        for method in ('parse', 'iterparse'):
+            subprocess.check_call([sys.executable, __file__, '--mode', options.mode,
+                                   '--run', method, path])
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
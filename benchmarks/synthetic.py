@@ -0,0 +1,61 @@
+"""
+Generators of synthetic PHP sources shared by the benchmarks.
+"""
+
+CLASS_TEMPLATE = '''/**
+ * Class number %(n)d.
+ */
+class Generated%(n)d extends Base implements Countable {
+    /**
+     * @var array
+     */
+    public $items = array();
+    protected $count = 0;
+
+    /**
+     * Adds an item.
+     */
+    public function add($key, $value = null) {
+        if (isset($this->items[$key])) {
+            throw new Exception("duplicated key: $key");
+        }
+        $this->items[$key] = $value;
+        $this->count += 1;
+        return $this;
+    }
+
+    public function count() {
+        $total = 0;
+        foreach ($this->items as $key => $value) {
+            $total = $total + strlen($key) * 2 - 1;
+        }
+        return $total;
+    }
+}
+
+'''
+
+FUNCTION_TEMPLATE = '''/**
+ * Function number %(n)d.
+ */
+function generated_%(n)d($a, array $b = array(1, 2, 3)) {
+    $result = $a . '-' . implode(',', $b);
+    return $result;
+}
+
+'''
+
+
+def php_source(lines):
+    """Returns a PHP file of roughly *lines* lines of classes and functions."""
+    chunks = ['<?php\n']
+    n = 0
+    total = 1
+    while total < lines:
+        for template in (CLASS_TEMPLATE, FUNCTION_TEMPLATE):
+            chunk = template % {'n': n}
+            chunks.append(chunk)
+            total += chunk.count('\n')
+        n += 1
+
+    return ''.join(chunks)
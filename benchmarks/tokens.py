@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Compares the token objects of the lexers with phpscan.TokenBuffer.
+
+Scans a synthetic file of --lines lines with phplex.lexer (the PLY lexer
+through FilteredLexer), with phpscan.Lexer, and into a TokenBuffer, and
+reports the best time of each and the memory all of its tokens take when
+they are kept.
+
+    $ python benchmarks/tokens.py [--lines 20000] [--repeat 3]
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from synthetic import php_source
+
+
+def footprint(objects):
+    # Bytes taken by objects and their values, each object counted once
+    size = sys.getsizeof(objects)
+    seen = set()
+    for obj in objects:
+        for value in (obj, getattr(obj, '__dict__', None), obj.value):
+            if value is not None and id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+
+    return size
+
+
+def buffer_footprint(buffer):
+    return sum(sys.getsizeof(column) for column in (buffer.types, buffer.starts, buffer.ends))
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.time()
+        result = func()
+        elapsed = time.time() - started
+        best = min(best or elapsed, elapsed)
+
+    return best, result
+
+
+def main():
+    from phply import phplex, phpscan
+
+    parser = ArgumentParser()
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args()
+
+    source = php_source(options.lines).decode('utf-8')
+    print('%d lines, %.1f MB' % (options.lines, len(source) / 1048576.0))
+
+    def scan(lexer):
+        lexer = lexer.clone()
+        lexer.input(source)
+        return list(lexer)
+
+    def tokenize():
+        lexer = phpscan.Lexer()
+        lexer.input(source)
+        return lexer.tokenize()
+
+    for name, func, size in (('phplex', lambda: scan(phplex.lexer), footprint),
+                             ('phpscan', lambda: scan(phpscan.lexer), footprint),
+                             ('buffer', tokenize, buffer_footprint)):
+        elapsed, tokens = best_of(options.repeat, func)
+        print('%-8s %d tokens in %.3f s, %6.1f MB (%.0f bytes/token)' %
+              (name, len(tokens), elapsed, size(tokens) / 1048576.0,
+               size(tokens) / float(len(tokens))))
+        del tokens
+
+
+if __name__ == '__main__':
+    main()
@@ -22,7 +22,13 @@ setup(
          'ply',
          'sphinxcontrib-phpdomain',
          'six',
+         'futures',
      ),
+     entry_points={
+         'console_scripts': [
+             'phpautodoc-prewarm = sphinxcontrib_phpautodoc:prewarm_main',
+         ],
+     },
      extras_require=dict(
          test=[
              'mock'
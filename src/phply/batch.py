@@ -0,0 +1,768 @@
+# ----------------------------------------------------------------------
+# batch.py
+#
+# Parses PHP files into the on-disk cache, one at a time or many at
+# once across a pool of worker processes.
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import copy
+import threading
+from collections import namedtuple
+import phpast as ast
+from source import Source, digest
+
+_parser = None
+_dense_parser = None
+_parser_lock = threading.Lock()
+
+ENGINES = ('ply', 'dense')
+_engine = 'ply'
+_positions = False
+
+
+def set_engine(name):
+    """Selects the LALR engine that parses: ``ply``, PLY's own parser, or
+    ``dense``, :class:`engine.Parser`, which runs the same tables from
+    integer-indexed arrays and builds identical trees.
+    """
+    global _parser, _engine
+    if name not in ENGINES:
+        raise ValueError('unknown parse engine: %r' % name)
+
+    with _parser_lock:
+        if name != _engine:
+            _engine = name
+            _parser = None
+
+
+def set_positions(enabled):
+    """Selects whether the nodes carry ``lexpos`` and ``lexend``, the
+    offsets of their text in the source; they are None by default.
+
+    Tracking them wraps every reduction of PLY's parser in a function
+    that passes the offsets of the symbols on, which slows it down.
+    """
+    global _parser, _dense_parser, _positions
+    with _parser_lock:
+        if enabled != _positions:
+            _positions = enabled
+            _parser = _dense_parser = None
+
+
+def get_parser(stream=False):
+    """Returns phply's lexer and parser; they are built on first use.
+
+    Both are shared prototypes; use :func:`parse`, which works on copies of
+    them, so that any number of threads can parse at the same time.  With
+    *stream*, the parser is an :class:`engine.Parser` whichever the engine
+    is, as PLY's own parser cannot yield the statements it reduces.
+    """
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            from phpscan import Lexer
+            from phpparse import parser, track_positions
+            if _engine == 'dense':
+                parser = dense_parser()
+            elif _positions:
+                parser = track_positions(parser)
+            _parser = (Lexer(comments='doc'), parser)
+        if stream:
+            return _parser[0], dense_parser()
+
+    return _parser
+
+
+def dense_parser():
+    # Called with _parser_lock held; both engines share one
+    global _dense_parser
+    if _dense_parser is None:
+        from engine import Parser
+        from phpparse import parser
+        _dense_parser = Parser(parser, _positions)
+
+    return _dense_parser
+
+
+class ParseError(SyntaxError):
+    """Raised for source code that cannot be parsed.
+
+    *tree* holds the declarations parsed before the error point.
+    """
+    tree = None
+
+
+class LimitExceeded(ParseError):
+    """Raised when parsing a file exceeds one of its :class:`Limits`."""
+
+
+class Limits(namedtuple('Limits', 'max_size timeout max_nodes')):
+    """Per-file limits on the source size in bytes, the parse time in
+    seconds and the number of nodes in the tree; None is unlimited.
+
+    A parse with a time or node limit runs in a child process, which is
+    killed when it runs out of time.
+    """
+
+    def __new__(cls, max_size=None, timeout=None, max_nodes=None):
+        return super(Limits, cls).__new__(cls, max_size, timeout, max_nodes)
+
+    @property
+    def isolated(self):
+        return self.timeout is not None or self.max_nodes is not None
+
+
+NODE_LIMIT_EXCEEDED = 3
+
+# Sources larger than this are parsed and written to the cache one
+# top-level statement at a time, and read back lazily
+STREAM_SIZE = 4 * 1024 * 1024
+
+
+def is_large(path):
+    return os.stat(path).st_size > STREAM_SIZE
+
+
+def pack_error(exc, limits=None):
+    if isinstance(exc, LimitExceeded):
+        return (exc.msg, None, None, None, tuple(limits))
+    else:
+        return (exc.msg, exc.lineno, exc.text, exc.tree)
+
+
+def unpack_error(entry):
+    if len(entry) == 5:
+        exc = LimitExceeded(entry[0])
+    else:
+        msg, lineno, text, tree = entry
+        exc = ParseError(msg, (None, lineno, None, text))
+        exc.tree = tree
+    return exc
+
+
+def count_nodes(tree):
+    count = 0
+    stack = [tree]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, ast.Node):
+            count += 1
+            stack.extend(getattr(obj, field) for field in obj.fields)
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return count
+
+
+def parse(source, mode='full'):
+    """Parses PHP source code.
+
+    In ``declarations`` mode, the bodies of functions and methods are skipped
+    and left empty; everything the directives render is parsed as usual.
+    In ``lazy`` mode, the bodies of functions, methods and closures are
+    skipped as well, but parsed from the source when they are first read
+    (see :class:`source.Source`).  Raises :class:`ParseError` on a syntax
+    error.
+    """
+    lexer, parser = new_parser(mode)
+    try:
+        return parser.parse(source, lexer=lexer)
+    except SyntaxError as exc:
+        raise parse_error(exc, parser)
+
+
+def iterparse(source, mode='full'):
+    """Like :func:`parse`, but yields the top-level statements one at a
+    time as they are parsed.
+
+    After a syntax error, the partial tree of the :class:`ParseError` only
+    holds the statements not yielded yet.
+    """
+    lexer, parser = new_parser(mode, stream=True)
+    try:
+        for node in parser.iterparse(source, lexer):
+            yield node
+    except SyntaxError as exc:
+        raise parse_error(exc, parser)
+
+
+# Tokens that start a top-level declaration, and tokens after which a
+# file is not split: alternative syntax blocks may hold declarations at
+# brace depth zero, and __halt_compiler() ends the PHP code.
+SPLIT_START = frozenset(['FUNCTION', 'CLASS', 'INTERFACE', 'ABSTRACT', 'FINAL'])
+UNSPLITTABLE = frozenset(['ENDIF', 'ENDWHILE', 'ENDFOR', 'ENDFOREACH', 'ENDSWITCH',
+                          'ENDDECLARE', 'HALT_COMPILER'])
+
+# Sources larger than this are split for parse_parallel()
+SPLIT_SIZE = 256 * 1024
+
+
+def split_points(source):
+    """Returns the offsets where top-level declarations start, including
+    the comments right before them, or None if the file cannot be split.
+
+    A declaration is only split off after a statement ended at brace depth
+    zero; strings and heredocs are skipped over by the scanner.
+    """
+    result = scan(source)
+    return result and result[0]
+
+
+def scan(source, php=False):
+    """Returns the :func:`split_points` of *source* and whether it ends
+    right after a complete top-level statement, or None.
+
+    With *php*, *source* starts in PHP code rather than in inline HTML.
+    """
+    from phpscan import Lexer
+
+    lexer = Lexer()
+    lexer.input(source)
+    if php:
+        lexer.begin('php')
+
+    points = []
+    depth = 0
+    last = None
+    comments = None
+    for t in iter(lexer.token, None):
+        if t.type in ('COMMENT', 'DOC_COMMENT'):
+            if comments is None:
+                comments = t.lexpos
+            continue
+        elif t.type in UNSPLITTABLE:
+            return None
+        elif t.type in SPLIT_START and depth == 0 and last in ('SEMI', 'RBRACE'):
+            points.append(t.lexpos if comments is None else comments)
+        elif t.type in ('LBRACE', 'CURLY_OPEN', 'DOLLAR_OPEN_CURLY_BRACES'):
+            depth += 1
+        elif t.type == 'RBRACE':
+            depth -= 1
+
+        last = t.type
+        comments = None
+
+    if last is None:
+        closed = comments is None
+    else:
+        closed = (comments is None and depth == 0 and last in ('SEMI', 'RBRACE') and
+                  lexer.current_state() == 'php')
+    return points, closed
+
+
+def split(source, count):
+    """Splits *source* into at most *count* chunks of similar size at
+    :func:`split_points`; returns (chunk, lineno) pairs, or None.
+
+    The first chunk is the start of the file and has no lineno.
+    """
+    points = split_points(source)
+    if not points:
+        return None
+
+    chunks = []
+    start = 0
+    lineno = 1
+    for point in points:
+        if point - start >= len(source) / count:
+            chunks.append((source[start:point], lineno if start else None))
+            lineno += chunks[-1][0].count('\n')
+            start = point
+    chunks.append((source[start:], lineno))
+    return chunks
+
+
+def parse_chunk(source, start, end, lineno, mode):
+    # Parses source[start:end] in place, so that the offsets of the nodes
+    # and lazy bodies are those in the whole source
+    lexer, parser = new_parser(mode)
+    lexer.input(source)
+    scanner = getattr(lexer, 'lexer', lexer)
+    scanner.lexpos = start
+    scanner.lexlen = end
+    if lineno is not None:
+        # The chunk starts in PHP code, right after a top-level statement
+        scanner.begin('php')
+        scanner.lineno = lineno
+        scanner.last_type = 'SEMI'
+    return parser.parse(lexer=lexer)
+
+
+def iterparse_parallel(source, mode='full', max_workers=None):
+    """Like :func:`iterparse`, but splits *source* at its top-level
+    declarations and parses the chunks across a pool of processes.
+
+    The statements are the same as those of a sequential parse; a file
+    that cannot be split safely is parsed sequentially.
+    """
+    from multiprocessing import cpu_count
+    from concurrent.futures import ProcessPoolExecutor
+    from phpparse import add_statement
+
+    # Lazy bodies refer to the whole source; without their bodies, the
+    # pieces are not worth sending to other processes anyway
+    max_workers = max_workers or cpu_count()
+    chunks = mode != 'lazy' and split(source, max_workers * 4)
+    if not chunks or len(chunks) == 1:
+        for node in iterparse(source, mode):
+            yield node
+        return
+
+    starts = [0]
+    for chunk, lineno in chunks:
+        starts.append(starts[-1] + len(chunk))
+
+    get_parser()
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(parse_chunk, chunk, 0, len(chunk), lineno, mode)
+                   for chunk, lineno in chunks]
+        try:
+            statements = []
+            for start, future in zip(starts, futures):
+                # A doc comment at the end of a chunk is attached to the
+                # declaration starting the next one, as add_statement()
+                # would have done in a sequential parse
+                for node in future.result():
+                    add_statement(statements, shift_lines(node, 0, start))
+
+                count = len(statements)
+                if count and isinstance(statements[-1], ast.Comment):
+                    count -= 1
+                for node in statements[:count]:
+                    yield node
+                del statements[:count]
+
+            for node in statements:
+                yield node
+        except SyntaxError:
+            for future in futures:
+                future.cancel()
+
+            # Report the error, and its partial tree, as a sequential
+            # parse does
+            parse(source, mode)
+            raise
+
+
+def fingerprint(text):
+    return digest(text.encode('utf-8'))
+
+
+def iterparse_spans(source, mode, spans, workers=None):
+    """Like :func:`iterparse`, but parses *source* one top-level
+    declaration at a time, appending the span of each to *spans*.
+
+    A span is ``(start, end, lineno, count, fingerprint)``: the offsets and
+    first line of the declaration and the statements up to the next one,
+    the number of top-level statements they parse to, and a digest of their
+    text.  *spans* is left empty if the file cannot be split.  With
+    *workers*, a file larger than :data:`SPLIT_SIZE` is parsed across that
+    many processes.
+    """
+    points = split_points(source)
+    if points is None:
+        for node in iterparse(source, mode):
+            yield node
+        return
+
+    try:
+        for node in parse_pieces(source, [0] + points + [len(source)], 1, mode, spans, workers):
+            yield node
+    except SyntaxError:
+        # Report the error, and its partial tree, as a sequential parse does
+        del spans[:]
+        parse(source, mode)
+        raise
+
+
+def parse_pieces(source, bounds, lineno, mode, spans, workers=None):
+    starts = []
+    chunks = []
+    linenos = []
+    for start, end in zip(bounds, bounds[1:]):
+        starts.append(start)
+        chunks.append(source[start:end])
+        linenos.append(lineno)
+        lineno += chunks[-1].count('\n')
+
+    if workers and mode != 'lazy' and bounds[-1] - bounds[0] > SPLIT_SIZE:
+        from concurrent.futures import ProcessPoolExecutor
+
+        get_parser()
+        executor = ProcessPoolExecutor(workers)
+        chunksize = max(1, len(chunks) / (workers * 4))
+        results = executor.map(parse_chunk, chunks, [0] * len(chunks), map(len, chunks),
+                               [n if start else None for start, n in zip(starts, linenos)],
+                               [mode] * len(chunks), chunksize=chunksize)
+    else:
+        executor = None
+        results = (parse_chunk(source, start, start + len(chunk), n if start else None, mode)
+                   for start, chunk, n in zip(starts, chunks, linenos))
+
+    try:
+        for start, chunk, n, nodes in zip(starts, chunks, linenos, results):
+            spans.append((start, start + len(chunk), n, len(nodes), fingerprint(chunk)))
+            for node in nodes:
+                # The workers parse the chunks on their own
+                if executor:
+                    shift_lines(node, 0, start)
+                yield node
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def reparse(source, tree, spans, mode, new_spans, workers=None):
+    """Parses *source*, a changed version of the source that *tree* was
+    parsed from by :func:`iterparse_spans`, appending its spans to
+    *new_spans*.
+
+    The declarations whose fingerprints still match at the start and at the
+    end of the file are taken from *tree*, with their line numbers shifted;
+    only the text between them is scanned and parsed.  Falls back to a full
+    parse if that text does not end with a complete statement.
+    """
+    from itertools import islice
+
+    delta = len(source) - spans[-1][1]
+    head = 0
+    while head < len(spans) - 1 and unchanged(source, spans[head], 0):
+        head += 1
+
+    # The first declaration starts in inline HTML and is always reparsed
+    # with the text before it
+    tail = len(spans)
+    while tail > max(head, 1) and spans[tail - 1][0] + delta >= spans[head][0] and \
+            unchanged(source, spans[tail - 1], delta):
+        tail -= 1
+
+    start = spans[head][0]
+    if tail < len(spans):
+        end = spans[tail][0] + delta
+    else:
+        end = len(source)
+
+    region = None
+    result = scan(source[start:end], php=start > 0)
+    if result and (result[1] or tail == len(spans)):
+        bounds = [start] + [start + point for point in result[0]] + [end]
+        new_spans.extend(spans[:head])
+        try:
+            region = list(parse_pieces(source, bounds, spans[head][2], mode, new_spans, workers))
+        except SyntaxError:
+            del new_spans[:]
+
+    if region is None:
+        for node in iterparse_spans(source, mode, new_spans, workers):
+            yield node
+        return
+
+    lines = 0
+    if tail < len(spans):
+        lines = source.count('\n', 0, end) + 1 - spans[tail][2]
+    for span in spans[tail:]:
+        new_spans.append((span[0] + delta, span[1] + delta, span[2] + lines) + span[3:])
+
+    nodes = iter(tree)
+    for node in islice(nodes, sum(span[3] for span in spans[:head])):
+        yield node
+    for node in region:
+        yield node
+    for node in islice(nodes, sum(span[3] for span in spans[head:tail]), None):
+        yield shift_lines(node, lines, delta)
+
+
+def unchanged(source, span, delta):
+    start, end, lineno, count, digest = span
+    return end + delta <= len(source) and fingerprint(source[start + delta:end + delta]) == digest
+
+
+def shift_lines(tree, delta, offset=0):
+    """Adds *delta* to the line numbers of the nodes in *tree* and to the
+    values of its ``__LINE__`` constants, and *offset* to their offsets and
+    to the spans of lazy bodies, in place; deferred fields are shifted when
+    they are resolved."""
+    if not delta and not offset:
+        return tree
+
+    stack = [tree]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, ast.Node):
+            # Nodes built from a nonterminal without a position have line 0
+            if obj.lineno:
+                obj.lineno += delta
+            if obj.lexpos is not None:
+                obj.lexpos += offset
+                obj.lexend += offset
+            if isinstance(obj, ast.MagicConstant) and obj.name == '__LINE__':
+                obj.value += delta
+            for slot in obj.__slots__:
+                value = getattr(obj, slot)
+                if isinstance(value, ast.SourceBody):
+                    setattr(obj, slot, ast.SourceBody(value.source, value.start + offset,
+                                                      value.end + offset, value.lineno + delta))
+                elif isinstance(value, ast.Deferred):
+                    setattr(obj, slot, ast.Deferred(resolve_shifted, value, delta, offset))
+                else:
+                    stack.append(value)
+        elif isinstance(obj, list):
+            stack.extend(obj)
+
+    return tree
+
+
+def resolve_shifted(deferred, delta, offset):
+    return shift_lines(deferred.resolve(), delta, offset)
+
+
+def new_parser(mode, stream=False):
+    lexer, parser = get_parser(stream)
+    lexer = lexer.clone()
+    if mode == 'declarations':
+        from phplex import DeclarationLexer
+        lexer = DeclarationLexer(lexer)
+    elif mode == 'lazy':
+        from phplex import DeclarationLexer
+        lexer = DeclarationLexer(lexer, Source)
+
+    # The parsing tables are shared; the parser's stacks are per copy
+    return lexer, copy.copy(parser)
+
+
+def parse_error(exc, parser):
+    from phpparse import recover
+    error = ParseError(exc.msg, (None, exc.lineno, None, exc.text))
+    error.tree = recover(getattr(parser, 'symstack', []))
+    return error
+
+
+def parse_file(path, cache, mode='full', limits=Limits(), workers=None):
+    """Parses the file at *path* and stores the result in *cache*.
+
+    A file that fails to parse is stored as well, so that the error is
+    raised again without parsing until the content of the file changes.
+    Raises :class:`LimitExceeded` if parsing the file exceeds *limits*.
+    If *workers* is given, a file larger than :data:`SPLIT_SIZE` is parsed
+    by :func:`iterparse_parallel` across that many processes.
+    """
+    if limits.max_size is not None and os.stat(path).st_size > limits.max_size:
+        raise LimitExceeded('source size limit exceeded (%d bytes)' % limits.max_size)
+    elif limits.isolated:
+        return parse_isolated(path, cache, mode, limits, workers)
+    else:
+        return store_file(path, cache, mode, workers=workers)
+
+
+def store_file(path, cache, mode, max_nodes=None, workers=None):
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        source = f.read()
+
+    large = len(source) > STREAM_SIZE
+    spans = []
+    streamed = False
+    try:
+        text = source.decode('utf-8')
+        previous = None
+        if getattr(cache, 'incremental', False):
+            previous = cache.previous(path, large, Source(text))
+
+        streamed = True
+        if previous:
+            statements = reparse(text, previous[0], previous[1], mode, spans, workers)
+        elif getattr(cache, 'incremental', False):
+            statements = iterparse_spans(text, mode, spans, workers)
+        elif workers and len(source) > SPLIT_SIZE:
+            # It reports errors as a sequential parse does
+            statements = iterparse_parallel(text, mode, workers)
+            streamed = False
+        elif large:
+            statements = iterparse(text, mode)
+        else:
+            statements = None
+            streamed = False
+
+        if large:
+            # Only one top-level statement is in memory at a time
+            cache.store(path, limit_nodes(statements, max_nodes), stat, digest(source), spans)
+            return cache.load(path, lazy=True)
+        elif statements is not None:
+            tree = list(statements)
+        else:
+            tree = parse(text, mode)
+    except LimitExceeded:
+        raise
+    except ParseError as exc:
+        if streamed:
+            # The partial tree of a streamed parse only holds the
+            # statements not yielded yet; report it as parse() does
+            exc = sequential_error(text, mode) or exc
+        cache.store(path, pack_error(exc), stat, digest(source))
+        raise exc
+
+    if max_nodes is not None and count_nodes(tree) > max_nodes:
+        raise node_limit_exceeded(max_nodes)
+
+    cache.store(path, tree, stat, digest(source), spans)
+    return tree
+
+
+def sequential_error(text, mode):
+    try:
+        parse(text, mode)
+    except ParseError as exc:
+        return exc
+
+
+def limit_nodes(statements, max_nodes):
+    count = 0
+    for node in statements:
+        if max_nodes is not None:
+            count += count_nodes(node)
+            if count > max_nodes:
+                raise node_limit_exceeded(max_nodes)
+        yield node
+
+
+def node_limit_exceeded(max_nodes):
+    return LimitExceeded('node count limit exceeded (%d nodes)' % max_nodes)
+
+
+def isolated_worker(path, cache, mode, max_nodes, workers):
+    try:
+        store_file(path, cache, mode, max_nodes, workers)
+    except LimitExceeded:
+        sys.exit(NODE_LIMIT_EXCEEDED)
+    except ParseError:
+        pass  # stored in the cache
+
+
+def parse_isolated(path, cache, mode, limits, workers=None):
+    from multiprocessing import Process
+
+    # The child parses the file into the cache, where it is read back from
+    worker = Process(target=isolated_worker, args=(path, cache, mode, limits.max_nodes, workers))
+    worker.start()
+    worker.join(limits.timeout)
+    if worker.is_alive():
+        worker.terminate()
+        worker.join()
+        cache.discard_temp(path, worker.pid)
+        error = LimitExceeded('parse time limit exceeded (%s seconds)' % limits.timeout)
+    elif worker.exitcode == NODE_LIMIT_EXCEEDED:
+        error = node_limit_exceeded(limits.max_nodes)
+    elif worker.exitcode != 0:
+        cache.discard_temp(path, worker.pid)
+        raise LimitExceeded('parse worker exited with code %d' % worker.exitcode)
+    else:
+        entry = cache.load(path, is_large(path))
+        if entry is None:
+            raise IOError('parse worker did not store the tree of %s' % path)
+        elif isinstance(entry, tuple):
+            raise unpack_error(entry)
+        else:
+            return entry
+
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        checksum = digest(f.read())
+    cache.store(path, pack_error(error, limits), stat, checksum)
+    raise error
+
+
+def load_file(path, cache, mode='full', limits=Limits(), workers=None):
+    """Returns the tree of the file at *path*, parsing it unless cached.
+
+    A limit failure is cached along with the limits it was hit with, and
+    ignored once they change.
+    """
+    entry = cache.load(path, is_large(path))
+    if entry is None:
+        return parse_file(path, cache, mode, limits, workers)
+    elif not isinstance(entry, tuple):
+        return entry
+    elif len(entry) == 5 and entry[4] != tuple(limits):
+        return parse_file(path, cache, mode, limits, workers)
+    else:
+        raise unpack_error(entry)
+
+
+def prewarm(path, cache, mode, limits, workers=None):
+    load_file(path, cache, mode, limits, workers)
+
+
+def parse_files(paths, cache, mode='full', max_workers=None, limits=Limits()):
+    """Parses many files into *cache* across a pool of processes.
+
+    Files that are already cached are skipped, and each file is parsed
+    under *limits*.  Yields ``(path, error)`` for
+    each file as soon as it is done, where *error* is the exception raised
+    while parsing it, or None.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Build the tables before the workers fork, so that each of them
+    # starts with a ready parser
+    get_parser()
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = dict((executor.submit(prewarm, path, cache, mode, limits), path) for path in paths)
+        for future in as_completed(futures):
+            yield futures[future], future.exception()
+
+
+class Prefetcher(object):
+    """Parses files into their caches in the background.
+
+    Files are handed to a pool of *max_workers* processes, which is started
+    on the first call to :meth:`submit`.  :meth:`wait` blocks until the
+    parse of one file is done, so that the tree can be read from the cache.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.executor = None
+        self.owner = None
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def submit(self, path, cache, mode, limits=Limits(), workers=None):
+        with self.lock:
+            if self.executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                get_parser()
+                self.executor = ProcessPoolExecutor(self.max_workers)
+                self.owner = os.getpid()
+
+            if (path, mode) not in self.pending:
+                future = self.executor.submit(prewarm, path, cache, mode, limits, workers)
+                self.pending[(path, mode)] = future
+
+    def wait(self, path, mode):
+        # Processes forked from the owner (e.g. by sphinx-build -j) share
+        # the cache but not the pool; they just parse on their own
+        if self.owner != os.getpid():
+            return
+
+        with self.lock:
+            future = self.pending.pop((path, mode), None)
+
+        if future:
+            try:
+                future.result()
+            except Exception:
+                pass  # the caller loads the error from the cache and reports it
+
+    def shutdown(self):
+        with self.lock:
+            for future in self.pending.values():
+                future.cancel()
+            self.pending.clear()
+
+            if self.executor and self.owner == os.getpid():
+                self.executor.shutdown()
+            self.executor = None
+            self.owner = None
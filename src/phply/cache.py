@@ -0,0 +1,267 @@
+# ----------------------------------------------------------------------
+# cache.py
+#
+# Caches for parsed PHP syntax trees.
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+import struct
+import marshal
+import glob
+import tempfile
+import threading
+from collections import OrderedDict
+import phpast as ast
+import serialize
+from source import Source, digest
+
+
+def sizeof(tree):
+    """Returns the approximate memory footprint of *tree* in bytes."""
+    size = 0
+    seen = set()
+    stack = [tree]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, ast.Node):
+            stack.extend(getattr(obj, slot) for slot in obj.__slots__)
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, ast.SourceBody):
+            stack.append(obj.source._text)
+        elif isinstance(obj, ast.Deferred):
+            stack.append(getattr(obj.func, '__self__', None))
+            stack.extend(obj.args)
+        elif isinstance(obj, serialize.Decoder):
+            stack.append(obj.data)
+        elif isinstance(obj, serialize.Statements):
+            stack.append(obj.decoder)
+        elif isinstance(obj, Exception):
+            stack.append(getattr(obj, 'tree', None))
+
+    return size
+
+
+class MemoryCache(object):
+    """LRU cache of parsed trees, shared by every directive in the process.
+
+    Entries are keyed by the absolute path of the source file and remember
+    the identity of the content they were parsed from; a lookup with a
+    different identity is a miss.  Least recently used trees are evicted
+    once their estimated size exceeds *budget* bytes.  Trees are shared
+    between callers, so they must not be modified.  The cache may be used
+    from several threads.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, path, identity):
+        with self.lock:
+            entry = self.entries.pop(path, None)
+            if entry is None:
+                return None
+            elif entry[0] != identity:
+                self.size -= entry[2]
+                return None
+            else:
+                self.entries[path] = entry
+                return entry[1]
+
+    def put(self, path, identity, tree):
+        cost = sizeof(tree)
+        with self.lock:
+            self.discard(path)
+            if cost <= self.budget:
+                self.entries[path] = (identity, tree, cost)
+                self.size += cost
+                self.shrink()
+
+    def discard(self, path):
+        with self.lock:
+            entry = self.entries.pop(path, None)
+            if entry:
+                self.size -= entry[2]
+
+    def shrink(self):
+        with self.lock:
+            while self.size > self.budget:
+                path, entry = self.entries.popitem(last=False)
+                self.size -= entry[2]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+class DiskCache(object):
+    """On-disk cache of parsed trees.
+
+    Each source file is stored under a name derived from its path relative
+    to *basedir*, so files sharing a basename do not overwrite each other.
+    Entries record the size, mtime and SHA-1 digest of the content they were
+    parsed from.  Matching size and mtime are trusted as is, unless the file
+    was modified within *mtime_granularity* seconds of the entry being
+    written; otherwise the content is hashed and compared, so a touched but
+    unchanged file is still a hit.
+
+    Entries are written to a temporary file and renamed into place, so
+    processes sharing the cache never see a partially written entry.  A
+    tree given as an iterator of top-level statements is written as it is
+    consumed, and *lazy* loads give back a :class:`serialize.Statements`
+    that decodes them one at a time.
+
+    An entry may also hold the spans of the top-level declarations of the
+    source it was parsed from; with *incremental*, a changed file is
+    reparsed from the :meth:`previous` entry (see :func:`batch.reparse`).
+    """
+    magic = 'PHPC'
+    version = 5
+    header = struct.Struct('<4sIQdd40sQ')
+    mtime_granularity = 2
+
+    def __init__(self, cachedir, basedir, incremental=False):
+        self.cachedir = cachedir
+        self.basedir = basedir
+        self.incremental = incremental
+
+    def cachename(self, path):
+        relpath = os.path.relpath(path, self.basedir)
+        if isinstance(relpath, unicode):
+            relpath = relpath.encode('utf-8')
+
+        return os.path.join(self.cachedir, digest(relpath) + '.parse')
+
+    def tempprefix(self, path, pid=None):
+        # Temporary files are named after the entry and the process that
+        # writes them, so that those of a writer killed midway can be found
+        return '%s.%d.' % (os.path.basename(self.cachename(path)), pid or os.getpid())
+
+    def discard_temp(self, path, pid):
+        """Removes the temporary files left by process *pid* if it was
+        killed while storing the entry of *path*."""
+        pattern = os.path.join(self.cachedir, self.tempprefix(path, pid) + '*.tmp')
+        for tmpname in glob.glob(pattern):
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+
+    def __contains__(self, path):
+        try:
+            stat = os.stat(path)
+            with open(self.cachename(path), 'rb') as f:
+                header = self.header.unpack(f.read(self.header.size))
+                return self.is_fresh(path, stat, header)
+        except Exception:
+            return False
+
+    def load(self, path, lazy=False):
+        try:
+            stat = os.stat(path)
+            with open(self.cachename(path), 'r+b') as f:
+                header = self.header.unpack(f.read(self.header.size))
+                if not self.is_fresh(path, stat, header):
+                    return None
+                elif header[3] != stat.st_mtime:
+                    self.touch(f, stat, header[5], header[6])
+
+                source = Source(path=path, checksum=header[5])
+                return serialize.loads(self.read_tree(f, header), lazy, source)
+        except Exception:
+            return None
+
+    def previous(self, path, lazy=False, source=None):
+        """Returns the tree stored for *path* and the spans it was stored
+        with, even if the file has changed since, or None.
+
+        The spans of lazy bodies in the tree refer to *source*, the
+        :class:`source.Source` of the current file."""
+        try:
+            with open(self.cachename(path), 'rb') as f:
+                header = self.header.unpack(f.read(self.header.size))
+                if header[0] != self.magic or header[1] != self.version or not header[6]:
+                    return None
+
+                tree = serialize.loads(self.read_tree(f, header), lazy, source)
+                return tree, marshal.loads(f.read())
+        except Exception:
+            return None
+
+    def read_tree(self, f, header):
+        if header[6]:
+            return f.read(header[6] - self.header.size)
+        else:
+            return f.read()
+
+    def is_fresh(self, path, stat, header):
+        magic, version, size, mtime, written, checksum, spans = header
+        if magic != self.magic or version != self.version or size != stat.st_size:
+            return False
+        elif mtime == stat.st_mtime and mtime + self.mtime_granularity < written:
+            return True
+        else:
+            with open(path, 'rb') as f:
+                return digest(f.read()) == checksum
+
+    def touch(self, f, stat, checksum, spans):
+        f.seek(0)
+        f.write(self.pack_header(stat, checksum, spans))
+        f.seek(self.header.size)
+
+    def pack_header(self, stat, checksum, spans=0):
+        return self.header.pack(self.magic, self.version, stat.st_size,
+                                stat.st_mtime, time.time(), checksum, spans)
+
+    def store(self, path, tree, stat, checksum, spans=None):
+        try:
+            os.makedirs(self.cachedir)
+        except OSError:
+            if not os.path.isdir(self.cachedir):
+                raise
+
+        fd, tmpname = tempfile.mkstemp(prefix=self.tempprefix(path), suffix='.tmp',
+                                       dir=self.cachedir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.pack_header(stat, checksum))
+                if isinstance(tree, (list, tuple)):
+                    serialize.dump(tree, f)
+                else:
+                    serialize.dump_iter(tree, f)
+
+                if spans:
+                    # Appended after the tree, as they may be collected
+                    # while an iterator of statements is consumed
+                    offset = f.tell()
+                    marshal.dump(spans, f)
+                    f.seek(0)
+                    f.write(self.pack_header(stat, checksum, offset))
+
+            replace(tmpname, self.cachename(path))
+        except:
+            os.unlink(tmpname)
+            raise
+
+
+def replace(src, dst):
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # Windows does not rename over an existing file
+        os.remove(dst)
+        os.rename(src, dst)
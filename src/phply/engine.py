@@ -0,0 +1,224 @@
+# ----------------------------------------------------------------------
+# engine.py
+#
+# A table-driven LALR engine for the PHP grammar.
+#
+# It runs the automaton that PLY built for phpparse, but from dense
+# tables: the actions and gotos of each state are lists indexed by small
+# integers, and each token type is mapped to its integer once, when it is
+# read.  The values and line numbers of the symbols are kept on plain
+# stacks rather than in a YaccSymbol per symbol, and the p_* functions
+# are called with a Production, a list of the values of the right-hand
+# side, so that p[n] and len(p) are plain list operations.
+#
+# The trees are identical to those of PLY's LRParser.parse(), which does
+# not track positions: p.lineno(n) of a nonterminal is 0 there, too.  With
+# positions, the offsets of the nodes are set as by
+# phpparse.track_positions().
+# ----------------------------------------------------------------------
+
+import ply.yacc as yacc
+from phpast import Comment, Node
+
+
+class Production(list):
+    """The right-hand side of a reduction, as passed to the p_* functions."""
+    __slots__ = ('tokens', 'base', 'lexer', 'parser')
+
+    def lineno(self, n):
+        t = self.tokens[self.base + n] if n else None
+        if t is None:
+            return 0
+        else:
+            return t.lineno
+
+
+class EndOfInput(object):
+    type = '$end'
+    value = None
+    lineno = 0
+
+
+END = EndOfInput()
+EMPTY = [None]
+
+
+class Parser(object):
+    """Parses with the tables of a PLY LRParser; a drop-in replacement for
+    its :meth:`parse`, plus :meth:`iterparse`.
+
+    Like LRParser, the parser leaves its state and symbol stacks on
+    ``statestack`` and ``symstack`` after a syntax error, and calls
+    ``errorfunc`` with the offending token (None at the end of input).
+    With *positions*, the nodes get the offsets of their text as well.
+    """
+
+    def __init__(self, parser, positions=False):
+        self.errorfunc = parser.errorfunc
+        self.positions = positions
+        self.statestack = []
+        self.symstack = []
+
+        terminals = set()
+        for actions in parser.action.values():
+            terminals.update(actions)
+        nonterminals = set()
+        for gotos in parser.goto.values():
+            nonterminals.update(gotos)
+
+        self.terminals = ['$end'] + sorted(terminals - set(['$end']))
+        self.nonterminals = sorted(nonterminals)
+        self.token_ids = dict((name, i) for i, name in enumerate(self.terminals))
+        nonterminal_ids = dict((name, i) for i, name in enumerate(self.nonterminals))
+
+        nstates = len(parser.action)
+        self.action = [[None] * len(self.terminals) for _ in range(nstates)]
+        self.goto = [None] * nstates
+        self.defaults = [None] * nstates
+        # The symbol each state is entered on, for symstack
+        self.symbols = [None] * nstates
+        for state, actions in parser.action.items():
+            row = self.action[state]
+            for name, action in actions.items():
+                row[self.token_ids[name]] = action
+                if action > 0:
+                    self.symbols[action] = name
+        for state, gotos in parser.goto.items():
+            row = self.goto[state] = [None] * len(self.nonterminals)
+            for name, target in gotos.items():
+                row[nonterminal_ids[name]] = target
+                self.symbols[target] = name
+        for state, action in parser.defaulted_states.items():
+            self.defaults[state] = action
+
+        self.productions = [(p.callable, p.len, nonterminal_ids.get(p.name))
+                            for p in parser.productions]
+        self.top_statement_list = nonterminal_ids['top_statement_list']
+
+    def parse(self, input=None, lexer=None):
+        for result in self.run(input, lexer, False):
+            return result
+
+    def iterparse(self, input=None, lexer=None):
+        """Yields the top-level statements as they are reduced; a trailing
+        doc comment is held back until the statement it documents.  This is
+        the streaming parse of both engines, as LRParser has none."""
+        for statements in self.run(input, lexer, True):
+            for node in statements:
+                yield node
+
+    def run(self, input, lexer, stream):
+        # Yields the result of the parse once it is accepted; when
+        # streaming, also the top-level statements completed before it
+        action = self.action
+        goto = self.goto
+        defaults = self.defaults
+        productions = self.productions
+        token_ids = self.token_ids
+        top_statement_list = self.top_statement_list
+        positions = self.positions
+
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+
+        # The tokens of the symbols are None for nonterminals, and their
+        # start offsets None for those derived from nothing
+        states = [0]
+        values = [None]
+        tokens = [None]
+        starts = [None]
+        end = None
+        self.statestack = states
+
+        # One Production serves every reduction
+        p = Production()
+        p.tokens = tokens
+        p.lexer = lexer
+        p.parser = self
+
+        state = 0
+        lookahead = None
+        tid = None
+        while True:
+            t = defaults[state]
+            if t is None:
+                if lookahead is None:
+                    lookahead = get_token() or END
+                    tid = token_ids.get(lookahead.type)
+                if tid is not None:
+                    t = action[state][tid]
+
+            if t is None:
+                self.error(lookahead, lexer, states, values, tokens)
+            elif t > 0:
+                states.append(t)
+                values.append(lookahead.value)
+                tokens.append(lookahead)
+                starts.append(lookahead.lexpos)
+                end = lookahead.lexend
+                state = t
+                lookahead = None
+            elif t < 0:
+                func, length, lhs = productions[-t]
+                if length:
+                    base = len(values) - length
+                    p[:] = values[base - 1:]
+                    p[0] = None
+                    p.base = base - 1
+                    func(p)
+
+                    start = starts[base] if positions else None
+                    if start is None and positions:
+                        for start in starts[base + 1:]:
+                            if start is not None:
+                                break
+                    del states[base:]
+                    del values[base:]
+                    del tokens[base:]
+                    del starts[base:]
+                else:
+                    p[:] = EMPTY
+                    func(p)
+                    start = None
+
+                value = p[0]
+                if start is not None and isinstance(value, Node) and value.lexpos is None:
+                    value.lexpos = start
+                    value.lexend = end
+                values.append(value)
+                tokens.append(None)
+                starts.append(start)
+                state = goto[states[-1]][lhs]
+                states.append(state)
+
+                if stream and lhs == top_statement_list and len(values) == 2:
+                    statements = values[1]
+                    count = len(statements)
+                    if count and isinstance(statements[-1], Comment) and \
+                       statements[-1].text.startswith('/**'):
+                        count -= 1
+                    if count:
+                        yield statements[:count]
+                        del statements[:count]
+            else:
+                yield values[-1]
+                return
+
+    def error(self, token, lexer, states, values, tokens):
+        # Rebuild PLY's symbol stack for phpparse.recover()
+        symstack = []
+        for state, value, t in zip(states, values, tokens):
+            sym = yacc.YaccSymbol()
+            sym.type = self.symbols[state] if state else '$end'
+            sym.value = value
+            sym.lineno = t.lineno if t is not None else 0
+            symstack.append(sym)
+        self.symstack = symstack
+
+        if token is END:
+            token = None
+        elif not hasattr(token, 'lexer'):
+            token.lexer = lexer
+        self.errorfunc(token)
+        raise SyntaxError('invalid syntax', (None, None, None, None))
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ABSTRACT', 'AND', 'AND_EQUAL', 'ARRAY', 'ARRAY_CAST', 'AS', 'AT', 'BOOLEAN_AND', 'BOOLEAN_NOT', 'BOOLEAN_OR', 'BOOL_CAST', 'BREAK', 'CASE', 'CATCH', 'CLASS', 'CLASS_C', 'CLONE', 'CLOSE_TAG', 'COLON', 'COMMA', 'COMMENT', 'CONCAT', 'CONCAT_EQUAL', 'CONST', 'CONSTANT_ENCAPSED_STRING', 'CONTINUE', 'CURLY_OPEN', 'DEC', 'DECLARE', 'DEFAULT', 'DIR', 'DIV', 'DIV_EQUAL', 'DNUMBER', 'DO', 'DOC_COMMENT', 'DOLLAR', 'DOLLAR_OPEN_CURLY_BRACES', 'DOUBLE_ARROW', 'DOUBLE_CAST', 'DOUBLE_COLON', 'ECHO', 'ELSE', 'ELSEIF', 'EMPTY', 'ENCAPSED_AND_WHITESPACE', 'ENDDECLARE', 'ENDFOR', 'ENDFOREACH', 'ENDIF', 'ENDSWITCH', 'ENDWHILE', 'END_HEREDOC', 'EQUALS', 'EVAL', 'EXIT', 'EXTENDS', 'FILE', 'FINAL', 'FOR', 'FOREACH', 'FUNCTION', 'FUNC_C', 'GLOBAL', 'HALT_COMPILER', 'IF', 'IMPLEMENTS', 'INC', 'INCLUDE', 'INCLUDE_ONCE', 'INLINE_HTML', 'INSTANCEOF', 'INTERFACE', 'INT_CAST', 'ISSET', 'IS_EQUAL', 'IS_GREATER', 'IS_GREATER_OR_EQUAL', 'IS_IDENTICAL', 'IS_NOT_EQUAL', 'IS_NOT_IDENTICAL', 'IS_SMALLER', 'IS_SMALLER_OR_EQUAL', 'LBRACE', 'LBRACKET', 'LINE', 'LIST', 'LNUMBER', 'LOGICAL_AND', 'LOGICAL_OR', 'LOGICAL_XOR', 'LPAREN', 'METHOD_C', 'MINUS', 'MINUS_EQUAL', 'MOD', 'MOD_EQUAL', 'MUL', 'MUL_EQUAL', 'NAMESPACE', 'NEW', 'NOT', 'NS_C', 'NS_SEPARATOR', 'NUM_STRING', 'OBJECT_CAST', 'OBJECT_OPERATOR', 'OPEN_TAG', 'OPEN_TAG_WITH_ECHO', 'OR', 'OR_EQUAL', 'PLUS', 'PLUS_EQUAL', 'PRINT', 'PRIVATE', 'PROTECTED', 'PUBLIC', 'QUESTION', 'QUOTE', 'RBRACE', 'RBRACKET', 'REQUIRE', 'REQUIRE_ONCE', 'RETURN', 'RPAREN', 'SEMI', 'SL', 'SL_EQUAL', 'SR', 'SR_EQUAL', 'START_HEREDOC', 'STATIC', 'STRING', 'STRING_CAST', 'STRING_VARNAME', 'SWITCH', 'THROW', 'TRY', 'UNSET', 'UNSET_CAST', 'USE', 'VAR', 'VARIABLE', 'WHILE', 'WHITESPACE', 'XOR', 'XOR_EQUAL'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'property': 'exclusive', 'quoted': 'exclusive', 'heredoc': 'exclusive', 'varname': 'exclusive', 'INITIAL': 'inclusive', 'heredocvar': 'exclusive', 'quotedvar': 'exclusive', 'offset': 'exclusive', 'php': 'exclusive'}
+_lexstatere   = {'php': [('(?P<t_php_WHITESPACE>[ \\t\\r\\n]+)|(?P<t_php_OBJECT_OPERATOR>->)|(?P<t_php_LBRACKET>\\[)|(?P<t_php_RBRACKET>\\])|(?P<t_php_LBRACE>\\{)|(?P<t_php_RBRACE>\\})|(?P<t_php_DOC_COMMENT>/\\*\\*)|(?P<t_php_COMMENT>/\\* | //[^?%\\n]*([?%](?!>)[^?%\\n]*)*\\n? | \\#[^?%\\n]*([?%](?!>)[^?%\\n]*)*\\n?)|(?P<t_php_CLOSE_TAG>[?%]>\\r?\\n?)|(?P<t_php_STRING>[A-Za-z_][\\w_]*)|(?P<t_php_VARIABLE>\\$[A-Za-z_][\\w_]*)|(?P<t_php_DNUMBER>(\\d*\\.\\d+|\\d+\\.\\d*)([Ee][+-]?\\d+)? | (\\d+[Ee][+-]?\\d+))|(?P<t_php_LNUMBER>(0x[0-9A-Fa-f]+)|\\d+)|(?P<t_php_CONSTANT_ENCAPSED_STRING>\'([^\\\\\']|\\\\(.|\\n))*\')|(?P<t_php_QUOTE>")|(?P<t_php_START_HEREDOC><<<[ \\t]*(?P<label>[A-Za-z_][\\w_]*)\\n)|(?P<t_php_DOUBLE_CAST>\\([ \\t]*([Rr][Ee][Aa][Ll]|[Dd][Oo][Uu][Bb][Ll][Ee]|[Ff][Ll][Oo][Aa][Tt])[ \\t]*\\))|(?P<t_php_INT_CAST>\\([ \\t]*[Ii][Nn][Tt]([Ee][Gg][Ee][Rr])?[ \\t]*\\))|(?P<t_php_BOOL_CAST>\\([ \\t]*[Bb][Oo][Oo][Ll]([Ee][Aa][Nn])?[ \\t]*\\))|(?P<t_php_OBJECT_CAST>\\([ \\t]*[Oo][Bb][Jj][Ee][Cc][Tt][ \\t]*\\))|(?P<t_php_STRING_CAST>\\([ \\t]*[Ss][Tt][Rr][Ii][Nn][Gg][ \\t]*\\))|(?P<t_php_UNSET_CAST>\\([ \\t]*[Uu][Nn][Ss][Ee][Tt][ \\t]*\\))|(?P<t_php_ARRAY_CAST>\\([ \\t]*[Aa][Rr][Rr][Aa][Yy][ \\t]*\\))|(?P<t_php_IS_NOT_EQUAL>(!=(?!=))|(<>))|(?P<t_php_CONCAT>\\.(?!\\d|=))|(?P<t_php_INC>\\+\\+)|(?P<t_php_BOOLEAN_OR>\\|\\|)|(?P<t_php_PLUS_EQUAL>\\+=)|(?P<t_php_IS_NOT_IDENTICAL>!==)|(?P<t_php_SR_EQUAL>>>=)|(?P<t_php_CONCAT_EQUAL>\\.=)|(?P<t_php_OR_EQUAL>\\|=)|(?P<t_php_XOR_EQUAL>\\^=)|(?P<t_php_SL_EQUAL><<=)|(?P<t_php_MUL_EQUAL>\\*=)|(?P<t_php_IS_IDENTICAL>===)|(?P<t_php_RPAREN>\\))|(?P<t_php_QUESTION>\\?)|(?P<t_php_MOD_EQUAL>%=)|(?P<t_php_OR>\\|)|(?P<t_php_IS_EQUAL>==)|(?P<t_php_XOR>\\^)|(?P<t_php_LPAREN>\\()|(?P<t_php_SR>>>)|(?P<t_php_AND_EQUAL>&=)|(?P<t_php_DEC>--)|(?P<t_php_IS_GREATER_OR_EQUAL>>=)|(?P<t_php_MINUS_EQUAL>-=)|(?P<t_php_DIV_EQUAL>/=)|(?P<t_php_SL><<)|(?P<t_php_DOUBLE_ARROW>=>)|(?P<t_php_MUL>\\*)|(?P<t_php_BOOLEAN_AND>&&)|(?P<t_php_PLUS>\\+)|(?P<t_php_IS_SMALLER_OR_EQUAL><=)|(?P<t_php_NS_SEPARATOR>\\\\)|(?P<t_php_DOUBLE_COLON>::)|(?P<t_php_DOLLAR>\\$)|(?P<t_php_AND>&)|(?P<t_php_AT>@)|(?P<t_php_MOD>%)|(?P<t_php_SEMI>;)|(?P<t_php_COLON>:)|(?P<t_php_NOT>~)|(?P<t_php_BOOLEAN_NOT>!)|(?P<t_php_EQUALS>=)|(?P<t_php_MINUS>-)|(?P<t_php_COMMA>,)|(?P<t_php_IS_SMALLER><)|(?P<t_php_IS_GREATER>>)|(?P<t_php_DIV>/)', [None, ('t_php_WHITESPACE', 'WHITESPACE'), ('t_php_OBJECT_OPERATOR', 'OBJECT_OPERATOR'), ('t_php_LBRACKET', 'LBRACKET'), ('t_php_RBRACKET', 'RBRACKET'), ('t_php_LBRACE', 'LBRACE'), ('t_php_RBRACE', 'RBRACE'), ('t_php_DOC_COMMENT', 'DOC_COMMENT'), ('t_php_COMMENT', 'COMMENT'), None, None, ('t_php_CLOSE_TAG', 'CLOSE_TAG'), ('t_php_STRING', 'STRING'), ('t_php_VARIABLE', 'VARIABLE'), ('t_php_DNUMBER', 'DNUMBER'), None, None, None, ('t_php_LNUMBER', 'LNUMBER'), None, ('t_php_CONSTANT_ENCAPSED_STRING', 'CONSTANT_ENCAPSED_STRING'), None, None, ('t_php_QUOTE', 'QUOTE'), ('t_php_START_HEREDOC', 'START_HEREDOC'), None, (None, 'DOUBLE_CAST'), None, (None, 'INT_CAST'), None, (None, 'BOOL_CAST'), None, (None, 'OBJECT_CAST'), (None, 'STRING_CAST'), (None, 'UNSET_CAST'), (None, 'ARRAY_CAST'), (None, 'IS_NOT_EQUAL'), None, None, (None, 'CONCAT'), (None, 'INC'), (None, 'BOOLEAN_OR'), (None, 'PLUS_EQUAL'), (None, 'IS_NOT_IDENTICAL'), (None, 'SR_EQUAL'), (None, 'CONCAT_EQUAL'), (None, 'OR_EQUAL'), (None, 'XOR_EQUAL'), (None, 'SL_EQUAL'), (None, 'MUL_EQUAL'), (None, 'IS_IDENTICAL'), (None, 'RPAREN'), (None, 'QUESTION'), (None, 'MOD_EQUAL'), (None, 'OR'), (None, 'IS_EQUAL'), (None, 'XOR'), (None, 'LPAREN'), (None, 'SR'), (None, 'AND_EQUAL'), (None, 'DEC'), (None, 'IS_GREATER_OR_EQUAL'), (None, 'MINUS_EQUAL'), (None, 'DIV_EQUAL'), (None, 'SL'), (None, 'DOUBLE_ARROW'), (None, 'MUL'), (None, 'BOOLEAN_AND'), (None, 'PLUS'), (None, 'IS_SMALLER_OR_EQUAL'), (None, 'NS_SEPARATOR'), (None, 'DOUBLE_COLON'), (None, 'DOLLAR'), (None, 'AND'), (None, 'AT'), (None, 'MOD'), (None, 'SEMI'), (None, 'COLON'), (None, 'NOT'), (None, 'BOOLEAN_NOT'), (None, 'EQUALS'), (None, 'MINUS'), (None, 'COMMA'), (None, 'IS_SMALLER'), (None, 'IS_GREATER'), (None, 'DIV')])], 'quoted': [('(?P<t_quoted_QUOTE>")|(?P<t_quoted_ENCAPSED_AND_WHITESPACE>( [^"\\\\${] | \\\\(.|\\n) | \\$(?![A-Za-z_{]) | \\{(?!\\$) )+)|(?P<t_quoted_VARIABLE>\\$[A-Za-z_][\\w_]*)|(?P<t_quoted_CURLY_OPEN>\\{(?=\\$))|(?P<t_quoted_DOLLAR_OPEN_CURLY_BRACES>\\$\\{)', [None, ('t_quoted_QUOTE', 'QUOTE'), ('t_quoted_ENCAPSED_AND_WHITESPACE', 'ENCAPSED_AND_WHITESPACE'), None, None, ('t_quoted_VARIABLE', 'VARIABLE'), ('t_quoted_CURLY_OPEN', 'CURLY_OPEN'), ('t_quoted_DOLLAR_OPEN_CURLY_BRACES', 'DOLLAR_OPEN_CURLY_BRACES')])], 'heredoc': [('(?P<t_heredoc_CURLY_OPEN>\\{(?=\\$))|(?P<t_heredoc_DOLLAR_OPEN_CURLY_BRACES>\\$\\{)|(?P<t_heredoc_END_HEREDOC>(?<=\\n)[A-Za-z_][\\w_]*)|(?P<t_heredoc_ENCAPSED_AND_WHITESPACE>( [^\\n\\\\${] | \\\\. | \\$(?![A-Za-z_{]) | \\{(?!\\$) )+\\n? | \\\\?\\n)|(?P<t_heredoc_VARIABLE>\\$[A-Za-z_][\\w_]*)', [None, ('t_heredoc_CURLY_OPEN', 'CURLY_OPEN'), ('t_heredoc_DOLLAR_OPEN_CURLY_BRACES', 'DOLLAR_OPEN_CURLY_BRACES'), ('t_heredoc_END_HEREDOC', 'END_HEREDOC'), ('t_heredoc_ENCAPSED_AND_WHITESPACE', 'ENCAPSED_AND_WHITESPACE'), None, ('t_heredoc_VARIABLE', 'VARIABLE')])], 'varname': [('(?P<t_varname_LBRACKET>\\[)|(?P<t_varname_RBRACE>\\})|(?P<t_varname_STRING_VARNAME>[A-Za-z_][\\w_]*)', [None, ('t_varname_LBRACKET', 'LBRACKET'), ('t_varname_RBRACE', 'RBRACE'), ('t_varname_STRING_VARNAME', 'STRING_VARNAME')])], 'INITIAL': [('(?P<t_OPEN_TAG><[?%]((php[ \\t\\r\\n]?)|=)?)|(?P<t_INLINE_HTML>[^<]|<(?![?%]))', [None, ('t_OPEN_TAG', 'OPEN_TAG'), None, None, ('t_INLINE_HTML', 'INLINE_HTML')])], 'heredocvar': [('(?P<t_heredocvar_VARIABLE>\\$[A-Za-z_][\\w_]*)|(?P<t_heredocvar_LBRACKET>\\[)|(?P<t_heredocvar_OBJECT_OPERATOR>->(?=[A-Za-z]))|(?P<t_heredocvar_CURLY_OPEN>\\{(?=\\$))|(?P<t_heredocvar_DOLLAR_OPEN_CURLY_BRACES>\\$\\{)|(?P<t_heredocvar_ENCAPSED_AND_WHITESPACE>( [^\\n\\\\${] | \\\\. | \\$(?![A-Za-z_{]) | \\{(?!\\$) )+\\n? | \\\\?\\n)', [None, ('t_heredocvar_VARIABLE', 'VARIABLE'), ('t_heredocvar_LBRACKET', 'LBRACKET'), ('t_heredocvar_OBJECT_OPERATOR', 'OBJECT_OPERATOR'), ('t_heredocvar_CURLY_OPEN', 'CURLY_OPEN'), ('t_heredocvar_DOLLAR_OPEN_CURLY_BRACES', 'DOLLAR_OPEN_CURLY_BRACES'), ('t_heredocvar_ENCAPSED_AND_WHITESPACE', 'ENCAPSED_AND_WHITESPACE')])], 'quotedvar': [('(?P<t_quotedvar_VARIABLE>\\$[A-Za-z_][\\w_]*)|(?P<t_quotedvar_QUOTE>")|(?P<t_quotedvar_LBRACKET>\\[)|(?P<t_quotedvar_OBJECT_OPERATOR>->(?=[A-Za-z]))|(?P<t_quotedvar_ENCAPSED_AND_WHITESPACE>( [^"\\\\${] | \\\\(.|\\n) | \\$(?![A-Za-z_{]) | \\{(?!\\$) )+)|(?P<t_quotedvar_CURLY_OPEN>\\{(?=\\$))|(?P<t_quotedvar_DOLLAR_OPEN_CURLY_BRACES>\\$\\{)', [None, ('t_quotedvar_VARIABLE', 'VARIABLE'), ('t_quotedvar_QUOTE', 'QUOTE'), ('t_quotedvar_LBRACKET', 'LBRACKET'), ('t_quotedvar_OBJECT_OPERATOR', 'OBJECT_OPERATOR'), ('t_quotedvar_ENCAPSED_AND_WHITESPACE', 'ENCAPSED_AND_WHITESPACE'), None, None, ('t_quotedvar_CURLY_OPEN', 'CURLY_OPEN'), ('t_quotedvar_DOLLAR_OPEN_CURLY_BRACES', 'DOLLAR_OPEN_CURLY_BRACES')])], 'offset': [('(?P<t_offset_RBRACKET>\\])|(?P<t_offset_VARIABLE>\\$[A-Za-z_][\\w_]*)|(?P<t_offset_STRING>[A-Za-z_][\\w_]*)|(?P<t_offset_NUM_STRING>\\d+)', [None, ('t_offset_RBRACKET', 'RBRACKET'), ('t_offset_VARIABLE', 'VARIABLE'), ('t_offset_STRING', 'STRING'), ('t_offset_NUM_STRING', 'NUM_STRING')])], 'property': [('(?P<t_property_STRING>[A-Za-z_][\\w_]*)', [None, ('t_property_STRING', 'STRING')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'property': 't_ANY_error', 'quoted': 't_ANY_error', 'heredoc': 't_ANY_error', 'varname': 't_ANY_error', 'INITIAL': 't_ANY_error', 'heredocvar': 't_ANY_error', 'quotedvar': 't_ANY_error', 'offset': 't_ANY_error', 'php': 't_ANY_error'}
+_lexstateeoff = {}
+_lexsignature = '00d3910aa4d3759ba09c20c2d3eb976d'
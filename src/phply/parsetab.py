@@ -0,0 +1,403 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftINCLUDEINCLUDE_ONCEEVALREQUIREREQUIRE_ONCEleftCOMMAleftLOGICAL_ORleftLOGICAL_XORleftLOGICAL_ANDrightPRINTleftEQUALSPLUS_EQUALMINUS_EQUALMUL_EQUALDIV_EQUALCONCAT_EQUALMOD_EQUALAND_EQUALOR_EQUALXOR_EQUALSL_EQUALSR_EQUALleftQUESTIONCOLONleftBOOLEAN_ORleftBOOLEAN_ANDleftORleftXORleftANDnonassocIS_EQUALIS_NOT_EQUALIS_IDENTICALIS_NOT_IDENTICALnonassocIS_SMALLERIS_SMALLER_OR_EQUALIS_GREATERIS_GREATER_OR_EQUALleftSLSRleftPLUSMINUSCONCATleftMULDIVMODrightBOOLEAN_NOTnonassocINSTANCEOFrightNOTINCDECINT_CASTDOUBLE_CASTSTRING_CASTARRAY_CASTOBJECT_CASTBOOL_CASTUNSET_CASTATrightLBRACKETnonassocNEWCLONEleftENDIFrightSTATICABSTRACTFINALPRIVATEPROTECTEDPUBLICABSTRACT AND AND_EQUAL ARRAY ARRAY_CAST AS AT BODY BOOLEAN_AND BOOLEAN_NOT BOOLEAN_OR BOOL_CAST BREAK CASE CATCH CLASS CLASS_C CLONE COLON COMMA COMMENT CONCAT CONCAT_EQUAL CONST CONSTANT_ENCAPSED_STRING CONTINUE CURLY_OPEN DEC DECLARE DEFAULT DIR DIV DIV_EQUAL DNUMBER DO DOC_COMMENT DOLLAR DOLLAR_OPEN_CURLY_BRACES DOUBLE_ARROW DOUBLE_CAST DOUBLE_COLON ECHO ELSE ELSEIF EMPTY ENCAPSED_AND_WHITESPACE ENDDECLARE ENDFOR ENDFOREACH ENDIF ENDSWITCH ENDWHILE END_HEREDOC EQUALS EVAL EXIT EXTENDS FILE FINAL FOR FOREACH FUNCTION FUNC_C GLOBAL HALT_COMPILER IF IMPLEMENTS INC INCLUDE INCLUDE_ONCE INLINE_HTML INSTANCEOF INTERFACE INT_CAST ISSET IS_EQUAL IS_GREATER IS_GREATER_OR_EQUAL IS_IDENTICAL IS_NOT_EQUAL IS_NOT_IDENTICAL IS_SMALLER IS_SMALLER_OR_EQUAL LBRACE LBRACKET LINE LIST LNUMBER LOGICAL_AND LOGICAL_OR LOGICAL_XOR LPAREN METHOD_C MINUS MINUS_EQUAL MOD MOD_EQUAL MUL MUL_EQUAL NAMESPACE NEW NOT NS_C NS_SEPARATOR NUM_STRING OBJECT_CAST OBJECT_OPERATOR OR OR_EQUAL PLUS PLUS_EQUAL PRINT PRIVATE PROTECTED PUBLIC QUESTION QUOTE RBRACE RBRACKET REQUIRE REQUIRE_ONCE RETURN RPAREN SEMI SL SL_EQUAL SR SR_EQUAL START_HEREDOC STATIC STRING STRING_CAST STRING_VARNAME SWITCH THROW TRY UNSET UNSET_CAST USE VAR VARIABLE WHILE XOR XOR_EQUALstart : top_statement_listtop_statement_list : top_statement_list top_statement\n                          | emptytop_statement : statement\n                     | comment\n                     | function_declaration_statement\n                     | class_declaration_statement\n                     | HALT_COMPILER LPAREN RPAREN SEMItop_statement : NAMESPACE namespace_name SEMI\n                     | NAMESPACE LBRACE top_statement_list RBRACE\n                     | NAMESPACE namespace_name LBRACE top_statement_list RBRACEtop_statement : CONST constant_declarations SEMItop_statement : USE use_declarations SEMIuse_declarations : use_declarations COMMA use_declaration\n                        | use_declarationuse_declaration : namespace_name\n                       | NS_SEPARATOR namespace_name\n                       | namespace_name AS STRING\n                       | NS_SEPARATOR namespace_name AS STRINGconstant_declarations : constant_declarations COMMA constant_declaration\n                             | constant_declarationconstant_declaration : STRING EQUALS static_scalarinner_statement_list : inner_statement_list inner_statement\n                            | emptyinner_statement_list : BODYinner_statement : statement\n                       | comment\n                       | function_declaration_statement\n                       | class_declaration_statement\n                       | HALT_COMPILER LPAREN RPAREN SEMIstatement : LBRACE inner_statement_list RBRACEstatement : IF LPAREN expr RPAREN statement elseif_list else_single\n                 | IF LPAREN expr RPAREN COLON inner_statement_list new_elseif_list new_else_single ENDIF SEMIstatement : WHILE LPAREN expr RPAREN while_statementstatement : DO statement WHILE LPAREN expr RPAREN SEMIstatement : FOR LPAREN for_expr SEMI for_expr SEMI for_expr RPAREN for_statementstatement : FOREACH LPAREN expr AS foreach_variable foreach_optional_arg RPAREN foreach_statementstatement : SWITCH LPAREN expr RPAREN switch_case_liststatement : BREAK SEMI\n                 | BREAK expr SEMIstatement : CONTINUE SEMI\n                 | CONTINUE expr SEMIstatement : RETURN SEMI\n                 | RETURN expr SEMIstatement : GLOBAL global_var_list SEMIstatement : STATIC static_var_list SEMIstatement : ECHO echo_expr_list SEMIstatement : INLINE_HTMLstatement : expr SEMIstatement : UNSET LPAREN unset_variables RPAREN SEMIstatement : SEMIstatement : TRY LBRACE inner_statement_list RBRACE CATCH LPAREN fully_qualified_class_name VARIABLE RPAREN LBRACE inner_statement_list RBRACE additional_catchesadditional_catches : additional_catches CATCH LPAREN fully_qualified_class_name VARIABLE RPAREN LBRACE inner_statement_list RBRACE\n                          | emptystatement : THROW expr SEMIstatement : DECLARE LPAREN declare_list RPAREN declare_statementdeclare_list : STRING EQUALS static_scalar\n                    | declare_list COMMA STRING EQUALS static_scalardeclare_statement : statement\n                         | COLON inner_statement_list ENDDECLARE SEMIelseif_list : empty\n                   | elseif_list ELSEIF LPAREN expr RPAREN statementelse_single : empty\n                   | ELSE statementnew_elseif_list : empty\n                       | new_elseif_list ELSEIF LPAREN expr RPAREN COLON inner_statement_listnew_else_single : empty\n                       | ELSE COLON inner_statement_listwhile_statement : statement\n                       | COLON inner_statement_list ENDWHILE SEMIfor_expr : empty\n                | non_empty_for_exprnon_empty_for_expr : non_empty_for_expr COMMA expr\n                          | exprfor_statement : statement\n                     | COLON inner_statement_list ENDFOR SEMIforeach_variable : VARIABLE\n                        | AND VARIABLEforeach_optional_arg : empty\n                            | DOUBLE_ARROW foreach_variableforeach_statement : statement\n                         | COLON inner_statement_list ENDFOREACH SEMIswitch_case_list : LBRACE case_list RBRACE\n                        | LBRACE SEMI case_list RBRACEswitch_case_list : COLON case_list ENDSWITCH SEMI\n                        | COLON SEMI case_list ENDSWITCH SEMIcase_list : empty\n                 | case_list CASE expr case_separator inner_statement_list\n                 | case_list DEFAULT case_separator inner_statement_listcase_separator : COLON\n                      | SEMIglobal_var_list : global_var_list COMMA global_var\n                       | global_varglobal_var : VARIABLE\n                  | DOLLAR variable\n                  | DOLLAR LBRACE expr RBRACEstatic_var_list : static_var_list COMMA static_var\n                       | static_varstatic_var : VARIABLE EQUALS static_scalar\n                  | VARIABLEecho_expr_list : echo_expr_list COMMA expr\n                      | exprunset_variables : unset_variables COMMA unset_variable\n                       | unset_variableunset_variable : variablefunction_declaration_statement : FUNCTION is_reference STRING LPAREN parameter_list RPAREN LBRACE inner_statement_list RBRACEclass_declaration_statement : class_entry_type STRING extends_from implements_list LBRACE class_statement_list RBRACE\n                                   | INTERFACE STRING interface_extends_list LBRACE class_statement_list RBRACEclass_entry_type : CLASS\n                        | ABSTRACT CLASS\n                        | FINAL CLASSextends_from : empty\n                    | EXTENDS fully_qualified_class_namefully_qualified_class_name : namespace_name\n                                  | NS_SEPARATOR namespace_name\n                                  | NAMESPACE NS_SEPARATOR namespace_nameimplements_list : IMPLEMENTS interface_list\n                       | emptyclass_statement_list : class_statement_list class_statement\n                            | emptyclass_statement : method_modifiers FUNCTION is_reference STRING LPAREN parameter_list RPAREN method_body\n                       | comment\n                       | variable_modifiers class_variable_declaration SEMI\n                       | class_constant_declaration SEMIclass_variable_declaration : class_variable_declaration COMMA VARIABLE EQUALS static_scalar\n                                  | VARIABLE EQUALS static_scalarclass_variable_declaration : class_variable_declaration COMMA VARIABLE\n                                  | VARIABLEclass_constant_declaration : class_constant_declaration COMMA STRING EQUALS static_scalar\n                                  | CONST STRING EQUALS static_scalarinterface_list : interface_list COMMA fully_qualified_class_name\n                      | fully_qualified_class_nameinterface_extends_list : EXTENDS interface_list\n                              | emptyvariable_modifiers : non_empty_member_modifiersvariable_modifiers : VARmethod_modifiers : non_empty_member_modifiersmethod_modifiers : emptymethod_body : LBRACE inner_statement_list RBRACE\n                   | SEMInon_empty_member_modifiers : non_empty_member_modifiers member_modifier\n                                  | member_modifiermember_modifier : PUBLIC\n                       | PROTECTED\n                       | PRIVATE\n                       | STATIC\n                       | ABSTRACT\n                       | FINALis_reference : AND\n                    | emptyparameter_list : parameter_list COMMA parameter\n                      | parameterparameter_list : emptyparameter : VARIABLE\n                 | class_name VARIABLE\n                 | ARRAY VARIABLE\n                 | AND VARIABLE\n                 | class_name AND VARIABLE\n                 | ARRAY AND VARIABLE\n                 | VARIABLE EQUALS static_scalar\n                 | class_name VARIABLE EQUALS static_scalar\n                 | ARRAY VARIABLE EQUALS static_scalar\n                 | AND VARIABLE EQUALS static_scalar\n                 | class_name AND VARIABLE EQUALS static_scalar\n                 | ARRAY AND VARIABLE EQUALS static_scalarexpr : variableexpr : variable EQUALS expr\n            | variable EQUALS AND exprexpr : NEW class_name_reference ctor_argumentsclass_name_reference : class_name\n                            | dynamic_class_name_referenceclass_name : namespace_name\n                  | NS_SEPARATOR namespace_name\n                  | NAMESPACE NS_SEPARATOR namespace_nameclass_name : STATICdynamic_class_name_reference : base_variable OBJECT_OPERATOR object_property dynamic_class_name_variable_properties\n                                    | base_variabledynamic_class_name_variable_properties : dynamic_class_name_variable_properties dynamic_class_name_variable_property\n                                              | emptydynamic_class_name_variable_property : OBJECT_OPERATOR object_propertyctor_arguments : LPAREN function_call_parameter_list RPAREN\n                      | emptyexpr : CLONE exprexpr : LIST LPAREN assignment_list RPAREN EQUALS exprassignment_list : assignment_list COMMA assignment_list_element\n                       | assignment_list_elementassignment_list_element : variable\n                               | empty\n                               | LIST LPAREN assignment_list RPARENvariable : base_variable_with_function_calls OBJECT_OPERATOR object_property method_or_not variable_properties\n                | base_variable_with_function_callsbase_variable_with_function_calls : base_variable\n                                         | function_callfunction_call : namespace_name LPAREN function_call_parameter_list RPAREN\n                     | NS_SEPARATOR namespace_name LPAREN function_call_parameter_list RPAREN\n                     | NAMESPACE NS_SEPARATOR namespace_name LPAREN function_call_parameter_list RPARENfunction_call : class_name DOUBLE_COLON STRING LPAREN function_call_parameter_list RPAREN\n                     | class_name DOUBLE_COLON variable_without_objects LPAREN function_call_parameter_list RPAREN\n                     | variable_class_name DOUBLE_COLON STRING LPAREN function_call_parameter_list RPAREN\n                     | variable_class_name DOUBLE_COLON variable_without_objects LPAREN function_call_parameter_list RPARENfunction_call : variable_without_objects LPAREN function_call_parameter_list RPARENmethod_or_not : LPAREN function_call_parameter_list RPAREN\n                     | emptyvariable_properties : variable_properties variable_property\n                           | emptyvariable_property : OBJECT_OPERATOR object_property method_or_notbase_variable : simple_indirect_reference\n                     | static_membersimple_indirect_reference : DOLLAR simple_indirect_reference\n                                 | reference_variablestatic_member : class_name DOUBLE_COLON variable_without_objects\n                     | variable_class_name DOUBLE_COLON variable_without_objectsvariable_class_name : reference_variablereference_variable : reference_variable LBRACKET dim_offset RBRACKETreference_variable : reference_variable LBRACE expr RBRACEreference_variable : compound_variablecompound_variable : VARIABLE\n                         | DOLLAR LBRACE expr RBRACEdim_offset : expr\n                  | emptyobject_property : variable_name object_dim_list\n                       | variable_without_objectsobject_dim_list : emptyobject_dim_list : object_dim_list LBRACKET dim_offset RBRACKETobject_dim_list : object_dim_list LBRACE expr RBRACEvariable_name : STRING\n                     | LBRACE expr RBRACEvariable_without_objects : simple_indirect_referenceexpr : scalarexpr : ARRAY LPAREN array_pair_list RPARENarray_pair_list : empty\n                       | non_empty_array_pair_list possible_commanon_empty_array_pair_list : non_empty_array_pair_list COMMA AND variable\n                                 | non_empty_array_pair_list COMMA expr\n                                 | AND variable\n                                 | exprnon_empty_array_pair_list : non_empty_array_pair_list COMMA expr DOUBLE_ARROW AND variable\n                                 | non_empty_array_pair_list COMMA expr DOUBLE_ARROW expr\n                                 | expr DOUBLE_ARROW AND variable\n                                 | expr DOUBLE_ARROW exprpossible_comma : empty\n                      | COMMAfunction_call_parameter_list : function_call_parameter_list COMMA function_call_parameter\n                                    | function_call_parameterfunction_call_parameter_list : emptyfunction_call_parameter : expr\n                               | AND variableexpr : FUNCTION is_reference LPAREN parameter_list RPAREN lexical_vars LBRACE inner_statement_list RBRACElexical_vars : USE LPAREN lexical_var_list RPAREN\n                    | emptylexical_var_list : lexical_var_list COMMA AND VARIABLE\n                        | lexical_var_list COMMA VARIABLE\n                        | AND VARIABLE\n                        | VARIABLEexpr : variable PLUS_EQUAL expr\n            | variable MINUS_EQUAL expr\n            | variable MUL_EQUAL expr\n            | variable DIV_EQUAL expr\n            | variable CONCAT_EQUAL expr\n            | variable MOD_EQUAL expr\n            | variable AND_EQUAL expr\n            | variable OR_EQUAL expr\n            | variable XOR_EQUAL expr\n            | variable SL_EQUAL expr\n            | variable SR_EQUAL exprexpr : expr BOOLEAN_AND expr\n            | expr BOOLEAN_OR expr\n            | expr LOGICAL_AND expr\n            | expr LOGICAL_OR expr\n            | expr LOGICAL_XOR expr\n            | expr AND expr\n            | expr OR expr\n            | expr XOR expr\n            | expr CONCAT expr\n            | expr PLUS expr\n            | expr MINUS expr\n            | expr MUL expr\n            | expr DIV expr\n            | expr SL expr\n            | expr SR expr\n            | expr MOD expr\n            | expr IS_IDENTICAL expr\n            | expr IS_NOT_IDENTICAL expr\n            | expr IS_EQUAL expr\n            | expr IS_NOT_EQUAL expr\n            | expr IS_SMALLER expr\n            | expr IS_SMALLER_OR_EQUAL expr\n            | expr IS_GREATER expr\n            | expr IS_GREATER_OR_EQUAL expr\n            | expr INSTANCEOF exprexpr : PLUS expr\n            | MINUS expr\n            | NOT expr\n            | BOOLEAN_NOT exprexpr : expr QUESTION expr COLON exprexpr : INC variable\n            | DEC variableexpr : variable INC\n            | variable DECexpr : INT_CAST exprexpr : DOUBLE_CAST exprexpr : STRING_CAST exprexpr : ARRAY_CAST exprexpr : OBJECT_CAST exprexpr : BOOL_CAST exprexpr : UNSET_CAST exprexpr : ISSET LPAREN isset_variables RPARENisset_variables : isset_variables COMMA variable\n                       | variableexpr : EMPTY LPAREN expr RPARENexpr : EVAL LPAREN expr RPARENexpr : INCLUDE exprexpr : INCLUDE_ONCE exprexpr : REQUIRE exprexpr : REQUIRE_ONCE exprexpr : EXIT\n            | EXIT LPAREN RPAREN\n            | EXIT LPAREN expr RPARENexpr : PRINT exprexpr : AT exprexpr : LPAREN expr RPARENscalar : class_constant\n              | common_scalar\n              | QUOTE encaps_list QUOTE\n              | START_HEREDOC encaps_list END_HEREDOCscalar : STRING_VARNAMEscalar : namespace_name\n              | NS_SEPARATOR namespace_name\n              | NAMESPACE NS_SEPARATOR namespace_nameclass_constant : class_name DOUBLE_COLON STRING\n                      | variable_class_name DOUBLE_COLON STRINGcommon_scalar : LNUMBERcommon_scalar : DNUMBERcommon_scalar : CONSTANT_ENCAPSED_STRINGcommon_scalar : LINEcommon_scalar : FILEcommon_scalar : DIRcommon_scalar : CLASS_Ccommon_scalar : METHOD_Ccommon_scalar : FUNC_Ccommon_scalar : NS_Cstatic_scalar : common_scalar\n                     | QUOTE QUOTE\n                     | QUOTE ENCAPSED_AND_WHITESPACE QUOTEstatic_scalar : namespace_name\n                     | NS_SEPARATOR namespace_name\n                     | NAMESPACE NS_SEPARATOR namespace_namestatic_scalar : PLUS static_scalar\n                     | MINUS static_scalarstatic_scalar : ARRAY LPAREN static_array_pair_list RPARENstatic_array_pair_list : empty\n                              | static_non_empty_array_pair_list possible_commastatic_non_empty_array_pair_list : static_non_empty_array_pair_list COMMA static_scalar\n                                        | static_scalarstatic_non_empty_array_pair_list : static_non_empty_array_pair_list COMMA static_scalar DOUBLE_ARROW static_scalar\n                                        | static_scalar DOUBLE_ARROW static_scalarnamespace_name : namespace_name NS_SEPARATOR STRING\n                      | STRINGencaps_list : encaps_list encaps_var\n                   | emptyencaps_list : encaps_list ENCAPSED_AND_WHITESPACEencaps_var : VARIABLEencaps_var : VARIABLE LBRACKET encaps_var_offset RBRACKETencaps_var : VARIABLE OBJECT_OPERATOR STRINGencaps_var : DOLLAR_OPEN_CURLY_BRACES expr RBRACEencaps_var : DOLLAR_OPEN_CURLY_BRACES STRING_VARNAME LBRACKET expr RBRACKET RBRACEencaps_var : CURLY_OPEN variable RBRACEencaps_var_offset : STRINGencaps_var_offset : NUM_STRINGencaps_var_offset : VARIABLEcomment : COMMENT\n               | DOC_COMMENTempty : '
+    
+_lr_action_items = {'DOUBLE_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,4,-3,4,-372,4,-371,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-373,4,4,-2,-5,-6,-4,-7,4,4,-51,-48,4,4,4,4,-373,4,4,-43,4,4,-373,-25,4,-24,-41,4,4,4,4,4,4,4,4,4,4,4,4,4,-49,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-39,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-373,-9,-44,-46,4,4,-47,4,-31,-23,-27,-28,-26,-29,-42,4,4,-45,4,4,-40,-13,-12,4,-55,-10,4,4,4,-8,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-11,-56,-373,-59,4,4,4,-34,-373,-69,-38,4,-50,-373,-373,4,-108,4,-30,4,4,4,-373,-61,4,-373,-373,-107,4,-83,-35,-32,4,-63,-373,-81,-37,-60,4,4,4,-70,-84,-91,-373,-90,-85,-64,4,4,-36,-373,-75,-106,-373,4,-86,-373,4,4,-373,4,-33,4,4,-82,4,-62,-76,-373,-373,-373,-52,-54,4,4,-373,4,-53,]),'DOC_COMMENT':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,411,417,505,510,511,512,514,515,556,560,561,562,568,581,584,585,591,593,596,600,638,641,644,658,659,660,670,680,687,690,695,701,704,707,708,709,710,711,714,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,5,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,5,-24,-41,-49,-39,5,-373,-9,-44,-46,-47,5,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,5,-373,-8,-11,-56,-373,-59,5,-120,-373,-34,-373,-69,-38,-50,-373,-373,5,-122,-119,-108,-30,5,5,5,-373,-61,-124,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,-123,5,5,-70,-84,-91,-373,-90,-85,-64,5,-36,-373,-75,-106,-373,5,-86,-373,5,-373,5,-33,5,-82,5,-62,-76,-373,-373,-373,-140,-121,-52,-54,5,5,-139,-373,5,-53,]),'IS_GREATER_OR_EQUAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,184,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,184,-183,184,184,-305,-294,184,-297,-210,-302,-304,-320,184,184,184,184,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,184,-210,-209,184,-299,-298,-300,184,-303,-329,184,184,184,184,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,184,-169,-182,-173,-325,184,184,184,184,-357,184,None,184,None,-277,-278,-276,-274,184,184,-275,184,None,184,184,184,184,None,184,-280,184,184,184,-279,-290,184,-281,-317,184,184,-321,184,184,184,184,184,184,184,184,184,184,184,184,184,-311,-310,184,-203,-373,-221,-223,184,184,-326,184,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,184,184,-227,-205,-190,-176,-179,-181,184,184,-195,184,184,-196,-202,-204,184,-200,-199,184,-198,-197,-178,184,-373,-225,-224,-180,184,-206,184,-248,184,184,]),'LBRACKET':([59,67,75,129,168,228,278,279,300,438,439,457,473,474,501,528,678,679,],[-217,179,-216,179,179,179,-226,-373,455,533,-223,554,-215,-214,-218,-227,-225,-224,]),'PROTECTED':([5,10,411,514,515,556,593,595,596,597,598,599,601,602,608,609,641,666,670,714,796,797,803,],[-372,-371,-373,597,-120,-373,-122,-147,-119,-144,-146,-148,-145,597,-143,-142,597,-141,-124,-123,-140,-121,-139,]),'PRIVATE':([5,10,411,514,515,556,593,595,596,597,598,599,601,602,608,609,641,666,670,714,796,797,803,],[-372,-371,-373,601,-120,-373,-122,-147,-119,-144,-146,-148,-145,601,-143,-142,601,-141,-124,-123,-140,-121,-139,]),'FILE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,7,-3,7,-372,7,-371,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-373,7,7,-2,-5,-6,-4,-7,7,7,-51,-48,7,7,7,7,-373,7,7,-43,7,7,-373,-25,7,-24,-41,7,7,7,7,7,7,7,7,7,7,7,7,7,-49,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-39,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-373,-9,-44,-46,7,7,7,-47,7,-31,-23,-27,-28,-26,-29,-42,7,7,-45,7,7,-40,-13,-12,7,7,-55,-10,7,7,7,7,-8,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-11,-56,-373,-59,7,7,7,7,7,-34,-373,-69,-38,7,-50,-373,-373,7,7,-108,7,7,7,7,-30,7,7,7,-373,-61,7,7,7,-373,7,7,-373,-107,7,-83,-35,-32,7,-63,-373,-81,-37,-60,7,7,7,7,7,-70,-84,-91,-373,-90,-85,-64,7,7,7,7,-36,-373,-75,-106,-373,7,-86,-373,7,7,7,-373,7,-33,7,7,-82,7,-62,-76,-373,-373,-373,-52,-54,7,7,-373,7,-53,]),'LINE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,8,-3,8,-372,8,-371,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-373,8,8,-2,-5,-6,-4,-7,8,8,-51,-48,8,8,8,8,-373,8,8,-43,8,8,-373,-25,8,-24,-41,8,8,8,8,8,8,8,8,8,8,8,8,8,-49,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-39,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-373,-9,-44,-46,8,8,8,-47,8,-31,-23,-27,-28,-26,-29,-42,8,8,-45,8,8,-40,-13,-12,8,8,-55,-10,8,8,8,8,-8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-11,-56,-373,-59,8,8,8,8,8,-34,-373,-69,-38,8,-50,-373,-373,8,8,-108,8,8,8,8,-30,8,8,8,-373,-61,8,8,8,-373,8,8,-373,-107,8,-83,-35,-32,8,-63,-373,-81,-37,-60,8,8,8,8,8,-70,-84,-91,-373,-90,-85,-64,8,8,8,8,-36,-373,-75,-106,-373,8,-86,-373,8,8,8,-373,8,-33,8,8,-82,8,-62,-76,-373,-373,-373,-52,-54,8,8,-373,8,-53,]),'MINUS':([0,1,3,4,5,6,7,8,9,10,11,12,13,17,19,20,21,25,26,27,28,29,30,32,36,37,39,40,41,44,46,47,48,49,50,51,53,54,55,59,65,66,67,69,70,72,73,74,75,77,78,79,82,84,85,88,89,91,92,94,95,97,98,99,100,102,104,105,106,107,108,111,112,114,115,118,119,120,121,122,126,128,129,135,136,137,138,140,145,147,148,149,150,151,152,153,154,157,164,165,166,167,168,172,173,174,176,177,178,179,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,213,214,225,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,253,254,255,262,264,265,270,271,275,276,277,278,279,280,283,284,285,286,287,288,290,291,292,293,294,295,297,301,305,306,308,310,311,314,315,316,319,320,321,322,323,326,331,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,369,370,371,374,378,379,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,409,417,420,423,431,432,433,434,435,436,437,438,439,448,449,450,456,457,462,463,464,466,467,468,470,471,473,474,475,478,480,482,483,485,489,490,498,499,501,502,503,505,510,511,512,523,526,528,530,531,532,533,539,554,560,561,562,563,564,565,568,569,571,573,575,577,579,581,584,585,586,591,592,600,618,619,621,622,625,627,630,635,636,638,640,642,643,644,645,653,656,658,659,660,662,672,674,677,678,679,680,682,684,687,690,692,694,695,699,701,704,705,707,708,709,710,711,712,713,720,721,722,728,731,732,733,734,735,736,738,744,745,746,751,752,753,754,755,756,760,762,763,764,766,767,768,770,774,777,778,779,780,781,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,9,-3,9,-372,-229,-336,-335,9,-371,9,9,-333,-341,-338,9,9,9,-322,9,9,-193,9,9,9,-334,9,-191,9,9,-192,9,9,-373,9,-337,9,-2,-5,-217,-6,-4,-210,-326,-7,-207,-327,189,-216,9,-316,9,-339,-340,-323,-51,-208,-48,-358,9,-166,9,-332,9,9,-301,-175,-292,-306,-291,-373,9,9,189,-183,189,-43,189,-305,-294,189,-297,-210,9,-302,9,-304,-320,189,-373,189,189,-25,9,-24,189,-41,-293,9,-170,-177,-373,-210,-207,-172,-171,-296,9,9,9,9,-328,9,9,9,9,9,9,9,9,-49,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,189,-39,9,9,9,-210,-209,189,9,-299,9,9,9,9,-298,9,9,9,9,9,9,9,9,-300,189,-303,9,-329,-373,-9,189,189,-44,-46,420,189,189,-222,9,-373,-226,-373,-228,-212,-331,9,-47,9,-31,-23,-27,-28,-26,-29,-42,-324,9,-211,-330,9,-45,189,-169,9,-182,-173,-325,189,189,189,189,9,-357,189,189,189,189,-277,-278,-276,-274,189,189,-275,189,189,189,189,189,189,189,189,189,189,189,189,189,-290,189,-281,-40,-317,189,-13,-12,420,189,-321,189,189,189,189,189,9,189,189,189,189,189,189,189,189,-55,-10,9,9,-311,420,9,-8,420,420,-310,9,9,189,-203,9,-373,-221,-223,9,9,189,189,-326,9,9,189,9,-211,-373,-174,-212,-215,-214,9,9,-230,-194,9,9,-318,9,-201,-307,-218,189,9,-11,-56,-373,-59,420,189,-227,-205,-190,9,9,420,9,-34,-373,-69,-176,-179,-181,-38,189,189,-195,189,9,189,-50,-373,-373,-196,9,420,-108,9,-202,-204,189,420,420,420,-200,-199,-30,189,-198,-197,9,-178,9,189,9,-373,-61,9,420,420,-373,-225,-224,-373,420,420,-373,-107,-180,9,-83,189,-35,-32,9,-63,-373,-81,-37,-60,420,420,9,-206,9,9,-70,-84,189,-91,-373,-90,-85,-64,9,9,420,420,-36,-373,-75,-106,-248,-373,9,-86,-373,9,189,420,9,-373,9,-33,9,189,9,-82,9,-62,-76,-373,-373,-373,-52,-54,9,9,-373,9,-53,]),'COMMENT':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,411,417,505,510,511,512,514,515,556,560,561,562,568,581,584,585,591,593,596,600,638,641,644,658,659,660,670,680,687,690,695,701,704,707,708,709,710,711,714,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,10,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,10,-24,-41,-49,-39,10,-373,-9,-44,-46,-47,10,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,10,-373,-8,-11,-56,-373,-59,10,-120,-373,-34,-373,-69,-38,-50,-373,-373,10,-122,-119,-108,-30,10,10,10,-373,-61,-124,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,-123,10,10,-70,-84,-91,-373,-90,-85,-64,10,-36,-373,-75,-106,-373,10,-86,-373,10,-373,10,-33,10,-82,10,-62,-76,-373,-373,-373,-140,-121,-52,-54,10,10,-139,-373,10,-53,]),'RPAREN':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,117,120,121,122,126,128,129,136,138,140,148,149,157,165,166,167,168,172,173,174,176,180,181,183,211,214,225,228,229,230,232,237,246,248,251,255,257,270,271,272,273,275,277,278,279,280,282,283,284,297,305,306,311,314,315,316,319,320,321,326,328,329,330,331,332,333,334,336,337,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,368,370,371,380,381,382,383,384,385,387,388,389,390,391,392,394,395,396,397,398,399,400,401,404,407,419,427,431,435,436,437,438,439,440,443,444,445,447,448,449,452,462,463,467,468,469,470,471,473,474,476,477,478,479,480,481,482,484,486,488,489,498,499,501,502,504,507,508,509,519,520,522,523,525,526,528,529,530,531,534,535,537,540,543,544,557,558,563,564,565,569,571,573,574,575,576,578,579,582,583,586,587,589,590,612,613,614,615,616,617,618,619,621,626,628,629,634,635,636,642,643,645,652,654,655,656,661,664,673,674,675,676,677,678,679,681,683,685,692,699,718,719,721,723,724,726,727,729,739,757,760,768,771,773,776,781,785,787,806,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,261,-314,-305,-294,-319,-297,-210,-302,-304,-320,-312,-315,-293,-170,-177,-373,-210,-207,-172,-171,-296,-373,-328,-373,-373,370,-373,-210,-209,387,-299,-298,-300,-303,-329,407,409,431,-74,-72,-71,-222,-373,-226,-373,-228,-373,-212,-331,-324,-211,-330,466,-169,-373,-182,-173,-325,472,-236,-373,480,-231,-373,-357,482,-246,-245,-244,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-187,-186,-188,487,-317,489,-105,-104,496,498,-309,499,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,503,-373,-311,-342,-345,-310,-203,-373,-373,-221,-223,-373,-152,-153,-154,541,-373,-373,546,-373,-373,-211,-373,565,-174,-212,-215,-214,-235,-232,-242,-241,-230,573,-194,-247,-373,-373,-318,-201,-307,-218,-168,586,-373,-77,-57,-349,-343,-348,-373,-346,-73,-227,619,-205,-190,624,-155,-156,-157,635,636,642,643,-176,-179,-181,-240,-234,-195,-243,-295,655,-185,657,-103,-308,-196,-78,662,-79,-344,-354,-351,-373,675,-347,-373,-202,-204,-158,-159,-160,-151,-200,-199,-198,-197,-178,-239,-233,-189,-184,-80,-58,-352,-242,-350,720,-373,-225,-224,-161,-162,-163,-180,-238,-356,-353,-206,-164,-165,758,-254,761,-237,-253,-248,782,-373,-355,-252,789,791,-251,807,]),'UNSET_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,11,-3,11,-372,11,-371,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-373,11,11,-2,-5,-6,-4,-7,11,11,-51,-48,11,11,11,11,-373,11,11,-43,11,11,-373,-25,11,-24,-41,11,11,11,11,11,11,11,11,11,11,11,11,11,-49,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-39,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-373,-9,-44,-46,11,11,-47,11,-31,-23,-27,-28,-26,-29,-42,11,11,-45,11,11,-40,-13,-12,11,-55,-10,11,11,11,-8,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-11,-56,-373,-59,11,11,11,-34,-373,-69,-38,11,-50,-373,-373,11,-108,11,-30,11,11,11,-373,-61,11,-373,-373,-107,11,-83,-35,-32,11,-63,-373,-81,-37,-60,11,11,11,-70,-84,-91,-373,-90,-85,-64,11,11,-36,-373,-75,-106,-373,11,-86,-373,11,11,-373,11,-33,11,11,-82,11,-62,-76,-373,-373,-373,-52,-54,11,11,-373,11,-53,]),'END_HEREDOC':([62,156,175,298,299,300,547,548,553,639,730,],[-373,-360,320,-359,-361,-362,-367,-364,-365,-363,-366,]),'PLUS':([0,1,3,4,5,6,7,8,9,10,11,12,13,17,19,20,21,25,26,27,28,29,30,32,36,37,39,40,41,44,46,47,48,49,50,51,53,54,55,59,65,66,67,69,70,72,73,74,75,77,78,79,82,84,85,88,89,91,92,94,95,97,98,99,100,102,104,105,106,107,108,111,112,114,115,118,119,120,121,122,126,128,129,135,136,137,138,140,145,147,148,149,150,151,152,153,154,157,164,165,166,167,168,172,173,174,176,177,178,179,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,213,214,225,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,253,254,255,262,264,265,270,271,275,276,277,278,279,280,283,284,285,286,287,288,290,291,292,293,294,295,297,301,305,306,308,310,311,314,315,316,319,320,321,322,323,326,331,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,369,370,371,374,378,379,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,409,417,420,423,431,432,433,434,435,436,437,438,439,448,449,450,456,457,462,463,464,466,467,468,470,471,473,474,475,478,480,482,483,485,489,490,498,499,501,502,503,505,510,511,512,523,526,528,530,531,532,533,539,554,560,561,562,563,564,565,568,569,571,573,575,577,579,581,584,585,586,591,592,600,618,619,621,622,625,627,630,635,636,638,640,642,643,644,645,653,656,658,659,660,662,672,674,677,678,679,680,682,684,687,690,692,694,695,699,701,704,705,707,708,709,710,711,712,713,720,721,722,728,731,732,733,734,735,736,738,744,745,746,751,752,753,754,755,756,760,762,763,764,766,767,768,770,774,777,778,779,780,781,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,12,-3,12,-372,-229,-336,-335,12,-371,12,12,-333,-341,-338,12,12,12,-322,12,12,-193,12,12,12,-334,12,-191,12,12,-192,12,12,-373,12,-337,12,-2,-5,-217,-6,-4,-210,-326,-7,-207,-327,194,-216,12,-316,12,-339,-340,-323,-51,-208,-48,-358,12,-166,12,-332,12,12,-301,-175,-292,-306,-291,-373,12,12,194,-183,194,-43,194,-305,-294,194,-297,-210,12,-302,12,-304,-320,194,-373,194,194,-25,12,-24,194,-41,-293,12,-170,-177,-373,-210,-207,-172,-171,-296,12,12,12,12,-328,12,12,12,12,12,12,12,12,-49,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,194,-39,12,12,12,-210,-209,194,12,-299,12,12,12,12,-298,12,12,12,12,12,12,12,12,-300,194,-303,12,-329,-373,-9,194,194,-44,-46,423,194,194,-222,12,-373,-226,-373,-228,-212,-331,12,-47,12,-31,-23,-27,-28,-26,-29,-42,-324,12,-211,-330,12,-45,194,-169,12,-182,-173,-325,194,194,194,194,12,-357,194,194,194,194,-277,-278,-276,-274,194,194,-275,194,194,194,194,194,194,194,194,194,194,194,194,194,-290,194,-281,-40,-317,194,-13,-12,423,194,-321,194,194,194,194,194,12,194,194,194,194,194,194,194,194,-55,-10,12,12,-311,423,12,-8,423,423,-310,12,12,194,-203,12,-373,-221,-223,12,12,194,194,-326,12,12,194,12,-211,-373,-174,-212,-215,-214,12,12,-230,-194,12,12,-318,12,-201,-307,-218,194,12,-11,-56,-373,-59,423,194,-227,-205,-190,12,12,423,12,-34,-373,-69,-176,-179,-181,-38,194,194,-195,194,12,194,-50,-373,-373,-196,12,423,-108,12,-202,-204,194,423,423,423,-200,-199,-30,194,-198,-197,12,-178,12,194,12,-373,-61,12,423,423,-373,-225,-224,-373,423,423,-373,-107,-180,12,-83,194,-35,-32,12,-63,-373,-81,-37,-60,423,423,12,-206,12,12,-70,-84,194,-91,-373,-90,-85,-64,12,12,423,423,-36,-373,-75,-106,-248,-373,12,-86,-373,12,194,423,12,-373,12,-33,12,194,12,-82,12,-62,-76,-373,-373,-373,-52,-54,12,12,-373,12,-53,]),'XOR_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,244,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'BODY':([49,147,511,561,584,680,687,708,734,735,736,754,762,766,777,794,795,808,],[150,150,150,150,150,150,150,150,-91,150,-90,150,150,150,150,150,150,150,]),'RBRACE':([3,5,6,7,8,10,13,17,19,26,29,37,40,46,49,51,54,55,59,65,66,67,69,70,72,73,75,78,82,84,85,88,89,91,92,95,98,102,104,105,106,107,108,114,115,119,120,121,122,126,128,129,136,138,140,147,148,149,150,151,152,154,157,165,166,167,168,172,173,174,176,181,191,213,228,229,232,237,246,248,250,251,252,253,262,264,275,277,278,279,280,283,284,286,287,288,290,291,292,293,294,295,297,305,306,310,314,316,319,320,322,332,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,369,370,374,378,386,387,388,389,390,391,392,394,395,396,397,398,399,400,402,403,405,407,411,417,431,434,435,437,438,439,453,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,505,510,512,514,515,528,530,531,556,560,562,563,564,565,566,568,573,575,581,585,586,593,596,600,619,621,622,635,636,638,641,642,643,645,647,648,649,656,659,660,670,677,678,679,680,687,689,690,692,693,695,701,704,707,709,710,711,714,721,722,728,731,732,734,735,736,738,744,753,755,756,760,762,763,764,777,778,779,783,788,790,792,793,795,796,797,798,799,801,803,808,809,810,],[-3,-372,-229,-336,-335,-371,-333,-341,-338,-322,-193,-334,-191,-192,-373,-337,-2,-5,-217,-6,-4,-210,-326,-7,-207,-327,-216,-316,-339,-340,-323,-51,-208,-48,-358,-166,-332,-301,-175,-292,-306,-291,-373,-313,-183,-43,-314,-305,-294,-319,-297,-210,-302,-304,-320,-373,-312,-315,-25,288,-24,-41,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,-49,-39,-210,-209,-299,-298,-300,-303,403,-329,-373,-9,-44,-46,-222,-373,-226,-373,-228,-212,-331,-47,451,-31,-23,-27,-28,-26,-29,-42,-324,-211,-330,-45,-169,-182,-173,-325,473,-357,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-40,-317,-13,-12,501,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-55,-10,505,-311,-373,-8,-310,528,-203,-373,-221,-223,547,553,-326,559,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,-11,-56,-59,600,-120,-227,-205,-190,-373,-34,-69,-176,-179,-181,-373,-38,-195,-295,-50,-373,-196,-122,-119,-108,-202,-204,678,-200,-199,-30,690,-198,-197,-178,-373,695,-87,-184,-373,-61,-124,-373,-225,-224,-373,-373,730,-107,-180,732,-83,-35,-32,-63,-81,-37,-60,-123,-206,756,760,-70,-84,-91,-373,-90,-85,-64,-36,-75,-106,-248,-373,-89,-86,-373,-88,-33,-82,793,-62,-76,-373,-373,-140,-121,-52,-54,803,-139,-373,810,-53,]),'DNUMBER':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,13,-3,13,-372,13,-371,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-373,13,13,-2,-5,-6,-4,-7,13,13,-51,-48,13,13,13,13,-373,13,13,-43,13,13,-373,-25,13,-24,-41,13,13,13,13,13,13,13,13,13,13,13,13,13,-49,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-39,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-373,-9,-44,-46,13,13,13,-47,13,-31,-23,-27,-28,-26,-29,-42,13,13,-45,13,13,-40,-13,-12,13,13,-55,-10,13,13,13,13,-8,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-11,-56,-373,-59,13,13,13,13,13,-34,-373,-69,-38,13,-50,-373,-373,13,13,-108,13,13,13,13,-30,13,13,13,-373,-61,13,13,13,-373,13,13,-373,-107,13,-83,-35,-32,13,-63,-373,-81,-37,-60,13,13,13,13,13,-70,-84,-91,-373,-90,-85,-64,13,13,13,13,-36,-373,-75,-106,-373,13,-86,-373,13,13,13,-373,13,-33,13,13,-82,13,-62,-76,-373,-373,-373,-52,-54,13,13,-373,13,-53,]),'BOOLEAN_OR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,198,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,198,-183,198,198,-305,-294,198,-297,-210,-302,-304,-320,198,198,198,198,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,198,-210,-209,198,-299,-298,-300,198,-303,-329,198,198,198,198,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,198,-169,-182,-173,-325,198,198,198,198,-357,198,-289,198,-288,-277,-278,-276,-274,198,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,198,-282,198,-279,-290,-272,-281,-317,198,198,-321,198,198,198,198,198,198,198,198,198,198,198,198,198,-311,-310,198,-203,-373,-221,-223,198,198,-326,198,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,198,-227,-205,-190,-176,-179,-181,198,198,-195,198,198,-196,-202,-204,198,-200,-199,198,-198,-197,-178,198,-373,-225,-224,-180,198,-206,198,-248,198,198,]),'NAMESPACE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,49,50,53,54,55,61,63,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,161,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,259,262,264,265,276,282,285,286,287,288,290,291,292,293,294,295,296,301,303,308,310,315,327,331,335,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,440,448,449,458,462,463,466,475,478,483,485,486,488,490,497,500,503,505,510,511,512,518,523,532,533,539,542,554,560,561,562,568,570,572,577,581,584,585,591,592,600,618,625,627,630,637,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,700,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,771,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,804,808,809,810,],[-373,14,-3,101,-372,101,-371,101,101,101,101,101,101,101,101,101,131,101,101,101,101,101,101,-373,101,101,-2,-5,169,131,-6,-4,-7,101,101,-51,-48,101,101,101,101,-373,101,101,-43,101,101,-373,-25,101,-24,-41,131,101,101,101,101,101,101,101,101,101,101,101,101,101,-49,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,131,-39,101,131,101,131,101,101,101,101,101,101,101,101,101,101,101,101,101,101,14,-373,-9,413,-44,-46,425,101,169,101,-47,101,-31,-23,-27,-28,-26,-29,-42,131,101,413,101,-45,101,131,101,131,-40,-13,-12,425,101,-55,-10,101,14,425,101,-8,425,425,101,101,101,169,101,101,413,101,101,101,101,101,101,101,131,131,101,131,131,101,-11,-56,-373,-59,413,425,101,101,425,169,101,-34,-373,-69,-38,131,131,101,-50,-373,-373,101,425,-108,101,425,425,425,413,-30,101,101,101,-373,-61,101,425,425,-373,425,425,-373,-107,101,-83,131,-35,-32,101,-63,-373,-81,-37,-60,425,425,101,101,101,-70,-84,-91,-373,-90,-85,-64,101,101,425,425,-36,-373,-75,-106,-373,101,-86,-373,101,425,169,101,-373,101,-33,101,101,-82,101,-62,-76,-373,-373,-373,-52,-54,101,101,413,-373,101,-53,]),'BOOLEAN_AND':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,200,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,200,-183,200,200,-305,-294,200,-297,-210,-302,-304,-320,200,200,200,200,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,200,-210,-209,200,-299,-298,-300,200,-303,-329,200,200,200,200,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,200,-169,-182,-173,-325,200,200,200,200,-357,200,-289,200,-288,-277,-278,-276,-274,200,-284,-275,-271,-286,-273,200,-285,-266,-287,-283,-280,200,-282,200,-279,-290,-272,-281,-317,200,200,-321,200,200,200,200,200,200,200,200,200,200,200,200,200,-311,-310,200,-203,-373,-221,-223,200,200,-326,200,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,200,-227,-205,-190,-176,-179,-181,200,200,-195,200,200,-196,-202,-204,200,-200,-199,200,-198,-197,-178,200,-373,-225,-224,-180,200,-206,200,-248,200,200,]),'ENCAPSED_AND_WHITESPACE':([52,62,155,156,175,298,299,300,422,547,548,553,639,730,],[-373,-373,299,-360,299,-359,-361,-362,521,-367,-364,-365,-363,-366,]),'EXTENDS':([116,158,],[259,303,]),'FOREACH':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,15,-3,-372,-371,-373,-2,-5,-6,-4,-7,15,-51,-48,-373,-43,-373,-25,15,-24,-41,-49,-39,15,-373,-9,-44,-46,-47,15,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,15,15,-8,15,15,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,15,-108,-30,15,15,-373,-61,15,-373,-373,-107,-83,-35,-32,15,-63,-373,-81,-37,-60,15,15,15,-70,-84,-91,-373,-90,-85,-64,15,-36,-373,-75,-106,-373,15,-86,-373,15,-373,15,-33,15,15,-82,15,-62,-76,-373,-373,-373,-52,-54,15,15,-373,15,-53,]),'EVAL':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,16,-3,16,-372,16,-371,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-373,16,16,-2,-5,-6,-4,-7,16,16,-51,-48,16,16,16,16,-373,16,16,-43,16,16,-373,-25,16,-24,-41,16,16,16,16,16,16,16,16,16,16,16,16,16,-49,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-39,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-373,-9,-44,-46,16,16,-47,16,-31,-23,-27,-28,-26,-29,-42,16,16,-45,16,16,-40,-13,-12,16,-55,-10,16,16,16,-8,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-11,-56,-373,-59,16,16,16,-34,-373,-69,-38,16,-50,-373,-373,16,-108,16,-30,16,16,16,-373,-61,16,-373,-373,-107,16,-83,-35,-32,16,-63,-373,-81,-37,-60,16,16,16,-70,-84,-91,-373,-90,-85,-64,16,16,-36,-373,-75,-106,-373,16,-86,-373,16,16,-373,16,-33,16,16,-82,16,-62,-76,-373,-373,-373,-52,-54,16,16,-373,16,-53,]),'ENDIF':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,568,581,584,585,600,638,658,659,660,690,695,701,702,703,704,707,709,710,711,731,732,738,740,743,744,753,755,756,764,766,779,780,783,790,792,793,794,798,799,800,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-38,-50,-373,-373,-108,-30,-373,-373,-61,-107,-83,-35,-65,-373,-32,-63,-81,-37,-60,-70,-84,-85,765,-67,-64,-36,-75,-106,-86,-373,-33,-68,-82,-62,-76,-373,-373,-52,-54,-66,-53,]),'VAR':([5,10,411,514,515,556,593,596,641,670,714,796,797,803,],[-372,-371,-373,604,-120,-373,-122,-119,604,-124,-123,-140,-121,-139,]),'IS_SMALLER_OR_EQUAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,201,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,201,-183,201,201,-305,-294,201,-297,-210,-302,-304,-320,201,201,201,201,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,201,-210,-209,201,-299,-298,-300,201,-303,-329,201,201,201,201,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,201,-169,-182,-173,-325,201,201,201,201,-357,201,None,201,None,-277,-278,-276,-274,201,201,-275,201,None,201,201,201,201,None,201,-280,201,201,201,-279,-290,201,-281,-317,201,201,-321,201,201,201,201,201,201,201,201,201,201,201,201,201,-311,-310,201,-203,-373,-221,-223,201,201,-326,201,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,201,201,-227,-205,-190,-176,-179,-181,201,201,-195,201,201,-196,-202,-204,201,-200,-199,201,-198,-197,-178,201,-373,-225,-224,-180,201,-206,201,-248,201,201,]),'IS_NOT_IDENTICAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,202,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,202,-183,202,202,-305,-294,202,-297,-210,-302,-304,-320,202,202,202,202,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,202,-210,-209,202,-299,-298,-300,202,-303,-329,202,202,202,202,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,202,-169,-182,-173,-325,202,202,202,202,-357,202,-289,202,-288,-277,-278,-276,-274,202,None,-275,202,-286,202,202,None,202,-287,None,-280,202,None,202,-279,-290,202,-281,-317,202,202,-321,202,202,202,202,202,202,202,202,202,202,202,202,202,-311,-310,202,-203,-373,-221,-223,202,202,-326,202,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,202,202,-227,-205,-190,-176,-179,-181,202,202,-195,202,202,-196,-202,-204,202,-200,-199,202,-198,-197,-178,202,-373,-225,-224,-180,202,-206,202,-248,202,202,]),'NS_C':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,17,-3,17,-372,17,-371,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-373,17,17,-2,-5,-6,-4,-7,17,17,-51,-48,17,17,17,17,-373,17,17,-43,17,17,-373,-25,17,-24,-41,17,17,17,17,17,17,17,17,17,17,17,17,17,-49,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-39,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-373,-9,-44,-46,17,17,17,-47,17,-31,-23,-27,-28,-26,-29,-42,17,17,-45,17,17,-40,-13,-12,17,17,-55,-10,17,17,17,17,-8,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-11,-56,-373,-59,17,17,17,17,17,-34,-373,-69,-38,17,-50,-373,-373,17,17,-108,17,17,17,17,-30,17,17,17,-373,-61,17,17,17,-373,17,17,-373,-107,17,-83,-35,-32,17,-63,-373,-81,-37,-60,17,17,17,17,17,-70,-84,-91,-373,-90,-85,-64,17,17,17,17,-36,-373,-75,-106,-373,17,-86,-373,17,17,17,-373,17,-33,17,17,-82,17,-62,-76,-373,-373,-373,-52,-54,17,17,-373,17,-53,]),'DECLARE':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,18,-3,-372,-371,-373,-2,-5,-6,-4,-7,18,-51,-48,-373,-43,-373,-25,18,-24,-41,-49,-39,18,-373,-9,-44,-46,-47,18,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,18,18,-8,18,18,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,18,-108,-30,18,18,-373,-61,18,-373,-373,-107,-83,-35,-32,18,-63,-373,-81,-37,-60,18,18,18,-70,-84,-91,-373,-90,-85,-64,18,-36,-373,-75,-106,-373,18,-86,-373,18,-373,18,-33,18,18,-82,18,-62,-76,-373,-373,-373,-52,-54,18,18,-373,18,-53,]),'LOGICAL_XOR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,204,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,204,-183,204,204,-305,-294,-319,-297,-210,-302,-304,-320,204,204,204,204,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,204,-210,-209,204,-299,-298,-300,204,-303,-329,204,204,204,204,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,204,-169,-182,-173,-325,204,204,204,204,-357,204,-289,-268,-288,-277,-278,-276,-274,204,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,204,-279,-290,-272,-281,-317,204,204,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,204,-311,-310,204,-203,-373,-221,-223,204,204,-326,204,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,204,-227,-205,-190,-176,-179,-181,204,204,-195,-295,204,-196,-202,-204,204,-200,-199,204,-198,-197,-178,-184,-373,-225,-224,-180,204,-206,204,-248,204,204,]),'CLASS_C':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,19,-3,19,-372,19,-371,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-373,19,19,-2,-5,-6,-4,-7,19,19,-51,-48,19,19,19,19,-373,19,19,-43,19,19,-373,-25,19,-24,-41,19,19,19,19,19,19,19,19,19,19,19,19,19,-49,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-39,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-373,-9,-44,-46,19,19,19,-47,19,-31,-23,-27,-28,-26,-29,-42,19,19,-45,19,19,-40,-13,-12,19,19,-55,-10,19,19,19,19,-8,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-11,-56,-373,-59,19,19,19,19,19,-34,-373,-69,-38,19,-50,-373,-373,19,19,-108,19,19,19,19,-30,19,19,19,-373,-61,19,19,19,-373,19,19,-373,-107,19,-83,-35,-32,19,-63,-373,-81,-37,-60,19,19,19,19,19,-70,-84,-91,-373,-90,-85,-64,19,19,19,19,-36,-373,-75,-106,-373,19,-86,-373,19,19,19,-373,19,-33,19,19,-82,19,-62,-76,-373,-373,-373,-52,-54,19,19,-373,19,-53,]),'INCLUDE_ONCE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,20,-3,20,-372,20,-371,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-373,20,20,-2,-5,-6,-4,-7,20,20,-51,-48,20,20,20,20,-373,20,20,-43,20,20,-373,-25,20,-24,-41,20,20,20,20,20,20,20,20,20,20,20,20,20,-49,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-39,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-373,-9,-44,-46,20,20,-47,20,-31,-23,-27,-28,-26,-29,-42,20,20,-45,20,20,-40,-13,-12,20,-55,-10,20,20,20,-8,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-11,-56,-373,-59,20,20,20,-34,-373,-69,-38,20,-50,-373,-373,20,-108,20,-30,20,20,20,-373,-61,20,-373,-373,-107,20,-83,-35,-32,20,-63,-373,-81,-37,-60,20,20,20,-70,-84,-91,-373,-90,-85,-64,20,20,-36,-373,-75,-106,-373,20,-86,-373,20,20,-373,20,-33,20,20,-82,20,-62,-76,-373,-373,-373,-52,-54,20,20,-373,20,-53,]),'CLONE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,21,-3,21,-372,21,-371,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-373,21,21,-2,-5,-6,-4,-7,21,21,-51,-48,21,21,21,21,-373,21,21,-43,21,21,-373,-25,21,-24,-41,21,21,21,21,21,21,21,21,21,21,21,21,21,-49,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-39,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-373,-9,-44,-46,21,21,-47,21,-31,-23,-27,-28,-26,-29,-42,21,21,-45,21,21,-40,-13,-12,21,-55,-10,21,21,21,-8,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-11,-56,-373,-59,21,21,21,-34,-373,-69,-38,21,-50,-373,-373,21,-108,21,-30,21,21,21,-373,-61,21,-373,-373,-107,21,-83,-35,-32,21,-63,-373,-81,-37,-60,21,21,21,-70,-84,-91,-373,-90,-85,-64,21,21,-36,-373,-75,-106,-373,21,-86,-373,21,21,-373,21,-33,21,21,-82,21,-62,-76,-373,-373,-373,-52,-54,21,21,-373,21,-53,]),'IS_IDENTICAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,205,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,205,-183,205,205,-305,-294,205,-297,-210,-302,-304,-320,205,205,205,205,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,205,-210,-209,205,-299,-298,-300,205,-303,-329,205,205,205,205,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,205,-169,-182,-173,-325,205,205,205,205,-357,205,-289,205,-288,-277,-278,-276,-274,205,None,-275,205,-286,205,205,None,205,-287,None,-280,205,None,205,-279,-290,205,-281,-317,205,205,-321,205,205,205,205,205,205,205,205,205,205,205,205,205,-311,-310,205,-203,-373,-221,-223,205,205,-326,205,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,205,205,-227,-205,-190,-176,-179,-181,205,205,-195,205,205,-196,-202,-204,205,-200,-199,205,-198,-197,-178,205,-373,-225,-224,-180,205,-206,205,-248,205,205,]),'ISSET':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,90,-3,90,-372,90,-371,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-373,90,90,-2,-5,-6,-4,-7,90,90,-51,-48,90,90,90,90,-373,90,90,-43,90,90,-373,-25,90,-24,-41,90,90,90,90,90,90,90,90,90,90,90,90,90,-49,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-39,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-373,-9,-44,-46,90,90,-47,90,-31,-23,-27,-28,-26,-29,-42,90,90,-45,90,90,-40,-13,-12,90,-55,-10,90,90,90,-8,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-11,-56,-373,-59,90,90,90,-34,-373,-69,-38,90,-50,-373,-373,90,-108,90,-30,90,90,90,-373,-61,90,-373,-373,-107,90,-83,-35,-32,90,-63,-373,-81,-37,-60,90,90,90,-70,-84,-91,-373,-90,-85,-64,90,90,-36,-373,-75,-106,-373,90,-86,-373,90,90,-373,90,-33,90,90,-82,90,-62,-76,-373,-373,-373,-52,-54,90,90,-373,90,-53,]),'ELSEIF':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,568,581,584,585,600,638,658,659,660,690,695,701,702,703,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,794,798,799,800,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-38,-50,-373,-373,-108,-30,-373,706,-61,-107,-83,-35,-65,742,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-373,-52,-54,-66,-53,]),'OR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,209,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,209,-183,209,209,-305,-294,209,-297,-210,-302,-304,-320,209,209,209,209,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,209,-210,-209,209,-299,-298,-300,209,-303,-329,209,209,209,209,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,209,-169,-182,-173,-325,209,209,209,209,-357,209,-289,209,-288,-277,-278,-276,-274,209,-284,-275,-271,-286,-273,209,-285,209,-287,-283,-280,209,-282,209,-279,-290,-272,-281,-317,209,209,-321,209,209,209,209,209,209,209,209,209,209,209,209,209,-311,-310,209,-203,-373,-221,-223,209,209,-326,209,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,209,-227,-205,-190,-176,-179,-181,209,209,-195,209,209,-196,-202,-204,209,-200,-199,209,-198,-197,-178,209,-373,-225,-224,-180,209,-206,209,-248,209,209,]),'HALT_COMPILER':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,417,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,680,687,690,695,701,704,707,708,709,710,711,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,24,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,289,-24,-41,-49,-39,24,-373,-9,-44,-46,-47,289,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,24,-8,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,289,-108,-30,289,289,-373,-61,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,289,289,-70,-84,-91,-373,-90,-85,-64,289,-36,-373,-75,-106,-373,289,-86,-373,289,-373,289,-33,289,-82,289,-62,-76,-373,-373,-373,-52,-54,289,289,-373,289,-53,]),'DIV_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,240,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'RETURN':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,25,-3,-372,-371,-373,-2,-5,-6,-4,-7,25,-51,-48,-373,-43,-373,-25,25,-24,-41,-49,-39,25,-373,-9,-44,-46,-47,25,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,25,25,-8,25,25,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,25,-108,-30,25,25,-373,-61,25,-373,-373,-107,-83,-35,-32,25,-63,-373,-81,-37,-60,25,25,25,-70,-84,-91,-373,-90,-85,-64,25,-36,-373,-75,-106,-373,25,-86,-373,25,-373,25,-33,25,25,-82,25,-62,-76,-373,-373,-373,-52,-54,25,25,-373,25,-53,]),'REQUIRE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,27,-3,27,-372,27,-371,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-373,27,27,-2,-5,-6,-4,-7,27,27,-51,-48,27,27,27,27,-373,27,27,-43,27,27,-373,-25,27,-24,-41,27,27,27,27,27,27,27,27,27,27,27,27,27,-49,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-39,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-373,-9,-44,-46,27,27,-47,27,-31,-23,-27,-28,-26,-29,-42,27,27,-45,27,27,-40,-13,-12,27,-55,-10,27,27,27,-8,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-11,-56,-373,-59,27,27,27,-34,-373,-69,-38,27,-50,-373,-373,27,-108,27,-30,27,27,27,-373,-61,27,-373,-373,-107,27,-83,-35,-32,27,-63,-373,-81,-37,-60,27,27,27,-70,-84,-91,-373,-90,-85,-64,27,27,-36,-373,-75,-106,-373,27,-86,-373,27,27,-373,27,-33,27,27,-82,27,-62,-76,-373,-373,-373,-52,-54,27,27,-373,27,-53,]),'BOOL_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,28,-3,28,-372,28,-371,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-373,28,28,-2,-5,-6,-4,-7,28,28,-51,-48,28,28,28,28,-373,28,28,-43,28,28,-373,-25,28,-24,-41,28,28,28,28,28,28,28,28,28,28,28,28,28,-49,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-39,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-373,-9,-44,-46,28,28,-47,28,-31,-23,-27,-28,-26,-29,-42,28,28,-45,28,28,-40,-13,-12,28,-55,-10,28,28,28,-8,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-11,-56,-373,-59,28,28,28,-34,-373,-69,-38,28,-50,-373,-373,28,-108,28,-30,28,28,28,-373,-61,28,-373,-373,-107,28,-83,-35,-32,28,-63,-373,-81,-37,-60,28,28,28,-70,-84,-91,-373,-90,-85,-64,28,28,-36,-373,-75,-106,-373,28,-86,-373,28,28,-373,28,-33,28,28,-82,28,-62,-76,-373,-373,-373,-52,-54,28,28,-373,28,-53,]),'BOOLEAN_NOT':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,30,-3,30,-372,30,-371,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-373,30,30,-2,-5,-6,-4,-7,30,30,-51,-48,30,30,30,30,-373,30,30,-43,30,30,-373,-25,30,-24,-41,30,30,30,30,30,30,30,30,30,30,30,30,30,-49,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-39,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-373,-9,-44,-46,30,30,-47,30,-31,-23,-27,-28,-26,-29,-42,30,30,-45,30,30,-40,-13,-12,30,-55,-10,30,30,30,-8,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-11,-56,-373,-59,30,30,30,-34,-373,-69,-38,30,-50,-373,-373,30,-108,30,-30,30,30,30,-373,-61,30,-373,-373,-107,30,-83,-35,-32,30,-63,-373,-81,-37,-60,30,30,30,-70,-84,-91,-373,-90,-85,-64,30,30,-36,-373,-75,-106,-373,30,-86,-373,30,30,-373,30,-33,30,30,-82,30,-62,-76,-373,-373,-373,-52,-54,30,30,-373,30,-53,]),'STATIC':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,49,50,53,54,55,61,63,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,161,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,282,285,286,287,288,290,291,292,293,294,295,296,301,308,310,315,327,331,335,369,374,378,393,402,403,404,405,409,411,417,432,433,436,440,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,505,510,511,512,514,515,532,533,542,554,556,560,561,562,568,570,572,577,581,584,585,591,593,595,596,597,598,599,600,601,602,608,609,618,638,641,644,653,658,659,660,662,666,670,680,687,690,694,695,700,701,704,705,707,708,709,710,711,714,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,771,774,777,778,779,780,782,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,31,-3,104,-372,104,-371,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-373,104,104,-2,-5,104,104,-6,-4,-7,104,31,-51,-48,104,104,104,104,-373,104,104,-43,104,104,-373,-25,31,-24,-41,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-49,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-39,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,31,-373,-9,-44,-46,104,104,104,-47,31,-31,-23,-27,-28,-26,-29,-42,104,104,104,-45,104,104,104,104,-40,-13,-12,104,-55,-10,104,31,31,-373,-8,104,104,104,104,104,104,104,104,31,104,104,104,104,104,104,104,104,104,31,-11,-56,-373,-59,598,-120,104,104,104,104,-373,-34,-373,-69,-38,104,104,104,-50,-373,-373,31,-122,-147,-119,-144,-146,-148,-108,-145,598,-143,-142,104,-30,598,31,104,31,-373,-61,31,-141,-124,-373,-373,-107,104,-83,104,-35,-32,31,-63,-373,-81,-37,-60,-123,31,31,31,-70,-84,-91,-373,-90,-85,-64,104,31,-36,-373,-75,-106,-373,31,-86,-373,104,104,31,-373,31,-33,31,31,-82,31,-62,-76,-373,-373,-373,-140,-121,-52,-54,31,31,-139,-373,31,-53,]),'MUL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,187,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,187,-306,187,187,-183,187,187,-305,-294,187,-297,-210,-302,-304,-320,187,187,187,187,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,187,-210,-209,187,-299,-298,-300,187,-303,-329,187,187,187,187,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,187,-169,-182,-173,-325,187,187,187,187,-357,187,187,187,187,-277,-278,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,-290,187,-281,-317,187,187,-321,187,187,187,187,187,187,187,187,187,187,187,187,187,-311,-310,187,-203,-373,-221,-223,187,187,-326,187,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,187,187,-227,-205,-190,-176,-179,-181,187,187,-195,187,187,-196,-202,-204,187,-200,-199,187,-198,-197,-178,187,-373,-225,-224,-180,187,-206,187,-248,187,187,]),'PRINT':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,32,-3,32,-372,32,-371,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-373,32,32,-2,-5,-6,-4,-7,32,32,-51,-48,32,32,32,32,-373,32,32,-43,32,32,-373,-25,32,-24,-41,32,32,32,32,32,32,32,32,32,32,32,32,32,-49,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-39,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-373,-9,-44,-46,32,32,-47,32,-31,-23,-27,-28,-26,-29,-42,32,32,-45,32,32,-40,-13,-12,32,-55,-10,32,32,32,-8,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-11,-56,-373,-59,32,32,32,-34,-373,-69,-38,32,-50,-373,-373,32,-108,32,-30,32,32,32,-373,-61,32,-373,-373,-107,32,-83,-35,-32,32,-63,-373,-81,-37,-60,32,32,32,-70,-84,-91,-373,-90,-85,-64,32,32,-36,-373,-75,-106,-373,32,-86,-373,32,32,-373,32,-33,32,32,-82,32,-62,-76,-373,-373,-373,-52,-54,32,32,-373,32,-53,]),'CONCAT_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,241,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'DEC':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,29,30,32,36,39,40,41,44,46,47,48,49,50,53,54,55,59,65,66,67,70,72,75,77,79,88,89,91,94,95,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,228,229,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,275,276,277,278,279,280,283,285,286,287,288,290,291,292,293,294,295,301,305,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,435,436,437,438,439,448,449,462,463,466,473,474,475,478,482,483,485,490,498,501,503,505,510,511,512,528,530,531,532,533,554,560,561,562,568,573,577,581,584,585,586,591,600,618,619,621,635,636,638,642,643,644,653,658,659,660,662,677,678,679,680,687,690,694,695,701,704,705,707,708,709,710,711,720,721,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,33,-3,33,-372,33,-371,33,33,33,33,33,33,33,-193,33,33,33,33,-191,33,33,-192,33,33,-373,33,33,-2,-5,-217,-6,-4,-210,-7,-207,-216,33,33,-51,-208,-48,33,232,33,33,33,-373,33,33,-43,33,33,-373,-25,33,-24,-41,33,33,33,33,33,33,33,33,33,33,33,33,33,-49,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-39,33,33,33,-210,-209,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-373,-9,-44,-46,-222,33,-373,-226,-373,-228,-212,33,-47,33,-31,-23,-27,-28,-26,-29,-42,33,-211,33,-45,33,33,-40,-13,-12,33,-55,-10,33,33,33,-8,33,33,-203,33,-373,-221,-223,33,33,33,33,33,-215,-214,33,33,-194,33,33,33,-201,-218,33,-11,-56,-373,-59,-227,-205,-190,33,33,33,-34,-373,-69,-38,-195,33,-50,-373,-373,-196,33,-108,33,-202,-204,-200,-199,-30,-198,-197,33,33,33,-373,-61,33,-373,-225,-224,-373,-373,-107,33,-83,-35,-32,33,-63,-373,-81,-37,-60,33,-206,33,33,-70,-84,-91,-373,-90,-85,-64,33,33,-36,-373,-75,-106,-373,33,-86,-373,33,33,-373,33,-33,33,33,-82,33,-62,-76,-373,-373,-373,-52,-54,33,33,-373,33,-53,]),'FINAL':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,411,417,505,510,511,512,514,515,556,560,561,562,568,581,584,585,591,593,595,596,597,598,599,600,601,602,608,609,638,641,644,658,659,660,666,670,680,687,690,695,701,704,707,708,709,710,711,714,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,34,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,34,-24,-41,-49,-39,34,-373,-9,-44,-46,-47,34,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,34,-373,-8,-11,-56,-373,-59,599,-120,-373,-34,-373,-69,-38,-50,-373,-373,34,-122,-147,-119,-144,-146,-148,-108,-145,599,-143,-142,-30,599,34,34,-373,-61,-141,-124,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,-123,34,34,-70,-84,-91,-373,-90,-85,-64,34,-36,-373,-75,-106,-373,34,-86,-373,34,-373,34,-33,34,-82,34,-62,-76,-373,-373,-373,-140,-121,-52,-54,34,34,-139,-373,34,-53,]),'EMPTY':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,35,-3,35,-372,35,-371,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-373,35,35,-2,-5,-6,-4,-7,35,35,-51,-48,35,35,35,35,-373,35,35,-43,35,35,-373,-25,35,-24,-41,35,35,35,35,35,35,35,35,35,35,35,35,35,-49,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-39,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-373,-9,-44,-46,35,35,-47,35,-31,-23,-27,-28,-26,-29,-42,35,35,-45,35,35,-40,-13,-12,35,-55,-10,35,35,35,-8,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-11,-56,-373,-59,35,35,35,-34,-373,-69,-38,35,-50,-373,-373,35,-108,35,-30,35,35,35,-373,-61,35,-373,-373,-107,35,-83,-35,-32,35,-63,-373,-81,-37,-60,35,35,35,-70,-84,-91,-373,-90,-85,-64,35,35,-36,-373,-75,-106,-373,35,-86,-373,35,35,-373,35,-33,35,35,-82,35,-62,-76,-373,-373,-373,-52,-54,35,35,-373,35,-53,]),'STRING_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,36,-3,36,-372,36,-371,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-373,36,36,-2,-5,-6,-4,-7,36,36,-51,-48,36,36,36,36,-373,36,36,-43,36,36,-373,-25,36,-24,-41,36,36,36,36,36,36,36,36,36,36,36,36,36,-49,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-39,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-373,-9,-44,-46,36,36,-47,36,-31,-23,-27,-28,-26,-29,-42,36,36,-45,36,36,-40,-13,-12,36,-55,-10,36,36,36,-8,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-11,-56,-373,-59,36,36,36,-34,-373,-69,-38,36,-50,-373,-373,36,-108,36,-30,36,36,36,-373,-61,36,-373,-373,-107,36,-83,-35,-32,36,-63,-373,-81,-37,-60,36,36,36,-70,-84,-91,-373,-90,-85,-64,36,36,-36,-373,-75,-106,-373,36,-86,-373,36,36,-373,36,-33,36,36,-82,36,-62,-76,-373,-373,-373,-52,-54,36,36,-373,36,-53,]),'CONSTANT_ENCAPSED_STRING':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,37,-3,37,-372,37,-371,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-373,37,37,-2,-5,-6,-4,-7,37,37,-51,-48,37,37,37,37,-373,37,37,-43,37,37,-373,-25,37,-24,-41,37,37,37,37,37,37,37,37,37,37,37,37,37,-49,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-39,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-373,-9,-44,-46,37,37,37,-47,37,-31,-23,-27,-28,-26,-29,-42,37,37,-45,37,37,-40,-13,-12,37,37,-55,-10,37,37,37,37,-8,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-11,-56,-373,-59,37,37,37,37,37,-34,-373,-69,-38,37,-50,-373,-373,37,37,-108,37,37,37,37,-30,37,37,37,-373,-61,37,37,37,-373,37,37,-373,-107,37,-83,-35,-32,37,-63,-373,-81,-37,-60,37,37,37,37,37,-70,-84,-91,-373,-90,-85,-64,37,37,37,37,-36,-373,-75,-106,-373,37,-86,-373,37,37,37,-373,37,-33,37,37,-82,37,-62,-76,-373,-373,-373,-52,-54,37,37,-373,37,-53,]),'DOUBLE_ARROW':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,120,121,122,126,128,129,136,138,140,148,149,157,165,166,167,168,172,173,174,176,181,228,229,232,237,246,248,251,275,277,278,279,280,283,284,297,305,306,314,316,319,320,326,332,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,387,388,389,390,391,392,394,395,396,397,398,399,400,407,419,427,431,435,437,438,439,467,468,470,471,473,474,480,482,489,498,499,501,502,507,508,519,520,522,525,528,530,531,563,564,565,571,573,575,586,587,612,613,617,619,621,635,636,642,643,645,656,675,677,678,679,692,719,721,760,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,-314,-305,-294,-319,-297,-210,-302,-304,-320,-312,-315,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,-210,-209,-299,-298,-300,-303,-329,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,-169,-182,-173,-325,475,-357,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-317,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-311,-342,-345,-310,-203,-373,-221,-223,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,588,-77,-349,-343,-348,-346,-227,-205,-190,-176,-179,-181,653,-195,-295,-196,-78,-344,672,-347,-202,-204,-200,-199,-198,-197,-178,-184,-350,-373,-225,-224,-180,752,-206,-248,]),'OBJECT_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,39,-3,39,-372,39,-371,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-373,39,39,-2,-5,-6,-4,-7,39,39,-51,-48,39,39,39,39,-373,39,39,-43,39,39,-373,-25,39,-24,-41,39,39,39,39,39,39,39,39,39,39,39,39,39,-49,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-373,-9,-44,-46,39,39,-47,39,-31,-23,-27,-28,-26,-29,-42,39,39,-45,39,39,-40,-13,-12,39,-55,-10,39,39,39,-8,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-11,-56,-373,-59,39,39,39,-34,-373,-69,-38,39,-50,-373,-373,39,-108,39,-30,39,39,39,-373,-61,39,-373,-373,-107,39,-83,-35,-32,39,-63,-373,-81,-37,-60,39,39,39,-70,-84,-91,-373,-90,-85,-64,39,39,-36,-373,-75,-106,-373,39,-86,-373,39,39,-373,39,-33,39,39,-82,39,-62,-76,-373,-373,-373,-52,-54,39,39,-373,39,-53,]),'ENDFOREACH':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,568,581,585,600,638,659,660,690,695,701,704,707,708,709,710,711,731,732,738,744,746,753,755,756,764,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-38,-50,-373,-108,-30,-373,-61,-107,-83,-35,-32,-63,-373,-81,-37,-60,-70,-84,-85,-64,769,-36,-75,-106,-86,-33,-82,-62,-76,-373,-52,-54,-53,]),'ENDSWITCH':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,567,568,581,585,600,638,649,650,651,659,660,690,695,697,701,704,707,709,710,711,731,732,734,735,736,738,744,753,755,756,762,763,764,778,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-373,-38,-50,-373,-108,-30,-87,-373,698,-373,-61,-107,-83,737,-35,-32,-63,-81,-37,-60,-70,-84,-91,-373,-90,-85,-64,-36,-75,-106,-373,-89,-86,-88,-33,-82,-62,-76,-373,-52,-54,-53,]),'COLON':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,120,121,122,126,128,129,136,138,140,148,149,157,165,166,167,168,172,173,174,176,181,228,229,232,237,246,248,251,275,277,278,279,280,283,284,297,305,306,314,316,319,320,332,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,387,388,389,390,391,392,394,395,396,397,398,399,400,407,409,431,435,437,438,439,466,467,468,470,471,472,473,474,480,482,489,498,499,501,502,503,528,530,531,563,564,565,573,575,586,619,621,635,636,642,643,645,656,662,677,678,679,692,696,720,721,733,741,760,789,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,-314,-305,-294,-319,-297,-210,-302,-304,-320,-312,-315,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,-210,-209,-299,-298,-300,-303,-329,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,-169,-182,-173,-325,-357,-289,-268,-288,-277,-278,-276,-274,485,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-317,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-311,511,-310,-203,-373,-221,-223,561,-211,-373,-174,-212,567,-215,-214,-230,-194,-318,-201,-307,-218,-168,584,-227,-205,-190,-176,-179,-181,-195,-295,-196,-202,-204,-200,-199,-198,-197,-178,-184,708,-373,-225,-224,-180,736,754,-206,736,766,-248,794,]),'$end':([0,1,2,3,5,10,54,55,65,66,70,88,91,119,154,191,213,253,262,264,286,288,295,310,369,374,378,402,403,417,505,510,512,560,562,568,581,585,600,659,660,690,695,701,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,798,799,810,],[-373,-1,0,-3,-372,-371,-2,-5,-6,-4,-7,-51,-48,-43,-41,-49,-39,-9,-44,-46,-47,-31,-42,-45,-40,-13,-12,-55,-10,-8,-11,-56,-59,-34,-69,-38,-50,-373,-108,-373,-61,-107,-83,-35,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-52,-54,-53,]),'FUNCTION':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,411,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,514,515,532,533,554,556,560,561,562,568,577,581,584,585,591,593,595,596,597,598,599,600,601,602,603,606,608,609,618,638,641,644,653,658,659,660,662,666,670,680,687,690,694,695,701,704,705,707,708,709,710,711,714,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,42,-3,103,-372,103,-371,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-373,103,103,-2,-5,-6,-4,-7,103,103,-51,-48,103,103,103,103,-373,103,103,-43,103,103,-373,-25,42,-24,-41,103,103,103,103,103,103,103,103,103,103,103,103,103,-49,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-39,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,42,-373,-9,-44,-46,103,103,-47,42,-31,-23,-27,-28,-26,-29,-42,103,103,-45,103,103,-40,-13,-12,103,-55,-10,103,42,103,-373,-8,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-11,-56,-373,-59,-373,-120,103,103,103,-373,-34,-373,-69,-38,103,-50,-373,-373,42,-122,-147,-119,-144,-146,-148,-108,-145,-137,-138,669,-143,-142,103,-30,-373,42,103,42,-373,-61,103,-141,-124,-373,-373,-107,103,-83,-35,-32,103,-63,-373,-81,-37,-60,-123,103,42,42,-70,-84,-91,-373,-90,-85,-64,103,42,-36,-373,-75,-106,-373,42,-86,-373,103,42,-373,42,-33,42,103,-82,42,-62,-76,-373,-373,-373,-140,-121,-52,-54,42,42,-139,-373,42,-53,]),'IS_SMALLER':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,196,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,196,-183,196,196,-305,-294,196,-297,-210,-302,-304,-320,196,196,196,196,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,196,-210,-209,196,-299,-298,-300,196,-303,-329,196,196,196,196,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,196,-169,-182,-173,-325,196,196,196,196,-357,196,None,196,None,-277,-278,-276,-274,196,196,-275,196,None,196,196,196,196,None,196,-280,196,196,196,-279,-290,196,-281,-317,196,196,-321,196,196,196,196,196,196,196,196,196,196,196,196,196,-311,-310,196,-203,-373,-221,-223,196,196,-326,196,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,196,196,-227,-205,-190,-176,-179,-181,196,196,-195,196,196,-196,-202,-204,196,-200,-199,196,-198,-197,-178,196,-373,-225,-224,-180,196,-206,196,-248,196,196,]),'FOR':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,38,-3,-372,-371,-373,-2,-5,-6,-4,-7,38,-51,-48,-373,-43,-373,-25,38,-24,-41,-49,-39,38,-373,-9,-44,-46,-47,38,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,38,38,-8,38,38,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,38,-108,-30,38,38,-373,-61,38,-373,-373,-107,-83,-35,-32,38,-63,-373,-81,-37,-60,38,38,38,-70,-84,-91,-373,-90,-85,-64,38,-36,-373,-75,-106,-373,38,-86,-373,38,-373,38,-33,38,38,-82,38,-62,-76,-373,-373,-373,-52,-54,38,38,-373,38,-53,]),'EQUALS':([29,40,46,59,67,72,75,89,95,125,221,228,229,256,275,277,278,279,280,283,305,435,437,438,439,445,473,474,482,487,498,501,513,528,530,531,535,537,540,573,586,619,621,626,628,635,636,642,643,665,667,677,678,679,717,721,749,],[-193,-191,-192,-217,-210,-207,-216,-208,236,265,379,-210,-209,408,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,539,-215,-214,-194,577,-201,-218,592,-227,-205,-190,625,627,630,-195,-196,-202,-204,682,684,-200,-199,-198,-197,712,713,-373,-225,-224,751,-206,770,]),'ELSE':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,568,581,584,585,600,638,658,659,660,690,695,701,702,703,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,794,798,799,800,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-38,-50,-373,-373,-108,-30,-373,705,-61,-107,-83,-35,-65,741,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-373,-52,-54,-66,-53,]),'TRY':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,45,-3,-372,-371,-373,-2,-5,-6,-4,-7,45,-51,-48,-373,-43,-373,-25,45,-24,-41,-49,-39,45,-373,-9,-44,-46,-47,45,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,45,45,-8,45,45,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,45,-108,-30,45,45,-373,-61,45,-373,-373,-107,-83,-35,-32,45,-63,-373,-81,-37,-60,45,45,45,-70,-84,-91,-373,-90,-85,-64,45,-36,-373,-75,-106,-373,45,-86,-373,45,-373,45,-33,45,45,-82,45,-62,-76,-373,-373,-373,-52,-54,45,45,-373,45,-53,]),'INTERFACE':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,417,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,680,687,690,695,701,704,707,708,709,710,711,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,23,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,23,-24,-41,-49,-39,23,-373,-9,-44,-46,-47,23,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,23,-8,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,23,-108,-30,23,23,-373,-61,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,23,23,-70,-84,-91,-373,-90,-85,-64,23,-36,-373,-75,-106,-373,23,-86,-373,23,-373,23,-33,23,-82,23,-62,-76,-373,-373,-373,-52,-54,23,23,-373,23,-53,]),'INCLUDE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,47,-3,47,-372,47,-371,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-373,47,47,-2,-5,-6,-4,-7,47,47,-51,-48,47,47,47,47,-373,47,47,-43,47,47,-373,-25,47,-24,-41,47,47,47,47,47,47,47,47,47,47,47,47,47,-49,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-39,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-373,-9,-44,-46,47,47,-47,47,-31,-23,-27,-28,-26,-29,-42,47,47,-45,47,47,-40,-13,-12,47,-55,-10,47,47,47,-8,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-11,-56,-373,-59,47,47,47,-34,-373,-69,-38,47,-50,-373,-373,47,-108,47,-30,47,47,47,-373,-61,47,-373,-373,-107,47,-83,-35,-32,47,-63,-373,-81,-37,-60,47,47,47,-70,-84,-91,-373,-90,-85,-64,47,47,-36,-373,-75,-106,-373,47,-86,-373,47,47,-373,47,-33,47,47,-82,47,-62,-76,-373,-373,-373,-52,-54,47,47,-373,47,-53,]),'REQUIRE_ONCE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,48,-3,48,-372,48,-371,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-373,48,48,-2,-5,-6,-4,-7,48,48,-51,-48,48,48,48,48,-373,48,48,-43,48,48,-373,-25,48,-24,-41,48,48,48,48,48,48,48,48,48,48,48,48,48,-49,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-39,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-373,-9,-44,-46,48,48,-47,48,-31,-23,-27,-28,-26,-29,-42,48,48,-45,48,48,-40,-13,-12,48,-55,-10,48,48,48,-8,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-11,-56,-373,-59,48,48,48,-34,-373,-69,-38,48,-50,-373,-373,48,-108,48,-30,48,48,48,-373,-61,48,-373,-373,-107,48,-83,-35,-32,48,-63,-373,-81,-37,-60,48,48,48,-70,-84,-91,-373,-90,-85,-64,48,48,-36,-373,-75,-106,-373,48,-86,-373,48,48,-373,48,-33,48,48,-82,48,-62,-76,-373,-373,-373,-52,-54,48,48,-373,48,-53,]),'AND':([6,7,8,13,17,19,26,29,37,40,42,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,103,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,180,181,183,212,225,228,229,230,232,236,237,246,247,248,251,254,255,270,271,275,277,278,279,280,282,283,284,297,305,306,311,314,315,316,319,320,321,322,323,326,331,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,404,406,407,431,434,435,436,437,438,439,440,441,442,448,449,450,456,457,462,463,464,467,468,470,471,473,474,475,478,480,482,483,489,498,499,501,502,526,528,530,531,542,563,564,565,569,571,573,575,579,586,588,619,621,622,635,636,640,642,643,645,653,656,669,677,678,679,686,692,699,721,733,759,760,768,771,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,141,-192,-337,-217,-210,-326,-207,-327,195,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,141,-175,-292,-306,-291,195,-183,195,195,-305,-294,195,-297,-210,-302,-304,-320,195,195,195,195,-293,-170,-177,-373,-210,-207,-172,-171,-296,327,-328,335,195,335,-210,-209,195,-299,393,-298,-300,195,-303,-329,195,195,195,195,-222,-373,-226,-373,-228,446,-212,-331,-324,-211,-330,195,-169,335,-182,-173,-325,195,195,195,195,335,-357,195,-289,195,-288,-277,-278,-276,-274,195,-284,-275,-271,-286,195,195,-285,195,-287,-283,-280,195,-282,195,-279,-290,195,-281,-317,195,195,-321,195,195,195,195,195,195,195,195,195,195,195,195,195,335,506,-311,-310,195,-203,335,-373,-221,-223,446,536,538,335,335,195,195,-326,335,335,195,-211,-373,-174,-212,-215,-214,570,572,-230,-194,335,-318,-201,-307,-218,-168,195,-227,-205,-190,446,-176,-179,-181,195,195,-195,195,195,-196,506,-202,-204,195,-200,-199,195,-198,-197,-178,700,195,141,-373,-225,-224,725,-180,195,-206,195,775,-248,195,446,195,]),'MOD_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,238,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'ENDWHILE':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,561,562,568,581,585,600,638,644,659,660,690,695,701,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-373,-69,-38,-50,-373,-108,-30,691,-373,-61,-107,-83,-35,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-52,-54,-53,]),'LBRACE':([0,1,3,5,10,14,45,49,54,55,59,65,66,67,70,75,79,88,91,92,93,108,110,116,119,129,139,147,150,151,152,154,158,161,168,191,213,228,250,252,253,258,260,262,264,278,279,286,287,288,290,291,292,293,294,295,302,304,310,313,332,369,374,378,402,403,405,409,412,415,416,417,438,439,459,460,461,466,472,473,474,501,503,505,510,511,512,517,528,541,555,560,561,562,568,581,584,585,591,600,610,611,620,624,632,633,638,644,646,658,659,660,662,678,679,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,758,761,762,763,764,766,774,777,778,779,780,782,783,788,790,791,792,793,794,795,798,799,800,801,807,808,809,810,],[-373,49,-3,-372,-371,108,147,-373,-2,-5,-217,-6,-4,178,-7,-216,49,-51,-48,-358,227,-373,252,-373,-43,178,276,-373,-25,49,-24,-41,-373,308,178,-49,-39,178,49,-373,-9,411,-134,-44,-46,-226,-373,-47,49,-31,-23,-27,-28,-26,-29,-42,-373,-112,-45,276,-357,-40,-13,-12,-55,-10,49,49,-132,-133,-114,-8,532,-223,556,-118,-113,49,566,-215,-214,-218,49,-11,-56,-373,-59,-115,-227,-373,-117,-34,-373,-69,-38,-50,-373,-373,49,-108,-116,-131,276,680,687,-250,-30,49,276,49,-373,-61,49,-225,-224,-373,-373,-107,-83,-35,-32,49,-63,-373,-81,-37,-60,49,49,49,-70,-84,-91,-373,-90,-85,-64,49,-36,-373,-75,-106,-249,777,-373,49,-86,-373,49,-373,49,-33,49,49,-82,49,-62,795,-76,-373,-373,-373,-52,-54,49,49,808,-373,49,-53,]),'MUL_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,235,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'ENDDECLARE':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,511,512,560,562,568,581,585,591,600,638,659,660,690,695,701,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-373,-59,-34,-69,-38,-50,-373,663,-108,-30,-373,-61,-107,-83,-35,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-52,-54,-53,]),'CONTINUE':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,50,-3,-372,-371,-373,-2,-5,-6,-4,-7,50,-51,-48,-373,-43,-373,-25,50,-24,-41,-49,-39,50,-373,-9,-44,-46,-47,50,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,50,50,-8,50,50,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,50,-108,-30,50,50,-373,-61,50,-373,-373,-107,-83,-35,-32,50,-63,-373,-81,-37,-60,50,50,50,-70,-84,-91,-373,-90,-85,-64,50,-36,-373,-75,-106,-373,50,-86,-373,50,-373,50,-33,50,50,-82,50,-62,-76,-373,-373,-373,-52,-54,50,50,-373,50,-53,]),'FUNC_C':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,84,-3,84,-372,84,-371,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-373,84,84,-2,-5,-6,-4,-7,84,84,-51,-48,84,84,84,84,-373,84,84,-43,84,84,-373,-25,84,-24,-41,84,84,84,84,84,84,84,84,84,84,84,84,84,-49,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-39,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-373,-9,-44,-46,84,84,84,-47,84,-31,-23,-27,-28,-26,-29,-42,84,84,-45,84,84,-40,-13,-12,84,84,-55,-10,84,84,84,84,-8,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-11,-56,-373,-59,84,84,84,84,84,-34,-373,-69,-38,84,-50,-373,-373,84,84,-108,84,84,84,84,-30,84,84,84,-373,-61,84,84,84,-373,84,84,-373,-107,84,-83,-35,-32,84,-63,-373,-81,-37,-60,84,84,84,84,84,-70,-84,-91,-373,-90,-85,-64,84,84,84,84,-36,-373,-75,-106,-373,84,-86,-373,84,84,84,-373,84,-33,84,84,-82,84,-62,-76,-373,-373,-373,-52,-54,84,84,-373,84,-53,]),'QUOTE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,52,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,155,156,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,298,299,300,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,422,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,521,523,532,533,539,547,548,553,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,639,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,730,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,52,-3,52,-372,52,-371,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-373,52,-373,52,-2,-5,-6,-4,-7,52,52,-51,-48,52,52,52,52,-373,52,52,-43,52,52,-373,-25,52,-24,-41,297,-360,52,52,52,52,52,52,52,52,52,52,52,52,52,-49,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-39,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-373,-9,-44,-46,422,52,52,-47,52,-31,-23,-27,-28,-26,-29,-42,-359,-361,-362,52,52,-45,52,52,-40,-13,-12,422,52,-55,-10,52,52,422,52,-8,422,520,422,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-11,-56,-373,-59,612,422,52,52,422,-367,-364,-365,52,-34,-373,-69,-38,52,-50,-373,-373,52,422,-108,52,422,422,422,-30,-363,52,52,52,-373,-61,52,422,422,-373,422,422,-373,-107,52,-83,-35,-32,52,-63,-373,-81,-37,-60,422,422,52,52,52,-366,-70,-84,-91,-373,-90,-85,-64,52,52,422,422,-36,-373,-75,-106,-373,52,-86,-373,52,422,52,-373,52,-33,52,52,-82,52,-62,-76,-373,-373,-373,-52,-54,52,52,-373,52,-53,]),'NOT':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,53,-3,53,-372,53,-371,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-373,53,53,-2,-5,-6,-4,-7,53,53,-51,-48,53,53,53,53,-373,53,53,-43,53,53,-373,-25,53,-24,-41,53,53,53,53,53,53,53,53,53,53,53,53,53,-49,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-39,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-373,-9,-44,-46,53,53,-47,53,-31,-23,-27,-28,-26,-29,-42,53,53,-45,53,53,-40,-13,-12,53,-55,-10,53,53,53,-8,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-11,-56,-373,-59,53,53,53,-34,-373,-69,-38,53,-50,-373,-373,53,-108,53,-30,53,53,53,-373,-61,53,-373,-373,-107,53,-83,-35,-32,53,-63,-373,-81,-37,-60,53,53,53,-70,-84,-91,-373,-90,-85,-64,53,53,-36,-373,-75,-106,-373,53,-86,-373,53,53,-373,53,-33,53,53,-82,53,-62,-76,-373,-373,-373,-52,-54,53,53,-373,53,-53,]),'INSTANCEOF':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,208,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,208,-306,208,208,-183,208,208,-305,208,208,-297,-210,-302,-304,-320,208,208,208,208,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,208,-210,-209,208,-299,-298,-300,208,-303,-329,208,208,208,208,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,208,-169,-182,-173,-325,208,208,208,208,-357,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,None,208,208,-317,208,208,-321,208,208,208,208,208,208,208,208,208,208,208,208,208,-311,-310,208,-203,-373,-221,-223,208,208,-326,208,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,208,208,-227,-205,-190,-176,-179,-181,208,208,-195,208,208,-196,-202,-204,208,-200,-199,208,-198,-197,-178,208,-373,-225,-224,-180,208,-206,208,-248,208,208,]),'INC':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,29,30,32,36,39,40,41,44,46,47,48,49,50,53,54,55,59,65,66,67,70,72,75,77,79,88,89,91,94,95,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,228,229,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,275,276,277,278,279,280,283,285,286,287,288,290,291,292,293,294,295,301,305,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,435,436,437,438,439,448,449,462,463,466,473,474,475,478,482,483,485,490,498,501,503,505,510,511,512,528,530,531,532,533,554,560,561,562,568,573,577,581,584,585,586,591,600,618,619,621,635,636,638,642,643,644,653,658,659,660,662,677,678,679,680,687,690,694,695,701,704,705,707,708,709,710,711,720,721,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,63,-3,63,-372,63,-371,63,63,63,63,63,63,63,-193,63,63,63,63,-191,63,63,-192,63,63,-373,63,63,-2,-5,-217,-6,-4,-210,-7,-207,-216,63,63,-51,-208,-48,63,237,63,63,63,-373,63,63,-43,63,63,-373,-25,63,-24,-41,63,63,63,63,63,63,63,63,63,63,63,63,63,-49,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-39,63,63,63,-210,-209,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-373,-9,-44,-46,-222,63,-373,-226,-373,-228,-212,63,-47,63,-31,-23,-27,-28,-26,-29,-42,63,-211,63,-45,63,63,-40,-13,-12,63,-55,-10,63,63,63,-8,63,63,-203,63,-373,-221,-223,63,63,63,63,63,-215,-214,63,63,-194,63,63,63,-201,-218,63,-11,-56,-373,-59,-227,-205,-190,63,63,63,-34,-373,-69,-38,-195,63,-50,-373,-373,-196,63,-108,63,-202,-204,-200,-199,-30,-198,-197,63,63,63,-373,-61,63,-373,-225,-224,-373,-373,-107,63,-83,-35,-32,63,-63,-373,-81,-37,-60,63,-206,63,63,-70,-84,-91,-373,-90,-85,-64,63,63,-36,-373,-75,-106,-373,63,-86,-373,63,63,-373,63,-33,63,63,-82,63,-62,-76,-373,-373,-373,-52,-54,63,63,-373,63,-53,]),'DEFAULT':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,566,567,568,581,585,600,638,647,648,649,650,651,659,660,690,693,695,697,701,704,707,709,710,711,731,732,734,735,736,738,744,753,755,756,762,763,764,778,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-373,-373,-38,-50,-373,-108,-30,-373,696,-87,-373,696,-373,-61,-107,696,-83,696,-35,-32,-63,-81,-37,-60,-70,-84,-91,-373,-90,-85,-64,-36,-75,-106,-373,-89,-86,-88,-33,-82,-62,-76,-373,-52,-54,-53,]),'GLOBAL':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,58,-3,-372,-371,-373,-2,-5,-6,-4,-7,58,-51,-48,-373,-43,-373,-25,58,-24,-41,-49,-39,58,-373,-9,-44,-46,-47,58,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,58,58,-8,58,58,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,58,-108,-30,58,58,-373,-61,58,-373,-373,-107,-83,-35,-32,58,-63,-373,-81,-37,-60,58,58,58,-70,-84,-91,-373,-90,-85,-64,58,-36,-373,-75,-106,-373,58,-86,-373,58,-373,58,-33,58,58,-82,58,-62,-76,-373,-373,-373,-52,-54,58,58,-373,58,-53,]),'MOD':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,210,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,210,-306,210,210,-183,210,210,-305,-294,210,-297,-210,-302,-304,-320,210,210,210,210,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,210,-210,-209,210,-299,-298,-300,210,-303,-329,210,210,210,210,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,210,-169,-182,-173,-325,210,210,210,210,-357,210,210,210,210,-277,-278,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,-290,210,-281,-317,210,210,-321,210,210,210,210,210,210,210,210,210,210,210,210,210,-311,-310,210,-203,-373,-221,-223,210,210,-326,210,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,210,210,-227,-205,-190,-176,-179,-181,210,210,-195,210,210,-196,-202,-204,210,-200,-199,210,-198,-197,-178,210,-373,-225,-224,-180,210,-206,210,-248,210,210,]),'WHILE':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,215,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,60,-3,-372,-371,-373,-2,-5,-6,-4,-7,60,-51,-48,-373,-43,-373,-25,60,-24,-41,-49,-39,372,60,-373,-9,-44,-46,-47,60,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,60,60,-8,60,60,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,60,-108,-30,60,60,-373,-61,60,-373,-373,-107,-83,-35,-32,60,-63,-373,-81,-37,-60,60,60,60,-70,-84,-91,-373,-90,-85,-64,60,-36,-373,-75,-106,-373,60,-86,-373,60,-373,60,-33,60,60,-82,60,-62,-76,-373,-373,-373,-52,-54,60,60,-373,60,-53,]),'NEW':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,61,-3,61,-372,61,-371,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-373,61,61,-2,-5,-6,-4,-7,61,61,-51,-48,61,61,61,61,-373,61,61,-43,61,61,-373,-25,61,-24,-41,61,61,61,61,61,61,61,61,61,61,61,61,61,-49,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-39,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-373,-9,-44,-46,61,61,-47,61,-31,-23,-27,-28,-26,-29,-42,61,61,-45,61,61,-40,-13,-12,61,-55,-10,61,61,61,-8,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-11,-56,-373,-59,61,61,61,-34,-373,-69,-38,61,-50,-373,-373,61,-108,61,-30,61,61,61,-373,-61,61,-373,-373,-107,61,-83,-35,-32,61,-63,-373,-81,-37,-60,61,61,61,-70,-84,-91,-373,-90,-85,-64,61,61,-36,-373,-75,-106,-373,61,-86,-373,61,61,-373,61,-33,61,61,-82,61,-62,-76,-373,-373,-373,-52,-54,61,61,-373,61,-53,]),'MINUS_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,243,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'CASE':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,566,567,568,581,585,600,638,647,648,649,650,651,659,660,690,693,695,697,701,704,707,709,710,711,731,732,734,735,736,738,744,753,755,756,762,763,764,778,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-373,-373,-38,-50,-373,-108,-30,-373,694,-87,-373,694,-373,-61,-107,694,-83,694,-35,-32,-63,-81,-37,-60,-70,-84,-91,-373,-90,-85,-64,-36,-75,-106,-373,-89,-86,-88,-33,-82,-62,-76,-373,-52,-54,-53,]),'START_HEREDOC':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,62,-3,62,-372,62,-371,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-373,62,62,-2,-5,-6,-4,-7,62,62,-51,-48,62,62,62,62,-373,62,62,-43,62,62,-373,-25,62,-24,-41,62,62,62,62,62,62,62,62,62,62,62,62,62,-49,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-39,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-373,-9,-44,-46,62,62,-47,62,-31,-23,-27,-28,-26,-29,-42,62,62,-45,62,62,-40,-13,-12,62,-55,-10,62,62,62,-8,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-11,-56,-373,-59,62,62,62,-34,-373,-69,-38,62,-50,-373,-373,62,-108,62,-30,62,62,62,-373,-61,62,-373,-373,-107,62,-83,-35,-32,62,-63,-373,-81,-37,-60,62,62,62,-70,-84,-91,-373,-90,-85,-64,62,62,-36,-373,-75,-106,-373,62,-86,-373,62,62,-373,62,-33,62,62,-82,62,-62,-76,-373,-373,-373,-52,-54,62,62,-373,62,-53,]),'IS_EQUAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,193,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,193,-183,193,193,-305,-294,193,-297,-210,-302,-304,-320,193,193,193,193,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,193,-210,-209,193,-299,-298,-300,193,-303,-329,193,193,193,193,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,193,-169,-182,-173,-325,193,193,193,193,-357,193,-289,193,-288,-277,-278,-276,-274,193,None,-275,193,-286,193,193,None,193,-287,None,-280,193,None,193,-279,-290,193,-281,-317,193,193,-321,193,193,193,193,193,193,193,193,193,193,193,193,193,-311,-310,193,-203,-373,-221,-223,193,193,-326,193,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,193,193,-227,-205,-190,-176,-179,-181,193,193,-195,193,193,-196,-202,-204,193,-200,-199,193,-198,-197,-178,193,-373,-225,-224,-180,193,-206,193,-248,193,193,]),'SWITCH':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,64,-3,-372,-371,-373,-2,-5,-6,-4,-7,64,-51,-48,-373,-43,-373,-25,64,-24,-41,-49,-39,64,-373,-9,-44,-46,-47,64,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,64,64,-8,64,64,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,64,-108,-30,64,64,-373,-61,64,-373,-373,-107,-83,-35,-32,64,-63,-373,-81,-37,-60,64,64,64,-70,-84,-91,-373,-90,-85,-64,64,-36,-373,-75,-106,-373,64,-86,-373,64,-373,64,-33,64,64,-82,64,-62,-76,-373,-373,-373,-52,-54,64,64,-373,64,-53,]),'ENDFOR':([5,10,88,91,119,150,152,154,191,213,262,264,286,288,290,291,292,293,294,295,310,369,402,510,512,560,562,568,581,585,600,638,659,660,690,695,701,704,707,709,710,711,731,732,738,744,753,754,755,756,764,774,779,783,790,792,793,798,799,810,],[-372,-371,-51,-48,-43,-25,-24,-41,-49,-39,-44,-46,-47,-31,-23,-27,-28,-26,-29,-42,-45,-40,-55,-56,-59,-34,-69,-38,-50,-373,-108,-30,-373,-61,-107,-83,-35,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-373,-75,-106,-86,786,-33,-82,-62,-76,-373,-52,-54,-53,]),'CATCH':([451,793,798,799,810,],[545,-373,802,-54,-53,]),'ARRAY':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,282,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,440,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,542,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,771,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,68,-3,68,-372,68,-371,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-373,68,68,-2,-5,-6,-4,-7,68,68,-51,-48,68,68,68,68,-373,68,68,-43,68,68,-373,-25,68,-24,-41,68,68,68,68,68,68,68,68,68,68,68,68,68,-49,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-39,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-373,-9,-44,-46,424,68,442,68,-47,68,-31,-23,-27,-28,-26,-29,-42,68,68,-45,68,68,-40,-13,-12,424,68,-55,-10,68,68,424,68,-8,424,424,68,68,68,442,68,68,68,68,68,68,68,68,68,68,68,-11,-56,-373,-59,424,68,68,424,442,68,-34,-373,-69,-38,68,-50,-373,-373,68,424,-108,68,424,424,424,-30,68,68,68,-373,-61,68,424,424,-373,424,424,-373,-107,68,-83,-35,-32,68,-63,-373,-81,-37,-60,424,424,68,68,68,-70,-84,-91,-373,-90,-85,-64,68,68,424,424,-36,-373,-75,-106,-373,68,-86,-373,68,424,442,68,-373,68,-33,68,68,-82,68,-62,-76,-373,-373,-373,-52,-54,68,68,-373,68,-53,]),'STRING_VARNAME':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,69,-3,69,-372,69,-371,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-373,69,69,-2,-5,-6,-4,-7,69,69,-51,-48,69,69,69,69,-373,69,69,-43,69,69,-373,-25,69,-24,-41,69,69,69,69,69,69,69,69,69,69,69,69,69,-49,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-39,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-373,-9,-44,-46,69,69,-47,69,-31,-23,-27,-28,-26,-29,-42,457,69,-45,69,69,-40,-13,-12,69,-55,-10,69,69,69,-8,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-11,-56,-373,-59,69,69,69,-34,-373,-69,-38,69,-50,-373,-373,69,-108,69,-30,69,69,69,-373,-61,69,-373,-373,-107,69,-83,-35,-32,69,-63,-373,-81,-37,-60,69,69,69,-70,-84,-91,-373,-90,-85,-64,69,69,-36,-373,-75,-106,-373,69,-86,-373,69,69,-373,69,-33,69,69,-82,69,-62,-76,-373,-373,-373,-52,-54,69,69,-373,69,-53,]),'METHOD_C':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,82,-3,82,-372,82,-371,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-373,82,82,-2,-5,-6,-4,-7,82,82,-51,-48,82,82,82,82,-373,82,82,-43,82,82,-373,-25,82,-24,-41,82,82,82,82,82,82,82,82,82,82,82,82,82,-49,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-39,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-373,-9,-44,-46,82,82,82,-47,82,-31,-23,-27,-28,-26,-29,-42,82,82,-45,82,82,-40,-13,-12,82,82,-55,-10,82,82,82,82,-8,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-11,-56,-373,-59,82,82,82,82,82,-34,-373,-69,-38,82,-50,-373,-373,82,82,-108,82,82,82,82,-30,82,82,82,-373,-61,82,82,82,-373,82,82,-373,-107,82,-83,-35,-32,82,-63,-373,-81,-37,-60,82,82,82,82,82,-70,-84,-91,-373,-90,-85,-64,82,82,82,82,-36,-373,-75,-106,-373,82,-86,-373,82,82,82,-373,82,-33,82,82,-82,82,-62,-76,-373,-373,-373,-52,-54,82,82,-373,82,-53,]),'IS_NOT_EQUAL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,199,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,199,-183,199,199,-305,-294,199,-297,-210,-302,-304,-320,199,199,199,199,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,199,-210,-209,199,-299,-298,-300,199,-303,-329,199,199,199,199,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,199,-169,-182,-173,-325,199,199,199,199,-357,199,-289,199,-288,-277,-278,-276,-274,199,None,-275,199,-286,199,199,None,199,-287,None,-280,199,None,199,-279,-290,199,-281,-317,199,199,-321,199,199,199,199,199,199,199,199,199,199,199,199,199,-311,-310,199,-203,-373,-221,-223,199,199,-326,199,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,199,199,-227,-205,-190,-176,-179,-181,199,199,-195,199,199,-196,-202,-204,199,-200,-199,199,-198,-197,-178,199,-373,-225,-224,-180,199,-206,199,-248,199,199,]),'NS_SEPARATOR':([0,1,3,4,5,9,10,11,12,14,20,21,25,27,28,30,32,33,36,39,41,44,47,48,49,50,53,54,55,61,63,65,66,70,73,77,79,80,88,91,92,94,97,99,100,101,108,110,111,112,119,131,133,135,137,147,150,151,152,154,161,164,169,173,177,178,179,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,219,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,251,252,253,259,262,264,265,269,276,282,285,286,287,288,290,291,292,293,294,295,296,301,303,308,310,315,319,327,331,332,335,369,373,374,375,378,379,393,402,403,404,405,408,409,413,416,417,420,423,425,427,430,432,433,436,440,448,449,458,462,463,466,470,475,478,483,485,486,488,490,497,500,503,505,510,511,512,517,518,523,525,532,533,539,542,554,560,561,562,568,570,572,577,581,584,585,591,592,600,610,617,618,625,627,630,637,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,700,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,771,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,804,808,809,810,],[-373,71,-3,71,-372,71,-371,71,71,109,71,71,71,71,71,71,71,132,71,71,71,71,71,71,-373,71,71,-2,-5,171,132,-6,-4,-7,182,71,71,217,-51,-48,-358,71,71,71,71,109,-373,182,71,71,-43,268,182,71,71,-373,-25,71,-24,-41,132,71,317,182,71,71,71,71,182,71,71,71,71,71,71,71,71,-49,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,132,-39,71,182,132,71,132,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,182,-373,-9,414,-44,-46,426,182,71,171,71,-47,71,-31,-23,-27,-28,-26,-29,-42,132,71,414,71,-45,71,182,132,71,-357,132,-40,217,-13,182,-12,426,71,-55,-10,71,71,426,71,516,182,-8,426,426,524,182,182,71,71,71,171,71,71,414,71,71,71,182,71,71,71,71,132,132,71,132,132,71,-11,-56,-373,-59,182,414,426,182,71,71,426,171,71,-34,-373,-69,-38,132,132,71,-50,-373,-373,71,426,-108,182,182,71,426,426,426,414,-30,71,71,71,-373,-61,71,426,426,-373,426,426,-373,-107,71,-83,132,-35,-32,71,-63,-373,-81,-37,-60,426,426,71,71,71,-70,-84,-91,-373,-90,-85,-64,71,71,426,426,-36,-373,-75,-106,-373,71,-86,-373,71,426,171,71,-373,71,-33,71,71,-82,71,-62,-76,-373,-373,-373,-52,-54,71,71,414,-373,71,-53,]),'DOLLAR_OPEN_CURLY_BRACES':([52,62,155,156,175,298,299,300,547,548,553,639,730,],[-373,-373,301,-360,301,-359,-361,-362,-367,-364,-365,-363,-366,]),'IMPLEMENTS':([92,158,302,304,332,416,461,517,610,],[-358,-373,458,-112,-357,-114,-113,-115,-116,]),'SR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,203,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,203,-183,203,203,-305,-294,203,-297,-210,-302,-304,-320,203,203,203,203,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,203,-210,-209,203,-299,-298,-300,203,-303,-329,203,203,203,203,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,203,-169,-182,-173,-325,203,203,203,203,-357,203,203,203,203,-277,-278,-276,-274,203,203,-275,203,203,203,203,203,203,203,203,-280,203,203,203,-279,-290,203,-281,-317,203,203,-321,203,203,203,203,203,203,203,203,203,203,203,203,203,-311,-310,203,-203,-373,-221,-223,203,203,-326,203,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,203,203,-227,-205,-190,-176,-179,-181,203,203,-195,203,203,-196,-202,-204,203,-200,-199,203,-198,-197,-178,203,-373,-225,-224,-180,203,-206,203,-248,203,203,]),'LIST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,76,-3,76,-372,76,-371,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-373,76,76,-2,-5,-6,-4,-7,76,76,-51,-48,76,76,76,76,-373,76,76,-43,76,76,-373,-25,76,-24,-41,76,76,76,76,76,76,76,76,76,76,76,76,76,-49,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,367,-39,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-373,-9,-44,-46,76,76,-47,76,-31,-23,-27,-28,-26,-29,-42,76,76,-45,76,76,-40,-13,-12,76,-55,-10,76,76,76,-8,76,76,76,76,76,76,76,76,76,76,76,76,367,367,76,76,-11,-56,-373,-59,76,76,76,-34,-373,-69,-38,76,-50,-373,-373,76,-108,76,-30,76,76,76,-373,-61,76,-373,-373,-107,76,-83,-35,-32,76,-63,-373,-81,-37,-60,76,76,76,-70,-84,-91,-373,-90,-85,-64,76,76,-36,-373,-75,-106,-373,76,-86,-373,76,76,-373,76,-33,76,76,-82,76,-62,-76,-373,-373,-373,-52,-54,76,76,-373,76,-53,]),'BREAK':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,77,-3,-372,-371,-373,-2,-5,-6,-4,-7,77,-51,-48,-373,-43,-373,-25,77,-24,-41,-49,-39,77,-373,-9,-44,-46,-47,77,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,77,77,-8,77,77,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,77,-108,-30,77,77,-373,-61,77,-373,-373,-107,-83,-35,-32,77,-63,-373,-81,-37,-60,77,77,77,-70,-84,-91,-373,-90,-85,-64,77,-36,-373,-75,-106,-373,77,-86,-373,77,-373,77,-33,77,77,-82,77,-62,-76,-373,-373,-373,-52,-54,77,77,-373,77,-53,]),'LOGICAL_OR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,206,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,206,-183,206,206,-305,-294,-319,-297,-210,-302,-304,-320,206,206,206,206,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,206,-210,-209,206,-299,-298,-300,206,-303,-329,206,206,206,206,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,206,-169,-182,-173,-325,206,206,206,206,-357,206,-289,-268,-288,-277,-278,-276,-274,206,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-317,206,206,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,206,-311,-310,206,-203,-373,-221,-223,206,206,-326,206,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,206,-227,-205,-190,-176,-179,-181,206,206,-195,-295,206,-196,-202,-204,206,-200,-199,206,-198,-197,-178,-184,-373,-225,-224,-180,206,-206,206,-248,206,206,]),'EXIT':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,78,-3,78,-372,78,-371,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-373,78,78,-2,-5,-6,-4,-7,78,78,-51,-48,78,78,78,78,-373,78,78,-43,78,78,-373,-25,78,-24,-41,78,78,78,78,78,78,78,78,78,78,78,78,78,-49,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-39,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-373,-9,-44,-46,78,78,-47,78,-31,-23,-27,-28,-26,-29,-42,78,78,-45,78,78,-40,-13,-12,78,-55,-10,78,78,78,-8,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-11,-56,-373,-59,78,78,78,-34,-373,-69,-38,78,-50,-373,-373,78,-108,78,-30,78,78,78,-373,-61,78,-373,-373,-107,78,-83,-35,-32,78,-63,-373,-81,-37,-60,78,78,78,-70,-84,-91,-373,-90,-85,-64,78,78,-36,-373,-75,-106,-373,78,-86,-373,78,78,-373,78,-33,78,78,-82,78,-62,-76,-373,-373,-373,-52,-54,78,78,-373,78,-53,]),'SL':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,207,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,207,-183,207,207,-305,-294,207,-297,-210,-302,-304,-320,207,207,207,207,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,207,-210,-209,207,-299,-298,-300,207,-303,-329,207,207,207,207,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,207,-169,-182,-173,-325,207,207,207,207,-357,207,207,207,207,-277,-278,-276,-274,207,207,-275,207,207,207,207,207,207,207,207,-280,207,207,207,-279,-290,207,-281,-317,207,207,-321,207,207,207,207,207,207,207,207,207,207,207,207,207,-311,-310,207,-203,-373,-221,-223,207,207,-326,207,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,207,207,-227,-205,-190,-176,-179,-181,207,207,-195,207,207,-196,-202,-204,207,-200,-199,207,-198,-197,-178,207,-373,-225,-224,-180,207,-206,207,-248,207,207,]),'LOGICAL_AND':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,185,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,185,-183,185,185,-305,-294,-319,-297,-210,-302,-304,-320,185,185,185,185,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,185,-210,-209,185,-299,-298,-300,185,-303,-329,185,185,185,185,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,185,-169,-182,-173,-325,185,185,185,185,-357,185,-289,-268,-288,-277,-278,-276,-274,185,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,185,-282,185,-279,-290,-272,-281,-317,185,185,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,185,-311,-310,185,-203,-373,-221,-223,185,185,-326,185,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,185,-227,-205,-190,-176,-179,-181,185,185,-195,-295,185,-196,-202,-204,185,-200,-199,185,-198,-197,-178,-184,-373,-225,-224,-180,185,-206,185,-248,185,185,]),'PUBLIC':([5,10,411,514,515,556,593,595,596,597,598,599,601,602,608,609,641,666,670,714,796,797,803,],[-372,-371,-373,608,-120,-373,-122,-147,-119,-144,-146,-148,-145,608,-143,-142,608,-141,-124,-123,-140,-121,-139,]),'DO':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,79,-3,-372,-371,-373,-2,-5,-6,-4,-7,79,-51,-48,-373,-43,-373,-25,79,-24,-41,-49,-39,79,-373,-9,-44,-46,-47,79,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,79,79,-8,79,79,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,79,-108,-30,79,79,-373,-61,79,-373,-373,-107,-83,-35,-32,79,-63,-373,-81,-37,-60,79,79,79,-70,-84,-91,-373,-90,-85,-64,79,-36,-373,-75,-106,-373,79,-86,-373,79,-373,79,-33,79,79,-82,79,-62,-76,-373,-373,-373,-52,-54,79,79,-373,79,-53,]),'USE':([0,1,3,5,10,54,55,65,66,70,88,91,108,119,154,191,213,250,252,253,262,264,286,288,295,310,369,374,378,402,403,405,417,505,510,512,541,560,562,568,581,585,600,659,660,690,695,701,704,707,709,710,711,731,732,738,744,753,755,756,764,779,783,790,792,793,798,799,810,],[-373,80,-3,-372,-371,-2,-5,-6,-4,-7,-51,-48,-373,-43,-41,-49,-39,80,-373,-9,-44,-46,-47,-31,-42,-45,-40,-13,-12,-55,-10,80,-8,-11,-56,-59,631,-34,-69,-38,-50,-373,-108,-373,-61,-107,-83,-35,-32,-63,-81,-37,-60,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-52,-54,-53,]),'CONST':([0,1,3,5,10,54,55,65,66,70,88,91,108,119,154,191,213,250,252,253,262,264,286,288,295,310,369,374,378,402,403,405,411,417,505,510,512,514,515,556,560,562,568,581,585,593,596,600,641,659,660,670,690,695,701,704,707,709,710,711,714,731,732,738,744,753,755,756,764,779,783,790,792,793,796,797,798,799,803,810,],[-373,81,-3,-372,-371,-2,-5,-6,-4,-7,-51,-48,-373,-43,-41,-49,-39,81,-373,-9,-44,-46,-47,-31,-42,-45,-40,-13,-12,-55,-10,81,-373,-8,-11,-56,-59,594,-120,-373,-34,-69,-38,-50,-373,-122,-119,-108,594,-373,-61,-124,-107,-83,-35,-32,-63,-81,-37,-60,-123,-70,-84,-85,-64,-36,-75,-106,-86,-33,-82,-62,-76,-373,-140,-121,-52,-54,-139,-53,]),'ABSTRACT':([0,1,3,5,10,49,54,55,65,66,70,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,411,417,505,510,511,512,514,515,556,560,561,562,568,581,584,585,591,593,595,596,597,598,599,600,601,602,608,609,638,641,644,658,659,660,666,670,680,687,690,695,701,704,707,708,709,710,711,714,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,796,797,798,799,800,801,803,808,809,810,],[-373,83,-3,-372,-371,-373,-2,-5,-6,-4,-7,-51,-48,-373,-43,-373,-25,83,-24,-41,-49,-39,83,-373,-9,-44,-46,-47,83,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,83,-373,-8,-11,-56,-373,-59,595,-120,-373,-34,-373,-69,-38,-50,-373,-373,83,-122,-147,-119,-144,-146,-148,-108,-145,595,-143,-142,-30,595,83,83,-373,-61,-141,-124,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,-123,83,83,-70,-84,-91,-373,-90,-85,-64,83,-36,-373,-75,-106,-373,83,-86,-373,83,-373,83,-33,83,-82,83,-62,-76,-373,-373,-373,-140,-121,-52,-54,83,83,-139,-373,83,-53,]),'IS_GREATER':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,186,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,186,-183,186,186,-305,-294,186,-297,-210,-302,-304,-320,186,186,186,186,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,186,-210,-209,186,-299,-298,-300,186,-303,-329,186,186,186,186,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,186,-169,-182,-173,-325,186,186,186,186,-357,186,None,186,None,-277,-278,-276,-274,186,186,-275,186,None,186,186,186,186,None,186,-280,186,186,186,-279,-290,186,-281,-317,186,186,-321,186,186,186,186,186,186,186,186,186,186,186,186,186,-311,-310,186,-203,-373,-221,-223,186,186,-326,186,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,186,186,-227,-205,-190,-176,-179,-181,186,186,-195,186,186,-196,-202,-204,186,-200,-199,186,-198,-197,-178,186,-373,-225,-224,-180,186,-206,186,-248,186,186,]),'DIV':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,188,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,188,-306,188,188,-183,188,188,-305,-294,188,-297,-210,-302,-304,-320,188,188,188,188,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,188,-210,-209,188,-299,-298,-300,188,-303,-329,188,188,188,188,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,188,-169,-182,-173,-325,188,188,188,188,-357,188,188,188,188,-277,-278,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,-290,188,-281,-317,188,188,-321,188,188,188,188,188,188,188,188,188,188,188,188,188,-311,-310,188,-203,-373,-221,-223,188,188,-326,188,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,188,188,-227,-205,-190,-176,-179,-181,188,188,-195,188,188,-196,-202,-204,188,-200,-199,188,-198,-197,-178,188,-373,-225,-224,-180,188,-206,188,-248,188,188,]),'UNSET':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,86,-3,-372,-371,-373,-2,-5,-6,-4,-7,86,-51,-48,-373,-43,-373,-25,86,-24,-41,-49,-39,86,-373,-9,-44,-46,-47,86,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,86,86,-8,86,86,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,86,-108,-30,86,86,-373,-61,86,-373,-373,-107,-83,-35,-32,86,-63,-373,-81,-37,-60,86,86,86,-70,-84,-91,-373,-90,-85,-64,86,-36,-373,-75,-106,-373,86,-86,-373,86,-373,86,-33,86,86,-82,86,-62,-76,-373,-373,-373,-52,-54,86,86,-373,86,-53,]),'CURLY_OPEN':([52,62,155,156,175,298,299,300,547,548,553,639,730,],[-373,-373,296,-360,296,-359,-361,-362,-367,-364,-365,-363,-366,]),'SEMI':([0,1,3,5,6,7,8,10,13,17,19,25,26,29,37,40,46,49,50,51,54,55,59,65,66,67,69,70,72,73,74,75,77,78,79,82,84,85,88,89,91,92,95,98,102,104,105,106,107,108,110,114,115,118,119,120,121,122,123,124,125,126,128,129,136,137,138,140,145,146,147,148,149,150,151,152,153,154,157,160,162,163,165,166,167,168,172,173,174,176,181,191,212,213,216,218,219,220,222,228,229,232,237,246,247,248,250,251,252,253,261,262,264,271,272,273,274,275,277,278,279,280,283,284,286,287,288,290,291,292,293,294,295,297,305,306,307,310,314,316,319,320,332,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,369,370,374,375,378,387,388,389,390,391,392,394,395,396,397,398,399,400,402,403,405,407,409,417,418,419,421,427,431,433,435,437,438,439,450,465,466,467,468,470,471,473,474,480,482,489,491,493,494,495,496,498,499,501,502,503,505,510,511,512,519,520,522,525,526,527,528,530,531,546,559,560,561,562,563,564,565,566,567,568,573,575,580,581,584,585,586,591,600,607,612,617,619,621,635,636,638,642,643,644,645,656,657,658,659,660,662,663,667,668,675,677,678,679,680,687,690,691,692,695,696,698,701,704,705,707,708,709,710,711,720,721,722,728,731,732,733,734,735,736,737,738,744,746,747,748,749,753,754,755,756,760,762,763,764,765,766,769,772,774,777,778,779,780,782,783,784,786,788,790,791,792,793,794,795,798,799,800,801,808,809,810,],[-373,88,-3,-372,-229,-336,-335,-371,-333,-341,-338,119,-322,-193,-334,-191,-192,-373,154,-337,-2,-5,-217,-6,-4,-210,-326,-7,-207,-327,191,-216,213,-316,88,-339,-340,-323,-51,-208,-48,-358,-166,-332,-301,-175,-292,-306,-291,-373,253,-313,-183,262,-43,-314,-305,-294,-98,264,-100,-319,-297,-210,-302,-373,-304,-320,-102,286,-373,-312,-315,-25,88,-24,295,-41,-293,-93,310,-94,-170,-177,-373,-210,-207,-172,-171,-296,-328,-49,369,-39,374,-15,-16,378,-21,-210,-209,-299,-298,-300,402,-303,88,-329,-373,-9,417,-44,-46,-74,-72,-71,433,-222,-373,-226,-373,-228,-212,-331,-47,88,-31,-23,-27,-28,-26,-29,-42,-324,-211,-330,-95,-45,-169,-182,-173,-325,-357,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-40,-317,-13,-17,-12,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-55,-10,88,-311,88,-8,-97,-342,-99,-345,-310,-373,-203,-373,-221,-223,-101,-92,88,-211,-373,-174,-212,-215,-214,-230,-194,-318,-14,-18,-20,-22,581,-201,-307,-218,-168,88,-11,-56,-373,-59,-349,-343,-348,-346,-73,618,-227,-205,-190,638,-96,-34,-373,-69,-176,-179,-181,647,650,-38,-195,-295,-19,-50,-373,-373,-196,88,-108,670,-344,-347,-202,-204,-200,-199,-30,-198,-197,88,-178,-184,701,88,-373,-61,88,711,-128,714,-350,-373,-225,-224,-373,-373,-107,731,-180,-83,734,738,-35,-32,88,-63,-373,-81,-37,-60,88,-206,88,88,-70,-84,734,-91,-373,-90,764,-85,-64,88,-130,-126,-127,-36,-373,-75,-106,-248,-373,88,-86,779,-373,783,-129,88,-373,88,-33,88,88,-82,-125,792,88,-62,796,-76,-373,-373,-373,-52,-54,88,88,-373,88,-53,]),'QUESTION':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,192,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,192,-183,192,192,-305,-294,192,-297,-210,-302,-304,-320,192,192,192,192,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,192,-210,-209,192,-299,-298,-300,192,-303,-329,192,192,192,192,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,192,-169,-182,-173,-325,192,192,192,192,-357,192,-289,192,-288,-277,-278,-276,-274,192,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,192,-282,192,-279,-290,-272,-281,-317,192,192,-321,192,192,192,192,192,192,192,192,192,192,192,192,192,-311,-310,192,-203,-373,-221,-223,192,192,-326,192,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,192,-227,-205,-190,-176,-179,-181,192,192,-195,-295,192,-196,-202,-204,192,-200,-199,192,-198,-197,-178,192,-373,-225,-224,-180,192,-206,192,-248,192,192,]),'ECHO':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,44,-3,-372,-371,-373,-2,-5,-6,-4,-7,44,-51,-48,-373,-43,-373,-25,44,-24,-41,-49,-39,44,-373,-9,-44,-46,-47,44,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,44,44,-8,44,44,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,44,-108,-30,44,44,-373,-61,44,-373,-373,-107,-83,-35,-32,44,-63,-373,-81,-37,-60,44,44,44,-70,-84,-91,-373,-90,-85,-64,44,-36,-373,-75,-106,-373,44,-86,-373,44,-373,44,-33,44,44,-82,44,-62,-76,-373,-373,-373,-52,-54,44,44,-373,44,-53,]),'SR_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,239,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'DOUBLE_COLON':([31,43,57,59,67,73,75,92,104,127,129,130,133,165,168,170,173,181,251,269,319,332,430,470,473,474,501,],[-175,144,159,-217,-213,-172,-216,-358,-175,266,-213,267,-172,312,-213,318,-172,-173,-174,-173,-173,-357,-174,-174,-215,-214,-218,]),'COMMA':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,120,121,122,123,124,125,126,128,129,136,138,140,145,146,148,149,157,160,162,163,165,166,167,168,172,173,174,176,181,183,211,216,218,219,220,222,225,228,229,232,237,246,248,251,257,271,272,275,277,278,279,280,282,283,284,297,305,306,307,314,315,316,319,320,326,328,331,332,333,334,336,337,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,368,370,375,380,381,382,383,384,385,387,388,389,390,391,392,394,395,396,397,398,399,400,404,407,412,415,416,418,419,421,427,431,435,436,437,438,439,440,443,444,445,447,448,449,450,462,463,465,467,468,469,470,471,473,474,476,480,481,482,484,486,488,489,491,493,494,495,498,499,501,502,504,509,517,519,520,522,525,526,528,529,530,531,534,535,537,540,543,544,555,557,558,559,563,564,565,569,571,573,574,575,576,578,580,582,583,586,607,610,611,612,613,615,617,619,621,626,628,629,634,635,636,642,643,645,652,654,655,656,664,667,668,675,677,678,679,681,683,685,692,699,718,719,721,723,724,726,727,739,747,748,749,757,760,771,772,773,776,784,785,787,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,-314,-305,-294,-98,263,-100,-319,-297,-210,-302,-304,-320,-102,285,-312,-315,-293,-93,309,-94,-170,-177,-373,-210,-207,-172,-171,-296,-328,-373,-373,373,-15,-16,377,-21,-373,-210,-209,-299,-298,-300,-303,-329,410,-74,432,-222,-373,-226,-373,-228,-373,-212,-331,-324,-211,-330,-95,-169,-373,-182,-173,-325,-236,478,-373,-357,483,-246,-245,-244,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-187,-186,-188,488,-317,-17,-105,-104,497,483,-309,500,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-373,-311,-132,518,-114,-97,-342,-99,-345,-310,-203,-373,-373,-221,-223,-373,-152,-153,-154,542,-373,-373,-101,-373,-373,-92,-211,-373,483,-174,-212,-215,-214,-235,-230,483,-194,-247,-373,-373,-318,-14,-18,-20,-22,-201,-307,-218,-168,483,-57,-115,-349,-343,-348,-346,-73,-227,483,-205,-190,542,-155,-156,-157,483,483,518,483,483,-96,-176,-179,-181,-240,-234,-195,-243,-295,488,-185,-19,-103,-308,-196,671,-116,-131,-344,-354,674,-347,-202,-204,-158,-159,-160,-151,-200,-199,-198,-197,-178,-239,-233,-189,-184,-58,-128,715,-350,-373,-225,-224,-161,-162,-163,-180,-238,-356,-353,-206,-164,-165,759,-254,-237,-130,-126,-127,-253,-248,-373,-129,-355,-252,-125,542,-251,]),'DIR':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,51,-3,51,-372,51,-371,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-373,51,51,-2,-5,-6,-4,-7,51,51,-51,-48,51,51,51,51,-373,51,51,-43,51,51,-373,-25,51,-24,-41,51,51,51,51,51,51,51,51,51,51,51,51,51,-49,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-39,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-373,-9,-44,-46,51,51,51,-47,51,-31,-23,-27,-28,-26,-29,-42,51,51,-45,51,51,-40,-13,-12,51,51,-55,-10,51,51,51,51,-8,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-11,-56,-373,-59,51,51,51,51,51,-34,-373,-69,-38,51,-50,-373,-373,51,51,-108,51,51,51,51,-30,51,51,51,-373,-61,51,51,51,-373,51,51,-373,-107,51,-83,-35,-32,51,-63,-373,-81,-37,-60,51,51,51,51,51,-70,-84,-91,-373,-90,-85,-64,51,51,51,51,-36,-373,-75,-106,-373,51,-86,-373,51,51,51,-373,51,-33,51,51,-82,51,-62,-76,-373,-373,-373,-52,-54,51,51,-373,51,-53,]),'AND_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,242,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'CLASS':([0,1,3,5,10,34,49,54,55,65,66,70,83,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,417,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,680,687,690,695,701,704,707,708,709,710,711,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,22,-3,-372,-371,134,-373,-2,-5,-6,-4,-7,223,-51,-48,-373,-43,-373,-25,22,-24,-41,-49,-39,22,-373,-9,-44,-46,-47,22,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,22,-8,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,22,-108,-30,22,22,-373,-61,-373,-373,-107,-83,-35,-32,-63,-373,-81,-37,-60,22,22,-70,-84,-91,-373,-90,-85,-64,22,-36,-373,-75,-106,-373,22,-86,-373,22,-373,22,-33,22,-82,22,-62,-76,-373,-373,-373,-52,-54,22,22,-373,22,-53,]),'SL_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,231,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'INLINE_HTML':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,91,-3,-372,-371,-373,-2,-5,-6,-4,-7,91,-51,-48,-373,-43,-373,-25,91,-24,-41,-49,-39,91,-373,-9,-44,-46,-47,91,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,91,91,-8,91,91,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,91,-108,-30,91,91,-373,-61,91,-373,-373,-107,-83,-35,-32,91,-63,-373,-81,-37,-60,91,91,91,-70,-84,-91,-373,-90,-85,-64,91,-36,-373,-75,-106,-373,91,-86,-373,91,-373,91,-33,91,91,-82,91,-62,-76,-373,-373,-373,-52,-54,91,91,-373,91,-53,]),'XOR':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,197,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,197,-183,197,197,-305,-294,197,-297,-210,-302,-304,-320,197,197,197,197,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,197,-210,-209,197,-299,-298,-300,197,-303,-329,197,197,197,197,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,197,-169,-182,-173,-325,197,197,197,197,-357,197,-289,197,-288,-277,-278,-276,-274,197,-284,-275,-271,-286,-273,197,-285,197,-287,-283,-280,197,-282,197,-279,-290,197,-281,-317,197,197,-321,197,197,197,197,197,197,197,197,197,197,197,197,197,-311,-310,197,-203,-373,-221,-223,197,197,-326,197,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,197,-227,-205,-190,-176,-179,-181,197,197,-195,197,197,-196,-202,-204,197,-200,-199,197,-198,-197,-178,197,-373,-225,-224,-180,197,-206,197,-248,197,197,]),'STRING':([0,1,3,4,5,9,10,11,12,14,20,21,22,23,25,27,28,30,32,33,36,39,41,42,44,47,48,49,50,53,54,55,56,61,63,65,66,70,71,77,79,80,81,88,91,94,97,99,100,108,109,111,112,113,119,132,134,135,137,139,141,142,143,144,147,150,151,152,154,159,161,164,171,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,217,223,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,259,262,264,265,266,267,268,276,282,285,286,287,288,290,291,292,293,294,295,296,301,303,308,310,313,315,317,327,331,335,369,373,374,376,377,378,379,393,402,403,404,405,408,409,410,414,417,420,423,426,432,433,436,440,448,449,454,455,458,462,463,466,475,478,483,485,486,488,490,492,497,500,503,505,510,511,512,516,518,523,524,532,533,539,542,554,560,561,562,568,570,572,577,581,584,585,591,592,594,600,618,620,625,627,630,637,638,644,646,653,658,659,660,662,669,671,672,674,680,682,684,687,690,694,695,700,701,704,705,707,708,709,710,711,712,713,716,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,771,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,804,808,809,810,],[-373,92,-3,92,-372,92,-371,92,92,92,92,92,-109,116,92,92,92,92,92,92,92,92,92,-373,92,92,92,-373,92,92,-2,-5,158,92,92,-6,-4,-7,92,92,92,92,221,-51,-48,92,92,92,92,-373,92,92,92,256,-43,92,-111,92,92,278,-149,281,-150,284,-373,-25,92,-24,-41,306,92,92,92,92,92,92,92,332,92,92,92,92,92,92,92,92,-49,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-39,92,92,-110,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-373,-9,92,-44,-46,92,428,429,92,92,92,92,-47,92,-31,-23,-27,-28,-26,-29,-42,92,92,92,92,-45,278,92,92,92,92,92,-40,92,-13,493,221,-12,92,92,-55,-10,92,92,92,92,513,92,-8,92,92,92,92,92,92,92,92,92,548,549,92,92,92,92,92,92,92,92,92,92,92,580,92,92,92,-11,-56,-373,-59,92,92,92,92,92,92,92,92,92,-34,-373,-69,-38,92,92,92,-50,-373,-373,92,92,665,-108,92,278,92,92,92,92,-30,92,278,92,92,-373,-61,92,-373,717,92,92,-373,92,92,-373,-107,92,-83,92,-35,-32,92,-63,-373,-81,-37,-60,92,92,750,92,92,92,-70,-84,-91,-373,-90,-85,-64,92,92,92,92,-36,-373,-75,-106,-373,92,-86,-373,92,92,92,92,-373,92,-33,92,92,-82,92,-62,-76,-373,-373,-373,-52,-54,92,92,92,-373,92,-53,]),'OBJECT_OPERATOR':([29,40,46,59,67,72,75,89,129,166,168,172,228,229,275,277,278,279,280,283,300,305,435,437,438,439,467,468,471,473,474,482,498,501,528,530,531,563,564,573,586,619,621,635,636,642,643,645,677,678,679,692,721,],[-193,139,-192,-217,-210,-207,-216,-208,-210,313,-210,-207,-210,-209,-222,-373,-226,-373,-228,-212,454,-211,-203,-373,-221,-223,-211,-373,-212,-215,-214,-194,-201,-218,-227,-205,620,646,-179,-195,-196,-202,-204,-200,-199,-198,-197,-178,-373,-225,-224,-180,-206,]),'DOLLAR':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,49,50,53,54,55,58,61,63,65,66,70,77,79,88,91,93,94,97,99,100,108,111,112,119,135,137,139,144,147,150,151,152,154,159,161,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,266,267,276,285,286,287,288,290,291,292,293,294,295,296,301,308,309,310,312,313,315,318,327,331,335,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,505,510,511,512,532,533,554,560,561,562,568,570,572,577,581,584,585,591,600,618,620,638,644,646,653,658,659,660,662,680,687,690,694,695,700,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,93,-3,93,-372,93,-371,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-373,93,93,-2,-5,161,93,93,-6,-4,-7,93,93,-51,-48,93,93,93,93,93,-373,93,93,-43,93,93,93,93,-373,-25,93,-24,-41,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-49,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-39,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-373,-9,-44,-46,93,93,93,93,-47,93,-31,-23,-27,-28,-26,-29,-42,93,93,93,161,-45,93,93,93,93,93,93,93,-40,-13,-12,93,-55,-10,93,93,93,-8,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-11,-56,-373,-59,93,93,93,-34,-373,-69,-38,93,93,93,-50,-373,-373,93,-108,93,93,-30,93,93,93,93,-373,-61,93,-373,-373,-107,93,-83,93,-35,-32,93,-63,-373,-81,-37,-60,93,93,93,-70,-84,-91,-373,-90,-85,-64,93,93,-36,-373,-75,-106,-373,93,-86,-373,93,93,-373,93,-33,93,93,-82,93,-62,-76,-373,-373,-373,-52,-54,93,93,-373,93,-53,]),'AS':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,120,121,122,126,128,129,136,138,140,148,149,157,165,166,167,168,172,173,174,176,181,219,228,229,232,237,246,248,251,254,275,277,278,279,280,283,284,297,305,306,314,316,319,320,332,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,375,387,388,389,390,391,392,394,395,396,397,398,399,400,407,431,435,437,438,439,467,468,470,471,473,474,480,482,489,498,499,501,502,528,530,531,563,564,565,573,575,586,619,621,635,636,642,643,645,656,677,678,679,692,721,760,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,-314,-305,-294,-319,-297,-210,-302,-304,-320,-312,-315,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,376,-210,-209,-299,-298,-300,-303,-329,406,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,-169,-182,-173,-325,-357,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-317,492,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-311,-310,-203,-373,-221,-223,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,-227,-205,-190,-176,-179,-181,-195,-295,-196,-202,-204,-200,-199,-198,-197,-178,-184,-373,-225,-224,-180,-206,-248,]),'AT':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,41,-3,41,-372,41,-371,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-373,41,41,-2,-5,-6,-4,-7,41,41,-51,-48,41,41,41,41,-373,41,41,-43,41,41,-373,-25,41,-24,-41,41,41,41,41,41,41,41,41,41,41,41,41,41,-49,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-39,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-373,-9,-44,-46,41,41,-47,41,-31,-23,-27,-28,-26,-29,-42,41,41,-45,41,41,-40,-13,-12,41,-55,-10,41,41,41,-8,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-11,-56,-373,-59,41,41,41,-34,-373,-69,-38,41,-50,-373,-373,41,-108,41,-30,41,41,41,-373,-61,41,-373,-373,-107,41,-83,-35,-32,41,-63,-373,-81,-37,-60,41,41,41,-70,-84,-91,-373,-90,-85,-64,41,41,-36,-373,-75,-106,-373,41,-86,-373,41,41,-373,41,-33,41,41,-82,41,-62,-76,-373,-373,-373,-52,-54,41,41,-373,41,-53,]),'LPAREN':([0,1,3,4,5,9,10,11,12,15,16,18,20,21,24,25,27,28,30,32,35,36,38,39,41,42,44,47,48,49,50,53,54,55,59,60,64,65,66,67,68,70,72,73,75,76,77,78,79,86,87,88,89,90,91,92,94,96,97,99,100,103,104,108,111,112,119,129,133,135,137,141,142,143,147,150,151,152,154,164,165,166,167,168,172,173,174,177,178,179,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,228,229,231,233,234,235,236,238,239,240,241,242,243,244,245,249,250,251,252,253,262,264,269,275,276,277,278,279,280,281,283,284,285,286,287,288,289,290,291,292,293,294,295,301,305,306,308,310,315,319,331,332,367,369,372,374,378,393,402,403,404,405,409,417,424,428,429,430,432,433,436,438,439,448,449,462,463,466,467,468,470,471,473,474,475,478,483,485,490,501,503,505,510,511,512,528,532,533,545,554,560,561,562,563,564,568,577,581,584,585,591,600,618,631,638,644,645,653,658,659,660,662,677,678,679,680,687,690,692,694,695,701,704,705,706,707,708,709,710,711,720,722,728,731,732,734,735,736,738,742,744,745,746,750,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,802,808,809,810,],[-373,94,-3,94,-372,94,-371,94,94,111,112,113,94,94,117,94,94,94,94,94,135,94,137,94,94,-373,94,94,94,-373,94,94,-2,-5,-217,164,177,-6,-4,-210,180,-7,-228,183,-216,211,94,214,94,224,225,-51,-208,226,-48,-358,94,245,94,94,94,-373,-175,-373,94,94,-43,-210,183,94,94,-149,282,-150,-373,-25,94,-24,-41,94,-170,-177,315,-210,-207,-172,-171,94,94,94,94,331,94,94,94,94,94,94,94,94,-49,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-39,94,94,94,-210,-209,94,94,94,94,94,94,94,94,94,94,94,94,94,282,94,404,-373,-9,-44,-46,331,-222,94,436,-226,-373,-228,440,448,449,94,-47,94,-31,452,-23,-27,-28,-26,-29,-42,94,462,463,94,-45,94,-173,94,-357,486,-40,490,-13,-12,94,-55,-10,94,94,94,-8,523,463,449,404,94,94,94,-221,-223,94,94,94,94,94,-211,-373,-174,-212,-215,-214,94,94,94,94,94,-218,94,-11,-56,-373,-59,-227,94,94,637,94,-34,-373,-69,-176,-179,-38,94,-50,-373,-373,94,-108,94,686,-30,94,-178,94,94,-373,-61,94,436,-225,-224,-373,-373,-107,-180,94,-83,-35,-32,94,745,-63,-373,-81,-37,-60,94,94,94,-70,-84,-91,-373,-90,-85,767,-64,94,94,771,-36,-373,-75,-106,-373,94,-86,-373,94,94,-373,94,-33,94,94,-82,94,-62,-76,-373,-373,-373,-52,-54,94,94,804,-373,94,-53,]),'VARIABLE':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,31,32,33,36,39,41,44,47,48,49,50,52,53,54,55,58,61,62,63,65,66,70,77,79,88,91,92,93,94,97,99,100,104,108,111,112,119,135,137,139,144,147,150,151,152,154,155,156,159,161,164,173,175,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,263,264,266,267,276,282,285,286,287,288,290,291,292,293,294,295,296,298,299,300,301,308,309,310,312,313,315,318,319,327,331,332,335,369,374,378,393,402,403,404,405,406,409,416,417,432,433,436,440,441,442,446,448,449,455,462,463,466,470,475,478,483,485,486,488,490,497,500,503,505,506,510,511,512,517,532,533,536,538,542,547,548,553,554,560,561,562,568,570,572,577,581,584,585,588,591,595,597,598,599,600,601,602,604,605,608,609,610,618,620,638,639,644,646,653,658,659,660,662,666,680,686,687,688,690,694,695,700,701,704,705,707,708,709,710,711,715,720,722,725,728,730,731,732,734,735,736,738,744,745,746,753,754,755,756,759,762,763,764,766,767,771,774,775,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,805,808,809,810,],[-373,59,-3,59,-372,59,-371,59,59,59,59,59,59,59,59,125,59,59,59,59,59,59,59,59,-373,59,-373,59,-2,-5,163,59,-373,59,-6,-4,-7,59,59,-51,-48,-358,59,59,59,59,59,-175,-373,59,59,-43,59,59,59,59,-373,-25,59,-24,-41,300,-360,59,59,59,-172,300,59,59,59,59,59,59,59,59,59,59,59,59,-49,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-39,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-373,-9,-44,125,-46,59,59,59,445,59,-47,59,-31,-23,-27,-28,-26,-29,-42,59,-359,-361,-362,59,59,163,-45,59,59,59,59,-173,59,59,-357,59,-40,-13,-12,59,-55,-10,59,59,508,59,-114,-8,59,59,59,445,535,537,540,59,59,551,59,59,59,-174,59,59,59,59,59,59,59,59,59,59,-11,587,-56,-373,-59,-115,59,59,626,628,445,-367,-364,-365,59,-34,-373,-69,-38,59,59,59,-50,-373,-373,508,59,-147,-144,-146,-148,-108,-145,-135,-136,667,-143,-142,-116,59,59,-30,-363,59,59,59,59,-373,-61,59,-141,-373,727,-373,729,-107,59,-83,59,-35,-32,59,-63,-373,-81,-37,-60,749,59,59,757,59,-366,-70,-84,-91,-373,-90,-85,-64,59,59,-36,-373,-75,-106,776,-373,59,-86,-373,59,445,59,787,-373,59,-33,59,59,-82,59,-62,-76,-373,-373,-373,-52,-54,59,59,806,-373,59,-53,]),'IF':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,96,-3,-372,-371,-373,-2,-5,-6,-4,-7,96,-51,-48,-373,-43,-373,-25,96,-24,-41,-49,-39,96,-373,-9,-44,-46,-47,96,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,96,96,-8,96,96,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,96,-108,-30,96,96,-373,-61,96,-373,-373,-107,-83,-35,-32,96,-63,-373,-81,-37,-60,96,96,96,-70,-84,-91,-373,-90,-85,-64,96,-36,-373,-75,-106,-373,96,-86,-373,96,-373,96,-33,96,96,-82,96,-62,-76,-373,-373,-373,-52,-54,96,96,-373,96,-53,]),'OR_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,233,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'CONCAT':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,74,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,118,120,121,122,126,128,129,136,138,140,145,148,149,153,157,165,166,167,168,172,173,174,176,181,212,228,229,230,232,237,246,247,248,251,254,255,270,271,275,277,278,279,280,283,284,297,305,306,311,314,316,319,320,321,322,323,326,332,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,371,386,387,388,389,390,391,392,394,395,396,397,398,399,400,401,407,431,434,435,437,438,439,450,456,457,464,467,468,470,471,473,474,480,482,489,498,499,501,502,526,528,530,531,563,564,565,569,571,573,575,579,586,619,621,622,635,636,640,642,643,645,656,677,678,679,692,699,721,733,760,768,781,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,190,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,190,-183,190,190,-305,-294,190,-297,-210,-302,-304,-320,190,190,190,190,-293,-170,-177,-373,-210,-207,-172,-171,-296,-328,190,-210,-209,190,-299,-298,-300,190,-303,-329,190,190,190,190,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,190,-169,-182,-173,-325,190,190,190,190,-357,190,190,190,190,-277,-278,-276,-274,190,190,-275,190,190,190,190,190,190,190,190,190,190,190,190,190,-290,190,-281,-317,190,190,-321,190,190,190,190,190,190,190,190,190,190,190,190,190,-311,-310,190,-203,-373,-221,-223,190,190,-326,190,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,190,190,-227,-205,-190,-176,-179,-181,190,190,-195,190,190,-196,-202,-204,190,-200,-199,190,-198,-197,-178,190,-373,-225,-224,-180,190,-206,190,-248,190,190,]),'PLUS_EQUAL':([29,40,46,59,67,72,75,89,95,228,229,275,277,278,279,280,283,305,435,437,438,439,473,474,482,498,501,528,530,531,573,586,619,621,635,636,642,643,677,678,679,721,],[-193,-191,-192,-217,-210,-207,-216,-208,234,-210,-209,-222,-373,-226,-373,-228,-212,-211,-203,-373,-221,-223,-215,-214,-194,-201,-218,-227,-205,-190,-195,-196,-202,-204,-200,-199,-198,-197,-373,-225,-224,-206,]),'NUM_STRING':([455,],[550,]),'LNUMBER':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,265,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,379,393,402,403,404,405,408,409,417,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,523,532,533,539,554,560,561,562,568,577,581,584,585,591,592,600,618,625,627,630,638,644,653,658,659,660,662,672,674,680,682,684,687,690,694,695,701,704,705,707,708,709,710,711,712,713,720,722,728,731,732,734,735,736,738,744,745,746,751,752,753,754,755,756,762,763,764,766,767,770,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,98,-3,98,-372,98,-371,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-373,98,98,-2,-5,-6,-4,-7,98,98,-51,-48,98,98,98,98,-373,98,98,-43,98,98,-373,-25,98,-24,-41,98,98,98,98,98,98,98,98,98,98,98,98,98,-49,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-39,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-373,-9,-44,-46,98,98,98,-47,98,-31,-23,-27,-28,-26,-29,-42,98,98,-45,98,98,-40,-13,-12,98,98,-55,-10,98,98,98,98,-8,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-11,-56,-373,-59,98,98,98,98,98,-34,-373,-69,-38,98,-50,-373,-373,98,98,-108,98,98,98,98,-30,98,98,98,-373,-61,98,98,98,-373,98,98,-373,-107,98,-83,-35,-32,98,-63,-373,-81,-37,-60,98,98,98,98,98,-70,-84,-91,-373,-90,-85,-64,98,98,98,98,-36,-373,-75,-106,-373,98,-86,-373,98,98,98,-373,98,-33,98,98,-82,98,-62,-76,-373,-373,-373,-52,-54,98,98,-373,98,-53,]),'RBRACKET':([6,7,8,13,17,19,26,29,37,40,46,51,59,67,69,72,73,75,78,82,84,85,89,92,95,98,102,104,105,106,107,114,115,120,121,122,126,128,129,136,138,140,148,149,157,165,166,167,168,172,173,174,176,179,181,228,229,232,237,246,248,251,275,277,278,279,280,283,284,297,305,306,314,316,319,320,323,324,325,332,338,339,340,341,342,343,344,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,370,387,388,389,390,391,392,394,395,396,397,398,399,400,407,431,435,437,438,439,467,468,470,471,473,474,480,482,489,498,499,501,502,528,530,531,533,549,550,551,552,563,564,565,573,575,586,619,621,623,635,636,640,642,643,645,656,677,678,679,692,721,760,],[-229,-336,-335,-333,-341,-338,-322,-193,-334,-191,-192,-337,-217,-210,-326,-207,-327,-216,-316,-339,-340,-323,-208,-358,-166,-332,-301,-175,-292,-306,-291,-313,-183,-314,-305,-294,-319,-297,-210,-302,-304,-320,-312,-315,-293,-170,-177,-373,-210,-207,-172,-171,-296,-373,-328,-210,-209,-299,-298,-300,-303,-329,-222,-373,-226,-373,-228,-212,-331,-324,-211,-330,-169,-182,-173,-325,-219,-220,474,-357,-289,-268,-288,-277,-278,-276,-274,-284,-275,-271,-286,-273,-267,-285,-266,-287,-283,-280,-270,-282,-269,-279,-290,-272,-281,-317,-321,-264,-262,-255,-257,-167,-260,-265,-258,-259,-261,-256,-263,-311,-310,-203,-373,-221,-223,-211,-373,-174,-212,-215,-214,-230,-194,-318,-201,-307,-218,-168,-227,-205,-190,-373,-368,-369,-370,639,-176,-179,-181,-195,-295,-196,-202,-204,679,-200,-199,689,-198,-197,-178,-184,-373,-225,-224,-180,-206,-248,]),'INT_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,97,-3,97,-372,97,-371,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-373,97,97,-2,-5,-6,-4,-7,97,97,-51,-48,97,97,97,97,-373,97,97,-43,97,97,-373,-25,97,-24,-41,97,97,97,97,97,97,97,97,97,97,97,97,97,-49,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-39,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-373,-9,-44,-46,97,97,-47,97,-31,-23,-27,-28,-26,-29,-42,97,97,-45,97,97,-40,-13,-12,97,-55,-10,97,97,97,-8,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-11,-56,-373,-59,97,97,97,-34,-373,-69,-38,97,-50,-373,-373,97,-108,97,-30,97,97,97,-373,-61,97,-373,-373,-107,97,-83,-35,-32,97,-63,-373,-81,-37,-60,97,97,97,-70,-84,-91,-373,-90,-85,-64,97,97,-36,-373,-75,-106,-373,97,-86,-373,97,97,-373,97,-33,97,97,-82,97,-62,-76,-373,-373,-373,-52,-54,97,97,-373,97,-53,]),'THROW':([0,1,3,5,10,49,54,55,65,66,70,79,88,91,108,119,147,150,151,152,154,191,213,250,252,253,262,264,286,287,288,290,291,292,293,294,295,310,369,374,378,402,403,405,409,417,466,503,505,510,511,512,560,561,562,568,581,584,585,591,600,638,644,658,659,660,662,680,687,690,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,746,753,754,755,756,762,763,764,766,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,99,-3,-372,-371,-373,-2,-5,-6,-4,-7,99,-51,-48,-373,-43,-373,-25,99,-24,-41,-49,-39,99,-373,-9,-44,-46,-47,99,-31,-23,-27,-28,-26,-29,-42,-45,-40,-13,-12,-55,-10,99,99,-8,99,99,-11,-56,-373,-59,-34,-373,-69,-38,-50,-373,-373,99,-108,-30,99,99,-373,-61,99,-373,-373,-107,-83,-35,-32,99,-63,-373,-81,-37,-60,99,99,99,-70,-84,-91,-373,-90,-85,-64,99,-36,-373,-75,-106,-373,99,-86,-373,99,-373,99,-33,99,99,-82,99,-62,-76,-373,-373,-373,-52,-54,99,99,-373,99,-53,]),'ARRAY_CAST':([0,1,3,4,5,9,10,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,49,50,53,54,55,65,66,70,77,79,88,91,94,97,99,100,108,111,112,119,135,137,147,150,151,152,154,164,177,178,179,180,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,213,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,252,253,262,264,276,285,286,287,288,290,291,292,293,294,295,301,308,310,315,331,369,374,378,393,402,403,404,405,409,417,432,433,436,448,449,462,463,466,475,478,483,485,490,503,505,510,511,512,532,533,554,560,561,562,568,577,581,584,585,591,600,618,638,644,653,658,659,660,662,680,687,690,694,695,701,704,705,707,708,709,710,711,720,722,728,731,732,734,735,736,738,744,745,746,753,754,755,756,762,763,764,766,767,774,777,778,779,780,782,783,788,790,792,793,794,795,798,799,800,801,808,809,810,],[-373,100,-3,100,-372,100,-371,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-373,100,100,-2,-5,-6,-4,-7,100,100,-51,-48,100,100,100,100,-373,100,100,-43,100,100,-373,-25,100,-24,-41,100,100,100,100,100,100,100,100,100,100,100,100,100,-49,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-39,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-373,-9,-44,-46,100,100,-47,100,-31,-23,-27,-28,-26,-29,-42,100,100,-45,100,100,-40,-13,-12,100,-55,-10,100,100,100,-8,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-11,-56,-373,-59,100,100,100,-34,-373,-69,-38,100,-50,-373,-373,100,-108,100,-30,100,100,100,-373,-61,100,-373,-373,-107,100,-83,-35,-32,100,-63,-373,-81,-37,-60,100,100,100,-70,-84,-91,-373,-90,-85,-64,100,100,-36,-373,-75,-106,-373,100,-86,-373,100,100,-373,100,-33,100,100,-82,100,-62,-76,-373,-373,-373,-52,-54,100,100,-373,100,-53,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'ctor_arguments':([167,],[314,]),'scalar':([1,4,9,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,50,53,77,79,94,97,99,100,111,112,135,137,151,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,301,308,315,331,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,490,503,532,533,554,577,591,618,644,653,658,662,694,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'declare_statement':([409,],[510,]),'assignment_list_element':([211,486,488,],[365,365,578,]),'constant_declarations':([81,],[220,]),'unset_variables':([224,],[382,]),'while_statement':([466,],[560,]),'reference_variable':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,93,94,97,99,100,111,112,135,137,139,144,151,159,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,266,267,276,285,287,296,301,308,312,313,315,318,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,620,644,646,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[67,67,67,67,67,67,67,67,67,67,67,67,129,67,67,67,67,67,67,67,67,168,129,67,67,228,67,67,67,67,67,67,67,67,228,228,67,228,129,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,129,67,129,67,129,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,228,228,67,67,67,129,67,67,228,228,67,228,129,67,129,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,129,129,67,129,129,67,67,67,67,129,129,67,67,67,228,67,228,67,67,67,67,129,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'for_statement':([720,],[753,]),'foreach_variable':([406,588,],[507,661,]),'non_empty_member_modifiers':([514,641,],[602,602,]),'encaps_var':([155,175,],[298,298,]),'parameter_list':([282,440,771,],[447,534,785,]),'parameter':([282,440,542,771,],[443,443,634,443,]),'class_variable_declaration':([605,],[668,]),'dynamic_class_name_variable_properties':([468,],[563,]),'dynamic_class_name_variable_property':([563,],[645,]),'inner_statement':([151,287,591,644,658,722,728,746,763,774,778,780,788,800,801,809,],[290,290,290,290,290,290,290,290,290,290,290,290,290,290,290,290,]),'class_constant':([1,4,9,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,50,53,77,79,94,97,99,100,111,112,135,137,151,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,301,308,315,331,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,490,503,532,533,554,577,591,618,644,653,658,662,694,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'function_call':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'member_modifier':([514,602,641,],[609,666,609,]),'class_name_reference':([61,],[167,]),'lexical_vars':([541,],[632,]),'else_single':([659,],[704,]),'base_variable_with_function_calls':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'inner_statement_list':([49,147,511,561,584,680,687,708,735,754,762,766,777,794,795,808,],[151,287,591,644,658,722,728,746,763,774,778,780,788,800,801,809,]),'global_var_list':([58,],[162,]),'static_non_empty_array_pair_list':([523,],[615,]),'static_scalar':([265,379,408,420,423,523,539,592,625,627,630,672,674,682,684,712,713,751,752,770,],[421,495,509,519,522,613,629,664,681,683,685,718,719,723,724,747,748,772,773,784,]),'object_property':([139,313,620,646,],[277,468,677,692,]),'implements_list':([302,],[459,]),'variable_class_name':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[43,43,43,43,43,43,43,43,43,43,43,43,130,43,43,43,43,43,43,43,43,170,130,43,43,43,43,43,43,43,43,43,43,43,130,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,130,43,130,43,130,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,130,43,43,43,130,43,130,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,130,130,43,130,130,43,43,43,43,130,130,43,43,43,43,43,43,43,43,130,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'static_var_list':([31,],[124,]),'use_declarations':([80,],[216,]),'class_declaration_statement':([1,151,250,287,405,591,644,658,722,728,746,763,774,778,780,788,800,801,809,],[70,294,70,294,70,294,294,294,294,294,294,294,294,294,294,294,294,294,294,]),'is_reference':([42,103,669,],[142,249,716,]),'object_dim_list':([279,],[438,]),'variable_modifiers':([514,641,],[605,605,]),'interface_extends_list':([116,],[258,]),'assignment_list':([211,486,],[368,576,]),'interface_list':([259,458,],[415,555,]),'top_statement':([1,250,405,],[54,54,54,]),'encaps_var_offset':([455,],[552,]),'comment':([1,151,250,287,405,514,591,641,644,658,722,728,746,763,774,778,780,788,800,801,809,],[55,291,55,291,55,593,291,593,291,291,291,291,291,291,291,291,291,291,291,291,291,]),'non_empty_for_expr':([137,433,618,],[272,272,272,]),'class_entry_type':([1,151,250,287,405,591,644,658,722,728,746,763,774,778,780,788,800,801,809,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'elseif_list':([585,],[659,]),'class_name':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,282,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,440,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,542,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,771,774,778,780,782,788,800,801,809,],[57,57,57,57,57,57,57,57,57,57,57,57,127,57,57,57,57,57,57,57,57,165,127,57,57,57,57,57,57,57,57,57,57,57,127,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,127,57,127,57,127,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,441,57,57,127,57,57,57,127,57,127,57,57,57,57,57,57,57,441,57,57,57,57,57,57,57,57,57,127,127,57,127,127,57,57,57,441,57,127,127,57,57,57,57,57,57,57,57,127,57,57,57,57,57,57,57,57,441,57,57,57,57,57,57,57,57,]),'class_statement':([514,641,],[596,596,]),'case_list':([566,567,647,650,],[648,651,693,697,]),'class_statement_list':([411,556,],[514,641,]),'base_variable':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,166,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'isset_variables':([226,],[385,]),'start':([0,],[2,]),'function_declaration_statement':([1,151,250,287,405,591,644,658,722,728,746,763,774,778,780,788,800,801,809,],[65,292,65,292,65,292,292,292,292,292,292,292,292,292,292,292,292,292,292,]),'statement':([1,79,151,250,287,405,409,466,503,591,644,658,662,705,720,722,728,746,763,774,778,780,782,788,800,801,809,],[66,215,293,66,293,66,512,562,585,293,293,293,709,744,755,293,293,293,293,293,293,293,790,293,293,293,293,]),'variable_name':([139,313,620,646,],[279,279,279,279,]),'top_statement_list':([0,108,252,],[1,250,405,]),'non_empty_array_pair_list':([180,],[328,]),'function_call_parameter':([183,225,315,331,404,436,448,449,462,463,483,],[337,337,337,337,337,337,337,337,337,337,574,]),'dim_offset':([179,533,],[325,623,]),'unset_variable':([224,497,],[381,582,]),'global_var':([58,309,],[160,465,]),'lexical_var_list':([686,],[726,]),'variable_property':([531,],[621,]),'simple_indirect_reference':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,93,94,97,99,100,111,112,135,137,139,144,151,159,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,266,267,276,285,287,296,301,308,312,313,315,318,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,620,644,646,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,172,72,72,72,229,72,72,72,72,72,72,72,72,280,280,72,280,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,280,280,72,72,72,72,72,72,280,280,72,280,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,280,72,280,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'array_pair_list':([180,],[329,]),'namespace_name':([1,4,9,11,12,14,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,71,77,79,80,94,97,99,100,109,111,112,132,135,137,151,161,164,171,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,217,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,259,265,268,276,282,285,287,296,301,303,308,315,317,327,331,335,373,379,393,404,405,408,409,414,420,423,426,432,433,436,440,448,449,458,462,463,466,475,478,483,485,486,488,490,497,500,503,516,518,523,524,532,533,539,542,554,570,572,577,591,592,618,625,627,630,637,644,653,658,662,672,674,682,684,694,700,705,712,713,720,722,728,745,746,751,752,763,767,770,771,774,778,780,782,788,800,801,804,809,],[73,73,73,73,73,110,73,73,73,73,73,73,73,133,73,73,73,73,73,73,73,73,173,133,181,73,73,219,73,73,73,73,251,73,73,269,73,73,73,133,73,319,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,133,73,375,133,73,133,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,416,427,430,73,173,73,73,133,73,416,73,73,470,133,73,133,219,427,73,73,73,427,73,517,427,427,525,73,73,73,173,73,73,416,73,73,73,73,73,73,73,133,133,73,133,133,73,610,416,427,617,73,73,427,173,73,133,133,73,73,427,73,427,427,427,416,73,73,73,73,427,427,427,427,73,133,73,427,427,73,73,73,73,73,427,427,73,73,427,173,73,73,73,73,73,73,73,416,73,]),'new_else_single':([703,],[740,]),'echo_expr_list':([44,],[146,]),'expr':([1,4,9,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,50,53,77,79,94,97,99,100,111,112,135,137,151,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,301,308,315,331,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,490,503,532,533,554,577,591,618,644,653,658,662,694,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[74,102,105,106,107,114,115,118,120,121,122,126,136,138,140,145,148,149,153,157,212,74,230,246,247,248,254,255,270,271,74,311,321,322,323,326,334,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,371,334,386,388,389,390,391,392,394,395,396,397,398,399,400,401,74,434,450,74,456,464,334,334,502,334,74,74,526,271,334,334,334,334,334,74,569,571,334,575,579,74,622,323,640,656,74,271,74,699,74,74,733,74,74,74,74,768,74,74,781,74,74,74,74,74,74,74,74,]),'method_modifiers':([514,641,],[606,606,]),'empty':([0,42,49,52,62,103,108,116,137,147,158,167,179,180,183,211,225,252,277,279,282,302,315,328,331,404,411,433,436,437,440,448,449,462,463,468,486,488,507,511,514,523,533,541,556,561,566,567,584,585,615,618,641,647,650,658,659,669,677,680,687,703,708,735,754,762,766,771,777,793,794,795,808,],[3,143,152,156,156,143,3,260,273,152,304,316,324,330,336,366,336,3,435,439,444,460,336,479,336,336,515,273,336,530,444,336,336,336,336,564,366,366,590,152,603,614,324,633,515,152,649,649,152,660,479,273,603,649,649,702,707,143,435,152,152,743,152,152,152,152,152,444,152,799,152,152,152,]),'switch_case_list':([472,],[568,]),'class_constant_declaration':([514,641,],[607,607,]),'encaps_list':([52,62,],[155,175,]),'new_elseif_list':([658,],[703,]),'extends_from':([158,],[302,]),'possible_comma':([328,615,],[477,673,]),'common_scalar':([1,4,9,11,12,20,21,25,27,28,30,32,36,39,41,44,47,48,50,53,77,79,94,97,99,100,111,112,135,137,151,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,225,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,265,276,285,287,301,308,315,331,379,393,404,405,408,409,420,423,432,433,436,448,449,462,463,466,475,478,483,485,490,503,523,532,533,539,554,577,591,592,618,625,627,630,644,653,658,662,672,674,682,684,694,705,712,713,720,722,728,745,746,751,752,763,767,770,774,778,780,782,788,800,801,809,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,419,85,85,85,85,85,85,85,419,85,85,85,419,85,419,419,85,85,85,85,85,85,85,85,85,85,85,85,85,85,419,85,85,419,85,85,85,419,85,419,419,419,85,85,85,85,419,419,419,419,85,85,419,419,85,85,85,85,85,419,419,85,85,419,85,85,85,85,85,85,85,85,]),'variable_properties':([437,],[531,]),'variable_without_objects':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,63,77,79,94,97,99,100,111,112,135,137,139,144,151,159,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,266,267,276,285,287,296,301,308,312,313,315,318,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,620,644,646,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,275,283,87,305,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,305,283,87,87,87,87,87,87,467,275,87,471,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,275,87,275,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'foreach_statement':([662,],[710,]),'fully_qualified_class_name':([259,303,458,518,637,804,],[412,461,412,611,688,805,]),'static_member':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'function_call_parameter_list':([183,225,315,331,404,436,448,449,462,463,],[333,383,469,481,504,529,543,544,557,558,]),'constant_declaration':([81,377,],[222,494,]),'foreach_optional_arg':([507,],[589,]),'additional_catches':([793,],[798,]),'case_separator':([696,733,],[735,762,]),'use_declaration':([80,373,],[218,491,]),'method_body':([791,],[797,]),'declare_list':([113,],[257,]),'variable':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,63,77,79,94,97,99,100,111,112,135,137,151,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,276,285,287,296,301,308,315,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,644,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[95,95,95,95,95,95,95,95,95,95,95,95,128,95,95,95,95,95,95,95,95,176,95,95,95,95,95,95,95,95,95,95,95,307,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,364,95,380,95,384,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,453,95,95,95,476,95,484,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,364,364,95,380,583,95,95,95,95,652,654,95,95,95,95,95,95,95,95,739,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'method_or_not':([277,677,],[437,721,]),'compound_variable':([1,4,9,11,12,20,21,25,27,28,30,32,33,36,39,41,44,47,48,50,53,61,63,77,79,93,94,97,99,100,111,112,135,137,139,144,151,159,161,164,177,178,179,180,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,224,225,226,227,231,233,234,235,236,238,239,240,241,242,243,244,245,250,266,267,276,285,287,296,301,308,312,313,315,318,327,331,335,393,404,405,409,432,433,436,448,449,462,463,466,475,478,483,485,486,488,490,497,500,503,532,533,554,570,572,577,591,618,620,644,646,653,658,662,694,700,705,720,722,728,745,746,763,767,774,778,780,782,788,800,801,809,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'static_var':([31,263,],[123,418,]),'static_array_pair_list':([523,],[616,]),'dynamic_class_name_reference':([61,],[174,]),'for_expr':([137,433,618,],[274,527,676,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> top_statement_list','start',1,'p_start','phpparse.py',85),
+  ('top_statement_list -> top_statement_list top_statement','top_statement_list',2,'p_top_statement_list','phpparse.py',89),
+  ('top_statement_list -> empty','top_statement_list',1,'p_top_statement_list','phpparse.py',90),
+  ('top_statement -> statement','top_statement',1,'p_top_statement','phpparse.py',97),
+  ('top_statement -> comment','top_statement',1,'p_top_statement','phpparse.py',98),
+  ('top_statement -> function_declaration_statement','top_statement',1,'p_top_statement','phpparse.py',99),
+  ('top_statement -> class_declaration_statement','top_statement',1,'p_top_statement','phpparse.py',100),
+  ('top_statement -> HALT_COMPILER LPAREN RPAREN SEMI','top_statement',4,'p_top_statement','phpparse.py',101),
+  ('top_statement -> NAMESPACE namespace_name SEMI','top_statement',3,'p_top_statement_namespace','phpparse.py',109),
+  ('top_statement -> NAMESPACE LBRACE top_statement_list RBRACE','top_statement',4,'p_top_statement_namespace','phpparse.py',110),
+  ('top_statement -> NAMESPACE namespace_name LBRACE top_statement_list RBRACE','top_statement',5,'p_top_statement_namespace','phpparse.py',111),
+  ('top_statement -> CONST constant_declarations SEMI','top_statement',3,'p_top_statement_constant','phpparse.py',120),
+  ('top_statement -> USE use_declarations SEMI','top_statement',3,'p_top_statement_use','phpparse.py',124),
+  ('use_declarations -> use_declarations COMMA use_declaration','use_declarations',3,'p_use_declarations','phpparse.py',128),
+  ('use_declarations -> use_declaration','use_declarations',1,'p_use_declarations','phpparse.py',129),
+  ('use_declaration -> namespace_name','use_declaration',1,'p_use_declaration','phpparse.py',136),
+  ('use_declaration -> NS_SEPARATOR namespace_name','use_declaration',2,'p_use_declaration','phpparse.py',137),
+  ('use_declaration -> namespace_name AS STRING','use_declaration',3,'p_use_declaration','phpparse.py',138),
+  ('use_declaration -> NS_SEPARATOR namespace_name AS STRING','use_declaration',4,'p_use_declaration','phpparse.py',139),
+  ('constant_declarations -> constant_declarations COMMA constant_declaration','constant_declarations',3,'p_constant_declarations','phpparse.py',150),
+  ('constant_declarations -> constant_declaration','constant_declarations',1,'p_constant_declarations','phpparse.py',151),
+  ('constant_declaration -> STRING EQUALS static_scalar','constant_declaration',3,'p_constant_declaration','phpparse.py',158),
+  ('inner_statement_list -> inner_statement_list inner_statement','inner_statement_list',2,'p_inner_statement_list','phpparse.py',162),
+  ('inner_statement_list -> empty','inner_statement_list',1,'p_inner_statement_list','phpparse.py',163),
+  ('inner_statement_list -> BODY','inner_statement_list',1,'p_inner_statement_list_body','phpparse.py',170),
+  ('inner_statement -> statement','inner_statement',1,'p_inner_statement','phpparse.py',174),
+  ('inner_statement -> comment','inner_statement',1,'p_inner_statement','phpparse.py',175),
+  ('inner_statement -> function_declaration_statement','inner_statement',1,'p_inner_statement','phpparse.py',176),
+  ('inner_statement -> class_declaration_statement','inner_statement',1,'p_inner_statement','phpparse.py',177),
+  ('inner_statement -> HALT_COMPILER LPAREN RPAREN SEMI','inner_statement',4,'p_inner_statement','phpparse.py',178),
+  ('statement -> LBRACE inner_statement_list RBRACE','statement',3,'p_statement_block','phpparse.py',183),
+  ('statement -> IF LPAREN expr RPAREN statement elseif_list else_single','statement',7,'p_statement_if','phpparse.py',187),
+  ('statement -> IF LPAREN expr RPAREN COLON inner_statement_list new_elseif_list new_else_single ENDIF SEMI','statement',10,'p_statement_if','phpparse.py',188),
+  ('statement -> WHILE LPAREN expr RPAREN while_statement','statement',5,'p_statement_while','phpparse.py',196),
+  ('statement -> DO statement WHILE LPAREN expr RPAREN SEMI','statement',7,'p_statement_do_while','phpparse.py',200),
+  ('statement -> FOR LPAREN for_expr SEMI for_expr SEMI for_expr RPAREN for_statement','statement',9,'p_statement_for','phpparse.py',204),
+  ('statement -> FOREACH LPAREN expr AS foreach_variable foreach_optional_arg RPAREN foreach_statement','statement',8,'p_statement_foreach','phpparse.py',208),
+  ('statement -> SWITCH LPAREN expr RPAREN switch_case_list','statement',5,'p_statement_switch','phpparse.py',215),
+  ('statement -> BREAK SEMI','statement',2,'p_statement_break','phpparse.py',219),
+  ('statement -> BREAK expr SEMI','statement',3,'p_statement_break','phpparse.py',220),
+  ('statement -> CONTINUE SEMI','statement',2,'p_statement_continue','phpparse.py',227),
+  ('statement -> CONTINUE expr SEMI','statement',3,'p_statement_continue','phpparse.py',228),
+  ('statement -> RETURN SEMI','statement',2,'p_statement_return','phpparse.py',235),
+  ('statement -> RETURN expr SEMI','statement',3,'p_statement_return','phpparse.py',236),
+  ('statement -> GLOBAL global_var_list SEMI','statement',3,'p_statement_global','phpparse.py',243),
+  ('statement -> STATIC static_var_list SEMI','statement',3,'p_statement_static','phpparse.py',247),
+  ('statement -> ECHO echo_expr_list SEMI','statement',3,'p_statement_echo','phpparse.py',251),
+  ('statement -> INLINE_HTML','statement',1,'p_statement_inline_html','phpparse.py',255),
+  ('statement -> expr SEMI','statement',2,'p_statement_expr','phpparse.py',259),
+  ('statement -> UNSET LPAREN unset_variables RPAREN SEMI','statement',5,'p_statement_unset','phpparse.py',263),
+  ('statement -> SEMI','statement',1,'p_statement_empty','phpparse.py',267),
+  ('statement -> TRY LBRACE inner_statement_list RBRACE CATCH LPAREN fully_qualified_class_name VARIABLE RPAREN LBRACE inner_statement_list RBRACE additional_catches','statement',13,'p_statement_try','phpparse.py',271),
+  ('additional_catches -> additional_catches CATCH LPAREN fully_qualified_class_name VARIABLE RPAREN LBRACE inner_statement_list RBRACE','additional_catches',9,'p_additional_catches','phpparse.py',277),
+  ('additional_catches -> empty','additional_catches',1,'p_additional_catches','phpparse.py',278),
+  ('statement -> THROW expr SEMI','statement',3,'p_statement_throw','phpparse.py',286),
+  ('statement -> DECLARE LPAREN declare_list RPAREN declare_statement','statement',5,'p_statement_declare','phpparse.py',290),
+  ('declare_list -> STRING EQUALS static_scalar','declare_list',3,'p_declare_list','phpparse.py',294),
+  ('declare_list -> declare_list COMMA STRING EQUALS static_scalar','declare_list',5,'p_declare_list','phpparse.py',295),
+  ('declare_statement -> statement','declare_statement',1,'p_declare_statement','phpparse.py',302),
+  ('declare_statement -> COLON inner_statement_list ENDDECLARE SEMI','declare_statement',4,'p_declare_statement','phpparse.py',303),
+  ('elseif_list -> empty','elseif_list',1,'p_elseif_list','phpparse.py',310),
+  ('elseif_list -> elseif_list ELSEIF LPAREN expr RPAREN statement','elseif_list',6,'p_elseif_list','phpparse.py',311),
+  ('else_single -> empty','else_single',1,'p_else_single','phpparse.py',318),
+  ('else_single -> ELSE statement','else_single',2,'p_else_single','phpparse.py',319),
+  ('new_elseif_list -> empty','new_elseif_list',1,'p_new_elseif_list','phpparse.py',324),
+  ('new_elseif_list -> new_elseif_list ELSEIF LPAREN expr RPAREN COLON inner_statement_list','new_elseif_list',7,'p_new_elseif_list','phpparse.py',325),
+  ('new_else_single -> empty','new_else_single',1,'p_new_else_single','phpparse.py',333),
+  ('new_else_single -> ELSE COLON inner_statement_list','new_else_single',3,'p_new_else_single','phpparse.py',334),
+  ('while_statement -> statement','while_statement',1,'p_while_statement','phpparse.py',340),
+  ('while_statement -> COLON inner_statement_list ENDWHILE SEMI','while_statement',4,'p_while_statement','phpparse.py',341),
+  ('for_expr -> empty','for_expr',1,'p_for_expr','phpparse.py',348),
+  ('for_expr -> non_empty_for_expr','for_expr',1,'p_for_expr','phpparse.py',349),
+  ('non_empty_for_expr -> non_empty_for_expr COMMA expr','non_empty_for_expr',3,'p_non_empty_for_expr','phpparse.py',353),
+  ('non_empty_for_expr -> expr','non_empty_for_expr',1,'p_non_empty_for_expr','phpparse.py',354),
+  ('for_statement -> statement','for_statement',1,'p_for_statement','phpparse.py',361),
+  ('for_statement -> COLON inner_statement_list ENDFOR SEMI','for_statement',4,'p_for_statement','phpparse.py',362),
+  ('foreach_variable -> VARIABLE','foreach_variable',1,'p_foreach_variable','phpparse.py',369),
+  ('foreach_variable -> AND VARIABLE','foreach_variable',2,'p_foreach_variable','phpparse.py',370),
+  ('foreach_optional_arg -> empty','foreach_optional_arg',1,'p_foreach_optional_arg','phpparse.py',377),
+  ('foreach_optional_arg -> DOUBLE_ARROW foreach_variable','foreach_optional_arg',2,'p_foreach_optional_arg','phpparse.py',378),
+  ('foreach_statement -> statement','foreach_statement',1,'p_foreach_statement','phpparse.py',383),
+  ('foreach_statement -> COLON inner_statement_list ENDFOREACH SEMI','foreach_statement',4,'p_foreach_statement','phpparse.py',384),
+  ('switch_case_list -> LBRACE case_list RBRACE','switch_case_list',3,'p_switch_case_list','phpparse.py',391),
+  ('switch_case_list -> LBRACE SEMI case_list RBRACE','switch_case_list',4,'p_switch_case_list','phpparse.py',392),
+  ('switch_case_list -> COLON case_list ENDSWITCH SEMI','switch_case_list',4,'p_switch_case_list_colon','phpparse.py',399),
+  ('switch_case_list -> COLON SEMI case_list ENDSWITCH SEMI','switch_case_list',5,'p_switch_case_list_colon','phpparse.py',400),
+  ('case_list -> empty','case_list',1,'p_case_list','phpparse.py',407),
+  ('case_list -> case_list CASE expr case_separator inner_statement_list','case_list',5,'p_case_list','phpparse.py',408),
+  ('case_list -> case_list DEFAULT case_separator inner_statement_list','case_list',4,'p_case_list','phpparse.py',409),
+  ('case_separator -> COLON','case_separator',1,'p_case_separator','phpparse.py',418),
+  ('case_separator -> SEMI','case_separator',1,'p_case_separator','phpparse.py',419),
+  ('global_var_list -> global_var_list COMMA global_var','global_var_list',3,'p_global_var_list','phpparse.py',423),
+  ('global_var_list -> global_var','global_var_list',1,'p_global_var_list','phpparse.py',424),
+  ('global_var -> VARIABLE','global_var',1,'p_global_var','phpparse.py',431),
+  ('global_var -> DOLLAR variable','global_var',2,'p_global_var','phpparse.py',432),
+  ('global_var -> DOLLAR LBRACE expr RBRACE','global_var',4,'p_global_var','phpparse.py',433),
+  ('static_var_list -> static_var_list COMMA static_var','static_var_list',3,'p_static_var_list','phpparse.py',442),
+  ('static_var_list -> static_var','static_var_list',1,'p_static_var_list','phpparse.py',443),
+  ('static_var -> VARIABLE EQUALS static_scalar','static_var',3,'p_static_var','phpparse.py',450),
+  ('static_var -> VARIABLE','static_var',1,'p_static_var','phpparse.py',451),
+  ('echo_expr_list -> echo_expr_list COMMA expr','echo_expr_list',3,'p_echo_expr_list','phpparse.py',458),
+  ('echo_expr_list -> expr','echo_expr_list',1,'p_echo_expr_list','phpparse.py',459),
+  ('unset_variables -> unset_variables COMMA unset_variable','unset_variables',3,'p_unset_variables','phpparse.py',466),
+  ('unset_variables -> unset_variable','unset_variables',1,'p_unset_variables','phpparse.py',467),
+  ('unset_variable -> variable','unset_variable',1,'p_unset_variable','phpparse.py',474),
+  ('function_declaration_statement -> FUNCTION is_reference STRING LPAREN parameter_list RPAREN LBRACE inner_statement_list RBRACE','function_declaration_statement',9,'p_function_declaration_statement','phpparse.py',478),
+  ('class_declaration_statement -> class_entry_type STRING extends_from implements_list LBRACE class_statement_list RBRACE','class_declaration_statement',7,'p_class_declaration_statement','phpparse.py',482),
+  ('class_declaration_statement -> INTERFACE STRING interface_extends_list LBRACE class_statement_list RBRACE','class_declaration_statement',6,'p_class_declaration_statement','phpparse.py',483),
+  ('class_entry_type -> CLASS','class_entry_type',1,'p_class_entry_type','phpparse.py',490),
+  ('class_entry_type -> ABSTRACT CLASS','class_entry_type',2,'p_class_entry_type','phpparse.py',491),
+  ('class_entry_type -> FINAL CLASS','class_entry_type',2,'p_class_entry_type','phpparse.py',492),
+  ('extends_from -> empty','extends_from',1,'p_extends_from','phpparse.py',497),
+  ('extends_from -> EXTENDS fully_qualified_class_name','extends_from',2,'p_extends_from','phpparse.py',498),
+  ('fully_qualified_class_name -> namespace_name','fully_qualified_class_name',1,'p_fully_qualified_class_name','phpparse.py',503),
+  ('fully_qualified_class_name -> NS_SEPARATOR namespace_name','fully_qualified_class_name',2,'p_fully_qualified_class_name','phpparse.py',504),
+  ('fully_qualified_class_name -> NAMESPACE NS_SEPARATOR namespace_name','fully_qualified_class_name',3,'p_fully_qualified_class_name','phpparse.py',505),
+  ('implements_list -> IMPLEMENTS interface_list','implements_list',2,'p_implements_list','phpparse.py',514),
+  ('implements_list -> empty','implements_list',1,'p_implements_list','phpparse.py',515),
+  ('class_statement_list -> class_statement_list class_statement','class_statement_list',2,'p_class_statement_list','phpparse.py',522),
+  ('class_statement_list -> empty','class_statement_list',1,'p_class_statement_list','phpparse.py',523),
+  ('class_statement -> method_modifiers FUNCTION is_reference STRING LPAREN parameter_list RPAREN method_body','class_statement',8,'p_class_statement','phpparse.py',531),
+  ('class_statement -> comment','class_statement',1,'p_class_statement','phpparse.py',532),
+  ('class_statement -> variable_modifiers class_variable_declaration SEMI','class_statement',3,'p_class_statement','phpparse.py',533),
+  ('class_statement -> class_constant_declaration SEMI','class_statement',2,'p_class_statement','phpparse.py',534),
+  ('class_variable_declaration -> class_variable_declaration COMMA VARIABLE EQUALS static_scalar','class_variable_declaration',5,'p_class_variable_declaration_initial','phpparse.py',545),
+  ('class_variable_declaration -> VARIABLE EQUALS static_scalar','class_variable_declaration',3,'p_class_variable_declaration_initial','phpparse.py',546),
+  ('class_variable_declaration -> class_variable_declaration COMMA VARIABLE','class_variable_declaration',3,'p_class_variable_declaration_no_initial','phpparse.py',553),
+  ('class_variable_declaration -> VARIABLE','class_variable_declaration',1,'p_class_variable_declaration_no_initial','phpparse.py',554),
+  ('class_constant_declaration -> class_constant_declaration COMMA STRING EQUALS static_scalar','class_constant_declaration',5,'p_class_constant_declaration','phpparse.py',561),
+  ('class_constant_declaration -> CONST STRING EQUALS static_scalar','class_constant_declaration',4,'p_class_constant_declaration','phpparse.py',562),
+  ('interface_list -> interface_list COMMA fully_qualified_class_name','interface_list',3,'p_interface_list','phpparse.py',569),
+  ('interface_list -> fully_qualified_class_name','interface_list',1,'p_interface_list','phpparse.py',570),
+  ('interface_extends_list -> EXTENDS interface_list','interface_extends_list',2,'p_interface_extends_list','phpparse.py',577),
+  ('interface_extends_list -> empty','interface_extends_list',1,'p_interface_extends_list','phpparse.py',578),
+  ('variable_modifiers -> non_empty_member_modifiers','variable_modifiers',1,'p_variable_modifiers_non_empty','phpparse.py',583),
+  ('variable_modifiers -> VAR','variable_modifiers',1,'p_variable_modifiers_var','phpparse.py',587),
+  ('method_modifiers -> non_empty_member_modifiers','method_modifiers',1,'p_method_modifiers_non_empty','phpparse.py',591),
+  ('method_modifiers -> empty','method_modifiers',1,'p_method_modifiers_empty','phpparse.py',595),
+  ('method_body -> LBRACE inner_statement_list RBRACE','method_body',3,'p_method_body','phpparse.py',599),
+  ('method_body -> SEMI','method_body',1,'p_method_body','phpparse.py',600),
+  ('non_empty_member_modifiers -> non_empty_member_modifiers member_modifier','non_empty_member_modifiers',2,'p_non_empty_member_modifiers','phpparse.py',607),
+  ('non_empty_member_modifiers -> member_modifier','non_empty_member_modifiers',1,'p_non_empty_member_modifiers','phpparse.py',608),
+  ('member_modifier -> PUBLIC','member_modifier',1,'p_member_modifier','phpparse.py',615),
+  ('member_modifier -> PROTECTED','member_modifier',1,'p_member_modifier','phpparse.py',616),
+  ('member_modifier -> PRIVATE','member_modifier',1,'p_member_modifier','phpparse.py',617),
+  ('member_modifier -> STATIC','member_modifier',1,'p_member_modifier','phpparse.py',618),
+  ('member_modifier -> ABSTRACT','member_modifier',1,'p_member_modifier','phpparse.py',619),
+  ('member_modifier -> FINAL','member_modifier',1,'p_member_modifier','phpparse.py',620),
+  ('is_reference -> AND','is_reference',1,'p_is_reference','phpparse.py',624),
+  ('is_reference -> empty','is_reference',1,'p_is_reference','phpparse.py',625),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','phpparse.py',629),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','phpparse.py',630),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list_empty','phpparse.py',637),
+  ('parameter -> VARIABLE','parameter',1,'p_parameter','phpparse.py',641),
+  ('parameter -> class_name VARIABLE','parameter',2,'p_parameter','phpparse.py',642),
+  ('parameter -> ARRAY VARIABLE','parameter',2,'p_parameter','phpparse.py',643),
+  ('parameter -> AND VARIABLE','parameter',2,'p_parameter','phpparse.py',644),
+  ('parameter -> class_name AND VARIABLE','parameter',3,'p_parameter','phpparse.py',645),
+  ('parameter -> ARRAY AND VARIABLE','parameter',3,'p_parameter','phpparse.py',646),
+  ('parameter -> VARIABLE EQUALS static_scalar','parameter',3,'p_parameter','phpparse.py',647),
+  ('parameter -> class_name VARIABLE EQUALS static_scalar','parameter',4,'p_parameter','phpparse.py',648),
+  ('parameter -> ARRAY VARIABLE EQUALS static_scalar','parameter',4,'p_parameter','phpparse.py',649),
+  ('parameter -> AND VARIABLE EQUALS static_scalar','parameter',4,'p_parameter','phpparse.py',650),
+  ('parameter -> class_name AND VARIABLE EQUALS static_scalar','parameter',5,'p_parameter','phpparse.py',651),
+  ('parameter -> ARRAY AND VARIABLE EQUALS static_scalar','parameter',5,'p_parameter','phpparse.py',652),
+  ('expr -> variable','expr',1,'p_expr_variable','phpparse.py',671),
+  ('expr -> variable EQUALS expr','expr',3,'p_expr_assign','phpparse.py',675),
+  ('expr -> variable EQUALS AND expr','expr',4,'p_expr_assign','phpparse.py',676),
+  ('expr -> NEW class_name_reference ctor_arguments','expr',3,'p_expr_new','phpparse.py',683),
+  ('class_name_reference -> class_name','class_name_reference',1,'p_class_name_reference','phpparse.py',687),
+  ('class_name_reference -> dynamic_class_name_reference','class_name_reference',1,'p_class_name_reference','phpparse.py',688),
+  ('class_name -> namespace_name','class_name',1,'p_class_name','phpparse.py',692),
+  ('class_name -> NS_SEPARATOR namespace_name','class_name',2,'p_class_name','phpparse.py',693),
+  ('class_name -> NAMESPACE NS_SEPARATOR namespace_name','class_name',3,'p_class_name','phpparse.py',694),
+  ('class_name -> STATIC','class_name',1,'p_class_name_static','phpparse.py',703),
+  ('dynamic_class_name_reference -> base_variable OBJECT_OPERATOR object_property dynamic_class_name_variable_properties','dynamic_class_name_reference',4,'p_dynamic_class_name_reference','phpparse.py',707),
+  ('dynamic_class_name_reference -> base_variable','dynamic_class_name_reference',1,'p_dynamic_class_name_reference','phpparse.py',708),
+  ('dynamic_class_name_variable_properties -> dynamic_class_name_variable_properties dynamic_class_name_variable_property','dynamic_class_name_variable_properties',2,'p_dynamic_class_name_variable_properties','phpparse.py',722),
+  ('dynamic_class_name_variable_properties -> empty','dynamic_class_name_variable_properties',1,'p_dynamic_class_name_variable_properties','phpparse.py',723),
+  ('dynamic_class_name_variable_property -> OBJECT_OPERATOR object_property','dynamic_class_name_variable_property',2,'p_dynamic_class_name_variable_property','phpparse.py',730),
+  ('ctor_arguments -> LPAREN function_call_parameter_list RPAREN','ctor_arguments',3,'p_ctor_arguments','phpparse.py',734),
+  ('ctor_arguments -> empty','ctor_arguments',1,'p_ctor_arguments','phpparse.py',735),
+  ('expr -> CLONE expr','expr',2,'p_expr_clone','phpparse.py',742),
+  ('expr -> LIST LPAREN assignment_list RPAREN EQUALS expr','expr',6,'p_expr_list_assign','phpparse.py',746),
+  ('assignment_list -> assignment_list COMMA assignment_list_element','assignment_list',3,'p_assignment_list','phpparse.py',750),
+  ('assignment_list -> assignment_list_element','assignment_list',1,'p_assignment_list','phpparse.py',751),
+  ('assignment_list_element -> variable','assignment_list_element',1,'p_assignment_list_element','phpparse.py',758),
+  ('assignment_list_element -> empty','assignment_list_element',1,'p_assignment_list_element','phpparse.py',759),
+  ('assignment_list_element -> LIST LPAREN assignment_list RPAREN','assignment_list_element',4,'p_assignment_list_element','phpparse.py',760),
+  ('variable -> base_variable_with_function_calls OBJECT_OPERATOR object_property method_or_not variable_properties','variable',5,'p_variable','phpparse.py',767),
+  ('variable -> base_variable_with_function_calls','variable',1,'p_variable','phpparse.py',768),
+  ('base_variable_with_function_calls -> base_variable','base_variable_with_function_calls',1,'p_base_variable_with_function_calls','phpparse.py',789),
+  ('base_variable_with_function_calls -> function_call','base_variable_with_function_calls',1,'p_base_variable_with_function_calls','phpparse.py',790),
+  ('function_call -> namespace_name LPAREN function_call_parameter_list RPAREN','function_call',4,'p_function_call','phpparse.py',794),
+  ('function_call -> NS_SEPARATOR namespace_name LPAREN function_call_parameter_list RPAREN','function_call',5,'p_function_call','phpparse.py',795),
+  ('function_call -> NAMESPACE NS_SEPARATOR namespace_name LPAREN function_call_parameter_list RPAREN','function_call',6,'p_function_call','phpparse.py',796),
+  ('function_call -> class_name DOUBLE_COLON STRING LPAREN function_call_parameter_list RPAREN','function_call',6,'p_function_call_static','phpparse.py',805),
+  ('function_call -> class_name DOUBLE_COLON variable_without_objects LPAREN function_call_parameter_list RPAREN','function_call',6,'p_function_call_static','phpparse.py',806),
+  ('function_call -> variable_class_name DOUBLE_COLON STRING LPAREN function_call_parameter_list RPAREN','function_call',6,'p_function_call_static','phpparse.py',807),
+  ('function_call -> variable_class_name DOUBLE_COLON variable_without_objects LPAREN function_call_parameter_list RPAREN','function_call',6,'p_function_call_static','phpparse.py',808),
+  ('function_call -> variable_without_objects LPAREN function_call_parameter_list RPAREN','function_call',4,'p_function_call_variable','phpparse.py',812),
+  ('method_or_not -> LPAREN function_call_parameter_list RPAREN','method_or_not',3,'p_method_or_not','phpparse.py',816),
+  ('method_or_not -> empty','method_or_not',1,'p_method_or_not','phpparse.py',817),
+  ('variable_properties -> variable_properties variable_property','variable_properties',2,'p_variable_properties','phpparse.py',822),
+  ('variable_properties -> empty','variable_properties',1,'p_variable_properties','phpparse.py',823),
+  ('variable_property -> OBJECT_OPERATOR object_property method_or_not','variable_property',3,'p_variable_property','phpparse.py',830),
+  ('base_variable -> simple_indirect_reference','base_variable',1,'p_base_variable','phpparse.py',834),
+  ('base_variable -> static_member','base_variable',1,'p_base_variable','phpparse.py',835),
+  ('simple_indirect_reference -> DOLLAR simple_indirect_reference','simple_indirect_reference',2,'p_simple_indirect_reference','phpparse.py',839),
+  ('simple_indirect_reference -> reference_variable','simple_indirect_reference',1,'p_simple_indirect_reference','phpparse.py',840),
+  ('static_member -> class_name DOUBLE_COLON variable_without_objects','static_member',3,'p_static_member','phpparse.py',847),
+  ('static_member -> variable_class_name DOUBLE_COLON variable_without_objects','static_member',3,'p_static_member','phpparse.py',848),
+  ('variable_class_name -> reference_variable','variable_class_name',1,'p_variable_class_name','phpparse.py',852),
+  ('reference_variable -> reference_variable LBRACKET dim_offset RBRACKET','reference_variable',4,'p_reference_variable_array_offset','phpparse.py',856),
+  ('reference_variable -> reference_variable LBRACE expr RBRACE','reference_variable',4,'p_reference_variable_string_offset','phpparse.py',860),
+  ('reference_variable -> compound_variable','reference_variable',1,'p_reference_variable_compound_variable','phpparse.py',864),
+  ('compound_variable -> VARIABLE','compound_variable',1,'p_compound_variable','phpparse.py',868),
+  ('compound_variable -> DOLLAR LBRACE expr RBRACE','compound_variable',4,'p_compound_variable','phpparse.py',869),
+  ('dim_offset -> expr','dim_offset',1,'p_dim_offset','phpparse.py',876),
+  ('dim_offset -> empty','dim_offset',1,'p_dim_offset','phpparse.py',877),
+  ('object_property -> variable_name object_dim_list','object_property',2,'p_object_property','phpparse.py',881),
+  ('object_property -> variable_without_objects','object_property',1,'p_object_property','phpparse.py',882),
+  ('object_dim_list -> empty','object_dim_list',1,'p_object_dim_list_empty','phpparse.py',889),
+  ('object_dim_list -> object_dim_list LBRACKET dim_offset RBRACKET','object_dim_list',4,'p_object_dim_list_array_offset','phpparse.py',893),
+  ('object_dim_list -> object_dim_list LBRACE expr RBRACE','object_dim_list',4,'p_object_dim_list_string_offset','phpparse.py',897),
+  ('variable_name -> STRING','variable_name',1,'p_variable_name','phpparse.py',901),
+  ('variable_name -> LBRACE expr RBRACE','variable_name',3,'p_variable_name','phpparse.py',902),
+  ('variable_without_objects -> simple_indirect_reference','variable_without_objects',1,'p_variable_without_objects','phpparse.py',909),
+  ('expr -> scalar','expr',1,'p_expr_scalar','phpparse.py',913),
+  ('expr -> ARRAY LPAREN array_pair_list RPAREN','expr',4,'p_expr_array','phpparse.py',917),
+  ('array_pair_list -> empty','array_pair_list',1,'p_array_pair_list','phpparse.py',921),
+  ('array_pair_list -> non_empty_array_pair_list possible_comma','array_pair_list',2,'p_array_pair_list','phpparse.py',922),
+  ('non_empty_array_pair_list -> non_empty_array_pair_list COMMA AND variable','non_empty_array_pair_list',4,'p_non_empty_array_pair_list_item','phpparse.py',929),
+  ('non_empty_array_pair_list -> non_empty_array_pair_list COMMA expr','non_empty_array_pair_list',3,'p_non_empty_array_pair_list_item','phpparse.py',930),
+  ('non_empty_array_pair_list -> AND variable','non_empty_array_pair_list',2,'p_non_empty_array_pair_list_item','phpparse.py',931),
+  ('non_empty_array_pair_list -> expr','non_empty_array_pair_list',1,'p_non_empty_array_pair_list_item','phpparse.py',932),
+  ('non_empty_array_pair_list -> non_empty_array_pair_list COMMA expr DOUBLE_ARROW AND variable','non_empty_array_pair_list',6,'p_non_empty_array_pair_list_pair','phpparse.py',943),
+  ('non_empty_array_pair_list -> non_empty_array_pair_list COMMA expr DOUBLE_ARROW expr','non_empty_array_pair_list',5,'p_non_empty_array_pair_list_pair','phpparse.py',944),
+  ('non_empty_array_pair_list -> expr DOUBLE_ARROW AND variable','non_empty_array_pair_list',4,'p_non_empty_array_pair_list_pair','phpparse.py',945),
+  ('non_empty_array_pair_list -> expr DOUBLE_ARROW expr','non_empty_array_pair_list',3,'p_non_empty_array_pair_list_pair','phpparse.py',946),
+  ('possible_comma -> empty','possible_comma',1,'p_possible_comma','phpparse.py',957),
+  ('possible_comma -> COMMA','possible_comma',1,'p_possible_comma','phpparse.py',958),
+  ('function_call_parameter_list -> function_call_parameter_list COMMA function_call_parameter','function_call_parameter_list',3,'p_function_call_parameter_list','phpparse.py',962),
+  ('function_call_parameter_list -> function_call_parameter','function_call_parameter_list',1,'p_function_call_parameter_list','phpparse.py',963),
+  ('function_call_parameter_list -> empty','function_call_parameter_list',1,'p_function_call_parameter_list_empty','phpparse.py',970),
+  ('function_call_parameter -> expr','function_call_parameter',1,'p_function_call_parameter','phpparse.py',974),
+  ('function_call_parameter -> AND variable','function_call_parameter',2,'p_function_call_parameter','phpparse.py',975),
+  ('expr -> FUNCTION is_reference LPAREN parameter_list RPAREN lexical_vars LBRACE inner_statement_list RBRACE','expr',9,'p_expr_function','phpparse.py',982),
+  ('lexical_vars -> USE LPAREN lexical_var_list RPAREN','lexical_vars',4,'p_lexical_vars','phpparse.py',986),
+  ('lexical_vars -> empty','lexical_vars',1,'p_lexical_vars','phpparse.py',987),
+  ('lexical_var_list -> lexical_var_list COMMA AND VARIABLE','lexical_var_list',4,'p_lexical_var_list','phpparse.py',994),
+  ('lexical_var_list -> lexical_var_list COMMA VARIABLE','lexical_var_list',3,'p_lexical_var_list','phpparse.py',995),
+  ('lexical_var_list -> AND VARIABLE','lexical_var_list',2,'p_lexical_var_list','phpparse.py',996),
+  ('lexical_var_list -> VARIABLE','lexical_var_list',1,'p_lexical_var_list','phpparse.py',997),
+  ('expr -> variable PLUS_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1008),
+  ('expr -> variable MINUS_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1009),
+  ('expr -> variable MUL_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1010),
+  ('expr -> variable DIV_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1011),
+  ('expr -> variable CONCAT_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1012),
+  ('expr -> variable MOD_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1013),
+  ('expr -> variable AND_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1014),
+  ('expr -> variable OR_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1015),
+  ('expr -> variable XOR_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1016),
+  ('expr -> variable SL_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1017),
+  ('expr -> variable SR_EQUAL expr','expr',3,'p_expr_assign_op','phpparse.py',1018),
+  ('expr -> expr BOOLEAN_AND expr','expr',3,'p_expr_binary_op','phpparse.py',1022),
+  ('expr -> expr BOOLEAN_OR expr','expr',3,'p_expr_binary_op','phpparse.py',1023),
+  ('expr -> expr LOGICAL_AND expr','expr',3,'p_expr_binary_op','phpparse.py',1024),
+  ('expr -> expr LOGICAL_OR expr','expr',3,'p_expr_binary_op','phpparse.py',1025),
+  ('expr -> expr LOGICAL_XOR expr','expr',3,'p_expr_binary_op','phpparse.py',1026),
+  ('expr -> expr AND expr','expr',3,'p_expr_binary_op','phpparse.py',1027),
+  ('expr -> expr OR expr','expr',3,'p_expr_binary_op','phpparse.py',1028),
+  ('expr -> expr XOR expr','expr',3,'p_expr_binary_op','phpparse.py',1029),
+  ('expr -> expr CONCAT expr','expr',3,'p_expr_binary_op','phpparse.py',1030),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binary_op','phpparse.py',1031),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binary_op','phpparse.py',1032),
+  ('expr -> expr MUL expr','expr',3,'p_expr_binary_op','phpparse.py',1033),
+  ('expr -> expr DIV expr','expr',3,'p_expr_binary_op','phpparse.py',1034),
+  ('expr -> expr SL expr','expr',3,'p_expr_binary_op','phpparse.py',1035),
+  ('expr -> expr SR expr','expr',3,'p_expr_binary_op','phpparse.py',1036),
+  ('expr -> expr MOD expr','expr',3,'p_expr_binary_op','phpparse.py',1037),
+  ('expr -> expr IS_IDENTICAL expr','expr',3,'p_expr_binary_op','phpparse.py',1038),
+  ('expr -> expr IS_NOT_IDENTICAL expr','expr',3,'p_expr_binary_op','phpparse.py',1039),
+  ('expr -> expr IS_EQUAL expr','expr',3,'p_expr_binary_op','phpparse.py',1040),
+  ('expr -> expr IS_NOT_EQUAL expr','expr',3,'p_expr_binary_op','phpparse.py',1041),
+  ('expr -> expr IS_SMALLER expr','expr',3,'p_expr_binary_op','phpparse.py',1042),
+  ('expr -> expr IS_SMALLER_OR_EQUAL expr','expr',3,'p_expr_binary_op','phpparse.py',1043),
+  ('expr -> expr IS_GREATER expr','expr',3,'p_expr_binary_op','phpparse.py',1044),
+  ('expr -> expr IS_GREATER_OR_EQUAL expr','expr',3,'p_expr_binary_op','phpparse.py',1045),
+  ('expr -> expr INSTANCEOF expr','expr',3,'p_expr_binary_op','phpparse.py',1046),
+  ('expr -> PLUS expr','expr',2,'p_expr_unary_op','phpparse.py',1050),
+  ('expr -> MINUS expr','expr',2,'p_expr_unary_op','phpparse.py',1051),
+  ('expr -> NOT expr','expr',2,'p_expr_unary_op','phpparse.py',1052),
+  ('expr -> BOOLEAN_NOT expr','expr',2,'p_expr_unary_op','phpparse.py',1053),
+  ('expr -> expr QUESTION expr COLON expr','expr',5,'p_expr_ternary_op','phpparse.py',1057),
+  ('expr -> INC variable','expr',2,'p_expr_pre_incdec','phpparse.py',1061),
+  ('expr -> DEC variable','expr',2,'p_expr_pre_incdec','phpparse.py',1062),
+  ('expr -> variable INC','expr',2,'p_expr_post_incdec','phpparse.py',1066),
+  ('expr -> variable DEC','expr',2,'p_expr_post_incdec','phpparse.py',1067),
+  ('expr -> INT_CAST expr','expr',2,'p_expr_cast_int','phpparse.py',1071),
+  ('expr -> DOUBLE_CAST expr','expr',2,'p_expr_cast_double','phpparse.py',1075),
+  ('expr -> STRING_CAST expr','expr',2,'p_expr_cast_string','phpparse.py',1079),
+  ('expr -> ARRAY_CAST expr','expr',2,'p_expr_cast_array','phpparse.py',1083),
+  ('expr -> OBJECT_CAST expr','expr',2,'p_expr_cast_object','phpparse.py',1087),
+  ('expr -> BOOL_CAST expr','expr',2,'p_expr_cast_bool','phpparse.py',1091),
+  ('expr -> UNSET_CAST expr','expr',2,'p_expr_cast_unset','phpparse.py',1095),
+  ('expr -> ISSET LPAREN isset_variables RPAREN','expr',4,'p_expr_isset','phpparse.py',1099),
+  ('isset_variables -> isset_variables COMMA variable','isset_variables',3,'p_isset_variables','phpparse.py',1103),
+  ('isset_variables -> variable','isset_variables',1,'p_isset_variables','phpparse.py',1104),
+  ('expr -> EMPTY LPAREN expr RPAREN','expr',4,'p_expr_empty','phpparse.py',1111),
+  ('expr -> EVAL LPAREN expr RPAREN','expr',4,'p_expr_eval','phpparse.py',1115),
+  ('expr -> INCLUDE expr','expr',2,'p_expr_include','phpparse.py',1119),
+  ('expr -> INCLUDE_ONCE expr','expr',2,'p_expr_include_once','phpparse.py',1123),
+  ('expr -> REQUIRE expr','expr',2,'p_expr_require','phpparse.py',1127),
+  ('expr -> REQUIRE_ONCE expr','expr',2,'p_expr_require_once','phpparse.py',1131),
+  ('expr -> EXIT','expr',1,'p_expr_exit','phpparse.py',1135),
+  ('expr -> EXIT LPAREN RPAREN','expr',3,'p_expr_exit','phpparse.py',1136),
+  ('expr -> EXIT LPAREN expr RPAREN','expr',4,'p_expr_exit','phpparse.py',1137),
+  ('expr -> PRINT expr','expr',2,'p_expr_print','phpparse.py',1144),
+  ('expr -> AT expr','expr',2,'p_expr_silence','phpparse.py',1148),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','phpparse.py',1152),
+  ('scalar -> class_constant','scalar',1,'p_scalar','phpparse.py',1156),
+  ('scalar -> common_scalar','scalar',1,'p_scalar','phpparse.py',1157),
+  ('scalar -> QUOTE encaps_list QUOTE','scalar',3,'p_scalar','phpparse.py',1158),
+  ('scalar -> START_HEREDOC encaps_list END_HEREDOC','scalar',3,'p_scalar','phpparse.py',1159),
+  ('scalar -> STRING_VARNAME','scalar',1,'p_scalar_string_varname','phpparse.py',1166),
+  ('scalar -> namespace_name','scalar',1,'p_scalar_namespace_name','phpparse.py',1170),
+  ('scalar -> NS_SEPARATOR namespace_name','scalar',2,'p_scalar_namespace_name','phpparse.py',1171),
+  ('scalar -> NAMESPACE NS_SEPARATOR namespace_name','scalar',3,'p_scalar_namespace_name','phpparse.py',1172),
+  ('class_constant -> class_name DOUBLE_COLON STRING','class_constant',3,'p_class_constant','phpparse.py',1181),
+  ('class_constant -> variable_class_name DOUBLE_COLON STRING','class_constant',3,'p_class_constant','phpparse.py',1182),
+  ('common_scalar -> LNUMBER','common_scalar',1,'p_common_scalar_lnumber','phpparse.py',1186),
+  ('common_scalar -> DNUMBER','common_scalar',1,'p_common_scalar_dnumber','phpparse.py',1195),
+  ('common_scalar -> CONSTANT_ENCAPSED_STRING','common_scalar',1,'p_common_scalar_string','phpparse.py',1199),
+  ('common_scalar -> LINE','common_scalar',1,'p_common_scalar_magic_line','phpparse.py',1203),
+  ('common_scalar -> FILE','common_scalar',1,'p_common_scalar_magic_file','phpparse.py',1207),
+  ('common_scalar -> DIR','common_scalar',1,'p_common_scalar_magic_dir','phpparse.py',1212),
+  ('common_scalar -> CLASS_C','common_scalar',1,'p_common_scalar_magic_class','phpparse.py',1219),
+  ('common_scalar -> METHOD_C','common_scalar',1,'p_common_scalar_magic_method','phpparse.py',1223),
+  ('common_scalar -> FUNC_C','common_scalar',1,'p_common_scalar_magic_func','phpparse.py',1227),
+  ('common_scalar -> NS_C','common_scalar',1,'p_common_scalar_magic_ns','phpparse.py',1231),
+  ('static_scalar -> common_scalar','static_scalar',1,'p_static_scalar','phpparse.py',1235),
+  ('static_scalar -> QUOTE QUOTE','static_scalar',2,'p_static_scalar','phpparse.py',1236),
+  ('static_scalar -> QUOTE ENCAPSED_AND_WHITESPACE QUOTE','static_scalar',3,'p_static_scalar','phpparse.py',1237),
+  ('static_scalar -> namespace_name','static_scalar',1,'p_static_scalar_namespace_name','phpparse.py',1246),
+  ('static_scalar -> NS_SEPARATOR namespace_name','static_scalar',2,'p_static_scalar_namespace_name','phpparse.py',1247),
+  ('static_scalar -> NAMESPACE NS_SEPARATOR namespace_name','static_scalar',3,'p_static_scalar_namespace_name','phpparse.py',1248),
+  ('static_scalar -> PLUS static_scalar','static_scalar',2,'p_static_scalar_unary_op','phpparse.py',1257),
+  ('static_scalar -> MINUS static_scalar','static_scalar',2,'p_static_scalar_unary_op','phpparse.py',1258),
+  ('static_scalar -> ARRAY LPAREN static_array_pair_list RPAREN','static_scalar',4,'p_static_scalar_array','phpparse.py',1262),
+  ('static_array_pair_list -> empty','static_array_pair_list',1,'p_static_array_pair_list','phpparse.py',1266),
+  ('static_array_pair_list -> static_non_empty_array_pair_list possible_comma','static_array_pair_list',2,'p_static_array_pair_list','phpparse.py',1267),
+  ('static_non_empty_array_pair_list -> static_non_empty_array_pair_list COMMA static_scalar','static_non_empty_array_pair_list',3,'p_static_non_empty_array_pair_list_item','phpparse.py',1274),
+  ('static_non_empty_array_pair_list -> static_scalar','static_non_empty_array_pair_list',1,'p_static_non_empty_array_pair_list_item','phpparse.py',1275),
+  ('static_non_empty_array_pair_list -> static_non_empty_array_pair_list COMMA static_scalar DOUBLE_ARROW static_scalar','static_non_empty_array_pair_list',5,'p_static_non_empty_array_pair_list_pair','phpparse.py',1282),
+  ('static_non_empty_array_pair_list -> static_scalar DOUBLE_ARROW static_scalar','static_non_empty_array_pair_list',3,'p_static_non_empty_array_pair_list_pair','phpparse.py',1283),
+  ('namespace_name -> namespace_name NS_SEPARATOR STRING','namespace_name',3,'p_namespace_name','phpparse.py',1290),
+  ('namespace_name -> STRING','namespace_name',1,'p_namespace_name','phpparse.py',1291),
+  ('encaps_list -> encaps_list encaps_var','encaps_list',2,'p_encaps_list','phpparse.py',1298),
+  ('encaps_list -> empty','encaps_list',1,'p_encaps_list','phpparse.py',1299),
+  ('encaps_list -> encaps_list ENCAPSED_AND_WHITESPACE','encaps_list',2,'p_encaps_list_string','phpparse.py',1309),
+  ('encaps_var -> VARIABLE','encaps_var',1,'p_encaps_var','phpparse.py',1317),
+  ('encaps_var -> VARIABLE LBRACKET encaps_var_offset RBRACKET','encaps_var',4,'p_encaps_var_array_offset','phpparse.py',1321),
+  ('encaps_var -> VARIABLE OBJECT_OPERATOR STRING','encaps_var',3,'p_encaps_var_object_property','phpparse.py',1326),
+  ('encaps_var -> DOLLAR_OPEN_CURLY_BRACES expr RBRACE','encaps_var',3,'p_encaps_var_dollar_curly_expr','phpparse.py',1331),
+  ('encaps_var -> DOLLAR_OPEN_CURLY_BRACES STRING_VARNAME LBRACKET expr RBRACKET RBRACE','encaps_var',6,'p_encaps_var_dollar_curly_array_offset','phpparse.py',1335),
+  ('encaps_var -> CURLY_OPEN variable RBRACE','encaps_var',3,'p_encaps_var_curly_variable','phpparse.py',1340),
+  ('encaps_var_offset -> STRING','encaps_var_offset',1,'p_encaps_var_offset_string','phpparse.py',1344),
+  ('encaps_var_offset -> NUM_STRING','encaps_var_offset',1,'p_encaps_var_offset_num_string','phpparse.py',1348),
+  ('encaps_var_offset -> VARIABLE','encaps_var_offset',1,'p_encaps_var_offset_variable','phpparse.py',1352),
+  ('comment -> COMMENT','comment',1,'p_comment','phpparse.py',1356),
+  ('comment -> DOC_COMMENT','comment',1,'p_comment','phpparse.py',1357),
+  ('empty -> <empty>','empty',0,'p_empty','phpparse.py',1361),
+]
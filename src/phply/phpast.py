@@ -38,19 +38,73 @@
 # SOFTWARE AND DOCUMENTATION, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH
 # DAMAGE.
 
+class Deferred(object):
+    """A field value that is computed by calling func(*args) on first access."""
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def resolve(self):
+        return self.func(*self.args)
+
+class SourceBody(Deferred):
+    """The statements of a body that the parser skipped, parsed from their
+    span in *source* on first access.
+
+    *source* provides the text of the whole file (see source.Source);
+    *start* and *end* are the offsets of the text between the braces, and
+    *lineno* is the line of the opening brace.
+    """
+
+    def __init__(self, source, start, end, lineno):
+        Deferred.__init__(self, source.parse_body, start, end, lineno)
+        self.source = source
+        self.start = start
+        self.end = end
+        self.lineno = lineno
+
+class DeferredField(object):
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, node, cls):
+        if node is None:
+            return self
+        value = self.slot.__get__(node, cls)
+        if isinstance(value, Deferred):
+            value = value.resolve()
+            self.slot.__set__(node, value)
+        return value
+
+    def __set__(self, node, value):
+        self.slot.__set__(node, value)
+
 class Node(object):
+    # lexpos and lexend are the offsets of the node's text in the source,
+    # like those of tokens; phpscan.Lines gives their lines and columns
+    __slots__ = ('lineno', 'lexpos', 'lexend')
     fields = []
+    deferred = ()
+    attributes = ()
 
     def __init__(self, *args, **kwargs):
         assert len(self.fields) == len(args), \
             '%s takes %d arguments' % (self.__class__.__name__,
                                        len(self.fields))
-        try:
-            self.lineno = kwargs['lineno']
-        except KeyError:
-            self.lineno = None
+        self.lineno = kwargs.get('lineno')
+        self.lexpos = kwargs.get('lexpos')
+        self.lexend = kwargs.get('lexend')
         for i, field in enumerate(self.fields):
             setattr(self, field, args[i])
+        for attribute in self.attributes:
+            setattr(self, attribute, kwargs.get(attribute))
+
+    def __reduce__(self):
+        values = [getattr(self, field) for field in self.fields]
+        values += [self.lineno, self.lexpos, self.lexend]
+        values += [getattr(self, attribute) for attribute in self.attributes]
+        return (self.__class__, tuple(values))
 
     def __repr__(self):
         return "%s(%s)" % (self.__class__.__name__,
@@ -94,9 +148,40 @@ class Node(object):
             values[field] = value
         return (self.__class__.__name__, values)
 
-def node(name, fields):
-    attrs = {'fields': fields}
-    return type(name, (Node,), attrs)
+def slot_name(field, deferred):
+    if field in deferred:
+        return '_' + field
+    else:
+        return field
+
+def node(name, fields, deferred=(), attributes=()):
+    # Nodes are allocated by the hundred thousand while parsing, so each
+    # class gets __slots__ and a constructor specialized to its fields.
+    # Attributes, like lineno, are not fields: they default to None and
+    # are left out of equality, repr() and generic().
+    slots = [slot_name(field, deferred) for field in fields] + list(attributes)
+    params = fields + ['lineno=None', 'lexpos=None', 'lexend=None']
+    params += [attribute + '=None' for attribute in attributes]
+    source = 'def __init__(self, %s):\n' % ', '.join(params)
+    for field, slot in zip(fields, slots):
+        source += '    self.%s = %s\n' % (slot, field)
+    source += '    self.lineno = lineno\n'
+    source += '    self.lexpos = lexpos\n'
+    source += '    self.lexend = lexend\n'
+    for attribute in attributes:
+        source += '    self.%s = %s\n' % (attribute, attribute)
+    namespace = {}
+    exec source in namespace
+
+    attrs = {'__slots__': tuple(slots),
+             '__init__': namespace['__init__'],
+             'fields': fields,
+             'deferred': tuple(deferred),
+             'attributes': tuple(attributes)}
+    cls = type(name, (Node,), attrs)
+    for field in deferred:
+        setattr(cls, field, DeferredField(cls.__dict__[slot_name(field, deferred)]))
+    return cls
 
 InlineHTML = node('InlineHTML', ['data'])
 Block = node('Block', ['nodes'])
@@ -117,15 +202,19 @@ Catch = node('Catch', ['class_', 'var', 'nodes'])
 Throw = node('Throw', ['node'])
 Declare = node('Declare', ['directives', 'node'])
 Directive = node('Directive', ['name', 'node'])
-Function = node('Function', ['name', 'params', 'nodes', 'is_ref'])
-Method = node('Method', ['name', 'modifiers', 'params', 'nodes', 'is_ref'])
-Closure = node('Closure', ['params', 'vars', 'nodes', 'is_ref'])
-Class = node('Class', ['name', 'type', 'extends', 'implements', 'nodes'])
-ClassConstants = node('ClassConstants', ['nodes'])
+Function = node('Function', ['name', 'params', 'nodes', 'is_ref'],
+                deferred=['nodes'], attributes=['doc'])
+Method = node('Method', ['name', 'modifiers', 'params', 'nodes', 'is_ref'],
+              deferred=['nodes'], attributes=['doc'])
+Closure = node('Closure', ['params', 'vars', 'nodes', 'is_ref'],
+               deferred=['nodes'])
+Class = node('Class', ['name', 'type', 'extends', 'implements', 'nodes'],
+             attributes=['doc'])
+ClassConstants = node('ClassConstants', ['nodes'], attributes=['doc'])
 ClassConstant = node('ClassConstant', ['name', 'initial'])
-ClassVariables = node('ClassVariables', ['modifiers', 'nodes'])
+ClassVariables = node('ClassVariables', ['modifiers', 'nodes'], attributes=['doc'])
 ClassVariable = node('ClassVariable', ['name', 'initial'])
-Interface = node('Interface', ['name', 'extends', 'nodes'])
+Interface = node('Interface', ['name', 'extends', 'nodes'], attributes=['doc'])
 AssignOp = node('AssignOp', ['op', 'left', 'right'])
 BinaryOp = node('BinaryOp', ['op', 'left', 'right'])
 UnaryOp = node('UnaryOp', ['op', 'expr'])
@@ -172,6 +261,7 @@ UseDeclarations = node('UseDeclarations', ['nodes'])
 UseDeclaration = node('UseDeclaration', ['name', 'alias'])
 ConstantDeclarations = node('ConstantDeclarations', ['nodes'])
 ConstantDeclaration = node('ConstantDeclaration', ['name', 'initial'])
+Comment = node('Comment', ['text'])
 
 def resolve_magic_constants(nodes):
     current = {}
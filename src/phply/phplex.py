@@ -43,6 +43,9 @@
 
 import ply.lex as lex
 import re
+import sys
+import tables
+import phpast as ast
 
 # todo: nowdocs
 # todo: backticks
@@ -227,17 +230,40 @@ t_php_STRING_CAST          = r'\([ \t]*[Ss][Tt][Rr][Ii][Nn][Gg][ \t]*\)'
 t_php_UNSET_CAST           = r'\([ \t]*[Uu][Nn][Ss][Ee][Tt][ \t]*\)'
 
 # Comments
+#
+# Only the opening of a block comment is matched by the regex; its end is
+# found by searching for the terminator, which takes linear time even on
+# huge docblocks.  An unterminated block comment is just a DIV.
 
 def t_php_DOC_COMMENT(t):
-    r'/\*\*(.|\n)*?\*/'
+    r'/\*\*'
+    if not end_comment(t, t.lexpos + 3):
+        t.type = 'COMMENT'
+        if not end_comment(t, t.lexpos + 2):
+            unterminated_comment(t)
     t.lexer.lineno += t.value.count("\n")
     return t
 
 def t_php_COMMENT(t):
-    r'/\*(.|\n)*?\*/ | //([^?%\n]|[?%](?!>))*\n? | \#([^?%\n]|[?%](?!>))*\n?'
+    r'/\* | //[^?%\n]*([?%](?!>)[^?%\n]*)*\n? | \#[^?%\n]*([?%](?!>)[^?%\n]*)*\n?'
+    if t.value == '/*' and not end_comment(t, t.lexpos + 2):
+        unterminated_comment(t)
     t.lexer.lineno += t.value.count("\n")
     return t
 
+def end_comment(t, pos):
+    end = t.lexer.lexdata.find('*/', pos)
+    if end < 0:
+        return False
+    t.lexer.lexpos = end + 2
+    t.value = t.lexer.lexdata[t.lexpos:end + 2]
+    return True
+
+def unterminated_comment(t):
+    t.type = 'DIV'
+    t.value = '/'
+    t.lexer.lexpos = t.lexpos + 1
+
 # Escaping from HTML
 
 def t_OPEN_TAG(t):
@@ -254,10 +280,21 @@ def t_php_CLOSE_TAG(t):
     return t
 
 def t_INLINE_HTML(t):
-    r'([^<]|<(?![?%]))+'
+    r'[^<]|<(?![?%])'
+    t.lexer.lexpos = find_open_tag(t.lexer.lexdata, t.lexer.lexpos)
+    t.value = t.lexer.lexdata[t.lexpos:t.lexer.lexpos]
     t.lexer.lineno += t.value.count("\n")
     return t
 
+def find_open_tag(data, pos):
+    while True:
+        pos = data.find('<', pos)
+        if pos < 0:
+            return len(data)
+        elif data[pos + 1:pos + 2] in ('?', '%'):
+            return pos
+        pos += 1
+
 # Identifiers and reserved words
 
 reserved_map = {
@@ -528,11 +565,141 @@ class FilteredLexer(object):
 
     __next__ = next
 
-full_lexer = lex.lex()
+class DeclarationLexer(object):
+    """Wraps a FilteredLexer, collapsing the bodies of named functions and
+    methods into a single BODY token.
+
+    The token stream of ``function name(...) { ... }`` becomes FUNCTION,
+    STRING, the parameter list, LBRACE, BODY and RBRACE; the value of BODY is
+    the (start, end) offsets of the body in the source.  Everything else,
+    including closures, passes through unchanged.
+
+    With *source*, a callable that returns a source.Source for the input
+    text, the bodies of closures are collapsed as well and the value of BODY
+    is an ast.SourceBody, which parses the body when it is first accessed.
+    """
+
+    def __init__(self, lexer, source=None):
+        self.lexer = lexer
+        self.source = source
+        self.text_source = None
+        self.pending = []
+        self.state = None
+        self.depth = 0
+
+    @property
+    def lineno(self):
+        return self.lexer.lineno
+
+    @lineno.setter
+    def lineno(self, value):
+        self.lexer.lineno = value
+
+    @property
+    def lexpos(self):
+        return self.lexer.lexpos
+
+    @lexpos.setter
+    def lexpos(self, value):
+        self.lexer.lexpos = value
+
+    def clone(self):
+        return DeclarationLexer(self.lexer.clone(), self.source)
+
+    def current_state(self):
+        return self.lexer.current_state()
+
+    def input(self, input):
+        self.lexer.input(input)
+        self.text_source = None
+        self.pending = []
+        self.state = None
+
+    def token(self):
+        if self.pending:
+            return self.pending.pop()
+
+        t = self.lexer.token()
+        if t is None:
+            return t
+
+        # Track "FUNCTION [AND] STRING ( parameters )" to find named bodies,
+        # and "FUNCTION [AND] ( parameters ) [USE ( variables )]" for closures.
+        if t.type == 'FUNCTION':
+            self.state = 'name'
+        elif self.state == 'name':
+            if t.type == 'STRING':
+                self.state = 'params'
+            elif t.type == 'LPAREN' and self.source:
+                self.state = 'param_list'
+                self.depth = 1
+            elif t.type != 'AND':
+                self.state = None
+        elif self.state == 'params':
+            if t.type == 'LPAREN':
+                self.state = 'param_list'
+                self.depth = 1
+            else:
+                self.state = None
+        elif self.state == 'param_list':
+            if t.type == 'LPAREN':
+                self.depth += 1
+            elif t.type == 'RPAREN':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.state = 'body'
+        elif self.state == 'body':
+            self.state = None
+            if t.type == 'LBRACE':
+                self.skip_body(t)
+            elif t.type == 'USE' and self.source:
+                self.state = 'params'
+
+        return t
+
+    def skip_body(self, lbrace):
+        depth = 1
+        while True:
+            t = self.lexer.token()
+            if t is None:
+                return
+            elif t.type in ('LBRACE', 'CURLY_OPEN', 'DOLLAR_OPEN_CURLY_BRACES'):
+                depth += 1
+            elif t.type == 'RBRACE':
+                depth -= 1
+                if depth == 0:
+                    break
+
+        body = lex.LexToken()
+        body.type = 'BODY'
+        body.value = (lbrace.lexpos + 1, t.lexpos)
+        if self.source:
+            if self.text_source is None:
+                self.text_source = self.source(self.lexer.lexdata)
+            body.value = ast.SourceBody(self.text_source, body.value[0], body.value[1], lbrace.lineno)
+        body.lineno = lbrace.lineno
+        body.lexpos = lbrace.lexpos + 1
+        body.lexend = t.lexpos
+        self.pending = [t, body]
+
+    # Iterator interface
+    def __iter__(self):
+        return self
+
+    def next(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    __next__ = next
+
+full_lexer = tables.build_lexer(sys.modules[__name__])
 lexer = FilteredLexer(full_lexer)
 
 full_tokens = tokens
 tokens = filter(lambda token: token not in unparsed, tokens)
+tokens += ('BODY',)  # emitted by DeclarationLexer
 
 if __name__ == "__main__":
     lex.runmain(full_lexer)
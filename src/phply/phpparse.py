@@ -43,13 +43,14 @@
 
 import os
 import sys
+import copy
 import phplex
+import tables
 import phpast as ast
 import ply.yacc as yacc
 
 # Get the token map
 tokens = phplex.tokens
-ast.Comment = ast.node('Comment', ['text'])
 
 precedence = (
     ('left', 'INCLUDE', 'INCLUDE_ONCE', 'EVAL', 'REQUIRE', 'REQUIRE_ONCE'),
@@ -81,6 +82,19 @@ precedence = (
     ('right', 'STATIC', 'ABSTRACT', 'FINAL', 'PRIVATE', 'PROTECTED', 'PUBLIC'),
 )
 
+# Declarations take the doc comment right before them as their doc
+documented = (ast.Function, ast.Class, ast.Interface, ast.Method,
+              ast.ClassVariables, ast.ClassConstants)
+
+def add_statement(statements, node):
+    if isinstance(node, documented) and statements:
+        last = statements[-1]
+        if isinstance(last, ast.Comment) and last.text.startswith('/**'):
+            node.doc = last.text
+            statements.pop()
+    statements.append(node)
+    return statements
+
 def p_start(p):
     'start : top_statement_list'
     p[0] = p[1]
@@ -89,7 +103,7 @@ def p_top_statement_list(p):
     '''top_statement_list : top_statement_list top_statement
                           | empty'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[0] = add_statement(p[1], p[2])
     else:
         p[0] = []
 
@@ -128,7 +142,8 @@ def p_use_declarations(p):
     '''use_declarations : use_declarations COMMA use_declaration
                         | use_declaration'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -150,7 +165,8 @@ def p_constant_declarations(p):
     '''constant_declarations : constant_declarations COMMA constant_declaration
                              | constant_declaration'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -162,7 +178,15 @@ def p_inner_statement_list(p):
     '''inner_statement_list : inner_statement_list inner_statement
                             | empty'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[0] = add_statement(p[1], p[2])
+    else:
+        p[0] = []
+
+def p_inner_statement_list_body(p):
+    'inner_statement_list : BODY'
+    # A body skipped by DeclarationLexer: empty, or parsed on first access
+    if isinstance(p[1], ast.SourceBody):
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -273,8 +297,9 @@ def p_additional_catches(p):
     '''additional_catches : additional_catches CATCH LPAREN fully_qualified_class_name VARIABLE RPAREN LBRACE inner_statement_list RBRACE
                           | empty'''
     if len(p) == 10:
-        p[0] = p[1] + [ast.Catch(p[4], ast.Variable(p[5], lineno=p.lineno(5)),
-                                 p[8], lineno=p.lineno(2))]
+        p[1].append(ast.Catch(p[4], ast.Variable(p[5], lineno=p.lineno(5)),
+                              p[8], lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -292,7 +317,8 @@ def p_declare_list(p):
     if len(p) == 4:
         p[0] = [ast.Directive(p[1], p[3], lineno=p.lineno(1))]
     else:
-        p[0] = p[1] + [ast.Directive(p[3], p[5], lineno=p.lineno(2))]
+        p[1].append(ast.Directive(p[3], p[5], lineno=p.lineno(2)))
+        p[0] = p[1]
 
 def p_declare_statement(p):
     '''declare_statement : statement
@@ -308,7 +334,8 @@ def p_elseif_list(p):
     if len(p) == 2:
         p[0] = []
     else:
-        p[0] = p[1] + [ast.ElseIf(p[4], p[6], lineno=p.lineno(2))]
+        p[1].append(ast.ElseIf(p[4], p[6], lineno=p.lineno(2)))
+        p[0] = p[1]
 
 def p_else_single(p):
     '''else_single : empty
@@ -322,8 +349,9 @@ def p_new_elseif_list(p):
     if len(p) == 2:
         p[0] = []
     else:
-        p[0] = p[1] + [ast.ElseIf(p[4], ast.Block(p[7], lineo=p.lineno(6)),
-                                  lineno=p.lineno(2))]
+        p[1].append(ast.ElseIf(p[4], ast.Block(p[7], lineno=p.lineno(6)),
+                               lineno=p.lineno(2)))
+        p[0] = p[1]
 
 def p_new_else_single(p):
     '''new_else_single : empty
@@ -349,7 +377,8 @@ def p_non_empty_for_expr(p):
     '''non_empty_for_expr : non_empty_for_expr COMMA expr
                           | expr'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -404,9 +433,11 @@ def p_case_list(p):
                  | case_list CASE expr case_separator inner_statement_list
                  | case_list DEFAULT case_separator inner_statement_list'''
     if len(p) == 6:
-        p[0] = p[1] + [ast.Case(p[3], p[5], lineno=p.lineno(2))]
+        p[1].append(ast.Case(p[3], p[5], lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 5:
-        p[0] = p[1] + [ast.Default(p[4], lineno=p.lineno(2))]
+        p[1].append(ast.Default(p[4], lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -419,7 +450,8 @@ def p_global_var_list(p):
     '''global_var_list : global_var_list COMMA global_var
                        | global_var'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -438,7 +470,8 @@ def p_static_var_list(p):
     '''static_var_list : static_var_list COMMA static_var
                        | static_var'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -454,7 +487,8 @@ def p_echo_expr_list(p):
     '''echo_expr_list : echo_expr_list COMMA expr
                       | expr'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -462,7 +496,8 @@ def p_unset_variables(p):
     '''unset_variables : unset_variables COMMA unset_variable
                        | unset_variable'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -519,7 +554,7 @@ def p_class_statement_list(p):
                             | empty'''
 
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[0] = add_statement(p[1], p[2])
     else:
         p[0] = []
 
@@ -541,7 +576,8 @@ def p_class_variable_declaration_initial(p):
     '''class_variable_declaration : class_variable_declaration COMMA VARIABLE EQUALS static_scalar
                                   | VARIABLE EQUALS static_scalar'''
     if len(p) == 6:
-        p[0] = p[1] + [ast.ClassVariable(p[3], p[5], lineno=p.lineno(2))]
+        p[1].append(ast.ClassVariable(p[3], p[5], lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = [ast.ClassVariable(p[1], p[3], lineno=p.lineno(1))]
 
@@ -549,7 +585,8 @@ def p_class_variable_declaration_no_initial(p):
     '''class_variable_declaration : class_variable_declaration COMMA VARIABLE
                                   | VARIABLE'''
     if len(p) == 4:
-        p[0] = p[1] + [ast.ClassVariable(p[3], None, lineno=p.lineno(2))]
+        p[1].append(ast.ClassVariable(p[3], None, lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = [ast.ClassVariable(p[1], None, lineno=p.lineno(1))]
 
@@ -557,7 +594,8 @@ def p_class_constant_declaration(p):
     '''class_constant_declaration : class_constant_declaration COMMA STRING EQUALS static_scalar
                                   | CONST STRING EQUALS static_scalar'''
     if len(p) == 6:
-        p[0] = p[1] + [ast.ClassConstant(p[3], p[5], lineno=p.lineno(2))]
+        p[1].append(ast.ClassConstant(p[3], p[5], lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = [ast.ClassConstant(p[2], p[4], lineno=p.lineno(1))]
 
@@ -565,7 +603,8 @@ def p_interface_list(p):
     '''interface_list : interface_list COMMA fully_qualified_class_name
                       | fully_qualified_class_name'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -603,7 +642,8 @@ def p_non_empty_member_modifiers(p):
     '''non_empty_member_modifiers : non_empty_member_modifiers member_modifier
                                   | member_modifier'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -625,7 +665,8 @@ def p_parameter_list(p):
     '''parameter_list : parameter_list COMMA parameter
                       | parameter'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -718,7 +759,8 @@ def p_dynamic_class_name_variable_properties(p):
     '''dynamic_class_name_variable_properties : dynamic_class_name_variable_properties dynamic_class_name_variable_property
                                               | empty'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -746,7 +788,8 @@ def p_assignment_list(p):
     '''assignment_list : assignment_list COMMA assignment_list_element
                        | assignment_list_element'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -818,7 +861,8 @@ def p_variable_properties(p):
     '''variable_properties : variable_properties variable_property
                            | empty'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -887,11 +931,13 @@ def p_object_dim_list_empty(p):
 
 def p_object_dim_list_array_offset(p):
     'object_dim_list : object_dim_list LBRACKET dim_offset RBRACKET'
-    p[0] = p[1] + [(ast.ArrayOffset, p[3], p.lineno(2))]
+    p[1].append((ast.ArrayOffset, p[3], p.lineno(2)))
+    p[0] = p[1]
 
 def p_object_dim_list_string_offset(p):
     'object_dim_list : object_dim_list LBRACE expr RBRACE'
-    p[0] = p[1] + [(ast.StringOffset, p[3], p.lineno(2))]
+    p[1].append((ast.StringOffset, p[3], p.lineno(2)))
+    p[0] = p[1]
 
 def p_variable_name(p):
     '''variable_name : STRING
@@ -927,9 +973,11 @@ def p_non_empty_array_pair_list_item(p):
                                  | AND variable
                                  | expr'''
     if len(p) == 5:
-        p[0] = p[1] + [ast.ArrayElement(None, p[4], True, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(None, p[4], True, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 4:
-        p[0] = p[1] + [ast.ArrayElement(None, p[3], False, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(None, p[3], False, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 3:
         p[0] = [ast.ArrayElement(None, p[2], True, lineno=p.lineno(1))]
     else:
@@ -941,9 +989,11 @@ def p_non_empty_array_pair_list_pair(p):
                                  | expr DOUBLE_ARROW AND variable
                                  | expr DOUBLE_ARROW expr'''
     if len(p) == 7:
-        p[0] = p[1] + [ast.ArrayElement(p[3], p[6], True, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(p[3], p[6], True, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 6:
-        p[0] = p[1] + [ast.ArrayElement(p[3], p[5], False, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(p[3], p[5], False, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 5:
         p[0] = [ast.ArrayElement(p[1], p[4], True, lineno=p.lineno(2))]
     else:
@@ -958,7 +1008,8 @@ def p_function_call_parameter_list(p):
     '''function_call_parameter_list : function_call_parameter_list COMMA function_call_parameter
                                     | function_call_parameter'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -992,9 +1043,11 @@ def p_lexical_var_list(p):
                         | AND VARIABLE
                         | VARIABLE'''
     if len(p) == 5:
-        p[0] = p[1] + [ast.LexicalVariable(p[4], True, lineno=p.lineno(2))]
+        p[1].append(ast.LexicalVariable(p[4], True, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 4:
-        p[0] = p[1] + [ast.LexicalVariable(p[3], False, lineno=p.lineno(2))]
+        p[1].append(ast.LexicalVariable(p[3], False, lineno=p.lineno(2)))
+        p[0] = p[1]
     elif len(p) == 3:
         p[0] = [ast.LexicalVariable(p[2], True, lineno=p.lineno(1))]
     else:
@@ -1099,7 +1152,8 @@ def p_isset_variables(p):
     '''isset_variables : isset_variables COMMA variable
                        | variable'''
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -1270,7 +1324,8 @@ def p_static_non_empty_array_pair_list_item(p):
     '''static_non_empty_array_pair_list : static_non_empty_array_pair_list COMMA static_scalar
                                         | static_scalar'''
     if len(p) == 4:
-        p[0] = p[1] + [ast.ArrayElement(None, p[3], False, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(None, p[3], False, lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = [ast.ArrayElement(None, p[1], False, lineno=p.lineno(1))]
 
@@ -1278,7 +1333,8 @@ def p_static_non_empty_array_pair_list_pair(p):
     '''static_non_empty_array_pair_list : static_non_empty_array_pair_list COMMA static_scalar DOUBLE_ARROW static_scalar
                                         | static_scalar DOUBLE_ARROW static_scalar'''
     if len(p) == 6:
-        p[0] = p[1] + [ast.ArrayElement(p[3], p[5], False, lineno=p.lineno(2))]
+        p[1].append(ast.ArrayElement(p[3], p[5], False, lineno=p.lineno(2)))
+        p[0] = p[1]
     else:
         p[0] = [ast.ArrayElement(p[1], p[3], False, lineno=p.lineno(2))]
 
@@ -1364,8 +1420,112 @@ def p_error(t):
     else:
         raise SyntaxError('unexpected EOF while parsing', (None, None, None, None))
 
+# Partial results after a syntax error, rebuilt from the parser's symbol
+# stack: the statements completed so far, with the namespaces, classes
+# and interfaces still open at the error point closed around their
+# completed members.
+open_blocks = [
+    (('NAMESPACE', 'LBRACE', 'top_statement_list'),
+     lambda s: ast.Namespace(None, s[2].value, lineno=s[0].lineno)),
+    (('NAMESPACE', 'namespace_name', 'LBRACE', 'top_statement_list'),
+     lambda s: ast.Namespace(s[1].value, s[3].value, lineno=s[0].lineno)),
+    (('class_entry_type', 'STRING', 'extends_from', 'implements_list', 'LBRACE', 'class_statement_list'),
+     lambda s: ast.Class(s[1].value, s[0].value, s[2].value, s[3].value, s[5].value, lineno=s[1].lineno)),
+    (('INTERFACE', 'STRING', 'interface_extends_list', 'LBRACE', 'class_statement_list'),
+     lambda s: ast.Interface(s[1].value, s[2].value, s[4].value, lineno=s[0].lineno)),
+]
+
+def recover(symstack):
+    types = [sym.type for sym in symstack]
+    if types[1:2] == ['top_statement_list']:
+        statements = symstack[1].value
+    else:
+        return []
+
+    # Only blocks nested in each other from the top level are open
+    # there: each starts right after the statements of the one before,
+    # and anything else (such as a class in a function body) ends them
+    blocks = []
+    i = 2
+    while True:
+        for pattern, build in open_blocks:
+            if tuple(types[i:i + len(pattern)]) == pattern:
+                blocks.append((build, symstack[i:i + len(pattern)]))
+                i += len(pattern)
+                break
+        else:
+            break
+
+    node = None
+    for build, symbols in reversed(blocks):
+        block = build(symbols)
+        if node is not None:
+            add_statement(block.nodes, node)
+        node = block
+    if node is not None:
+        add_statement(statements, node)
+    return statements
+
 # Build the grammar
-parser = yacc.yacc(debug=0, write_tables=0)
+parser = tables.build_parser(sys.modules[__name__])
+
+# Positions: a copy of the parser whose reductions record where the text
+# of each nonterminal starts and ends on its symbol, as tokens carry them
+# in lexpos and lexend (None for a nonterminal
+# derived from nothing), and set them on the node a reduction builds,
+# unless it already has them.
+def track_positions(parser):
+    parser = copy.copy(parser)
+    productions = []
+    for production in parser.productions:
+        production = copy.copy(production)
+        if production.callable:
+            production.callable = tracking(production.callable, production.len)
+        productions.append(production)
+    parser.productions = productions
+    return parser
+
+def tracking(func, length):
+    # Reductions of one symbol, the most common, just pass its offsets on
+    if length == 0:
+        def action(p):
+            func(p)
+            sym = p.slice[0]
+            sym.lexpos = sym.lexend = None
+    elif length == 1:
+        def action(p):
+            func(p)
+            sym, first = p.slice
+            sym.lexpos = start = first.lexpos
+            sym.lexend = end = first.lexend
+            node = sym.value
+            if start is not None and isinstance(node, ast.Node) and node.lexpos is None:
+                node.lexpos = start
+                node.lexend = end
+    else:
+        def action(p):
+            func(p)
+            symbols = p.slice
+            start = end = None
+            for i in xrange(1, length + 1):
+                start = symbols[i].lexpos
+                if start is not None:
+                    for j in xrange(length, i - 1, -1):
+                        end = symbols[j].lexend
+                        if end is not None:
+                            break
+                    break
+
+            sym = symbols[0]
+            sym.lexpos = start
+            sym.lexend = end
+            node = sym.value
+            if start is not None and isinstance(node, ast.Node) and node.lexpos is None:
+                node.lexpos = start
+                node.lexend = end
+
+    action.__name__ = func.__name__
+    return action
 
 if __name__ == '__main__':
     import readline
@@ -0,0 +1,574 @@
+# ----------------------------------------------------------------------
+# phpscan.py
+#
+# A hand-written scanner for PHP.
+#
+# Produces exactly the token stream of phplex.lexer (the PLY lexer seen
+# through FilteredLexer): the same token types, values, line numbers and
+# positions, using the same lexer states.  The php state, which yields
+# most tokens, is scanned inline with a single regex that also skips the
+# whitespace before each token, so whitespace and open tags never become
+# tokens and no rule function is called per token.  The other states are
+# rare and are scanned by small per-state methods.
+#
+# Newlines are not counted as the text is scanned.  Tokens carry the
+# offsets of their start and end, and their line number is looked up from
+# the start offset when it is read (see Lines).  tokenize() scans the
+# whole input into a TokenBuffer, which keeps no object per token, for
+# tools that hold every token of a file; the parser reads the tokens as
+# they are scanned.
+# ----------------------------------------------------------------------
+
+import re
+import copy
+from array import array
+from bisect import bisect_left
+import phplex
+
+reserved_map = phplex.reserved_map
+
+IDENT_START = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_')
+ALPHA = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+DIGITS = frozenset('0123456789')
+
+casts = {
+    'array':   'ARRAY_CAST',
+    'bool':    'BOOL_CAST',
+    'boolean': 'BOOL_CAST',
+    'real':    'DOUBLE_CAST',
+    'double':  'DOUBLE_CAST',
+    'float':   'DOUBLE_CAST',
+    'int':     'INT_CAST',
+    'integer': 'INT_CAST',
+    'object':  'OBJECT_CAST',
+    'string':  'STRING_CAST',
+    'unset':   'UNSET_CAST',
+}
+
+operators = {
+    '+': 'PLUS', '-': 'MINUS', '*': 'MUL', '/': 'DIV', '%': 'MOD',
+    '&': 'AND', '|': 'OR', '~': 'NOT', '^': 'XOR', '<<': 'SL', '>>': 'SR',
+    '&&': 'BOOLEAN_AND', '||': 'BOOLEAN_OR', '!': 'BOOLEAN_NOT',
+    '<': 'IS_SMALLER', '>': 'IS_GREATER', '<=': 'IS_SMALLER_OR_EQUAL',
+    '>=': 'IS_GREATER_OR_EQUAL', '==': 'IS_EQUAL', '!=': 'IS_NOT_EQUAL',
+    '<>': 'IS_NOT_EQUAL', '===': 'IS_IDENTICAL', '!==': 'IS_NOT_IDENTICAL',
+
+    '=': 'EQUALS', '*=': 'MUL_EQUAL', '/=': 'DIV_EQUAL', '%=': 'MOD_EQUAL',
+    '+=': 'PLUS_EQUAL', '-=': 'MINUS_EQUAL', '<<=': 'SL_EQUAL',
+    '>>=': 'SR_EQUAL', '&=': 'AND_EQUAL', '|=': 'OR_EQUAL',
+    '^=': 'XOR_EQUAL', '.=': 'CONCAT_EQUAL',
+
+    '++': 'INC', '--': 'DEC',
+
+    '=>': 'DOUBLE_ARROW', '::': 'DOUBLE_COLON',
+
+    '(': 'LPAREN', ')': 'RPAREN', '[': 'LBRACKET', ']': 'RBRACKET',
+    '{': 'LBRACE', '}': 'RBRACE', '$': 'DOLLAR', ',': 'COMMA', '.': 'CONCAT',
+    '?': 'QUESTION', ':': 'COLON', ';': 'SEMI', '@': 'AT', '\\': 'NS_SEPARATOR',
+}
+
+# Close tags after these tokens do not end a statement
+NO_SEMI = frozenset(['OPEN_TAG', 'SEMI', 'COLON', 'LBRACE', 'RBRACE'])
+
+# Tokens that end the previous statement, and keywords that start the
+# declarations a doc comment may document
+STATEMENT_END = frozenset([None, 'OPEN_TAG', 'SEMI', 'LBRACE', 'RBRACE'])
+DECLARATION_START = frozenset(['FUNCTION', 'CLASS', 'INTERFACE', 'ABSTRACT', 'FINAL',
+                               'PUBLIC', 'PROTECTED', 'PRIVATE', 'STATIC', 'VAR',
+                               'CONST'])
+
+
+def either(words, escape=re.escape):
+    # Longest first, so that the longest operator wins
+    return '|'.join(escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+def ignorecase(word):
+    return ''.join('[%s%s]' % (c.upper(), c) for c in word)
+
+
+# A token of the php state and the whitespace before it.  The alternatives
+# are tried in order; the leading ones take precedence over operators that
+# share a prefix with them, just like rule functions do in phplex.
+php_token = re.compile(r'''
+    ([ \t\r\n]*)
+    (?:
+        (?P<name>[A-Za-z_]\w*)
+      | (?P<variable>\$[A-Za-z_]\w*)
+      | (?P<dnumber>(\d*\.\d+|\d+\.\d*)([Ee][+-]?\d+)?|(\d+[Ee][+-]?\d+))
+      | (?P<lnumber>(0x[0-9A-Fa-f]+)|\d+)
+      | (?P<comment>/\*|//|\#)
+      | (?P<close_tag>[?%]>\r?\n?)
+      | (?P<single_quoted>'[^\\']*(?:\\[\s\S][^\\']*)*')
+      | (?P<quote>")
+      | (?P<heredoc><<<[ \t]*(?P<label>[A-Za-z_]\w*)\n)
+      | (?P<cast>\([ \t]*(''' + either(casts, ignorecase) + r''')[ \t]*\))
+      | (?P<open>[[{])
+      | (?P<close>[]}])
+      | (?P<arrow>->)
+      | (?P<operator>''' + either(set(operators) - set('[]{}')) + r''')
+      | (?P<end>\Z)
+      | (?P<illegal>)
+    )''', re.VERBOSE)
+
+identifier = re.compile(r'[A-Za-z_]\w*')
+variable = re.compile(r'\$[A-Za-z_]\w*')
+num_string = re.compile(r'\d+')
+line_comment = re.compile(r'(?://|\#)[^?%\n]*(?:[?%](?!>)[^?%\n]*)*\n?')
+open_tag = re.compile(r'<[?%]((php[ \t\r\n]?)|=)?')
+quoted_encapsed = re.compile(r'(?:[^"\\${]+|\\[\s\S]|\$(?![A-Za-z_{])|\{(?!\$))+')
+heredoc_encapsed = re.compile(r'(?:[^\n\\${]+|\\.|\$(?![A-Za-z_{])|\{(?!\$))+\n?|\\?\n')
+newline = re.compile(r'\n')
+
+# Characters of newline index built at a time
+INDEX_SIZE = 64 * 1024
+
+
+class Lines(object):
+    """Line numbers and columns of the offsets in *data*, from *pos* on,
+    where the line is *lineno*.
+
+    They are looked up by bisecting an index of the newlines, which is
+    built as far as it is needed, once for the whole text.
+    """
+
+    def __init__(self, data, pos=0, lineno=1):
+        self.data = data
+        self.pos = pos
+        self.base = lineno
+        self.newlines = []
+        self.indexed = pos
+
+    def lineno(self, pos):
+        if pos > self.indexed:
+            self.index(pos)
+        return self.base + bisect_left(self.newlines, pos)
+
+    def column(self, pos):
+        # Columns count from 0, like the offsets
+        return pos - self.data.rfind('\n', 0, pos) - 1
+
+    def index(self, pos):
+        end = min(len(self.data), max(pos, self.indexed + INDEX_SIZE))
+        self.newlines.extend(m.start() for m in newline.finditer(self.data, self.indexed, end))
+        self.indexed = end
+
+
+class Token(object):
+    __slots__ = ('type', 'value', 'lexpos', 'lexend', 'lines', 'lexer')
+
+    def __init__(self, type, value, lexpos, lexend, lines):
+        self.type = type
+        self.value = value
+        self.lexpos = lexpos
+        self.lexend = lexend
+        self.lines = lines
+
+    @property
+    def lineno(self):
+        # The lexer indexes the newlines up to the end of each token
+        lines = self.lines
+        return lines.base + bisect_left(lines.newlines, self.lexpos)
+
+    def __repr__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    __str__ = __repr__
+
+
+# The token types of a TokenBuffer, by id
+TYPES = phplex.full_tokens
+type_ids = dict((type, i) for i, type in enumerate(TYPES))
+
+
+class TokenBuffer(object):
+    """The tokens scanned from *data*, in three parallel arrays: the id of
+    their type in TYPES, and the offsets of their start and end.
+
+    A token takes 9 bytes here, and no object is made for it until it is
+    read.  Its value is always the text between its offsets, so it is not
+    stored but sliced from *data*.  Reading a token makes a :class:`Token`.
+    """
+
+    def __init__(self, data, lines):
+        self.data = data
+        self.lines = lines
+        self.types = array('B')
+        self.starts = array('i')
+        self.ends = array('i')
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, i):
+        return Token(TYPES[self.types[i]], self.value(i), self.starts[i], self.ends[i], self.lines)
+
+    def value(self, i):
+        return self.data[self.starts[i]:self.ends[i]]
+
+
+class Lexer(object):
+    """Scanner with the interface of phplex.FilteredLexer.
+
+    With ``comments='doc'``, comments are dropped before they reach the
+    parser, except for doc comments that come right before a declaration;
+    the node preceding each declaration is then the same as with all
+    comments.
+    """
+
+    def __init__(self, comments='all'):
+        self.comments = comments
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lines = Lines(self.lexdata)
+        self.lexstate = 'INITIAL'
+        self.lexstatestack = []
+        self.heredoc_label = None
+        self.last_type = None
+
+    def clone(self):
+        lexer = copy.copy(self)
+        lexer.lexstatestack = list(self.lexstatestack)
+        lexer.last_type = None
+        return lexer
+
+    @property
+    def lineno(self):
+        return self.lines.lineno(self.lexpos)
+
+    @lineno.setter
+    def lineno(self, value):
+        # The line at lexpos; those of later offsets follow from the text
+        self.lines = Lines(self.lexdata, self.lexpos, value)
+
+    def input(self, input):
+        lineno = self.lineno
+        self.lexdata = input
+        self.lexpos = 0
+        self.lexlen = len(input)
+        self.lineno = lineno
+
+    def current_state(self):
+        return self.lexstate
+
+    def begin(self, state):
+        self.lexstate = state
+
+    def push_state(self, state):
+        self.lexstatestack.append(self.lexstate)
+        self.lexstate = state
+
+    def pop_state(self):
+        self.lexstate = self.lexstatestack.pop()
+
+    def error(self, pos):
+        raise SyntaxError('illegal character', (None, self.lines.lineno(pos), None, self.lexdata[pos:]))
+
+    def token(self):
+        type, value, start, end = self.scan()
+        if type is None:
+            return None
+        return Token(type, value, start, end, self.lines)
+
+    def tokenize(self):
+        """Scans the rest of the input into a :class:`TokenBuffer`."""
+        buffer = TokenBuffer(self.lexdata, self.lines)
+        types = buffer.types.append
+        starts = buffer.starts.append
+        ends = buffer.ends.append
+        scan = self.scan
+        while True:
+            type, value, start, end = scan()
+            if type is None:
+                return buffer
+            types(type_ids[type])
+            starts(start)
+            ends(end)
+
+    def scan(self):
+        # The type, value and offsets of the next token; a None type at
+        # the end of the input
+        data = self.lexdata
+        end = self.lexlen
+        pos = self.lexpos
+        type = value = start = None
+        while pos < end:
+            if self.lexstate != 'php':
+                start = pos
+                type, value, pos = self.scanners[self.lexstate](self, data, pos)
+                if type == 'OPEN_TAG':
+                    self.last_type = type
+                    continue
+                elif type == 'OPEN_TAG_WITH_ECHO':
+                    type = 'ECHO'
+                break
+
+            m = php_token.match(data, pos)
+            start = m.end(1)
+            if start >= end:
+                # Only whitespace is left before lexlen
+                pos = end
+                type = None
+                break
+
+            kind = m.lastgroup
+            value = m.group(kind)
+            pos = m.end()
+            if kind == 'name':
+                type = reserved_map.get(value.upper(), 'STRING')
+            elif kind == 'operator':
+                type = operators[value]
+            elif kind == 'variable':
+                type = 'VARIABLE'
+            elif kind == 'open':
+                type = operators[value]
+                self.lexstatestack.append('php')
+            elif kind == 'close':
+                type = operators[value]
+                self.lexstate = self.lexstatestack.pop()
+            elif kind == 'arrow':
+                type = 'OBJECT_OPERATOR'
+                if data[pos:pos + 1] in IDENT_START:
+                    self.push_state('property')
+            elif kind == 'lnumber':
+                type = 'LNUMBER'
+            elif kind == 'dnumber':
+                type = 'DNUMBER'
+            elif kind == 'single_quoted':
+                type = 'CONSTANT_ENCAPSED_STRING'
+            elif kind == 'quote':
+                type = 'QUOTE'
+                self.push_state('quoted')
+            elif kind == 'comment':
+                type, value, pos = self.scan_comment(data, start)
+                if self.comments == 'doc':
+                    # The empty /**/ is a COMMENT, but documents as well
+                    if type == 'COMMENT' and not value.startswith('/**'):
+                        continue
+                    elif not self.documents(data, pos):
+                        continue
+            elif kind == 'cast':
+                type = casts[value[1:-1].strip(' \t').lower()]
+            elif kind == 'heredoc':
+                type = 'START_HEREDOC'
+                self.push_state('heredoc')
+                self.heredoc_label = m.group('label')
+            elif kind == 'close_tag':
+                self.lexstate = 'INITIAL'
+                if self.last_type in NO_SEMI:
+                    continue
+                type = 'SEMI'
+            elif kind == 'illegal':
+                self.error(start)
+
+            else:
+                type = None
+            break
+        else:
+            type = None
+
+        if pos > self.lines.indexed:
+            self.lines.index(pos)
+        self.lexpos = pos
+        self.last_type = type
+        return type, value, start, pos
+
+    def documents(self, data, pos):
+        # Whether a doc comment ending at pos documents a declaration
+        if self.last_type not in STATEMENT_END:
+            return False
+
+        m = php_token.match(data, pos)
+        if m.lastgroup != 'name':
+            return False
+
+        return reserved_map.get(m.group('name').upper()) in DECLARATION_START
+
+    def scan_comment(self, data, pos):
+        if data[pos] == '/' and data[pos + 1] == '*':
+            if data[pos + 2:pos + 3] == '*':
+                close = data.find('*/', pos + 3)
+                if close >= 0:
+                    return 'DOC_COMMENT', data[pos:close + 2], close + 2
+
+            close = data.find('*/', pos + 2)
+            if close >= 0:
+                return 'COMMENT', data[pos:close + 2], close + 2
+            else:
+                return 'DIV', '/', pos + 1
+
+        m = line_comment.match(data, pos)
+        return 'COMMENT', m.group(), m.end()
+
+    def scan_initial(self, data, pos):
+        m = open_tag.match(data, pos)
+        if m:
+            self.begin('php')
+            value = m.group()
+            if '=' in value:
+                return 'OPEN_TAG_WITH_ECHO', value, m.end()
+            else:
+                return 'OPEN_TAG', value, m.end()
+
+        end = phplex.find_open_tag(data, pos)
+        return 'INLINE_HTML', data[pos:end], end
+
+    def scan_quoted(self, data, pos):
+        c = data[pos]
+        if c == '"':
+            self.pop_state()
+            return 'QUOTE', c, pos + 1
+        elif c == '$':
+            m = variable.match(data, pos)
+            if m:
+                self.push_state('quotedvar')
+                return 'VARIABLE', m.group(), m.end()
+            elif data[pos + 1:pos + 2] == '{':
+                return self.scan_dollar_open_curly_braces(data, pos, self.push_state)
+        elif c == '{' and data[pos + 1:pos + 2] == '$':
+            self.push_state('php')
+            return 'CURLY_OPEN', c, pos + 1
+
+        return self.scan_encapsed(data, pos, quoted_encapsed)
+
+    def scan_quotedvar(self, data, pos):
+        if data[pos] == '"':
+            self.pop_state()
+            self.pop_state()
+            return 'QUOTE', '"', pos + 1
+
+        return self.scan_var(data, pos, quoted_encapsed)
+
+    def scan_heredoc(self, data, pos):
+        c = data[pos]
+        if c == '{' and data[pos + 1:pos + 2] == '$':
+            self.push_state('php')
+            return 'CURLY_OPEN', c, pos + 1
+        elif c == '$':
+            if data[pos + 1:pos + 2] == '{':
+                return self.scan_dollar_open_curly_braces(data, pos, self.push_state)
+
+            m = variable.match(data, pos)
+            if m:
+                self.push_state('heredocvar')
+                return 'VARIABLE', m.group(), m.end()
+        elif c in IDENT_START and pos > 0 and data[pos - 1] == '\n':
+            m = identifier.match(data, pos)
+            value = m.group()
+            if value == self.heredoc_label:
+                self.heredoc_label = None
+                self.pop_state()
+                return 'END_HEREDOC', value, m.end()
+            else:
+                return 'ENCAPSED_AND_WHITESPACE', value, m.end()
+
+        m = heredoc_encapsed.match(data, pos)
+        if m is None:
+            self.error(pos)
+
+        return 'ENCAPSED_AND_WHITESPACE', m.group(), m.end()
+
+    def scan_heredocvar(self, data, pos):
+        return self.scan_var(data, pos, heredoc_encapsed)
+
+    def scan_var(self, data, pos, encapsed):
+        # The rest of a string or heredoc right after a variable
+        c = data[pos]
+        if c == '$':
+            m = variable.match(data, pos)
+            if m:
+                return 'VARIABLE', m.group(), m.end()
+            elif data[pos + 1:pos + 2] == '{':
+                return self.scan_dollar_open_curly_braces(data, pos, self.begin)
+        elif c == '[':
+            self.begin('offset')
+            return 'LBRACKET', c, pos + 1
+        elif c == '-' and data[pos + 1:pos + 2] == '>' and data[pos + 2:pos + 3] in ALPHA:
+            self.begin('property')
+            return 'OBJECT_OPERATOR', '->', pos + 2
+        elif c == '{' and data[pos + 1:pos + 2] == '$':
+            self.begin('php')
+            return 'CURLY_OPEN', c, pos + 1
+
+        self.pop_state()
+        return self.scan_encapsed(data, pos, encapsed)
+
+    def scan_encapsed(self, data, pos, encapsed):
+        m = encapsed.match(data, pos)
+        if m is None:
+            self.error(pos)
+
+        return 'ENCAPSED_AND_WHITESPACE', m.group(), m.end()
+
+    def scan_dollar_open_curly_braces(self, data, pos, enter):
+        if data[pos + 2:pos + 3] in IDENT_START:
+            enter('varname')
+        else:
+            enter('php')
+        return 'DOLLAR_OPEN_CURLY_BRACES', '${', pos + 2
+
+    def scan_varname(self, data, pos):
+        c = data[pos]
+        if c == '[':
+            self.push_state('php')
+            return 'LBRACKET', c, pos + 1
+        elif c == '}':
+            self.pop_state()
+            return 'RBRACE', c, pos + 1
+        elif c in IDENT_START:
+            m = identifier.match(data, pos)
+            return 'STRING_VARNAME', m.group(), m.end()
+
+        self.error(pos)
+
+    def scan_offset(self, data, pos):
+        c = data[pos]
+        if c in IDENT_START:
+            m = identifier.match(data, pos)
+            return 'STRING', m.group(), m.end()
+        elif c in DIGITS:
+            m = num_string.match(data, pos)
+            return 'NUM_STRING', m.group(), m.end()
+        elif c == '$':
+            m = variable.match(data, pos)
+            if m:
+                return 'VARIABLE', m.group(), m.end()
+        elif c == ']':
+            self.pop_state()
+            return 'RBRACKET', c, pos + 1
+
+        self.error(pos)
+
+    def scan_property(self, data, pos):
+        if data[pos] in IDENT_START:
+            m = identifier.match(data, pos)
+            self.pop_state()
+            return 'STRING', m.group(), m.end()
+
+        self.error(pos)
+
+    scanners = {
+        'INITIAL': scan_initial,
+        'quoted': scan_quoted,
+        'quotedvar': scan_quotedvar,
+        'varname': scan_varname,
+        'offset': scan_offset,
+        'property': scan_property,
+        'heredoc': scan_heredoc,
+        'heredocvar': scan_heredocvar,
+    }
+
+    # Iterator interface
+    def __iter__(self):
+        return self
+
+    def next(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    __next__ = next
+
+lexer = Lexer()
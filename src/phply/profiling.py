@@ -0,0 +1,191 @@
+# ----------------------------------------------------------------------
+# profiling.py
+#
+# Counts where the parser spends its time: the reductions of each p_*
+# function of phpparse and the tokens of each type, with the time spent
+# in their actions and in the lexer.
+#
+#     $ python -m phply.profiling [--mode full] [--json] file.php ...
+# ----------------------------------------------------------------------
+
+import sys
+import copy
+import json
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+import batch
+import engine
+
+
+class ProfilingLexer(object):
+    """Wraps a lexer, counting the tokens of each type and the time spent
+    producing them."""
+
+    def __init__(self, lexer, tokens):
+        self.lexer = lexer
+        self.tokens = tokens
+
+    def __getattr__(self, name):
+        return getattr(self.lexer, name)
+
+    def input(self, input):
+        self.lexer.input(input)
+
+    def token(self):
+        started = timer()
+        t = self.lexer.token()
+        elapsed = timer() - started
+        if t is not None:
+            counter = self.tokens.get(t.type)
+            if counter is None:
+                counter = self.tokens[t.type] = [0, 0.0]
+            counter[0] += 1
+            counter[1] += elapsed
+        return t
+
+
+class Profile(object):
+    """Counters of the parses run through :meth:`instrument`.
+
+    ``productions`` and ``tokens`` map the name of each p_* function and
+    each token type to its count and the seconds spent in it; ``shifts``
+    is the number of tokens shifted, which is all of them except the one
+    a syntax error is raised on.
+    """
+
+    def __init__(self):
+        self.productions = {}
+        self.tokens = {}
+        self.errors = 0
+        self.seconds = 0.0
+
+    @property
+    def reductions(self):
+        return sum(count for count, _ in self.productions.values())
+
+    @property
+    def shifts(self):
+        return sum(count for count, _ in self.tokens.values()) - self.errors
+
+    def instrument(self, lexer, parser):
+        """Returns copies of *lexer* and *parser* that count into this
+        profile; *parser* is PLY's or an :class:`engine.Parser`."""
+        parser = copy.copy(parser)
+        if isinstance(parser, engine.Parser):
+            parser.productions = [(self.action(func), length, lhs)
+                                  for func, length, lhs in parser.productions]
+        else:
+            productions = []
+            for production in parser.productions:
+                production = copy.copy(production)
+                production.callable = self.action(production.callable)
+                productions.append(production)
+            parser.productions = productions
+
+        errorfunc = parser.errorfunc
+
+        def error(t):
+            if t is not None:
+                self.errors += 1
+            return errorfunc(t)
+
+        parser.errorfunc = error
+        return ProfilingLexer(lexer, self.tokens), parser
+
+    def action(self, func):
+        if func is None:
+            return None
+
+        counter = self.productions.setdefault(func.__name__, [0, 0.0])
+
+        def action(p):
+            started = timer()
+            func(p)
+            counter[1] += timer() - started
+            counter[0] += 1
+
+        return action
+
+    def parse(self, source, mode='full'):
+        """Parses *source* like :func:`batch.parse`, counting into this
+        profile."""
+        lexer, parser = self.instrument(*batch.new_parser(mode))
+        started = timer()
+        try:
+            return parser.parse(source, lexer=lexer)
+        except SyntaxError as exc:
+            raise batch.parse_error(exc, parser)
+        finally:
+            self.seconds += timer() - started
+
+    def as_dict(self):
+        def counters(table):
+            return dict((name, {'count': count, 'seconds': seconds})
+                        for name, (count, seconds) in table.items() if count)
+
+        return {'seconds': self.seconds,
+                'shifts': self.shifts,
+                'reductions': self.reductions,
+                'productions': counters(self.productions),
+                'tokens': counters(self.tokens)}
+
+    def report(self, sort='seconds', limit=None):
+        """Returns the counters as text, each table sorted by *sort*:
+        ``seconds``, ``count`` or ``name``."""
+        lines = ['%.3f s, %d shifts, %d reductions' % (self.seconds, self.shifts, self.reductions)]
+        for title, table in (('production', self.productions), ('token', self.tokens)):
+            rows = [(name, count, seconds) for name, (count, seconds) in table.items() if count]
+            if sort == 'name':
+                rows.sort()
+            elif sort == 'count':
+                rows.sort(key=lambda row: (-row[1], row[0]))
+            else:
+                rows.sort(key=lambda row: (-row[2], row[0]))
+
+            lines.append('')
+            lines.append('%-40s %10s %10s %10s' % (title, 'count', 'seconds', 'us/call'))
+            for name, count, seconds in rows[:limit]:
+                lines.append('%-40s %10d %10.4f %10.2f' % (name, count, seconds, seconds * 1e6 / count))
+
+        return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Parses PHP files and prints where the parser spent its time."""
+    parser = ArgumentParser(prog='python -m phply.profiling',
+                            description='Count the reductions of each grammar production '
+                                        'and the tokens of each type in parsing PHP files.')
+    parser.add_argument('paths', nargs='+', help='PHP files to parse')
+    parser.add_argument('-m', '--mode', default='full', choices=('declarations', 'lazy', 'full'),
+                        help='parse mode (default: full)')
+    parser.add_argument('--engine', default='ply', choices=batch.ENGINES,
+                        help='parse engine (default: ply)')
+    parser.add_argument('--json', action='store_true', help='print the counters as JSON')
+    parser.add_argument('-s', '--sort', default='seconds', choices=('seconds', 'count', 'name'),
+                        help='sort order of the report (default: seconds)')
+    parser.add_argument('-n', '--limit', type=int, default=None,
+                        help='number of rows of each table of the report (default: all)')
+    args = parser.parse_args(argv)
+
+    batch.set_engine(args.engine)
+    profile = Profile()
+    failures = 0
+    for path in args.paths:
+        with open(path, 'rb') as f:
+            source = f.read().decode('utf-8')
+        try:
+            profile.parse(source, args.mode)
+        except batch.ParseError as exc:
+            failures += 1
+            sys.stderr.write('%s: %s\n' % (path, exc))
+
+    if args.json:
+        print(json.dumps(profile.as_dict(), indent=2, separators=(',', ': '), sort_keys=True))
+    else:
+        print(profile.report(args.sort, args.limit))
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,372 @@
+# ----------------------------------------------------------------------
+# serialize.py
+#
+# Compact binary serialization of phpast trees.
+#
+# File layout (integers are little-endian, varints are LEB128):
+#
+#   'PHPT' version:u16
+#   schema    varint count, then for each node type its name, and its
+#             fields followed by its attributes
+#   skeleton  varint size, then the top-level statements
+#   bodies    the bodies of the functions, methods and closures above
+#
+# A node is its type, its line number, the offset and length of its text
+# in the source (or N), its fields, and its attributes, such as the doc
+# comment of a declaration.
+#
+# The skeleton refers to each body by its offset in the body section,
+# so loading a file decodes declarations, class members and their doc
+# comments only.  A body is decoded the first time its ``nodes`` field
+# is read.  The bodies of a ``lazy`` parse were never parsed; they are
+# stored as their span in the source file, and parsed from it instead.
+#
+# dump_iter() writes the statements of a file as they are parsed.  It
+# declares every node type in the schema up front and patches the sizes
+# in afterwards, which is why they may be encoded with padding bytes.
+# ----------------------------------------------------------------------
+
+import shutil
+import struct
+import tempfile
+import phpast as ast
+
+MAGIC = 'PHPT'
+VERSION = 4
+
+header = struct.Struct('<4sH')
+double = struct.Struct('<d')
+
+
+def write_varint(out, value):
+    while value > 0x7f:
+        out.append(chr(0x80 | (value & 0x7f)))
+        value >>= 7
+    out.append(chr(value))
+
+
+def padded_varint(value, width=10):
+    out = []
+    for _ in xrange(width - 1):
+        out.append(chr(0x80 | (value & 0x7f)))
+        value >>= 7
+    out.append(chr(value))
+    return ''.join(out)
+
+
+def read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = ord(data[pos])
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def write_string(out, value):
+    write_varint(out, len(value))
+    out.append(value)
+
+
+def read_string(data, pos):
+    size, pos = read_varint(data, pos)
+    return data[pos:pos + size], pos + size
+
+
+class Encoder(object):
+    def __init__(self):
+        self.types = {}
+        self.schema = []
+        self.bodies = []
+        self.bodies_size = 0
+
+    def encode(self, value, out, defer=True):
+        if value is None:
+            out.append('N')
+        elif value is True:
+            out.append('T')
+        elif value is False:
+            out.append('F')
+        elif isinstance(value, (int, long)):
+            out.append('i')
+            write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, float):
+            out.append('f')
+            out.append(double.pack(value))
+        elif isinstance(value, str):
+            out.append('s')
+            write_string(out, value)
+        elif isinstance(value, unicode):
+            out.append('u')
+            write_string(out, value.encode('utf-8'))
+        elif isinstance(value, list):
+            out.append('l')
+            write_varint(out, len(value))
+            for item in value:
+                self.encode(item, out, defer)
+        elif isinstance(value, tuple):
+            out.append('t')
+            write_varint(out, len(value))
+            for item in value:
+                self.encode(item, out, defer)
+        elif isinstance(value, ast.Node):
+            self.encode_node(value, out, defer)
+        else:
+            raise TypeError('cannot serialize %r' % (value,))
+
+    def encode_node(self, node, out, defer):
+        cls = node.__class__
+        if cls not in self.types:
+            self.types[cls] = len(self.schema)
+            self.schema.append(cls)
+
+        out.append('n')
+        write_varint(out, self.types[cls])
+        self.encode(node.lineno, out, defer)
+        self.encode_position(node, out)
+        for field in cls.fields:
+            if field in cls.deferred:
+                value = getattr(node, ast.slot_name(field, cls.deferred))
+                if isinstance(value, ast.SourceBody):
+                    self.encode_span(value, out)
+                    continue
+
+            if defer and field in cls.deferred:
+                self.encode_body(getattr(node, field), out)
+            else:
+                self.encode(getattr(node, field), out, defer)
+        for attribute in cls.attributes:
+            self.encode(getattr(node, attribute), out, defer)
+
+    def encode_position(self, node, out):
+        # The length is usually smaller than the end offset
+        if node.lexpos is None:
+            out.append('N')
+        else:
+            out.append('i')
+            write_varint(out, node.lexpos)
+            write_varint(out, node.lexend - node.lexpos)
+
+    def encode_span(self, body, out):
+        out.append('p')
+        write_varint(out, body.start)
+        write_varint(out, body.end)
+        write_varint(out, body.lineno)
+
+    def encode_body(self, value, out):
+        body = []
+        self.encode(value, body, defer=False)
+        body = ''.join(body)
+
+        out.append('b')
+        write_varint(out, self.bodies_size)
+        self.bodies.append(body)
+        self.bodies_size += len(body)
+
+    def declare_all(self):
+        for name, cls in sorted(vars(ast).items()):
+            if isinstance(cls, type) and issubclass(cls, ast.Node) and cls is not ast.Node:
+                self.types[cls] = len(self.schema)
+                self.schema.append(cls)
+
+    def encode_schema(self, out):
+        write_varint(out, len(self.schema))
+        for cls in self.schema:
+            write_string(out, cls.__name__)
+            names = cls.fields + list(cls.attributes)
+            write_varint(out, len(names))
+            for name in names:
+                write_string(out, name)
+
+
+class Decoder(object):
+    def __init__(self, data, source=None):
+        self.data = data
+        self.source = source
+        self.types = []
+        self.bodies_offset = None
+
+    def decode(self, pos):
+        data = self.data
+        tag = data[pos]
+        pos += 1
+        if tag == 'n':
+            type_id, pos = read_varint(data, pos)
+            cls = self.types[type_id]
+            lineno, pos = self.decode(pos)
+            lexpos = lexend = None
+            if data[pos] == 'i':
+                lexpos, pos = read_varint(data, pos + 1)
+                length, pos = read_varint(data, pos)
+                lexend = lexpos + length
+            else:
+                pos += 1
+            args = []
+            for _ in cls.fields:
+                value, pos = self.decode(pos)
+                args.append(value)
+            attributes = {}
+            for attribute in cls.attributes:
+                attributes[attribute], pos = self.decode(pos)
+            return cls(*args, lineno=lineno, lexpos=lexpos, lexend=lexend, **attributes), pos
+        elif tag == 'l' or tag == 't':
+            count, pos = read_varint(data, pos)
+            items = []
+            for _ in xrange(count):
+                item, pos = self.decode(pos)
+                items.append(item)
+            if tag == 't':
+                items = tuple(items)
+            return items, pos
+        elif tag == 's':
+            return read_string(data, pos)
+        elif tag == 'u':
+            value, pos = read_string(data, pos)
+            return value.decode('utf-8'), pos
+        elif tag == 'i':
+            value, pos = read_varint(data, pos)
+            if value & 1:
+                return -((value + 1) >> 1), pos
+            else:
+                return value >> 1, pos
+        elif tag == 'N':
+            return None, pos
+        elif tag == 'T':
+            return True, pos
+        elif tag == 'F':
+            return False, pos
+        elif tag == 'f':
+            return double.unpack_from(data, pos)[0], pos + double.size
+        elif tag == 'b':
+            offset, pos = read_varint(data, pos)
+            return ast.Deferred(self.decode_body, self.bodies_offset + offset), pos
+        elif tag == 'p':
+            start, pos = read_varint(data, pos)
+            end, pos = read_varint(data, pos)
+            lineno, pos = read_varint(data, pos)
+            if self.source is None:
+                raise ValueError('no source for the body at offset %d' % start)
+            return ast.SourceBody(self.source, start, end, lineno), pos
+        else:
+            raise ValueError('unknown tag %r at offset %d' % (tag, pos - 1))
+
+    def decode_body(self, pos):
+        return self.decode(pos)[0]
+
+    def decode_schema(self, pos):
+        count, pos = read_varint(self.data, pos)
+        for _ in xrange(count):
+            name, pos = read_string(self.data, pos)
+            nfields, pos = read_varint(self.data, pos)
+            fields = []
+            for _ in xrange(nfields):
+                field, pos = read_string(self.data, pos)
+                fields.append(field)
+
+            cls = getattr(ast, name, None)
+            if not (isinstance(cls, type) and issubclass(cls, ast.Node) and
+                    cls.fields + list(cls.attributes) == fields):
+                raise ValueError('unknown node type: %s(%s)' % (name, ', '.join(fields)))
+            self.types.append(cls)
+
+        return pos
+
+
+class Statements(object):
+    """Top-level statements of a serialized file, decoded one at a time
+    each time they are iterated, so that only one is in memory at once."""
+
+    def __init__(self, decoder, pos):
+        self.decoder = decoder
+        self.count, self.pos = read_varint(decoder.data, pos)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        pos = self.pos
+        for _ in xrange(self.count):
+            node, pos = self.decoder.decode(pos)
+            yield node
+
+
+def dumps(tree):
+    encoder = Encoder()
+    skeleton = []
+    encoder.encode(tree, skeleton)
+    skeleton = ''.join(skeleton)
+
+    out = [header.pack(MAGIC, VERSION)]
+    encoder.encode_schema(out)
+    write_string(out, skeleton)
+    out.extend(encoder.bodies)
+    return ''.join(out)
+
+
+def dump_iter(statements, f):
+    encoder = Encoder()
+    encoder.declare_all()
+    out = [header.pack(MAGIC, VERSION)]
+    encoder.encode_schema(out)
+    f.write(''.join(out))
+
+    size_pos = f.tell()
+    f.write(padded_varint(0))
+    f.write('l')
+    f.write(padded_varint(0))
+
+    size = 1 + 10
+    count = 0
+    bodies = tempfile.TemporaryFile()
+    try:
+        for node in statements:
+            out = []
+            encoder.encode(node, out)
+            chunk = ''.join(out)
+            f.write(chunk)
+            size += len(chunk)
+            count += 1
+
+            for body in encoder.bodies:
+                bodies.write(body)
+            del encoder.bodies[:]
+
+        end = f.tell()
+        f.seek(size_pos)
+        f.write(padded_varint(size))
+        f.write('l')
+        f.write(padded_varint(count))
+        f.seek(end)
+
+        bodies.seek(0)
+        shutil.copyfileobj(bodies, f)
+    finally:
+        bodies.close()
+
+
+def loads(data, lazy=False, source=None):
+    """Decodes a tree; *source* is the source.Source that the bodies of a
+    ``lazy`` parse are parsed from."""
+    magic, version = header.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('unsupported format')
+
+    decoder = Decoder(data, source)
+    pos = decoder.decode_schema(header.size)
+    size, pos = read_varint(data, pos)
+    decoder.bodies_offset = pos + size
+    if lazy and data[pos] == 'l':
+        return Statements(decoder, pos + 1)
+    else:
+        return decoder.decode(pos)[0]
+
+
+def dump(tree, f):
+    f.write(dumps(tree))
+
+
+def load(f, lazy=False, source=None):
+    return loads(f.read(), lazy, source)
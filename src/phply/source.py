@@ -0,0 +1,50 @@
+# ----------------------------------------------------------------------
+# source.py
+#
+# The text of the PHP files that the lazy bodies of a tree are parsed
+# from.
+# ----------------------------------------------------------------------
+
+import hashlib
+
+
+def digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+class Source(object):
+    """The text of a source file, for the bodies of a ``lazy`` parse.
+
+    The text is given, or read from *path* the first time a body is parsed;
+    the file must still have the SHA-1 digest *checksum* then.
+    """
+
+    def __init__(self, text=None, path=None, checksum=None):
+        self._text = text
+        self.path = path
+        self.checksum = checksum
+
+    @property
+    def text(self):
+        if self._text is None:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            if digest(data) != self.checksum:
+                raise IOError('%s has changed since it was parsed' % self.path)
+            self._text = data.decode('utf-8')
+
+        return self._text
+
+    def parse_body(self, start, end, lineno):
+        # The body is parsed as the block between its braces
+        from batch import new_parser, parse_error
+        lexer, parser = new_parser('full')
+        lexer.input(self.text)
+        lexer.begin('php')
+        lexer.lexpos = start - 1
+        lexer.lexlen = end + 1
+        lexer.lineno = lineno
+        try:
+            return parser.parse(lexer=lexer)[0].nodes
+        except SyntaxError as exc:
+            raise parse_error(exc, parser)
@@ -0,0 +1,128 @@
+# ----------------------------------------------------------------------
+# tables.py
+#
+# Persistent PLY tables for the PHP lexer and parser.
+#
+# Building the LALR automaton and the lexer's master regexes takes
+# seconds, so the generated tables are shipped next to this module and
+# reused as long as their signature matches the grammar.  When the
+# grammar (or PLY's table format) changes, they are rebuilt once and
+# written back; into a per-user cache directory if the package itself
+# is read-only.
+# ----------------------------------------------------------------------
+
+import os
+import imp
+import hashlib
+import ply.lex as lex
+import ply.yacc as yacc
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def cache_dir():
+    basedir = os.environ.get('XDG_CACHE_HOME')
+    if not basedir:
+        basedir = os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(basedir, 'phply')
+
+
+def table_dirs():
+    return [PACKAGE_DIR, cache_dir()]
+
+
+def writable_dir():
+    for dirname in table_dirs():
+        try:
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            if os.access(dirname, os.W_OK):
+                return dirname
+        except OSError:
+            pass
+
+    return None
+
+
+def load_table(name, is_valid):
+    for dirname in table_dirs():
+        path = os.path.join(dirname, name + '.py')
+        if not os.path.exists(path):
+            continue
+
+        try:
+            module = imp.load_source('phply.%s' % name, path)
+            if is_valid(module):
+                return module
+        except Exception:
+            pass
+
+    return None
+
+
+def lexer_signature(module):
+    parts = [repr(module.states)]
+
+    rules = [(name, getattr(module, name)) for name in dir(module) if name.startswith('t_')]
+    for name, rule in sorted(rules, key=_rule_order):
+        if callable(rule):
+            parts.append('%s:%s' % (name, rule.__doc__))
+        else:
+            parts.append('%s:%s' % (name, rule))
+
+    return hashlib.md5('\n'.join(parts)).hexdigest()
+
+
+def _rule_order(item):
+    name, rule = item
+    if callable(rule):
+        return (0, rule.__code__.co_firstlineno, name)
+    else:
+        return (1, 0, name)
+
+
+def build_lexer(module):
+    signature = lexer_signature(module)
+
+    def is_valid(table):
+        return (getattr(table, '_tabversion', None) == lex.__tabversion__ and
+                getattr(table, '_lexsignature', None) == signature)
+
+    lextab = load_table('lextab', is_valid)
+    if lextab:
+        return lex.lex(module=module, optimize=1, lextab=lextab)
+
+    lexer = lex.lex(module=module)
+    outputdir = writable_dir()
+    if outputdir:
+        try:
+            lexer.writetab('lextab', outputdir)
+            with open(os.path.join(outputdir, 'lextab.py'), 'a') as f:
+                f.write('_lexsignature = %r\n' % signature)
+        except IOError:
+            pass
+
+    return lexer
+
+
+def parser_signature(module):
+    pinfo = yacc.ParserReflect(vars(module))
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def build_parser(module):
+    signature = parser_signature(module)
+
+    def is_valid(table):
+        return (getattr(table, '_tabversion', None) == yacc.__tabversion__ and
+                getattr(table, '_lr_signature', None) == signature)
+
+    parsetab = load_table('parsetab', is_valid)
+    if parsetab:
+        return yacc.yacc(module=module, debug=0, tabmodule=parsetab, write_tables=0)
+
+    outputdir = writable_dir()
+    return yacc.yacc(module=module, debug=0, tabmodule='phply.parsetab',
+                     outputdir=outputdir, write_tables=outputdir is not None)
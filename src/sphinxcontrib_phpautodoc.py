@@ -6,36 +6,36 @@
     :copyright: Copyright 2013 by Takeshi KOMIYA
     :license: Apache 2.0, see LICENSE for details.
 """
+import io
 import os
 import re
-import codecs
-import pickle
+import sys
+from argparse import ArgumentParser
 from phply import phpast as ast
-from phply.phplex import lexer
-from phply.phpparse import parser
+from phply.batch import get_parser, parse  # NOQA: re-exported
+from phply.batch import LimitExceeded, Limits, ParseError, Prefetcher, load_file, parse_files
+from phply.batch import ENGINES, set_engine
+from phply.cache import DiskCache, MemoryCache
 from docutils import nodes
 from docutils.parsers import rst
 from docutils.parsers.rst import Directive
 from docutils.statemachine import ViewList
 
 
-def is_comment(node):
-    if isinstance(node, ast.Comment) and node.text[0:3] == '/**':
-        return True
-    else:
-        return False
+memory_cache = MemoryCache(128 * 1024 * 1024)
+prefetcher = Prefetcher()
 
 
-def is_private_comment(comment):
-    if is_comment(comment):
-        return re.search('@access\s+private', comment.text)
+def is_private_comment(doc):
+    if doc:
+        return re.search('@access\s+private', doc)
     else:
         return False
 
 
-def comment2lines(node):
+def comment2lines(doc):
     comments = []
-    for line in node.text.splitlines():
+    for line in doc.splitlines():
         if re.match('^\s*/?\*{1,2} ?', line):  # starts with '/**' or '/*' or '*' ?
             line = re.sub('\s*\*/.*$', '', line)  # remove '*/' of tail
             line = re.sub('^\s*/?\*{1,2} ?', '', line)  # remove '/**' or '/*' or '*' of top
@@ -74,44 +74,45 @@ def to_s(node):
     return ret
 
 
-def is_same_mtime(path1, path2):
-    try:
-        mtime1 = os.stat(path1).st_mtime
-        mtime2 = os.stat(path2).st_mtime
+class AutodocCache(object):
+    def parse_code(self, filename, mode=None):
+        if mode is None:
+            mode = self.state.document.settings.env.config.phpautodoc_parse_mode
 
-        return mtime1 == mtime2
-    except Exception:
-        return False
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        identity = (stat.st_size, stat.st_mtime, mode)
 
+        tree = memory_cache.get(path, identity)
+        if tree is None:
+            prefetcher.wait(path, mode)
+            try:
+                tree = self.load_code(filename, mode)
+            except ParseError as exc:
+                tree = exc
+            memory_cache.put(path, identity, tree)
 
-def basename(path, ext=None):
-    filename = os.path.basename(path)
-    if ext:
-        basename, _ext = os.path.splitext(filename)
-        filename = "%s.%s" % (basename, ext)
+        if isinstance(tree, ParseError):
+            raise tree
 
-    return filename
+        return tree
 
+    def load_code(self, filename, mode):
+        env = self.state.document.settings.env
+        cache = disk_cache(env.doctreedir, env.srcdir, mode,
+                           env.config.phpautodoc_incremental_parse)
+        return load_file(filename, cache, mode, parse_limits(env.config),
+                         env.config.phpautodoc_parse_workers)
 
-class AutodocCache(object):
-    def parse_code(self, filename):
-        basedir = self.state.document.settings.env.doctreedir
-        cachename = os.path.join(basedir, basename(filename, 'parse'))
-        if is_same_mtime(filename, cachename):
-            tree = pickle.load(open(cachename, 'rb'))
-        else:
-            try:
-                with codecs.open(filename, 'r', 'utf-8') as f:
-                    tree = parser.parse(f.read(), lexer=lexer.clone())
 
-                with open(cachename, 'wb') as f:
-                    pickle.dump(tree, f)
-                mtime = os.stat(filename).st_mtime
-                os.utime(cachename, (mtime, mtime))
-            except Exception:
-                raise
+def disk_cache(doctreedir, srcdir, mode, incremental=False):
+    return DiskCache(os.path.join(doctreedir, 'phpautodoc', mode), srcdir, incremental)
 
-        return tree
+
+def parse_limits(config):
+    return Limits(config.phpautodoc_max_source_size,
+                  config.phpautodoc_parse_timeout,
+                  config.phpautodoc_max_nodes)
 
 
 class PHPDocWriter(Directive):
@@ -135,15 +136,15 @@ class PHPDocWriter(Directive):
         self.add_line(u'.. %s:%s:: %s' % (domain, directive, name), indent_level)
         self.add_line('')
 
-    def add_directive(self, directive, name, comment_node, indent_level=0, force=False):
-        if is_private_comment(comment_node):
+    def add_directive(self, directive, name, doc, indent_level=0, force=False):
+        if is_private_comment(doc):
             if force is True:
                 self.add_directive_header(directive, name, indent_level)
-        elif is_comment(comment_node) or 'undoc-members' in self.options or force is True:
+        elif doc or 'undoc-members' in self.options or force is True:
             self.add_directive_header(directive, name, indent_level)
 
-            if is_comment(comment_node):
-                for line in comment2lines(comment_node):
+            if doc:
+                for line in comment2lines(doc):
                     self.add_line(line, indent_level + 1)
                 self.add_line('')
 
@@ -170,49 +171,75 @@ class PHPAutodocDirectiveBase(PHPDocWriter, AutodocCache):
             msg = '%s cannot read source code: %s' % (self.directive_name, self.options['filename'])
             return [self.state.document.reporter.warning(msg, line=self.lineno)]
 
-        try:
-            tree = self.parse_code(filename)
-            self.traverse(tree)
-            self.state.document.settings.env.note_dependency(filename)
+        # Recorded even if the file fails to parse, so that fixing it
+        # rebuilds the document
+        self.state.document.settings.env.note_dependency(filename)
 
-            if self.content:
-                for line in self.content:
-                    self.add_line(line, 1)
+        messages = []
+        tree = self.parse_or_report(filename, None, messages)
+        if tree is None:
+            return messages
 
-                self.add_line('')
+        self.traverse(tree)
+
+        if self.content:
+            for line in self.content:
+                self.add_line(line, 1)
 
             self.add_line('')
 
-            node = nodes.paragraph()
-            node.document = self.state.document
-            self.state.nested_parse(self.result, 0, node)
+        self.add_line('')
+
+        node = nodes.paragraph()
+        node.document = self.state.document
+        self.state.nested_parse(self.result, 0, node)
+
+        return messages + node.children
 
-            return node.children
-        except SyntaxError as exc:
+    def parse_or_report(self, filename, mode, messages):
+        """Returns the tree to render, or None; problems are appended to
+        *messages* as warnings."""
+        config = self.state.document.settings.env.config
+        mode = mode or config.phpautodoc_parse_mode
+        try:
+            return self.parse_code(filename, mode)
+        except LimitExceeded as exc:
+            msg = 'phpautodoc parse limit exceeded [%s]: %s' % (filename, exc)
+            fallback = config.phpautodoc_limit_fallback and mode == 'full'
+            if fallback:
+                msg += '; rendering declarations only'
+
+            messages.append(self.state_machine.reporter.warning(msg, line=self.lineno))
+            if fallback:
+                return self.parse_or_report(filename, 'declarations', messages)
+        except ParseError as exc:
             msg = 'phpautodoc parse error [%s]: %s' % (filename, exc)
-            return [self.state_machine.reporter.warning(msg, line=self.lineno)]
+            messages.append(self.state_machine.reporter.warning(msg, line=self.lineno))
+            if config.phpautodoc_partial_parse:
+                return exc.tree
+
+        return None
 
     def traverse(self, tree, indent=0):
         pass
 
     def traverse_all(self, tree, indent=0):
-        last_node = None
         for node in tree:
             if isinstance(node, ast.Function):
-                self.add_directive('function', to_s(node), last_node, indent)
+                self.add_directive('function', to_s(node), node.doc, indent)
             elif isinstance(node, ast.Class):
-                if is_private_comment(last_node):
+                if is_private_comment(node.doc):
                     pass
                 else:
-                    self.add_directive('class', node.name, last_node, indent)
+                    self.add_directive('class', node.name, node.doc, indent)
 
                     if 'members' in self.options:
                         self.traverse_all(node.nodes, indent + 1)
             elif isinstance(node, ast.Interface):
-                if is_private_comment(last_node):
+                if is_private_comment(node.doc):
                     pass
                 else:
-                    self.add_directive('interface', node.name, last_node, indent)
+                    self.add_directive('interface', node.name, node.doc, indent)
 
                     if 'members' in self.options:
                         self.traverse_all(node.nodes, indent + 1)
@@ -220,15 +247,13 @@ class PHPAutodocDirectiveBase(PHPDocWriter, AutodocCache):
                 if 'protected' in node.modifiers or 'private' in node.modifiers:
                     pass
                 else:
-                    self.add_directive('method', to_s(node), last_node, indent)
+                    self.add_directive('method', to_s(node), node.doc, indent)
             elif isinstance(node, ast.ClassVariables):
                 if 'protected' in node.modifiers or 'private' in node.modifiers:
                     pass
                 else:
                     for variable in node.nodes:
-                        self.add_directive('attr', variable.name, last_node, indent)
-
-            last_node = node
+                        self.add_directive('attr', variable.name, node.doc, indent)
 
 
 class PHPAutoModuleDirective(PHPAutodocDirectiveBase):
@@ -248,21 +273,18 @@ class PHPAutoClassDirective(PHPAutodocDirectiveBase):
         return super(PHPAutoClassDirective, self).run()
 
     def traverse(self, tree, indent=0):
-        last_node = None
         for node in tree:
             if isinstance(node, ast.Class) and node.name in self.targets:
-                self.add_directive('class', node.name, last_node, indent, force=True)
+                self.add_directive('class', node.name, node.doc, indent, force=True)
 
                 if 'members' in self.options:
                     self.traverse_all(node.nodes, indent + 1)
             elif isinstance(node, ast.Interface) and node.name in self.targets:
-                self.add_directive('interface', node.name, last_node, indent, force=True)
+                self.add_directive('interface', node.name, node.doc, indent, force=True)
 
                 if 'members' in self.options:
                     self.traverse_all(node.nodes, indent + 1)
 
-            last_node = node
-
 
 class PHPAutoFunctionDirective(PHPAutodocDirectiveBase):
     has_content = True
@@ -278,18 +300,135 @@ class PHPAutoFunctionDirective(PHPAutodocDirectiveBase):
         return super(PHPAutoFunctionDirective, self).run()
 
     def traverse(self, tree, indent=0):
-        last_node = None
         for node in tree:
             if isinstance(node, ast.Function) and node.name in self.targets:
-                self.add_directive('function', to_s(node), last_node, indent, force=True)
+                self.add_directive('function', to_s(node), node.doc, indent, force=True)
                 break
 
-            last_node = node
+
+def on_builder_inited(app):
+    prefetcher.max_workers = app.config.phpautodoc_prefetch_workers
+    memory_cache.budget = app.config.phpautodoc_memory_cache_size
+    memory_cache.shrink()
+    set_engine(app.config.phpautodoc_parse_engine)
+
+
+directive_re = re.compile(r'^[ \t]*\.\.[ \t]+phpauto(?:module|class|function)::.*'
+                          r'((?:\n[ \t]+:[\w-]+:.*)*)', re.M)
+filename_re = re.compile(r':filename:[ \t]*(.*?)[ \t]*$', re.M)
+
+
+def find_references(env, docnames):
+    """Yields the :filename: of every directive in the documents."""
+    for docname in docnames:
+        try:
+            with io.open(env.doc2path(docname), encoding=env.config.source_encoding,
+                         errors='replace') as f:
+                source = f.read()
+        except (IOError, OSError):
+            continue
+
+        for options in directive_re.findall(source):
+            for filename in filename_re.findall(options):
+                yield filename
+
+
+def on_env_before_read_docs(app, env, docnames):
+    # Parallel readers are forked and do not wait for the prefetcher, so
+    # they would parse the same files again while it is busy
+    if app.config.phpautodoc_prefetch_workers == 0 or getattr(app, 'parallel', 0) > 1:
+        return
+
+    mode = app.config.phpautodoc_parse_mode
+    cache = disk_cache(env.doctreedir, env.srcdir, mode, app.config.phpautodoc_incremental_parse)
+    limits = parse_limits(app.config)
+    for filename in set(find_references(env, docnames)):
+        path = os.path.abspath(os.path.join(env.srcdir, filename))
+        if os.path.isfile(path):
+            prefetcher.submit(path, cache, mode, limits, app.config.phpautodoc_parse_workers)
+
+
+def on_build_finished(app, exception):
+    prefetcher.shutdown()
+    memory_cache.clear()
 
 
 def setup(app):
+    app.add_config_value('phpautodoc_memory_cache_size', 128 * 1024 * 1024, '')
+    app.add_config_value('phpautodoc_parse_mode', 'declarations', 'env')
+    app.add_config_value('phpautodoc_prefetch_workers', 0, '')
+    app.add_config_value('phpautodoc_partial_parse', False, 'env')
+    app.add_config_value('phpautodoc_max_source_size', None, 'env')
+    app.add_config_value('phpautodoc_parse_timeout', None, 'env')
+    app.add_config_value('phpautodoc_max_nodes', None, 'env')
+    app.add_config_value('phpautodoc_limit_fallback', True, 'env')
+    app.add_config_value('phpautodoc_parse_workers', 0, '')
+    app.add_config_value('phpautodoc_incremental_parse', False, '')
+    app.add_config_value('phpautodoc_parse_engine', 'ply', '')
+    app.connect('builder-inited', on_builder_inited)
+    app.connect('env-before-read-docs', on_env_before_read_docs)
+    app.connect('build-finished', on_build_finished)
+
     classes = [PHPAutoModuleDirective,
                PHPAutoClassDirective,
                PHPAutoFunctionDirective]
     for cls in classes:
         app.add_directive(cls.directive_name, cls)
+
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
+
+
+def find_sources(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                for filename in sorted(files):
+                    if filename.endswith('.php'):
+                        yield os.path.abspath(os.path.join(root, filename))
+        else:
+            yield os.path.abspath(path)
+
+
+def prewarm_main(argv=None):
+    """Parses PHP sources into the cache of a Sphinx build ahead of time."""
+    parser = ArgumentParser(prog='phpautodoc-prewarm',
+                            description='Parse PHP sources into the phpautodoc cache '
+                                        'before running sphinx-build.')
+    parser.add_argument('srcdir', help='source directory of the documents')
+    parser.add_argument('doctreedir', help='doctree directory of the build (e.g. _build/doctrees)')
+    parser.add_argument('paths', nargs='*',
+                        help='PHP files or directories to parse (default: srcdir)')
+    parser.add_argument('-m', '--mode', default='declarations',
+                        choices=('declarations', 'lazy', 'full'),
+                        help='phpautodoc_parse_mode of the build (default: declarations)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--max-size', type=int, default=None,
+                        help='phpautodoc_max_source_size of the build')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='phpautodoc_parse_timeout of the build')
+    parser.add_argument('--max-nodes', type=int, default=None,
+                        help='phpautodoc_max_nodes of the build')
+    parser.add_argument('--incremental', action='store_true',
+                        help='store the spans for phpautodoc_incremental_parse')
+    parser.add_argument('--engine', default='ply', choices=ENGINES,
+                        help='phpautodoc_parse_engine of the build (default: ply)')
+    args = parser.parse_args(argv)
+
+    set_engine(args.engine)
+
+    cache = disk_cache(os.path.abspath(args.doctreedir), os.path.abspath(args.srcdir), args.mode,
+                       args.incremental)
+    sources = find_sources(args.paths or [args.srcdir])
+
+    failures = 0
+    limits = Limits(args.max_size, args.timeout, args.max_nodes)
+    for path, error in parse_files(sources, cache, args.mode, args.jobs, limits):
+        if error:
+            failures += 1
+            sys.stderr.write('%s: %s\n' % (path, error))
+
+    return 1 if failures else 0
@@ -0,0 +1,22 @@
+<?php
+
+/**
+ * Greets the world.
+ */
+function doc_hello() {
+    echo "hello";
+}
+
+/**
+ * A class that is not finished yet.
+ */
+class Partial {
+    /**
+     * Finished method.
+     */
+    public function finished() {
+    }
+
+    public function unfinished( {
+    }
+}
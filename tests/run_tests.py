@@ -5,6 +5,7 @@ import re
 import sys
 import shutil
 import unittest
+from contextlib import contextmanager
 from cStringIO import StringIO
 from mock import Mock, patch
 from tempfile import mkdtemp
@@ -13,14 +14,55 @@ from docutils.frontend import OptionParser
 from docutils.utils import new_document
 from sphinx.application import Sphinx
 from sphinx.config import Config
+from sphinx.events import EventManager
 import sphinxcontrib_phpautodoc as phpautodoc
 
 TESTDIR = os.path.dirname(__file__)
+SAMPLES = ('class.php', 'function.php', 'interface.php', 'arguments.php')
+
+
+def read_inputs(names=SAMPLES):
+    return [open(os.path.join(TESTDIR, 'inputs', name)).read().decode('utf-8') for name in names]
+
+
+@contextmanager
+def disk_cache(srcdir=None):
+    # A DiskCache in a temporary directory, for the files of srcdir or of
+    # that directory itself
+    from phply.cache import DiskCache
+    tmpdir = mkdtemp()
+    try:
+        yield tmpdir, DiskCache(os.path.join(tmpdir, '_cache'), srcdir or tmpdir)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def load_twice(path, cache, *args, **kwargs):
+    # The trees of the file as parsed, then as cached
+    from phply.batch import load_file
+    return [load_file(path, cache, *args, **kwargs) for _ in range(2)]
+
+
+def linenos(tree):
+    # The line numbers of every node of the tree, in order
+    result = []
+    for node in tree:
+        node.accept(lambda n: result.append(n.lineno))
+    return result
+
+
+class EngineTestCase(unittest.TestCase):
+    # Restores the default engine and positions after each test
+    def tearDown(self):
+        from phply.batch import set_engine, set_positions
+        set_engine('ply')
+        set_positions(False)
 
 
 class FakeSphinx(Sphinx):
     def __init__(self):
         self.config = Config(None, None, {}, None)
+        self.events = EventManager()
         self.verbosity = 0
         self._setting_up_extension = ['']
 
@@ -32,12 +74,13 @@ class TestPHPAutodoc(unittest.TestCase):
         self.settings.tab_width = 8
         self.settings.pep_references = False
         self.settings.rfc_references = False
-        self.settings.env = Mock(srcdir=os.path.dirname(__file__),
-                                 doctreedir=mkdtemp())
-
         self.app = FakeSphinx()
         phpautodoc.setup(self.app)
 
+        self.settings.env = Mock(srcdir=os.path.dirname(__file__),
+                                 doctreedir=mkdtemp(),
+                                 config=self.app.config)
+
     def tearDown(self):
         shutil.rmtree(self.settings.env.doctreedir)
 
@@ -52,10 +95,69 @@ class TestPHPAutodoc(unittest.TestCase):
         finally:
             sys.stderr = orig_stderr
 
+    @patch("sphinxcontrib_phpautodoc.ViewList")
+    def test_partial_parse(self, ViewList):
+        src = ".. phpautomodule::\n   :filename: inputs/partial_syntax_error.php\n   :members:\n"
+        self.app.config.phpautodoc_partial_parse = True
+        try:
+            orig_stderr = sys.stderr
+            sys.stderr = StringIO()
+
+            doc = new_document('<test>', self.settings)
+            self.parser.parse(src, doc)
+            self.assertIn('parse error', sys.stderr.getvalue())
+        finally:
+            sys.stderr = orig_stderr
+
+        results = [args[0][0] for args in ViewList().append.call_args_list]
+        self.assertIn(u'.. php:function:: doc_hello()', results)
+        self.assertIn(u'.. php:class:: Partial', results)
+        self.assertIn(u'   .. php:method:: finished()', results)
+
+    @patch("sphinxcontrib_phpautodoc.ViewList")
+    def test_limit_fallback(self, ViewList):
+        path = os.path.join(self.settings.env.doctreedir, 'heavy.php')
+        with open(path, 'wb') as f:
+            f.write('<?php\n/** doc */\nfunction heavy() { %s }\n' % ('$a = array(1, 2, 3);' * 100))
+
+        self.app.config.phpautodoc_parse_mode = 'full'
+        self.app.config.phpautodoc_max_nodes = 50
+        try:
+            orig_stderr = sys.stderr
+            sys.stderr = StringIO()
+
+            doc = new_document('<test>', self.settings)
+            self.parser.parse(".. phpautomodule::\n   :filename: %s\n" % path, doc)
+            self.assertIn('node count limit exceeded', sys.stderr.getvalue())
+        finally:
+            sys.stderr = orig_stderr
+
+        results = [args[0][0] for args in ViewList().append.call_args_list]
+        self.assertIn(u'.. php:function:: heavy()', results)
+
+    @patch('phply.batch.STREAM_SIZE', 0)
+    @patch("sphinxcontrib_phpautodoc.ViewList")
+    def test_streamed(self, ViewList):
+        doc = new_document('<test>', self.settings)
+        src = open(os.path.join(TESTDIR, 'inputs', 'phpautomodule', 'class_members.rst')).read()
+        self.parser.parse(src, doc)
+
+        results = "\n".join(args[0][0] for args in ViewList().append.call_args_list)
+        expected = open(os.path.join(TESTDIR, 'outputs', 'phpautomodule', 'class_members.rst')).read()
+        self.assertEqual(expected, results)
+
+    def test_parallel_safe(self):
+        metadata = phpautodoc.setup(FakeSphinx())
+        self.assertTrue(metadata['parallel_read_safe'])
+        self.assertTrue(metadata['parallel_write_safe'])
+
     @classmethod
-    def append(cls, name):
+    def append(cls, name, parse_mode=None):
         @patch("sphinxcontrib_phpautodoc.ViewList")
         def testcase(self, ViewList):
+            if parse_mode:
+                self.app.config.phpautodoc_parse_mode = parse_mode
+
             doc = new_document('<test>', self.settings)
             src = open(os.path.join(TESTDIR, 'inputs', name)).read()
             self.parser.parse(src, doc)
@@ -65,10 +167,922 @@ class TestPHPAutodoc(unittest.TestCase):
             self.assertEqual(results, expected)
 
         funcname = "test_%s" % re.sub('[\.\-/]', '_', name, re.M)
+        if parse_mode:
+            funcname += "_%s" % parse_mode
         testcase.__name__ = funcname
         setattr(cls, funcname, testcase)
 
 
+class TestPLYTables(unittest.TestCase):
+    def test_tables_are_up_to_date(self):
+        from phply import phplex, phpparse, tables
+        lextab = tables.load_table('lextab', lambda table: True)
+        parsetab = tables.load_table('parsetab', lambda table: True)
+
+        self.assertEqual(tables.lexer_signature(phplex), lextab._lexsignature)
+        self.assertEqual(tables.parser_signature(phpparse), parsetab._lr_signature)
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_identity(self):
+        from phply.cache import MemoryCache
+        cache = MemoryCache(1024 * 1024)
+        tree = [phpautodoc.ast.Comment('/** doc */')]
+        cache.put('/path/to/foo.php', (10, 1.0), tree)
+
+        self.assertIs(tree, cache.get('/path/to/foo.php', (10, 1.0)))
+        self.assertIsNone(cache.get('/path/to/foo.php', (11, 2.0)))
+        self.assertIsNone(cache.get('/path/to/foo.php', (10, 1.0)))
+        self.assertEqual(0, cache.size)
+
+    def test_eviction(self):
+        from phply.cache import MemoryCache, sizeof
+        tree = [phpautodoc.ast.Comment('/** doc */')]
+        cache = MemoryCache(sizeof(tree) * 2)
+        cache.put('/path/to/foo.php', 1, tree)
+        cache.put('/path/to/bar.php', 1, tree)
+        cache.get('/path/to/foo.php', 1)
+        cache.put('/path/to/baz.php', 1, tree)
+
+        self.assertEqual(['/path/to/foo.php', '/path/to/baz.php'], list(cache.entries))
+        self.assertLessEqual(cache.size, cache.budget)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        from phply.cache import DiskCache
+        self.srcdir = mkdtemp()
+        self.cache = DiskCache(os.path.join(self.srcdir, '_cache'), self.srcdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+
+    def write(self, relpath, content):
+        path = os.path.join(self.srcdir, relpath)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        return path
+
+    def store(self, path, tree):
+        from phply.cache import digest
+        with open(path, 'rb') as f:
+            self.cache.store(path, tree, os.stat(path), digest(f.read()))
+
+    def test_same_basename(self):
+        path1 = self.write('app/Models/User.php', '<?php class User {}')
+        path2 = self.write('lib/Legacy/User.php', '<?php class User {}')
+        self.store(path1, ['app'])
+        self.store(path2, ['lib'])
+
+        self.assertEqual(['app'], self.cache.load(path1))
+        self.assertEqual(['lib'], self.cache.load(path2))
+
+    def test_touched(self):
+        path = self.write('User.php', '<?php class User {}')
+        self.store(path, ['User'])
+        os.utime(path, (0, 0))
+        self.assertEqual(['User'], self.cache.load(path))
+
+        self.write('User.php', '<?php class Resu {}')
+        self.assertIsNone(self.cache.load(path))
+
+    def test_overwrite(self):
+        path = self.write('User.php', '<?php class User {}')
+        self.store(path, ['User'])
+        self.store(path, ['Resu'])
+
+        self.assertEqual(['Resu'], self.cache.load(path))
+        self.assertEqual(1, len(os.listdir(self.cache.cachedir)))
+
+    def test_previous(self):
+        from phply.cache import digest
+        path = self.write('User.php', '<?php class User {}')
+        with open(path, 'rb') as f:
+            self.cache.store(path, ['User'], os.stat(path), digest(f.read()), [(0, 19, 1, 1, 'x')])
+        self.assertEqual(['User'], self.cache.load(path))
+
+        self.write('User.php', '<?php class Resu {}')
+        self.assertIsNone(self.cache.load(path))
+        self.assertEqual((['User'], [(0, 19, 1, 1, 'x')]), self.cache.previous(path))
+
+        self.store(path, ['Resu'])
+        self.assertIsNone(self.cache.previous(path))
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        from phply.cache import DiskCache
+        self.srcdir = mkdtemp()
+        self.cache = DiskCache(os.path.join(self.srcdir, '_cache'), self.srcdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+
+    def test_parse_files(self):
+        from phply.batch import parse_files
+        paths = []
+        for name in ('class.php', 'function.php', 'syntax_error.php'):
+            paths.append(os.path.join(self.srcdir, name))
+            shutil.copy(os.path.join(TESTDIR, 'inputs', name), paths[-1])
+
+        results = dict(parse_files(paths, self.cache, 'declarations', 2))
+        self.assertEqual(set(paths), set(results))
+        self.assertIsNone(results[paths[0]])
+        self.assertIsNone(results[paths[1]])
+        self.assertIsInstance(results[paths[2]], SyntaxError)
+
+        source = open(paths[0]).read().decode('utf-8')
+        self.assertEqual(phpautodoc.parse(source, 'declarations'), self.cache.load(paths[0]))
+        self.assertIn(paths[2], self.cache)
+
+
+class TestParseError(unittest.TestCase):
+    def setUp(self):
+        from phply.cache import DiskCache
+        self.srcdir = mkdtemp()
+        self.cache = DiskCache(os.path.join(self.srcdir, '_cache'), self.srcdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+
+    def test_partial_tree(self):
+        source = '<?php function a() {}\nnamespace N { /** doc */ class B { function m() {} public $x = ; } }'
+        with self.assertRaises(phpautodoc.ParseError) as cm:
+            phpautodoc.parse(source, 'declarations')
+
+        self.assertEqual(2, cm.exception.lineno)
+        tree = cm.exception.tree
+        self.assertEqual(['Function', 'Namespace'], [node.__class__.__name__ for node in tree])
+        cls = tree[1].nodes[0]
+        self.assertEqual(('B', '/** doc */'), (cls.name, cls.doc))
+        self.assertEqual(['m'], [node.name for node in cls.nodes])
+
+    def test_nested_class(self):
+        # A class open inside a function body is not a top-level block
+        source = ('<?php function a() {}\n'
+                  'function f() { if (1) { class X { function m() {} function n( { } } }')
+        for mode in ('full', 'declarations'):
+            with self.assertRaises(phpautodoc.ParseError) as cm:
+                phpautodoc.parse(source, mode)
+            self.assertEqual(['a'], [node.name for node in cm.exception.tree])
+
+    def test_negative_cache(self):
+        from phply.batch import load_file
+        path = os.path.join(self.srcdir, 'broken.php')
+        with open(path, 'wb') as f:
+            f.write('<?php function a() {}\nfunction b( {}')
+
+        with self.assertRaises(phpautodoc.ParseError):
+            load_file(path, self.cache)
+
+        with patch('phply.batch.parse') as parse:
+            with self.assertRaises(phpautodoc.ParseError) as cm:
+                load_file(path, self.cache)
+            self.assertFalse(parse.called)
+        self.assertEqual((2, ['a']), (cm.exception.lineno, [node.name for node in cm.exception.tree]))
+
+        with open(path, 'wb') as f:
+            f.write('<?php function a() {}\nfunction b() {}')
+        self.assertEqual(['a', 'b'], [node.name for node in load_file(path, self.cache)])
+
+    @patch('phply.batch.STREAM_SIZE', 0)
+    def test_streamed_partial_tree(self):
+        # The statements yielded before the error are part of the tree
+        from phply.batch import load_file
+        path = os.path.join(self.srcdir, 'broken.php')
+        with open(path, 'wb') as f:
+            f.write('<?php a();\nb();\nclass C {}\nfunction d( {')
+
+        for _ in range(2):  # parsed, then cached
+            with self.assertRaises(phpautodoc.ParseError) as cm:
+                load_file(path, self.cache)
+            tree = cm.exception.tree
+            self.assertEqual(['a', 'b', 'C'], [getattr(node, 'name', None) for node in tree])
+
+
+class TestLimits(unittest.TestCase):
+    def setUp(self):
+        from phply.cache import DiskCache
+        self.srcdir = mkdtemp()
+        self.cache = DiskCache(os.path.join(self.srcdir, '_cache'), self.srcdir)
+        self.path = os.path.join(self.srcdir, 'heavy.php')
+        with open(self.path, 'wb') as f:
+            f.write('<?php\n' + '$a = array(1, 2, 3);\n' * 100)
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+
+    def test_max_size(self):
+        from phply.batch import Limits, load_file
+        with self.assertRaises(phpautodoc.LimitExceeded):
+            load_file(self.path, self.cache, limits=Limits(max_size=1000))
+        self.assertEqual(100, len(load_file(self.path, self.cache, limits=Limits(max_size=10000))))
+
+    def test_max_nodes(self):
+        from phply.batch import Limits, load_file
+        with self.assertRaises(phpautodoc.LimitExceeded):
+            load_file(self.path, self.cache, limits=Limits(max_nodes=100))
+
+        with patch('phply.batch.parse_isolated') as parse_isolated:
+            with self.assertRaises(phpautodoc.LimitExceeded):
+                load_file(self.path, self.cache, limits=Limits(max_nodes=100))
+            self.assertFalse(parse_isolated.called)
+
+        self.assertEqual(100, len(load_file(self.path, self.cache, limits=Limits(max_nodes=1000))))
+
+    def test_timeout(self):
+        import time
+        from phply.batch import Limits, load_file
+        with patch('phply.batch.parse', side_effect=lambda *args: time.sleep(60)):
+            started = time.time()
+            with self.assertRaises(phpautodoc.LimitExceeded) as cm:
+                load_file(self.path, self.cache, limits=Limits(timeout=0.5))
+
+        self.assertLess(time.time() - started, 10)
+        self.assertIn('time limit', str(cm.exception))
+
+    def test_timeout_while_storing(self):
+        import time
+        from phply import serialize
+        from phply.batch import Limits, load_file
+
+        parent = os.getpid()
+        real_dump = serialize.dump
+
+        def dump(tree, f):
+            # The worker hangs midway through writing its entry
+            if os.getpid() == parent:
+                return real_dump(tree, f)
+            f.write('partial')
+            f.flush()
+            time.sleep(60)
+
+        with patch('phply.serialize.dump', side_effect=dump):
+            with self.assertRaises(phpautodoc.LimitExceeded):
+                load_file(self.path, self.cache, limits=Limits(timeout=1))
+
+        # the entry of the limit failure is all that is left
+        self.assertEqual(1, len(os.listdir(self.cache.cachedir)))
+        self.assertFalse([name for name in os.listdir(self.cache.cachedir) if name.endswith('.tmp')])
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.app = FakeSphinx()
+        phpautodoc.setup(self.app)
+        self.app.config.phpautodoc_prefetch_workers = 1
+        phpautodoc.on_builder_inited(self.app)
+
+        self.env = Mock(srcdir=TESTDIR,
+                        doctreedir=mkdtemp(),
+                        config=self.app.config,
+                        doc2path=lambda docname: os.path.join(TESTDIR, docname + '.rst'))
+
+    def tearDown(self):
+        phpautodoc.on_build_finished(self.app, None)
+        shutil.rmtree(self.env.doctreedir)
+
+    def test_find_references(self):
+        docnames = ['inputs/phpautomodule/class_basic', 'inputs/phpautoclass/class_members_and_content', 'missing']
+        self.assertEqual(['inputs/class.php', 'inputs/class.php'],
+                         list(phpautodoc.find_references(self.env, docnames)))
+
+    def test_prefetch(self):
+        docnames = ['inputs/phpautomodule/class_basic', 'inputs/phpautofunction/function_basic']
+        phpautodoc.on_env_before_read_docs(self.app, self.env, docnames)
+
+        paths = [os.path.join(TESTDIR, 'inputs', name) for name in ('class.php', 'function.php')]
+        prefetcher = phpautodoc.prefetcher
+        self.assertEqual(set((path, 'declarations') for path in paths), set(prefetcher.pending))
+
+        cache = phpautodoc.disk_cache(self.env.doctreedir, TESTDIR, 'declarations')
+        for path in paths:
+            prefetcher.wait(path, 'declarations')
+            self.assertIn(path, cache)
+        self.assertEqual({}, prefetcher.pending)
+
+    def test_opt_in(self):
+        docnames = ['inputs/phpautomodule/class_basic']
+        self.app.parallel = 2
+        phpautodoc.on_env_before_read_docs(self.app, self.env, docnames)
+        self.assertEqual({}, phpautodoc.prefetcher.pending)
+
+        app = FakeSphinx()
+        phpautodoc.setup(app)
+        self.assertEqual(0, app.config.phpautodoc_prefetch_workers)
+        phpautodoc.on_env_before_read_docs(app, self.env, docnames)
+        self.assertEqual({}, phpautodoc.prefetcher.pending)
+
+
+class TestPHPAST(unittest.TestCase):
+    def test_node(self):
+        import pickle
+        ast = phpautodoc.ast
+        node = ast.Function('foo', [], [ast.Return(1, lineno=2)], False, lineno=1)
+
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertEqual(('foo', [], False, 1), (node.name, node.params, node.is_ref, node.lineno))
+        self.assertEqual(node, pickle.loads(pickle.dumps(node)))
+        self.assertEqual(2, pickle.loads(pickle.dumps(node, 0)).nodes[0].lineno)
+
+
+class TestSerialize(unittest.TestCase):
+    def parse(self, filename):
+        lexer, parser = phpautodoc.get_parser()
+        with open(os.path.join(TESTDIR, 'inputs', filename)) as f:
+            return parser.parse(f.read().decode('utf-8'), lexer=lexer.clone())
+
+    def test_roundtrip(self):
+        from phply import serialize
+        for filename in os.listdir(os.path.join(TESTDIR, 'inputs')):
+            if filename.endswith('.php') and not filename.endswith('syntax_error.php'):
+                tree = self.parse(filename)
+                self.assertEqual(tree, serialize.loads(serialize.dumps(tree)))
+
+    def test_dump_iter(self):
+        from phply import serialize
+        tree = self.parse('class.php') + self.parse('function.php')
+        out = StringIO()
+        serialize.dump_iter(iter(tree), out)
+
+        self.assertEqual(tree, serialize.loads(out.getvalue()))
+        self.assertEqual(tree, list(serialize.loads(out.getvalue(), lazy=True)))
+
+    def test_deferred_bodies(self):
+        from phply import serialize
+        source = "<?php function foo() { return 1 + 2; }"
+        lexer, parser = phpautodoc.get_parser()
+        tree = serialize.loads(serialize.dumps(parser.parse(source, lexer=lexer.clone())))
+
+        self.assertIsInstance(tree[0]._nodes, phpautodoc.ast.Deferred)
+        self.assertEqual('foo', tree[0].name)
+        self.assertEqual(('Return', {'node': ('BinaryOp', {'op': '+', 'left': 1, 'right': 2})}),
+                         tree[0].nodes[0].generic())
+
+    def test_doc(self):
+        # doc is not a field: it is kept apart from equality and generic()
+        import pickle
+        from phply import serialize
+        source = "<?php /** f */ function f() {} class A { /** m */ function m() {} }"
+        lexer, parser = phpautodoc.get_parser()
+        tree = parser.parse(source, lexer=lexer.clone())
+        undocumented = parser.parse(source.replace('/** f */', '').replace('/** m */', ''),
+                                    lexer=lexer.clone())
+
+        self.assertEqual(undocumented, tree)
+        self.assertEqual(undocumented[0].generic(), tree[0].generic())
+        self.assertEqual(repr(undocumented), repr(tree))
+        for copied in (serialize.loads(serialize.dumps(tree)), pickle.loads(pickle.dumps(tree, 2))):
+            self.assertEqual(('/** f */', '/** m */'), (copied[0].doc, copied[1].nodes[0].doc))
+
+
+class TestIterParse(unittest.TestCase):
+    def test_same_statements(self):
+        from phply.batch import iterparse
+        sources = read_inputs()
+        sources += [u'<?php /** a */ /** b */ function f() {} /** c */',
+                    u'<?php namespace A { /** x */ class B {} } /** d */ $x = 1; /** e */ function g() {}',
+                    u'html <?php echo 1; ?> tail', u'']
+        for source in sources:
+            self.assertEqual(phpautodoc.parse(source), list(iterparse(source)))
+
+    def test_streamed(self):
+        from phply.batch import iterparse
+        statements = iterparse(u'<?php /** doc */ function f() {} function g() {} $x = ;')
+        first = next(statements)
+        self.assertEqual(('f', '/** doc */'), (first.name, first.doc))
+        self.assertEqual('g', next(statements).name)
+        with self.assertRaises(phpautodoc.ParseError):
+            next(statements)
+
+    @patch('phply.batch.STREAM_SIZE', 0)
+    def test_load_file(self):
+        from phply.serialize import Statements
+        path = os.path.join(TESTDIR, 'inputs', 'class.php')
+        expected = phpautodoc.parse(read_inputs(['class.php'])[0])
+        with disk_cache(TESTDIR) as (_, cache):
+            for tree in load_twice(path, cache):
+                self.assertIsInstance(tree, Statements)
+                self.assertEqual(expected, list(tree))
+
+
+class TestSplitParse(unittest.TestCase):
+    source = u'''<?php
+namespace Foo;
+use A\\B;
+/** doc */
+function f($a) { $s = "{$a} ${a}"; return <<<EOT
+}
+EOT;
+}
+$x = array(1);
+// comment
+final class C extends B { /** m */ function m() {} }
+?>html<?php function g() {}
+abstract class D { abstract function n(); }
+interface I { function i(); }
+'''
+
+    def test_same_statements(self):
+        from phply.batch import iterparse_parallel, split
+        source = self.source + self.source.replace(u'<?php', u'', 1) * 4
+        self.assertEqual(8, len(split(source, 8)))
+        for mode in ('full', 'declarations'):
+            expected = phpautodoc.parse(source, mode)
+            statements = list(iterparse_parallel(source, mode, 2))
+            self.assertEqual(expected, statements)
+            self.assertEqual([node.lineno for node in expected],
+                             [node.lineno for node in statements])
+
+    def test_unsplittable(self):
+        from phply.batch import split
+        self.assertIsNone(split(u'<?php if (1): function f() {} $x = 1; function g() {} endif;', 8))
+        self.assertIsNone(split(u'<?php namespace A { function f() {} function g() {} }', 8))
+        self.assertIsNone(split(u'<?php $x = 1; __halt_compiler(); function f() {}', 8))
+
+    def test_syntax_error(self):
+        from phply.batch import iterparse_parallel
+        source = self.source + self.source.replace(u'<?php', u'', 1) + u'function ( {'
+        with self.assertRaises(phpautodoc.ParseError) as expected:
+            phpautodoc.parse(source)
+        with self.assertRaises(phpautodoc.ParseError) as cm:
+            list(iterparse_parallel(source, 'full', 2))
+        self.assertEqual(expected.exception.lineno, cm.exception.lineno)
+        self.assertEqual(expected.exception.tree, cm.exception.tree)
+
+    @patch('phply.batch.SPLIT_SIZE', 0)
+    def test_load_file(self):
+        from phply.batch import load_file
+        path = os.path.join(TESTDIR, 'inputs', 'class.php')
+        expected = phpautodoc.parse(read_inputs(['class.php'])[0])
+        with disk_cache(TESTDIR) as (_, cache):
+            self.assertEqual(expected, load_file(path, cache, workers=2))
+            self.assertEqual(expected, cache.load(path))
+
+
+class TestIncrementalParse(unittest.TestCase):
+    source = u'''<?php
+/** doc */
+function f($a) {
+    return $a;
+}
+
+class C {
+    /** m */
+    function m($b) {
+        return array($b, 1);
+    }
+}
+
+$x = 1;
+interface I { function i(); }
+function g() { return "{$x}"; }
+'''
+
+    def setUp(self):
+        from phply.cache import DiskCache
+        self.srcdir = mkdtemp()
+        self.path = os.path.join(self.srcdir, 'file.php')
+        self.cache = DiskCache(os.path.join(self.srcdir, '_cache'), self.srcdir, incremental=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+
+    def reparse(self, source, mode='full'):
+        from phply import batch
+        with open(self.path, 'wb') as f:
+            f.write(self.source.encode('utf-8'))
+        batch.load_file(self.path, self.cache, mode)
+
+        with open(self.path, 'wb') as f:
+            f.write(source.encode('utf-8'))
+        os.utime(self.path, (0, 0))
+        with patch('phply.batch.parse_chunk', wraps=batch.parse_chunk) as parse_chunk:
+            tree = batch.load_file(self.path, self.cache, mode)
+
+        expected = phpautodoc.parse(source, mode)
+        self.assertEqual(expected, tree)
+        self.assertEqual(linenos(expected), linenos(tree))
+        return parse_chunk
+
+    def test_reparse(self):
+        from phply import batch
+        source = self.source.replace(u'return array($b, 1);', u'$c = 2;\n\n        return array($b, $c);')
+        parse_chunk = self.reparse(source)
+        self.assertEqual(1, parse_chunk.call_count)
+        source, start, end = parse_chunk.call_args[0][:3]
+        self.assertTrue(source[start:end].startswith(u'class C {'))
+
+        # Spans are updated, and the next edit is reparsed from them
+        source = source.replace(u'"{$x}"', u'$x')
+        with open(self.path, 'wb') as f:
+            f.write(source.encode('utf-8'))
+        with patch('phply.batch.parse_chunk', wraps=batch.parse_chunk) as parse_chunk:
+            self.assertEqual(phpautodoc.parse(source), batch.load_file(self.path, self.cache))
+        self.assertEqual(1, parse_chunk.call_count)
+
+    def test_insert(self):
+        parse_chunk = self.reparse(self.source.replace(u'\n$x = 1;', u'\nfunction h() {}\n$x = 1;'))
+        self.assertEqual(2, parse_chunk.call_count)
+
+        parse_chunk = self.reparse(self.source.replace(u'<?php\n', u'<?php\nfunction h() {}\n'))
+        self.assertEqual(2, parse_chunk.call_count)
+
+    def test_line_constant(self):
+        # __LINE__ is the line it is on, which moves with the statement
+        from phply.cache import DiskCache
+        self.source = (u'<?php\nfunction f() {}\nfunction g() { return __LINE__; }\n'
+                       u'class C { const L = __LINE__; function m($a = __LINE__) {} }\n')
+        for mode in ('full', 'declarations', 'lazy'):
+            self.cache = DiskCache(os.path.join(self.srcdir, mode), self.srcdir, incremental=True)
+            self.reparse(self.source.replace(u'f() {}', u'f() {\n}'), mode)
+
+    def test_fallback(self):
+        # The edited text no longer ends with a complete statement
+        parse_chunk = self.reparse(self.source.replace(u'$x = 1;\n', u'$x = 1;\n?>\nhtml\n<?php\n'))
+        self.assertEqual(3, parse_chunk.call_count)
+
+        self.assertRaises(phpautodoc.ParseError, self.reparse, self.source.replace(u'$x = 1;', u'$x = 1'))
+
+
+class TestLazyParse(unittest.TestCase):
+    source = u'''<?php
+$f = function ($a) use ($b, &$c) { return function &() { return __FUNCTION__; }; };
+function &g(array $x = array()) { $y = function() use ($x) { ?>html<?php }; }
+class A {
+    function m() {
+        /** doc */
+        function inner() {}
+    }
+    abstract function n();
+}
+'''
+
+    def test_same_tree(self):
+        from phply.batch import iterparse_spans
+        for source in read_inputs() + [self.source]:
+            expected = phpautodoc.parse(source, 'full')
+            tree = phpautodoc.parse(source, 'lazy')
+            self.assertEqual(expected, tree)
+            self.assertEqual(linenos(expected), linenos(tree))
+            self.assertEqual(expected, list(iterparse_spans(source, 'lazy', [])))
+
+    def test_unparsed(self):
+        from phply.phpast import SourceBody
+        tree = phpautodoc.parse(self.source, 'lazy')
+        self.assertIsInstance(tree[0].expr._nodes, SourceBody)
+        self.assertIsInstance(tree[1]._nodes, SourceBody)
+        self.assertIsInstance(tree[2].nodes[0]._nodes, SourceBody)
+        self.assertEqual([], tree[2].nodes[1].nodes)
+
+        body = tree[2].nodes[0].nodes
+        self.assertEqual(('inner', '/** doc */', 7), (body[0].name, body[0].doc, body[0].lineno))
+
+    def test_cache(self):
+        from phply.batch import load_file
+        with disk_cache() as (tmpdir, cache):
+            path = os.path.join(tmpdir, 'lazy.php')
+            with open(path, 'wb') as f:
+                f.write(self.source.encode('utf-8'))
+
+            expected = phpautodoc.parse(self.source)
+            for tree in load_twice(path, cache, 'lazy'):
+                self.assertEqual(expected, tree)
+                self.assertEqual(linenos(expected), linenos(tree))
+
+            # Bodies are not parsed from a file that changed after loading
+            tree = load_file(path, cache, 'lazy')
+            with open(path, 'ab') as f:
+                f.write('$x = 1;')
+            with self.assertRaises(IOError):
+                tree[1].nodes
+
+
+class TestDenseEngine(EngineTestCase):
+    def test_same_tree(self):
+        from phply.batch import iterparse, set_engine
+        from phply.engine import Parser
+        sources = read_inputs(name for name in os.listdir(os.path.join(TESTDIR, 'inputs'))
+                              if name.endswith('.php') and 'syntax_error' not in name)
+        sources += [TestSplitParse.source, TestLazyParse.source,
+                    u'<?php /** a */ /** b */ function f() {} /** c */', u'html <?php echo 1; ?> tail', u'']
+        for source in sources:
+            for mode in ('full', 'declarations', 'lazy'):
+                set_engine('ply')
+                expected = phpautodoc.parse(source, mode)
+                set_engine('dense')
+                self.assertIsInstance(phpautodoc.get_parser()[1], Parser)
+                tree = phpautodoc.parse(source, mode)
+                self.assertEqual(expected, tree)
+                self.assertEqual(linenos(expected), linenos(tree))
+                self.assertEqual(expected, list(iterparse(source, mode)))
+
+    def test_syntax_error(self):
+        from phply.batch import set_engine
+        for source in read_inputs(['syntax_error.php', 'partial_syntax_error.php']):
+            errors = []
+            for engine in ('ply', 'dense'):
+                set_engine(engine)
+                with self.assertRaises(phpautodoc.ParseError) as cm:
+                    phpautodoc.parse(source)
+                errors.append((cm.exception.args, cm.exception.tree))
+            self.assertEqual(errors[0], errors[1])
+
+        with self.assertRaises(ValueError):
+            set_engine('unknown')
+
+
+class TestProfiling(EngineTestCase):
+    def test_counters(self):
+        from phply.batch import set_engine
+        from phply.profiling import Profile
+        source = u'<?php function f($a) { return $a + 1; } f(2);'
+        for engine in ('ply', 'dense'):
+            set_engine(engine)
+            profile = Profile()
+            self.assertEqual(phpautodoc.parse(source), profile.parse(source))
+            self.assertEqual(1, profile.productions['p_function_declaration_statement'][0])
+            self.assertEqual(2, profile.tokens['LNUMBER'][0])
+            self.assertEqual(17, profile.shifts)
+            self.assertEqual(sum(count for count, _ in profile.productions.values()),
+                             profile.reductions)
+
+            with self.assertRaises(phpautodoc.ParseError):
+                profile.parse(u'<?php $x = ;')
+            self.assertEqual(19, profile.shifts)
+
+    def test_main(self):
+        import json
+        from StringIO import StringIO
+        from phply import profiling
+        path = os.path.join(TESTDIR, 'inputs', 'class.php')
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertEqual(0, profiling.main(['--json', path]))
+        counters = json.loads(stdout.getvalue())
+        self.assertEqual(16, counters['productions']['p_class_statement']['count'])
+        self.assertEqual(counters['reductions'],
+                         sum(c['count'] for c in counters['productions'].values()))
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertEqual(0, profiling.main(['-s', 'count', '-n', '1', path]))
+        lines = stdout.getvalue().splitlines()
+        self.assertIn('p_class_statement_list', lines[3])
+        self.assertEqual('', lines[4])
+
+
+class TestPositions(EngineTestCase):
+    source = u'''<?php
+/** doc */
+function f($a, $b = 1) {
+    return $a + $b;
+}
+class C extends B {
+    public function m() { echo "x{$y}"; }
+}
+$x = array(1, 2);
+'''
+
+    def setUp(self):
+        from phply.batch import set_positions
+        set_positions(True)
+
+    def positions(self, tree):
+        positions = []
+        for node in tree:
+            node.accept(lambda n: positions.append((n.lineno, n.lexpos, n.lexend)))
+        return positions
+
+    def test_lines(self):
+        from phply.phpscan import Lines
+        lines = Lines(u'a\nbc\n\nd')
+        self.assertEqual([1, 1, 2, 2, 2, 3, 4], [lines.lineno(pos) for pos in range(7)])
+        self.assertEqual([0, 1, 0, 1, 2, 0, 0], [lines.column(pos) for pos in range(7)])
+        self.assertEqual(5, Lines(u'a\nbc\n\nd', 2, 3).lineno(6))
+
+    def test_tokens(self):
+        from phply.phpscan import Lexer
+        lexer = Lexer()
+        lexer.input(self.source)
+        for t in lexer:
+            self.assertEqual(t.value, self.source[t.lexpos:t.lexend])
+            self.assertEqual(self.source.count('\n', 0, t.lexpos) + 1, t.lineno)
+        self.assertEqual(10, lexer.lineno)
+
+    def test_nodes(self):
+        from phply.batch import set_engine
+        tree = phpautodoc.parse(self.source)
+        function, cls, assignment = tree
+        self.assertEqual('/** doc */', function.doc)
+        self.assertEqual(u'function f($a, $b = 1) {\n    return $a + $b;\n}',
+                         self.source[function.lexpos:function.lexend])
+        self.assertEqual(u'$b = 1', self.source[function.params[1].lexpos:function.params[1].lexend])
+        method = cls.nodes[0]
+        self.assertEqual(u'public function m() { echo "x{$y}"; }',
+                         self.source[method.lexpos:method.lexend])
+        self.assertEqual(u'array(1, 2)', self.source[assignment.expr.lexpos:assignment.expr.lexend])
+
+        for mode in ('full', 'declarations', 'lazy'):
+            expected = self.positions(phpautodoc.parse(self.source, mode))
+            set_engine('dense')
+            self.assertEqual(expected, self.positions(phpautodoc.parse(self.source, mode)))
+            set_engine('ply')
+
+    def test_disabled(self):
+        from phply.batch import iterparse, set_engine, set_positions
+        set_positions(False)
+        for engine in ('ply', 'dense'):
+            set_engine(engine)
+            for tree in (phpautodoc.parse(self.source), list(iterparse(self.source))):
+                positions = self.positions(tree)
+                self.assertEqual([(None, None)], list(set(position[1:] for position in positions)))
+
+    def test_serialized(self):
+        import pickle
+        from phply import serialize
+        tree = phpautodoc.parse(self.source)
+        expected = self.positions(tree)
+        self.assertEqual(expected, self.positions(serialize.loads(serialize.dumps(tree))))
+        self.assertEqual(expected, self.positions(pickle.loads(pickle.dumps(tree, 2))))
+
+    def test_split(self):
+        from phply.batch import iterparse_parallel, iterparse_spans, reparse
+        source = TestSplitParse.source + TestSplitParse.source.replace(u'<?php', u'', 1) * 3
+        expected = self.positions(phpautodoc.parse(source))
+        self.assertEqual(expected, self.positions(iterparse_parallel(source, 'full', 2)))
+
+        spans = []
+        tree = list(iterparse_spans(source, 'full', spans))
+        self.assertEqual(expected, self.positions(tree))
+
+        changed = source.replace(u'function g() {}', u'function g() {\n    $z = 1;\n}', 1)
+        self.assertEqual(self.positions(phpautodoc.parse(changed)),
+                         self.positions(reparse(changed, tree, spans, 'full', [])))
+
+
+class TestPHPScan(unittest.TestCase):
+    source = u'''<html><?= $title ?>
+<% echo 1 %><?php
+/**/ $a; /* comment */ /** doc */ // line ?> html <?php # hash
+$s = "a $b[0] $c[$d] $e[f] $g->h {$i['j']} ${k} ${l['m']} \\" $n$o $ \\{";
+$h = <<<EOT
+line $a->b $c[1] {$d} ${e}
+EO $f
+EOT;
+$z = (int) $q . ( Array ) (foo) 0x1F + 1.5e3 + .5 + 1. + 1e5 - 0x;
+if ($a !== $b && $c != $d || $e <> $f) { $i .= $j; $k <<= 1; $l->m->n(); }
+foo::bar(); \\ns\\f(); $a ? $b : @$c; $a++ + --$b; 'it\\'s
+multiline';
+?>
+tail'''
+
+    def tokens(self, lexer, source):
+        lexer = lexer.clone()
+        lexer.input(source)
+        return [(t.type, t.value, t.lineno, t.lexpos) for t in lexer]
+
+    def test_same_tokens(self):
+        from phply import phplex, phpscan
+        sources = [self.source, u'<?php $a /* open', u'<?php $a /** open', u'<?php /**/ $a']
+        sources += read_inputs(name for name in os.listdir(os.path.join(TESTDIR, 'inputs'))
+                               if name.endswith('.php'))
+
+        for source in sources:
+            self.assertEqual(self.tokens(phplex.lexer, source),
+                             self.tokens(phpscan.lexer, source))
+
+    def test_illegal_character(self):
+        from phply import phpscan
+        with self.assertRaises(SyntaxError) as cm:
+            self.tokens(phpscan.lexer, u'<?php\n$a = `ls`;')
+        self.assertEqual((2, u'`ls`;'), (cm.exception.lineno, cm.exception.text))
+
+    def test_doc_comments_only(self):
+        from phply import phpscan
+        from phply.phpparse import parser
+        source = u'''<?php
+/** file */
+# hash
+/** one */ function one() { // inside
+    return 1; /* after */ }
+/** lost */ // plain
+function two() {}
+/** lost */ $a = 1;
+function three() {}
+class A {
+    /** attr */ public $x; /** lost */
+    /** method */ abstract function m(); /** lost */ # plain
+    /** const */ const C = 1;
+}'''
+
+        def docs(nodes):
+            results = []
+            for node in nodes:
+                if hasattr(node, 'doc'):
+                    results.append((node.__class__.__name__, node.doc))
+                if isinstance(node, phpautodoc.ast.Class):
+                    results.extend(docs(node.nodes))
+            return results
+
+        full = parser.parse(source, lexer=phpscan.lexer.clone())
+        tree = parser.parse(source, lexer=phpscan.Lexer(comments='doc'))
+
+        self.assertEqual(docs(full), docs(tree))
+        self.assertEqual([('Function', '/** one */'), ('Function', None), ('Function', None),
+                          ('Class', None), ('ClassVariables', '/** attr */'),
+                          ('Method', '/** method */'), ('ClassConstants', '/** const */')],
+                         docs(tree))
+        self.assertEqual(['Function', 'Function', 'Assignment', 'Function', 'Class'],
+                         [node.__class__.__name__ for node in tree])
+        self.assertEqual([phpautodoc.ast.Return(1)], tree[0].nodes)
+        self.assertEqual(['ClassVariables', 'Method', 'ClassConstants'],
+                         [node.__class__.__name__ for node in tree[4].nodes])
+
+        # comments inside expressions no longer reach the parser
+        tree = parser.parse(u'<?php foo(/* a */ 1);', lexer=phpscan.Lexer(comments='doc'))
+        self.assertEqual('FunctionCall', tree[0].__class__.__name__)
+
+    def test_empty_doc_comment(self):
+        # /**/ is a COMMENT, but documents what follows like a doc comment
+        from phply import phpscan
+        from phply.phpparse import parser
+
+        def parse(source):
+            full = parser.parse(source, lexer=phpscan.lexer.clone())
+            tree = parser.parse(source, lexer=phpscan.Lexer(comments='doc'))
+            self.assertEqual(full, tree)
+            return tree
+
+        self.assertEqual('/**/', parse(u'<?php\n$a = 1;\n/**/ function f() {}')[1].doc)
+        self.assertEqual('/**/', parse(u'<?php\nclass A { /**/ function m() {} }')[0].nodes[0].doc)
+
+    def test_token_buffer(self):
+        from phply import phpscan
+        for comments in ('all', 'doc'):
+            lexer = phpscan.Lexer(comments)
+            lexer.input(self.source)
+            buffer = lexer.tokenize()
+            self.assertEqual(self.tokens(phpscan.Lexer(comments), self.source),
+                             [(t.type, t.value, t.lineno, t.lexpos) for t in buffer])
+            self.assertEqual([buffer.value(i) for i in range(len(buffer))],
+                             [t.value for t in buffer])
+            self.assertEqual([1, 4, 4], [column.itemsize for column in
+                                         (buffer.types, buffer.starts, buffer.ends)])
+
+
+class TestDeclarationLexer(unittest.TestCase):
+    def tokens(self, source):
+        from phply.phplex import DeclarationLexer
+        lexer, parser = phpautodoc.get_parser()
+        lexer = DeclarationLexer(lexer.clone())
+        lexer.input(source)
+        return [(t.type, t.value) for t in lexer]
+
+    def test_bodies(self):
+        source = ('<?php function &foo($a = array()) { if ($a) { echo "{$a[0]} ${a}"; } }\n'
+                  'abstract class A { abstract function bar(); function baz() { return function() { }; } }')
+        bodies = [value for type, value in self.tokens(source) if type == 'BODY']
+        self.assertEqual([' if ($a) { echo "{$a[0]} ${a}"; } ',
+                          ' return function() { }; '],
+                         [source[start:end] for start, end in bodies])
+
+    def test_parse(self):
+        source = '<?php class A { /** doc */ function foo($a) { while (1) { } } }'
+        tree = phpautodoc.parse(source, 'declarations')
+        method = tree[0].nodes[0]
+
+        self.assertEqual(phpautodoc.parse(source, 'full')[0].nodes[0].doc, method.doc)
+        self.assertEqual(('foo', '/** doc */', []), (method.name, method.doc, method.nodes))
+        self.assertEqual('a', method.params[0].name[1:])
+
+
+class TestParallelParse(unittest.TestCase):
+    def test_threads(self):
+        import threading
+        from glob import glob
+        sources = [open(path).read() for path in glob(os.path.join(TESTDIR, 'inputs', '*.php'))
+                   if not path.endswith('syntax_error.php')]
+        expected = [phpautodoc.parse(source) for source in sources]
+
+        results = {}
+
+        def worker(n):
+            try:
+                results[n] = [phpautodoc.parse(source) for source in sources]
+            except Exception as exc:
+                results[n] = exc
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([expected] * 8, [results[n] for n in range(8)])
+
+
 # setup testcases
 for root, dirs, files in os.walk(os.path.join(TESTDIR, 'inputs')):
     dirname = re.sub('.*?inputs/?', '', root)
@@ -76,6 +1090,7 @@ for root, dirs, files in os.walk(os.path.join(TESTDIR, 'inputs')):
         if filename[-4:] == '.rst':
             path = os.path.join(dirname, filename)
             TestPHPAutodoc.append(path)
+            TestPHPAutodoc.append(path, parse_mode='full')
 
 
 if __name__ == "__main__":